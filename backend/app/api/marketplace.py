@@ -82,10 +82,11 @@ async def browse_agents(
     sort_by: str = Query("newest"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
 ) -> Dict[str, Any]:
     """Browse all marketplace listings with optional category filter."""
     return await marketplace_service.browse_agents(
-        category=category, sort_by=sort_by, limit=limit, offset=offset
+        category=category, sort_by=sort_by, limit=limit, offset=offset, cursor=cursor
     )
 
 
@@ -102,7 +103,13 @@ async def search_agents(body: SearchAgentsRequest) -> Dict[str, Any]:
     if body.category:
         filters["category"] = body.category.value
 
-    return await marketplace_service.search_agents(query=body.query, filters=filters)
+    return await marketplace_service.search_agents(
+        query=body.query,
+        filters=filters,
+        sort_by=body.sort_by.value if body.sort_by else None,
+        limit=body.limit,
+        cursor=body.cursor,
+    )
 
 
 @router.get("/categories", response_model=List[str])
@@ -55,8 +55,14 @@ def _get_registry():
 def _get_sandbox():
     global _sandbox_service
     if _sandbox_service is None:
+        from app.core.config import settings
         from app.services.plugin_sandbox_service import PluginSandboxService
-        _sandbox_service = PluginSandboxService(registry=_get_registry())
+        _sandbox_service = PluginSandboxService(
+            registry=_get_registry(),
+            isolation=settings.plugin_sandbox_isolation,
+            max_workers=settings.plugin_sandbox_workers or None,
+            memory_limit_mb=settings.plugin_sandbox_memory_limit_mb or None,
+        )
     return _sandbox_service
 
 
@@ -4,6 +4,7 @@ Zero-human provisioning API.
 Exposes:
   POST /v1/public/provision   — wallet sig → API key (no auth required)
   POST /v1/public/keys        — create additional key (auth required)
+  POST /v1/public/keys/revoke — revoke one of the caller's keys (auth required)
   GET  /v1/public/capabilities — machine-readable capability manifest (public)
 
 These endpoints enable fully autonomous agent onboarding:
@@ -55,6 +56,14 @@ class CreateKeyResponse(BaseModel):
     created_at: str
 
 
+class RevokeKeyRequest(BaseModel):
+    api_key: str = Field(..., description="API key to revoke")
+
+
+class RevokeKeyResponse(BaseModel):
+    revoked: bool
+
+
 # ---------------------------------------------------------------------------
 # Capability manifest (static, config-driven)
 # ---------------------------------------------------------------------------
@@ -170,6 +179,33 @@ async def create_key(
     return CreateKeyResponse(**result)
 
 
+@router.post(
+    "/keys/revoke",
+    response_model=RevokeKeyResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Revoke an API key",
+    description="""
+Deactivate one of the authenticated user's API keys.
+
+The key stops authenticating immediately on this instance; the cached
+resolution is evicted as part of the revocation.
+""",
+)
+async def revoke_key(
+    request_body: RevokeKeyRequest,
+    http_request: Request,
+) -> RevokeKeyResponse:
+    user_id = getattr(http_request.state, "user_id", None)
+    if not user_id:
+        raise APIError(status_code=401, error_code="UNAUTHORIZED", detail="Authentication required")
+
+    svc = get_provision_service()
+    revoked = await svc.revoke_key(request_body.api_key, user_id=user_id)
+    if not revoked:
+        raise APIError(status_code=404, error_code="API_KEY_NOT_FOUND", detail="API key not found")
+    return RevokeKeyResponse(revoked=True)
+
+
 @router.get(
     "/capabilities",
     status_code=status.HTTP_200_OK,
@@ -10,6 +10,8 @@ Per PRD Section 11 (Deterministic Replay):
 - GET /v1/public/{project_id}/runs - List all runs
 - GET /v1/public/{project_id}/runs/{run_id} - Get run details
 - GET /v1/public/{project_id}/runs/{run_id}/replay - Get complete replay data
+- GET /v1/public/{project_id}/runs/{run_id}/replay/stream - Stream replay data
+  (NDJSON or SSE) with the validation summary sent as a trailer
 
 Endpoints aggregate:
 - agent_profile: Agent configuration
@@ -19,8 +21,10 @@ Endpoints aggregate:
 
 All data is ordered chronologically by timestamp for deterministic replay.
 """
-from typing import Optional
+import json
+from typing import AsyncIterator, Literal, Optional
 from fastapi import APIRouter, Depends, status, Path, Query, HTTPException
+from fastapi.responses import StreamingResponse
 from app.core.auth import get_current_user
 from app.core.errors import APIError
 from app.schemas.runs import (
@@ -31,7 +35,7 @@ from app.schemas.runs import (
     ProjectStatsResponse,
     ErrorResponse
 )
-from app.services.replay_service import replay_service
+from app.services.replay_service import replay_service, DEFAULT_REPLAY_CHUNK_SIZE
 
 
 router = APIRouter(
@@ -365,3 +369,114 @@ async def get_run_replay(
         raise RunNotFoundError(run_id=run_id, project_id=project_id)
 
     return replay_data
+
+
+def _encode_replay_frames(
+    frames: AsyncIterator[dict],
+    fmt: str
+) -> AsyncIterator[str]:
+    """Serialize replay frames as NDJSON lines or SSE events."""
+    async def encode() -> AsyncIterator[str]:
+        async for frame in frames:
+            data = json.dumps(frame, separators=(",", ":"))
+            if fmt == "sse":
+                yield f"event: {frame['type']}\ndata: {data}\n\n"
+            else:
+                yield data + "\n"
+    return encode()
+
+
+@router.get(
+    "/{project_id}/runs/{run_id}/replay/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        200: {
+            "description": "Replay frames as NDJSON lines or SSE events",
+            "content": {"application/x-ndjson": {}, "text/event-stream": {}}
+        },
+        401: {
+            "description": "Invalid or missing API key",
+            "model": ErrorResponse
+        },
+        404: {
+            "description": "Run not found",
+            "model": ErrorResponse
+        }
+    },
+    summary="Stream run replay data",
+    description="""
+    Stream replay data for long runs instead of building one response.
+
+    **Authentication:** Requires X-API-Key header
+
+    **Frames (in order):**
+    - header: run fields and agent profile
+    - records: up to chunk_size records, chronologically merged across
+      agent_memory, compliance_events and x402_requests; each entry is
+      {"record_type": "memory" | "compliance_event" | "x402_request", "record": {...}}
+    - trailer: validation summary (same shape as the replay endpoint) and
+      record_count
+
+    **Formats:**
+    - ndjson (default): one JSON frame per line
+    - sse: `event: <frame type>` with the frame as `data`
+
+    Validation is computed while records are streamed, so clients can
+    verify records as they arrive and check the trailer at the end.
+    """
+)
+async def stream_run_replay(
+    project_id: str = Path(
+        ...,
+        description="Project ID"
+    ),
+    run_id: str = Path(
+        ...,
+        description="Run ID to stream replay data for"
+    ),
+    format: Literal["ndjson", "sse"] = Query(
+        default="ndjson",
+        description="Stream encoding"
+    ),
+    chunk_size: int = Query(
+        default=DEFAULT_REPLAY_CHUNK_SIZE,
+        ge=1,
+        le=5000,
+        description="Maximum records per frame"
+    ),
+    current_user: str = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Stream replay data for a run.
+
+    Args:
+        project_id: Project identifier
+        run_id: Run identifier
+        format: 'ndjson' or 'sse'
+        chunk_size: Maximum records per records frame
+        current_user: Authenticated user ID
+
+    Returns:
+        StreamingResponse of replay frames
+
+    Raises:
+        RunNotFoundError: If run is not found
+    """
+    frames = replay_service.stream_replay(
+        project_id=project_id,
+        run_id=run_id,
+        chunk_size=chunk_size
+    )
+
+    if frames is None:
+        raise RunNotFoundError(run_id=run_id, project_id=project_id)
+
+    return StreamingResponse(
+        _encode_replay_frames(frames, format),
+        media_type="text/event-stream" if format == "sse" else "application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
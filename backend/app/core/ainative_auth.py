@@ -3,22 +3,22 @@ AINative JWT Token Validation.
 
 Validates JWT tokens by calling AINative's auth API.
 This allows the backend to accept tokens issued by AINative Studio.
+
+Validation results are cached in the shared credential cache
+(app.core.credential_cache) and upstream calls reuse one pooled client.
 """
 import httpx
 import logging
 from typing import Optional
-from datetime import datetime, timedelta
-from functools import lru_cache
 from pydantic import BaseModel
 
+from app.core.credential_cache import KIND_AINATIVE_TOKEN, get_credential_cache
+
 logger = logging.getLogger(__name__)
 
 # AINative Auth API endpoint
 AINATIVE_AUTH_URL = "https://api.ainative.studio/v1/public/auth"
 
-# Cache TTL for token validation (5 minutes)
-TOKEN_CACHE_TTL = timedelta(minutes=5)
-
 
 class AINativeUser(BaseModel):
     """User info from AINative auth."""
@@ -30,87 +30,92 @@ class AINativeUser(BaseModel):
     username: Optional[str] = None
 
 
-class TokenValidationCache:
-    """Simple in-memory cache for token validation results."""
+# Shared connection pool for AINative auth calls (created lazily)
+_http_client: Optional[httpx.AsyncClient] = None
 
-    def __init__(self):
-        self._cache: dict[str, tuple[AINativeUser, datetime]] = {}
 
-    def get(self, token: str) -> Optional[AINativeUser]:
-        """Get cached user if token is still valid."""
-        if token in self._cache:
-            user, cached_at = self._cache[token]
-            if datetime.utcnow() - cached_at < TOKEN_CACHE_TTL:
-                return user
-            # Cache expired, remove it
-            del self._cache[token]
-        return None
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the pooled AsyncClient, recreating it if it was closed."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the pooled AsyncClient (call on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
-    def set(self, token: str, user: AINativeUser) -> None:
-        """Cache token validation result."""
-        self._cache[token] = (user, datetime.utcnow())
 
-    def invalidate(self, token: str) -> None:
-        """Remove token from cache."""
-        self._cache.pop(token, None)
+def _user_from_response(data: dict) -> AINativeUser:
+    """Build an AINativeUser from the /me response body."""
+    return AINativeUser(
+        user_id=data.get("id", ""),
+        email=data.get("email", ""),
+        is_active=data.get("is_active", True),
+        role=data.get("role", "user"),
+        full_name=data.get("full_name"),
+        username=data.get("username"),
+    )
 
 
-# Global cache instance
-_token_cache = TokenValidationCache()
+async def _fetch_ainative_user(token: str) -> Optional[AINativeUser]:
+    """
+    Resolve a token via AINative's /me endpoint.
+
+    Returns None when AINative rejects the token. Transport errors and
+    unexpected statuses raise, so they are not cached as rejections.
+    """
+    response = await _get_http_client().get(
+        f"{AINATIVE_AUTH_URL}/me",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    if response.status_code == 200:
+        user = _user_from_response(response.json())
+        logger.info(f"AINative token validated for user {user.user_id}")
+        return user
+
+    if response.status_code == 401:
+        logger.warning("AINative token validation failed: unauthorized")
+        return None
+
+    raise httpx.HTTPStatusError(
+        f"AINative auth API error: {response.status_code}",
+        request=response.request,
+        response=response,
+    )
 
 
 async def validate_ainative_token(token: str) -> Optional[AINativeUser]:
     """
     Validate a JWT token against AINative's auth API.
 
+    Results are served from the shared credential cache; concurrent
+    validations of the same token share one upstream call.
+
     Args:
         token: JWT token string (without 'Bearer ' prefix)
 
     Returns:
         AINativeUser if token is valid, None otherwise
     """
-    # Check cache first
-    cached_user = _token_cache.get(token)
-    if cached_user:
-        logger.debug(f"Token validation cache hit for user {cached_user.user_id}")
-        return cached_user
-
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Call AINative's /me endpoint to validate token and get user info
-            response = await client.get(
-                f"{AINATIVE_AUTH_URL}/me",
-                headers={"Authorization": f"Bearer {token}"}
-            )
-
-            if response.status_code == 200:
-                data = response.json()
-                user = AINativeUser(
-                    user_id=data.get("id", ""),
-                    email=data.get("email", ""),
-                    is_active=data.get("is_active", True),
-                    role=data.get("role", "user"),
-                    full_name=data.get("full_name"),
-                    username=data.get("username"),
-                )
-
-                # Cache the result
-                _token_cache.set(token, user)
-
-                logger.info(f"AINative token validated for user {user.user_id}")
-                return user
-
-            elif response.status_code == 401:
-                logger.warning("AINative token validation failed: unauthorized")
-                return None
-
-            else:
-                logger.error(f"AINative auth API error: {response.status_code}")
-                return None
-
+        return await get_credential_cache().get_or_load(
+            KIND_AINATIVE_TOKEN, token, lambda: _fetch_ainative_user(token)
+        )
     except httpx.TimeoutException:
         logger.error("AINative auth API timeout")
         return None
+    except httpx.HTTPStatusError as e:
+        logger.error(str(e))
+        return None
     except httpx.RequestError as e:
         logger.error(f"AINative auth API request error: {e}")
         return None
@@ -124,9 +129,9 @@ def validate_ainative_token_sync(token: str) -> Optional[AINativeUser]:
     Synchronous version of validate_ainative_token.
     Used for contexts where async is not available.
     """
-    # Check cache first
-    cached_user = _token_cache.get(token)
-    if cached_user:
+    cache = get_credential_cache()
+    found, cached_user = cache.lookup(KIND_AINATIVE_TOKEN, token)
+    if found:
         return cached_user
 
     try:
@@ -137,18 +142,12 @@ def validate_ainative_token_sync(token: str) -> Optional[AINativeUser]:
             )
 
             if response.status_code == 200:
-                data = response.json()
-                user = AINativeUser(
-                    user_id=data.get("id", ""),
-                    email=data.get("email", ""),
-                    is_active=data.get("is_active", True),
-                    role=data.get("role", "user"),
-                    full_name=data.get("full_name"),
-                    username=data.get("username"),
-                )
-                _token_cache.set(token, user)
+                user = _user_from_response(response.json())
+                cache.store(KIND_AINATIVE_TOKEN, token, user)
                 return user
 
+            if response.status_code == 401:
+                cache.store(KIND_AINATIVE_TOKEN, token, None)
             return None
 
     except Exception as e:
@@ -156,7 +155,11 @@ def validate_ainative_token_sync(token: str) -> Optional[AINativeUser]:
         return None
 
 
+def invalidate_ainative_token(token: str) -> None:
+    """Drop a cached token validation result (e.g. on logout)."""
+    get_credential_cache().invalidate(KIND_AINATIVE_TOKEN, token)
+
+
 def clear_token_cache() -> None:
     """Clear the entire token validation cache."""
-    global _token_cache
-    _token_cache = TokenValidationCache()
+    get_credential_cache().clear(KIND_AINATIVE_TOKEN)
@@ -124,6 +124,46 @@ class Settings(BaseSettings):
         description="Default project id substituted when rewriting /api/v1/* in workshop mode"
     )
 
+    # Credential cache for API key / bearer token resolution
+    credential_cache_max_entries: int = Field(
+        default=10_000,
+        description="Maximum cached API keys and tokens before LRU eviction"
+    )
+    credential_cache_positive_ttl_seconds: float = Field(
+        default=300.0,
+        description="Seconds a resolved API key or token stays cached"
+    )
+    credential_cache_negative_ttl_seconds: float = Field(
+        default=30.0,
+        description="Seconds a rejected API key or token stays cached"
+    )
+
+    # Largest request body the middleware will buffer and parse
+    max_request_body_bytes: int = Field(
+        default=1_048_576,
+        description="Request bodies above this size are rejected with 413"
+    )
+
+    # Conversation thread persistence
+    thread_db_path: str = Field(
+        default="",
+        description="SQLite file for conversation threads; empty keeps threads in memory"
+    )
+
+    # Plugin tool execution (Issue #243)
+    plugin_sandbox_isolation: str = Field(
+        default="inline",
+        description="'inline' runs plugin tools on the event loop; 'process' uses warm worker processes"
+    )
+    plugin_sandbox_workers: int = Field(
+        default=0,
+        description="Process-mode worker count; 0 uses the CPU count"
+    )
+    plugin_sandbox_memory_limit_mb: int = Field(
+        default=1024,
+        description="Process-mode address-space cap per worker in MB; 0 disables the cap"
+    )
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
@@ -0,0 +1,191 @@
+"""
+Credential resolution cache.
+
+Caches the outcome of resolving an API key or bearer token to a principal
+so the auth middleware does not hit ZeroDB or the AINative auth API on
+every request.
+
+Features:
+- Positive results (credential resolved) and negative results (credential
+  rejected) are cached with separate TTLs.
+- Size-bounded LRU eviction.
+- Single-flight: concurrent lookups of the same credential share one
+  in-flight resolution.
+- Explicit invalidation for revoked keys and logged-out tokens.
+
+Credentials are stored under a SHA-256 digest, never in plain text.
+Loader exceptions (network errors, timeouts) are propagated to every
+waiter and are not cached.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+# Credential kinds (cache namespaces)
+KIND_API_KEY = "api_key"
+KIND_AINATIVE_TOKEN = "ainative_token"
+
+
+class CredentialCache:
+    """
+    LRU cache of credential → principal with positive/negative TTLs.
+
+    The synchronous ``lookup``/``store`` pair is safe to call from worker
+    threads; ``get_or_load`` adds single-flight loading on the event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        positive_ttl: float = 300.0,
+        negative_ttl: float = 30.0,
+    ) -> None:
+        """
+        Initialise the cache.
+
+        Args:
+            max_entries: Maximum cached credentials before LRU eviction.
+            positive_ttl: Seconds a resolved principal stays cached.
+            negative_ttl: Seconds a rejected credential stays cached.
+        """
+        self._max_entries = max_entries
+        self._positive_ttl = positive_ttl
+        self._negative_ttl = negative_ttl
+        # digest -> (value, expires_at); value None marks a negative entry
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _digest(kind: str, credential: str) -> str:
+        return kind + ":" + hashlib.sha256(credential.encode("utf-8")).hexdigest()
+
+    def lookup(self, kind: str, credential: str) -> Tuple[bool, Any]:
+        """
+        Look up a credential.
+
+        Returns:
+            ``(found, value)`` where ``value`` is None for a cached rejection.
+        """
+        digest = self._digest(kind, credential)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self._entries[digest]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return True, value
+
+    def store(self, kind: str, credential: str, value: Any) -> None:
+        """Cache a resolution result (``None`` caches a rejection)."""
+        ttl = self._positive_ttl if value is not None else self._negative_ttl
+        if ttl <= 0:
+            return
+        digest = self._digest(kind, credential)
+        with self._lock:
+            self._entries[digest] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    async def get_or_load(
+        self,
+        kind: str,
+        credential: str,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached principal or resolve it once via ``loader``.
+
+        Concurrent callers for the same credential await the same load.
+
+        Args:
+            kind: Credential namespace (e.g. ``KIND_API_KEY``).
+            credential: Raw API key or token.
+            loader: Coroutine factory returning the principal or None.
+
+        Returns:
+            The resolved principal, or None when the credential is rejected.
+
+        Raises:
+            Whatever ``loader`` raises; failures are not cached.
+        """
+        found, cached = self.lookup(kind, credential)
+        if found:
+            return cached
+
+        digest = self._digest(kind, credential)
+        inflight = self._inflight.get(digest)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[digest] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an unobserved failure is not logged by asyncio
+            future.exception()
+            raise
+        else:
+            # Skip caching if the credential was invalidated mid-load
+            if self._inflight.get(digest) is future:
+                self.store(kind, credential, value)
+            future.set_result(value)
+            return value
+        finally:
+            if self._inflight.get(digest) is future:
+                del self._inflight[digest]
+
+    def invalidate(self, kind: str, credential: str) -> None:
+        """Drop a single credential, e.g. after revocation."""
+        digest = self._digest(kind, credential)
+        with self._lock:
+            self._entries.pop(digest, None)
+        self._inflight.pop(digest, None)
+
+    def clear(self, kind: Optional[str] = None) -> None:
+        """Drop every cached credential, or only those of one kind."""
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+                return
+            prefix = kind + ":"
+            for digest in [d for d in self._entries if d.startswith(prefix)]:
+                del self._entries[digest]
+
+
+# Global cache instance shared by the auth middleware and services
+credential_cache = CredentialCache(
+    max_entries=settings.credential_cache_max_entries,
+    positive_ttl=settings.credential_cache_positive_ttl_seconds,
+    negative_ttl=settings.credential_cache_negative_ttl_seconds,
+)
+
+
+def get_credential_cache() -> CredentialCache:
+    """Return the module-level CredentialCache singleton."""
+    return credential_cache
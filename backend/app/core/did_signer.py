@@ -14,14 +14,49 @@ Security Features:
 - Constant-time signature verification
 - DID format validation before resolution
 - No private key logging
+
+Verification Performance:
+- Parsed verifying keys are cached per DID (LRU), so repeat callers skip
+  DID resolution and public-key decoding
+- When the ``cryptography`` package is installed, verification runs in
+  OpenSSL instead of the pure-Python ``ecdsa`` implementation; results
+  are identical (raw r||s signatures over the SHA256 payload digest)
+- ``verify_many`` checks a batch, optionally fanned out over a thread or
+  process pool
 """
 import hashlib
 import json
 import hmac
-from typing import Dict, Any, Tuple
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from ecdsa import SigningKey, VerifyingKey, SECP256k1, BadSignatureError
 from ecdsa.util import sigencode_string, sigdecode_string
 
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.hazmat.primitives.asymmetric.utils import (
+        Prehashed,
+        encode_dss_signature,
+    )
+    _CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    _CRYPTOGRAPHY_AVAILABLE = False
+
+# Verification backend: "cryptography" (OpenSSL) when installed, else "ecdsa"
+VERIFY_BACKEND = "cryptography" if _CRYPTOGRAPHY_AVAILABLE else "ecdsa"
+
+# Maximum number of parsed verifying keys kept in memory
+VERIFYING_KEY_CACHE_SIZE = 4096
+
+# Items per task when verify_many fans out to an executor
+VERIFY_CHUNK_SIZE = 64
+
+# (payload, signature_hex, did)
+SignedItem = Tuple[Dict[str, Any], str, str]
+
 
 class SignatureVerificationError(Exception):
     """Raised when signature verification fails."""
@@ -187,15 +222,9 @@ class DIDSigner:
             raise InvalidDIDError(f"Invalid DID format: {did}")
 
         try:
-            # Resolve DID to public key
-            public_key_hex = DIDSigner.resolve_did(did)
-            public_key_bytes = bytes.fromhex(public_key_hex)
-
-            # Create verifying key
-            verifying_key = VerifyingKey.from_string(
-                public_key_bytes,
-                curve=SECP256k1
-            )
+            # Resolve DID to a parsed verifying key (cached per DID)
+            backend = VERIFY_BACKEND
+            verifying_key = _load_verifying_key(did, backend)
 
             # Hash the payload
             payload_hash = DIDSigner._hash_payload(payload)
@@ -204,14 +233,10 @@ class DIDSigner:
             signature_bytes = bytes.fromhex(signature_hex)
 
             # Verify signature
-            verifying_key.verify_digest(
-                signature_bytes,
-                payload_hash,
-                sigdecode=sigdecode_string
+            return _verify_digest(
+                verifying_key, signature_bytes, payload_hash, backend
             )
 
-            return True
-
         except (ValueError, BadSignatureError):
             # Invalid signature or malformed data
             return False
@@ -220,6 +245,45 @@ class DIDSigner:
             # Any other error (malformed hex, etc.)
             return False
 
+    @staticmethod
+    def verify_many(
+        items: Iterable[SignedItem],
+        executor: Optional[Executor] = None,
+        chunk_size: int = VERIFY_CHUNK_SIZE,
+    ) -> List[bool]:
+        """
+        Verify a batch of signatures.
+
+        Each item is checked exactly like ``verify_signature``, except that
+        an invalid DID format yields False for that item instead of raising,
+        so one bad entry cannot abort the batch.
+
+        Args:
+            items: (payload, signature_hex, did) tuples
+            executor: Optional thread or process pool to spread the work
+                over; verification runs inline when omitted
+            chunk_size: Items per submitted task when using an executor
+
+        Returns:
+            One boolean per item, in input order
+        """
+        batch = list(items)
+        if executor is None or len(batch) <= chunk_size:
+            return _verify_chunk(batch)
+
+        chunks = [
+            batch[i:i + chunk_size] for i in range(0, len(batch), chunk_size)
+        ]
+        results: List[bool] = []
+        for chunk_result in executor.map(_verify_chunk, chunks):
+            results.extend(chunk_result)
+        return results
+
+    @staticmethod
+    def clear_verifying_key_cache() -> None:
+        """Drop all cached verifying keys."""
+        _load_verifying_key.cache_clear()
+
     @staticmethod
     def _validate_did_format(did: str) -> bool:
         """
@@ -369,3 +433,64 @@ class DIDSigner:
 
         # Use constant-time comparison
         return hmac.compare_digest(signature1, signature2)
+
+
+@lru_cache(maxsize=VERIFYING_KEY_CACHE_SIZE)
+def _load_verifying_key(did: str, backend: str) -> Any:
+    """
+    Resolve a DID and parse its public key for the given backend.
+
+    Cached per (DID, backend). Resolution failures raise and are not cached.
+    """
+    public_key_bytes = bytes.fromhex(DIDSigner.resolve_did(did))
+    if backend == "cryptography":
+        return ec.EllipticCurvePublicKey.from_encoded_point(
+            ec.SECP256K1(), b"\x04" + public_key_bytes
+        )
+    return VerifyingKey.from_string(public_key_bytes, curve=SECP256k1)
+
+
+def _verify_digest(
+    verifying_key: Any,
+    signature_bytes: bytes,
+    payload_hash: bytes,
+    backend: str,
+) -> bool:
+    """
+    Check a raw r||s signature over a SHA256 digest.
+
+    Raises:
+        BadSignatureError / ValueError: ecdsa backend rejects the signature
+    """
+    if backend == "cryptography":
+        if len(signature_bytes) != 64:
+            return False
+        r = int.from_bytes(signature_bytes[:32], "big")
+        s = int.from_bytes(signature_bytes[32:], "big")
+        try:
+            verifying_key.verify(
+                encode_dss_signature(r, s),
+                payload_hash,
+                ec.ECDSA(Prehashed(hashes.SHA256())),
+            )
+        except InvalidSignature:
+            return False
+        return True
+
+    verifying_key.verify_digest(
+        signature_bytes,
+        payload_hash,
+        sigdecode=sigdecode_string
+    )
+    return True
+
+
+def _verify_chunk(items: Sequence[SignedItem]) -> List[bool]:
+    """Verify a list of items (module-level so process pools can pickle it)."""
+    results = []
+    for payload, signature_hex, did in items:
+        try:
+            results.append(DIDSigner.verify_signature(payload, signature_hex, did))
+        except (InvalidDIDError, TypeError):
+            results.append(False)
+    return results
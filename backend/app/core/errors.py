@@ -880,6 +880,29 @@ class RateLimitExceededError(APIError):
         self.retry_after_seconds = retry_after_seconds
 
 
+class PayloadTooLargeError(APIError):
+    """
+    Raised when a request body exceeds the configured size cap.
+
+    Checked against Content-Length and while buffering, before any
+    JSON parsing happens.
+
+    Returns:
+        - HTTP 413 (Content Too Large)
+        - error_code: PAYLOAD_TOO_LARGE
+        - detail: Message with the size limit
+    """
+
+    def __init__(self, max_bytes: int):
+        detail = f"Request body exceeds the maximum size of {max_bytes} bytes."
+        super().__init__(
+            status_code=413,
+            error_code="PAYLOAD_TOO_LARGE",
+            detail=detail,
+        )
+        self.max_bytes = max_bytes
+
+
 def format_error_response(error_code: str, detail: str) -> Dict[str, str]:
     """
     Format error response per DX Contract.
@@ -34,6 +34,7 @@ from app.crew.tasks import (
     create_transaction_task,
     Task
 )
+from app.crew.task_graph import TaskGraph
 from app.services.agent_memory_service import get_agent_memory_service
 from app.services.x402_service import x402_service
 from app.services.compliance_service import compliance_service
@@ -166,7 +167,9 @@ class X402Crew:
         self,
         project_id: str,
         run_id: Optional[str] = None,
-        use_llm: bool = False
+        use_llm: bool = False,
+        stage_timeout: Optional[float] = None,
+        write_buffer=None
     ):
         """
         Initialize X402 crew with project and run identifiers.
@@ -176,10 +179,15 @@ class X402Crew:
             run_id: Optional run identifier (generated if not provided)
             use_llm: Whether to use Gemini LLM for real decision-making
                      (default: False for backward compatibility)
+            stage_timeout: Optional per-stage timeout in seconds
+            write_buffer: Optional CrewWriteBuffer; when set, memory writes
+                and compliance events are buffered instead of awaited
         """
         self.project_id = project_id
         self.run_id = run_id or self._generate_run_id()
         self.use_llm = use_llm
+        self.stage_timeout = stage_timeout
+        self.write_buffer = write_buffer
         self._gemini_service = None
 
         # Create the 3 agent personas
@@ -316,17 +324,20 @@ class X402Crew:
         Returns:
             Memory record with memory_id
         """
-        memory_service = get_agent_memory_service()
+        entry = {
+            "project_id": self.project_id,
+            "agent_id": agent_id,
+            "run_id": self.run_id,
+            "memory_type": memory_type,
+            "content": content,
+            "namespace": "x402_workflow",
+            "metadata": metadata or {}
+        }
 
-        memory = await memory_service.store_memory(
-            project_id=self.project_id,
-            agent_id=agent_id,
-            run_id=self.run_id,
-            memory_type=memory_type,
-            content=content,
-            namespace="x402_workflow",
-            metadata=metadata or {}
-        )
+        if self.write_buffer is not None:
+            memory = await self.write_buffer.store_memory(**entry)
+        else:
+            memory = await get_agent_memory_service().store_memory(**entry)
 
         logger.info(
             f"Stored {memory_type} for {agent_id}",
@@ -511,7 +522,7 @@ Respond with valid JSON.
 
         compliance_output["memory_id"] = memory.get("memory_id")
 
-        # Create compliance event
+        # Create compliance event (its details carry the memory_id)
         event_data = ComplianceEventCreate(
             agent_id=self.agent_ids["compliance"],
             event_type=ComplianceEventType.KYC_CHECK,
@@ -521,10 +532,16 @@ Respond with valid JSON.
             run_id=self.run_id
         )
 
-        compliance_event = await compliance_service.create_event(
-            project_id=self.project_id,
-            event_data=event_data
-        )
+        if self.write_buffer is not None:
+            compliance_event = await self.write_buffer.create_event(
+                project_id=self.project_id,
+                event_data=event_data
+            )
+        else:
+            compliance_event = await compliance_service.create_event(
+                project_id=self.project_id,
+                event_data=event_data
+            )
 
         compliance_output["event_id"] = compliance_event.event_id if hasattr(compliance_event, 'event_id') else compliance_event.get("event_id")
 
@@ -834,6 +851,44 @@ Respond with valid JSON.
             logger.error(f"Gemini transaction guidance failed: {e}")
             return None
 
+    def build_task_graph(self, input_data: Dict[str, Any]) -> TaskGraph:
+        """
+        Build the stage graph for one workflow run.
+
+        Analyst -> Compliance -> Transaction is a true data dependency
+        chain; concurrency inside a stage (e.g. the compliance memory write
+        and compliance event) is handled by the stage itself.
+
+        Args:
+            input_data: Input data including query
+
+        Returns:
+            TaskGraph with analyst, compliance and transaction stages
+        """
+        graph = TaskGraph()
+        graph.add_stage(
+            "analyst",
+            lambda deps: self._execute_analyst_task(query=input_data.get("query", "")),
+            timeout=self.stage_timeout
+        )
+        graph.add_stage(
+            "compliance",
+            lambda deps: self._execute_compliance_task(analyst_output=deps["analyst"]),
+            depends_on=("analyst",),
+            timeout=self.stage_timeout
+        )
+        graph.add_stage(
+            "transaction",
+            lambda deps: self._execute_transaction_task(
+                compliance_output=deps["compliance"],
+                analyst_output=deps["analyst"],
+                input_data=input_data
+            ),
+            depends_on=("analyst", "compliance"),
+            timeout=self.stage_timeout
+        )
+        return graph
+
     async def kickoff(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute the complete 3-agent workflow.
@@ -842,30 +897,20 @@ Respond with valid JSON.
             input_data: Input data including query
 
         Returns:
-            Final result with request_id and all outputs
+            Final result with request_id, all outputs and per-stage timings
         """
         logger.info(
             f"Starting X402 crew workflow for project {self.project_id}",
             extra={"run_id": self.run_id, "input_data": input_data}
         )
 
-        try:
-            # Step 1: Analyst - Market data aggregation
-            analyst_output = await self._execute_analyst_task(
-                query=input_data.get("query", "")
-            )
-
-            # Step 2: Compliance - AML/KYC checks
-            compliance_output = await self._execute_compliance_task(
-                analyst_output=analyst_output
-            )
+        graph = self.build_task_graph(input_data)
 
-            # Step 3: Transaction - X402 submission
-            transaction_output = await self._execute_transaction_task(
-                compliance_output=compliance_output,
-                analyst_output=analyst_output,
-                input_data=input_data
-            )
+        try:
+            outputs = await graph.run()
+            analyst_output = outputs["analyst"]
+            compliance_output = outputs["compliance"]
+            transaction_output = outputs["transaction"]
 
             # Build final result
             result = {
@@ -880,14 +925,16 @@ Respond with valid JSON.
                     compliance_output.get("memory_id"),
                     transaction_output.get("memory_id")
                 ],
-                "compliance_event_id": compliance_output.get("event_id")
+                "compliance_event_id": compliance_output.get("event_id"),
+                "stage_timings": graph.timings
             }
 
             logger.info(
                 f"X402 crew workflow completed successfully",
                 extra={
                     "run_id": self.run_id,
-                    "request_id": transaction_output.get("request_id")
+                    "request_id": transaction_output.get("request_id"),
+                    "total_ms": graph.total_ms
                 }
             )
 
@@ -896,6 +943,10 @@ Respond with valid JSON.
         except Exception as e:
             logger.error(
                 f"X402 crew workflow failed: {e}",
-                extra={"run_id": self.run_id, "error": str(e)}
+                extra={
+                    "run_id": self.run_id,
+                    "error": str(e),
+                    "stage_timings": graph.timings
+                }
             )
             raise
@@ -0,0 +1,256 @@
+"""
+TaskGraph: dependency-driven concurrent stage execution for crew workflows.
+
+Stages declare the stages they depend on. Each stage starts as soon as all
+of its dependencies have finished, so independent work (memory context
+loading, audit writes, ...) overlaps and end-to-end latency is bounded by
+the critical path rather than the sum of all stages.
+
+Features:
+- Per-stage timeout (asyncio.wait_for) and retry with a fixed delay
+- Optional stages: a failure is logged and its result is None, dependents
+  still run
+- Per-stage timings (start offset, duration, attempts, status) recorded for
+  every run, including failed ones
+- Graph is validated before execution (unknown dependencies, cycles)
+
+Usage:
+    graph = TaskGraph()
+    graph.add_stage("context", lambda deps: load_context())
+    graph.add_stage("audit", lambda deps: record_audit(), required=False)
+    graph.add_stage("crew", lambda deps: crew.kickoff(deps["context"]),
+                    depends_on=("context",), timeout=30.0, retries=2)
+    results = await graph.run()
+    graph.timings["crew"]["duration_ms"]
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+StageFunc = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+
+class TaskGraphError(ValueError):
+    """Raised when a graph is malformed (unknown dependency or cycle)."""
+
+
+@dataclass
+class Stage:
+    """
+    A unit of work in a TaskGraph.
+
+    Fields:
+    - name: Unique stage name; results are keyed by it
+    - func: Coroutine function called with {dependency name: result}
+    - depends_on: Names of stages that must finish first
+    - timeout: Seconds allowed per attempt (None = no limit)
+    - retries: Additional attempts after the first failure
+    - retry_delay: Seconds to wait between attempts
+    - required: If False, a failure yields None instead of failing the graph
+    """
+
+    name: str
+    func: StageFunc
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    retries: int = 0
+    retry_delay: float = 0.0
+    required: bool = True
+
+
+class TaskGraph:
+    """
+    Runs a DAG of async stages with maximal concurrency.
+
+    A required stage that still fails after its retries cancels the stages
+    that are in flight and its exception is re-raised from run(); timings
+    collected so far remain available on ``timings``. Optional stages that
+    have already started (e.g. audit writes) are allowed to finish first.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, Stage] = {}
+        self.timings: Dict[str, Dict[str, Any]] = {}
+        self.total_ms: Optional[float] = None
+
+    def add_stage(
+        self,
+        name: str,
+        func: StageFunc,
+        depends_on: Tuple[str, ...] = (),
+        timeout: Optional[float] = None,
+        retries: int = 0,
+        retry_delay: float = 0.0,
+        required: bool = True
+    ) -> "TaskGraph":
+        """
+        Add a stage to the graph.
+
+        Returns:
+            The graph, so calls can be chained
+        """
+        if name in self._stages:
+            raise TaskGraphError(f"Duplicate stage: {name}")
+        self._stages[name] = Stage(
+            name=name,
+            func=func,
+            depends_on=tuple(depends_on),
+            timeout=timeout,
+            retries=max(0, retries),
+            retry_delay=retry_delay,
+            required=required
+        )
+        return self
+
+    def execution_order(self) -> List[str]:
+        """
+        Topologically sort the stages (Kahn's algorithm).
+
+        Returns:
+            Stage names, every stage after its dependencies
+
+        Raises:
+            TaskGraphError: On an unknown dependency or a cycle
+        """
+        remaining = {}
+        dependents: Dict[str, List[str]] = {name: [] for name in self._stages}
+        for stage in self._stages.values():
+            for dep in stage.depends_on:
+                if dep not in self._stages:
+                    raise TaskGraphError(
+                        f"Stage '{stage.name}' depends on unknown stage '{dep}'"
+                    )
+                dependents[dep].append(stage.name)
+            remaining[stage.name] = len(stage.depends_on)
+
+        ready = [name for name, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for child in dependents[name]:
+                remaining[child] -= 1
+                if remaining[child] == 0:
+                    ready.append(child)
+
+        if len(order) != len(self._stages):
+            cyclic = sorted(set(self._stages) - set(order))
+            raise TaskGraphError(f"Cycle between stages: {', '.join(cyclic)}")
+        return order
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Execute all stages.
+
+        Returns:
+            {stage name: result}
+
+        Raises:
+            TaskGraphError: If the graph is malformed
+            Exception: The error of the first required stage that failed
+        """
+        order = self.execution_order()
+        self.timings = {}
+        started = time.perf_counter()
+
+        tasks: Dict[str, asyncio.Task] = {}
+        for name in order:
+            tasks[name] = asyncio.create_task(
+                self._run_stage(self._stages[name], tasks, started),
+                name=f"stage:{name}"
+            )
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException as e:
+            # On a stage failure, let optional stages already under way
+            # finish; on outside cancellation, stop everything
+            spare_started = isinstance(e, Exception)
+            for name, task in tasks.items():
+                if spare_started and self._is_running_optional(name):
+                    continue
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            self.total_ms = (time.perf_counter() - started) * 1000
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    def _is_running_optional(self, name: str) -> bool:
+        timing = self.timings.get(name)
+        return (
+            not self._stages[name].required
+            and timing is not None
+            and timing["status"] == "running"
+        )
+
+    async def _run_stage(
+        self,
+        stage: Stage,
+        tasks: Dict[str, asyncio.Task],
+        started: float
+    ) -> Any:
+        deps = {}
+        for dep in stage.depends_on:
+            deps[dep] = await tasks[dep]
+
+        timing = {
+            "start_ms": (time.perf_counter() - started) * 1000,
+            "duration_ms": 0.0,
+            "attempts": 0,
+            "status": "running",
+        }
+        self.timings[stage.name] = timing
+        stage_start = time.perf_counter()
+
+        try:
+            result = await self._attempt(stage, deps, timing)
+            timing["status"] = "completed"
+            return result
+        except asyncio.CancelledError:
+            timing["status"] = "cancelled"
+            raise
+        except Exception as e:
+            timing["status"] = "failed"
+            timing["error"] = str(e) or type(e).__name__
+            if stage.required:
+                raise
+            logger.warning(
+                f"Optional stage '{stage.name}' failed: {e}",
+                extra={"stage": stage.name, "attempts": timing["attempts"]}
+            )
+            return None
+        finally:
+            timing["duration_ms"] = (time.perf_counter() - stage_start) * 1000
+
+    async def _attempt(
+        self,
+        stage: Stage,
+        deps: Dict[str, Any],
+        timing: Dict[str, Any]
+    ) -> Any:
+        """Call the stage, retrying up to ``stage.retries`` times."""
+        while True:
+            timing["attempts"] += 1
+            try:
+                if stage.timeout is None:
+                    return await stage.func(deps)
+                return await asyncio.wait_for(stage.func(deps), timeout=stage.timeout)
+            except Exception as e:
+                if timing["attempts"] > stage.retries:
+                    raise
+                logger.warning(
+                    f"Stage '{stage.name}' attempt {timing['attempts']} failed: {e}",
+                    extra={
+                        "stage": stage.name,
+                        "attempt": timing["attempts"],
+                        "max_attempts": stage.retries + 1
+                    }
+                )
+                if stage.retry_delay > 0:
+                    await asyncio.sleep(stage.retry_delay)
@@ -26,7 +26,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError, HTTPException
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.core.config import settings
-from app.core.errors import APIError, format_error_response
+from app.core.errors import APIError, PayloadTooLargeError, format_error_response
 from app.core.exceptions import ZeroDBException
 from app.schemas.x402_protocol import X402ProtocolRequest, X402ProtocolResponse
 from app.core.did_signer import DIDSigner, InvalidDIDError
@@ -157,7 +157,7 @@ try:
     from app.api.hedera_audit import router as hedera_audit_router
 except ImportError:
     hedera_audit_router = None
-from app.middleware import APIKeyAuthMiddleware, ImmutableMiddleware
+from app.middleware import APIKeyAuthMiddleware, ImmutableMiddleware, read_json
 # Refs #285, #300: Workshop-mode path rewriter for flat /api/v1/* prefix
 from app.middleware.workshop_prefix import WorkshopPrefixMiddleware
 
@@ -213,6 +213,67 @@ app.add_middleware(
 )
 
 
+# Issue #242: warm the in-memory nonce window and start batched nonce
+# persistence; flush whatever is still queued on shutdown. NonceMiddleware
+# is the guard's only user, so nothing runs unless it is mounted.
+def _nonce_middleware_mounted() -> bool:
+    from app.middleware.nonce_middleware import NonceMiddleware
+    return any(m.cls is NonceMiddleware for m in app.user_middleware)
+
+
+@app.on_event("startup")
+async def start_nonce_replay_guard():
+    """Warm the nonce replay guard from ZeroDB."""
+    if not _nonce_middleware_mounted():
+        return
+    from app.services.nonce_replay_guard import get_nonce_replay_guard
+    await get_nonce_replay_guard().start()
+
+
+@app.on_event("shutdown")
+async def stop_nonce_replay_guard():
+    """Flush pending nonces to ZeroDB."""
+    if not _nonce_middleware_mounted():
+        return
+    from app.services.nonce_replay_guard import get_nonce_replay_guard
+    await get_nonce_replay_guard().stop()
+
+
+@app.on_event("startup")
+async def start_billing_metering():
+    """Start batched usage-event persistence and rollup reconciliation."""
+    if billing_router is None:
+        return
+    from app.services.billing_service import billing_service
+    await billing_service.start()
+
+
+@app.on_event("shutdown")
+async def stop_billing_metering():
+    """Flush buffered usage events to ZeroDB."""
+    if billing_router is None:
+        return
+    from app.services.billing_service import billing_service
+    await billing_service.stop()
+
+
+@app.on_event("shutdown")
+async def stop_plugin_sandbox_workers():
+    """Stop plugin sandbox worker processes, if any were started."""
+    if plugins_router is None:
+        return
+    from app.api import plugins
+    if plugins._sandbox_service is not None:
+        await plugins._sandbox_service.close()
+
+
+@app.on_event("shutdown")
+async def close_ainative_auth_client():
+    """Close the pooled AINative auth HTTP client."""
+    from app.core.ainative_auth import close_http_client
+    await close_http_client()
+
+
 # Exception handlers - implement DX Contract error format
 # Handlers are registered in order of specificity (most specific first)
 
@@ -442,10 +503,12 @@ async def x402_signed_request(request: Request):
         - All requests logged for audit trail
         - Rate limiting TODO (max 100 req/min per DID)
     """
-    # Parse and validate request body
+    # Parse and validate request body (shared with the middleware layers)
     try:
-        body = await request.json()
+        body = await read_json(request)
         x402_request = X402ProtocolRequest(**body)
+    except PayloadTooLargeError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
@@ -2,9 +2,16 @@
 Middleware package for FastAPI application.
 
 Provides:
+- ASGIMiddleware / RequestContext: Pure ASGI base with shared per-request parsing
 - APIKeyAuthMiddleware: Authentication for public API endpoints
 - ImmutableMiddleware: Append-only enforcement for agent tables (Epic 12, Issue 6)
 """
+from app.middleware.asgi import (
+    ASGIMiddleware,
+    RequestContext,
+    get_request_context,
+    read_json,
+)
 from app.middleware.api_key_auth import APIKeyAuthMiddleware
 from app.middleware.immutable import (
     ImmutableMiddleware,
@@ -20,6 +27,11 @@ from app.middleware.immutable import (
 )
 
 __all__ = [
+    # Pure ASGI base and shared request context
+    "ASGIMiddleware",
+    "RequestContext",
+    "get_request_context",
+    "read_json",
     # Authentication middleware
     "APIKeyAuthMiddleware",
     # Immutable record middleware and utilities (Epic 12, Issue 6)
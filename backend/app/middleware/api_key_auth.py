@@ -14,10 +14,9 @@ This middleware:
 4. Attaches user_id to request state for downstream use
 5. Allows health check, docs, and login endpoints to pass through
 """
-from typing import Callable, Optional
+from typing import Optional
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.config import settings
 from app.core.errors import format_error_response
 from app.core.jwt import (
@@ -27,12 +26,13 @@ from app.core.jwt import (
     InvalidJWTError
 )
 from app.core.ainative_auth import validate_ainative_token
+from app.middleware.asgi import ASGIMiddleware
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-class APIKeyAuthMiddleware(BaseHTTPMiddleware):
+class APIKeyAuthMiddleware(ASGIMiddleware):
     """
     Middleware to enforce authentication on all public endpoints.
 
@@ -70,31 +70,28 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
     # Prefix for public API endpoints that require authentication
     PUBLIC_API_PREFIX = "/v1/public/"
 
-    async def dispatch(
-        self, request: Request, call_next: Callable
-    ) -> Response:
+    async def before_request(self, request: Request) -> Optional[Response]:
         """
-        Intercept and validate authentication for public endpoints.
+        Validate authentication for public endpoints.
 
         Supports both X-API-Key and JWT Bearer token authentication.
         Per Epic 2 Story 4: JWT should be usable as alternative to X-API-Key.
 
         Args:
             request: The incoming HTTP request
-            call_next: The next middleware or route handler
 
         Returns:
-            Response: Either a 401 error or the result of call_next
+            Optional[Response]: A 401 error, or None to continue
         """
         path = request.url.path
 
         # Skip authentication for exempt paths
         if path in self.EXEMPT_PATHS:
-            return await call_next(request)
+            return None
 
         # Only authenticate public API endpoints
         if not path.startswith(self.PUBLIC_API_PREFIX):
-            return await call_next(request)
+            return None
 
         # Try to authenticate using either X-API-Key or JWT
         user_id = await self._authenticate_request(request, path)
@@ -131,7 +128,7 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
         )
 
         # Continue to route handler
-        return await call_next(request)
+        return None
 
     async def _authenticate_request(
         self, request: Request, path: str
@@ -0,0 +1,280 @@
+"""
+Pure ASGI middleware base and shared request context.
+
+Starlette's ``BaseHTTPMiddleware`` runs every layer's downstream call in a
+separate task and re-wraps the response body stream, which costs latency
+per layer and breaks streaming responses. Middleware in this package
+instead subclass ``ASGIMiddleware``: a layer inspects the request in
+``before_request`` and either returns a short-circuit ``Response`` or
+``None`` to pass the untouched ``send`` channel downstream.
+
+All layers share one ``RequestContext`` per request, stored in the ASGI
+scope, so path classification, the Starlette ``Request`` wrapper, the
+request body and its JSON decoding are done once for the whole chain.
+The body is only buffered when a layer asks for it (x402 POSTs); it is
+replayed to the route handler through the context's ``receive``, and
+handlers read the already-decoded JSON with ``read_json``.
+
+Bodies are capped at ``settings.max_request_body_bytes``: the
+Content-Length header is checked before reading and the running total
+while buffering, so oversized payloads are rejected with 413 before any
+parsing. JSON is decoded with orjson when it is installed. orjson reads
+integers beyond 64 bits as floats, which would change signed payloads
+(e.g. wei amounts) on re-serialisation, so bodies with 19 or more
+consecutive digits are decoded with the stdlib parser instead.
+
+Built by AINative Dev Team
+"""
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Awaitable, Callable, MutableMapping, Optional
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.core.config import settings
+from app.core.errors import PayloadTooLargeError, format_error_response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# A digit run this long may be an integer orjson cannot hold exactly
+_LONG_DIGIT_RUN = re.compile(rb"\d{19,}")
+
+
+def _json_loads(body: bytes) -> Any:
+    if orjson is None or _LONG_DIGIT_RUN.search(body):
+        return json.loads(body)
+    return orjson.loads(body)
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+# Scope key under which the shared RequestContext is stored
+REQUEST_CONTEXT_KEY = "agent402.request_context"
+
+# Paths that accept signed x402 protocol POSTs
+X402_PATHS = frozenset({"/x402"})
+
+_NO_BODY = object()
+
+
+class RequestContext:
+    """
+    Per-request state shared by every middleware layer and the route handler.
+
+    Attributes:
+        scope: The ASGI scope this context was built for.
+        path: Request path (after any workshop-mode rewrite).
+        method: Upper-cased HTTP method.
+        is_x402_post: True for POSTs to a signed x402 endpoint.
+        max_body_bytes: Body size cap enforced by ``body()``.
+    """
+
+    __slots__ = (
+        "scope",
+        "path",
+        "method",
+        "is_x402_post",
+        "max_body_bytes",
+        "_receive",
+        "_body",
+        "_body_replayed",
+        "_json",
+        "_request",
+    )
+
+    def __init__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        max_body_bytes: Optional[int] = None,
+    ) -> None:
+        self.scope = scope
+        self.path: str = scope.get("path", "")
+        self.method: str = scope.get("method", "GET").upper()
+        self.is_x402_post = self.method == "POST" and self.path in X402_PATHS
+        self.max_body_bytes = (
+            settings.max_request_body_bytes if max_body_bytes is None else max_body_bytes
+        )
+        self._receive = receive
+        self._body: Optional[bytes] = None
+        self._body_replayed = False
+        self._json: Any = _NO_BODY
+        self._request: Optional[ContextRequest] = None
+
+    @property
+    def request(self) -> "ContextRequest":
+        """A Starlette Request shared by all layers (lazy)."""
+        if self._request is None:
+            self._request = ContextRequest(self)
+        return self._request
+
+    def declared_length(self) -> Optional[int]:
+        """Content-Length header value, or None if absent or malformed."""
+        for name, value in self.scope.get("headers", ()):
+            if name == b"content-length":
+                try:
+                    return int(value)
+                except ValueError:
+                    return None
+        return None
+
+    async def body(self) -> bytes:
+        """
+        Read and buffer the full request body (once per request).
+
+        Raises:
+            PayloadTooLargeError: Declared or received size exceeds the cap.
+        """
+        if self._body is None:
+            limit = self.max_body_bytes
+            declared = self.declared_length()
+            if declared is not None and declared > limit:
+                raise PayloadTooLargeError(limit)
+
+            chunks = []
+            received = 0
+            while True:
+                message = await self._receive()
+                if message["type"] != "http.request":
+                    break
+                chunk = message.get("body", b"")
+                received += len(chunk)
+                if received > limit:
+                    raise PayloadTooLargeError(limit)
+                chunks.append(chunk)
+                if not message.get("more_body", False):
+                    break
+            self._body = b"".join(chunks)
+        return self._body
+
+    async def json(self) -> Any:
+        """Decode the request body as JSON (once per request)."""
+        if self._json is _NO_BODY:
+            self._json = _json_loads(await self.body())
+        return self._json
+
+    async def receive(self) -> Message:
+        """
+        ASGI ``receive`` for downstream apps.
+
+        Replays the buffered body once if a layer consumed it, otherwise
+        defers to the server's ``receive``.
+        """
+        if self._body is not None and not self._body_replayed:
+            self._body_replayed = True
+            return {"type": "http.request", "body": self._body, "more_body": False}
+        return await self._receive()
+
+
+class ContextRequest(Request):
+    """Starlette Request whose body/json reads go through the RequestContext."""
+
+    def __init__(self, context: RequestContext) -> None:
+        super().__init__(context.scope, context.receive)
+        self.context = context
+
+    async def body(self) -> bytes:
+        return await self.context.body()
+
+    async def json(self) -> Any:
+        return await self.context.json()
+
+
+def get_request_context(scope: Scope, receive: Receive) -> RequestContext:
+    """
+    Return the RequestContext for ``scope``, creating it on first use.
+
+    If an outer layer replaced the scope (e.g. a path rewrite) the context
+    is rebuilt for the new scope, keeping any body already buffered.
+    """
+    context = scope.get(REQUEST_CONTEXT_KEY)
+    if context is not None and context.scope is scope:
+        return context
+
+    new_context = RequestContext(scope, receive)
+    if context is not None and context._body is not None:
+        new_context._body = context._body
+        new_context._json = context._json
+        new_context._receive = context._receive
+    scope[REQUEST_CONTEXT_KEY] = new_context
+    return new_context
+
+
+async def read_json(request: Request) -> Any:
+    """
+    Return the request's JSON body from the shared request context.
+
+    Route handlers use this instead of ``await request.json()`` so a body
+    already decoded by a middleware layer is not read or parsed again.
+
+    Raises:
+        PayloadTooLargeError: Body exceeds ``settings.max_request_body_bytes``.
+        ValueError: Body is not valid JSON.
+    """
+    return await get_request_context(request.scope, request.receive).json()
+
+
+class ASGIMiddleware:
+    """
+    Base class for the app's pure ASGI middleware.
+
+    Subclasses implement ``before_request``. Non-HTTP scopes (lifespan,
+    websocket) pass straight through.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        context = get_request_context(scope, receive)
+        try:
+            response = await self.before_request(context.request)
+        except PayloadTooLargeError as exc:
+            response = JSONResponse(
+                status_code=exc.status_code,
+                content=format_error_response(
+                    error_code=exc.error_code,
+                    detail=exc.detail,
+                ),
+            )
+        if response is not None:
+            await response(scope, context.receive, send)
+            return
+        await self.app(scope, context.receive, send)
+
+    async def before_request(self, request: Request) -> Optional[Response]:
+        """
+        Inspect the request before it reaches the next layer.
+
+        Returns:
+            A Response to short-circuit the chain, or None to continue.
+        """
+        return None
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        ``BaseHTTPMiddleware``-style entry point for driving a layer directly.
+
+        Args:
+            request: Incoming request.
+            call_next: Coroutine producing the downstream response.
+
+        Returns:
+            The short-circuit response, or the result of ``call_next``.
+        """
+        response = await self.before_request(request)
+        if response is not None:
+            return response
+        return await call_next(request)
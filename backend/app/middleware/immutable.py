@@ -27,8 +27,8 @@ from typing import Callable, Set, List, Optional, Dict, Any
 from functools import wraps
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.errors import APIError, format_error_response
+from app.middleware.asgi import ASGIMiddleware
 import logging
 
 logger = logging.getLogger(__name__)
@@ -277,7 +277,7 @@ def add_immutable_metadata(response_data: Dict[str, Any], table_name: str) -> Di
     return response_data
 
 
-class ImmutableMiddleware(BaseHTTPMiddleware):
+class ImmutableMiddleware(ASGIMiddleware):
     """
     Middleware to enforce append-only semantics at the HTTP route level.
 
@@ -321,16 +321,15 @@ class ImmutableMiddleware(BaseHTTPMiddleware):
         "/projects/",  # Project agent associations (e.g., /projects/xyz/agents/did:...)
     ]
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def before_request(self, request: Request) -> Optional[Response]:
         """
-        Intercept and validate requests to immutable table endpoints.
+        Validate requests to immutable table endpoints.
 
         Args:
             request: The incoming HTTP request
-            call_next: The next middleware or route handler
 
         Returns:
-            Response: Either a 403 error or the result of call_next
+            Optional[Response]: A 403 error, or None to continue
         """
         path = request.url.path.lower()
         method = request.method.upper()
@@ -339,7 +338,7 @@ class ImmutableMiddleware(BaseHTTPMiddleware):
         # Project agent associations are not the agents table
         for allowed in self.ALLOWED_PATH_PATTERNS:
             if allowed in path:
-                return await call_next(request)
+                return None
 
         # Check if this is a mutating request to an immutable table
         if method in MUTATING_METHODS:
@@ -379,7 +378,7 @@ class ImmutableMiddleware(BaseHTTPMiddleware):
                     )
 
         # Continue to route handler for allowed operations
-        return await call_next(request)
+        return None
 
 
 # Convenience decorator for route handlers
@@ -15,19 +15,21 @@ Refs #242
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Optional
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.core.errors import PayloadTooLargeError
+from app.middleware.asgi import X402_PATHS, ASGIMiddleware
 
 logger = logging.getLogger(__name__)
 
 # Paths that require nonce validation (POST only)
-_NONCE_PROTECTED_PATHS = frozenset({"/x402"})
+_NONCE_PROTECTED_PATHS = X402_PATHS
 
 
-class NonceMiddleware(BaseHTTPMiddleware):
+class NonceMiddleware(ASGIMiddleware):
     """
     Middleware that enforces nonce-based replay prevention on x402 POST requests.
 
@@ -62,31 +64,37 @@ class NonceMiddleware(BaseHTTPMiddleware):
             self._guard = get_nonce_replay_guard()
         return self._guard
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def before_request(self, request: Request) -> Optional[Response]:
         """
-        Intercept requests, validate nonces on protected POST paths.
+        Validate nonces on protected POST paths.
+
+        The JSON body comes from the shared request context, so it is not
+        re-read when the rate limiter has already parsed it.
 
         Args:
             request: Incoming HTTP request.
-            call_next: Next middleware or route handler.
 
         Returns:
             - 409 JSONResponse on replay attack.
             - 400 JSONResponse on stale/invalid nonce.
-            - Downstream response on success or when nonce validation is skipped.
+            - None on success or when nonce validation is skipped.
         """
         path = request.url.path
         method = request.method.upper()
 
         # Only POST requests to protected paths are nonce-checked
         if path not in _NONCE_PROTECTED_PATHS or method != "POST":
-            return await call_next(request)
+            return None
 
         # Parse JSON body — non-fatal if body is malformed
         try:
             body = await request.json()
+        except PayloadTooLargeError:
+            raise
         except Exception:
             body = {}
+        if not isinstance(body, dict):
+            body = {}
 
         nonce = body.get("nonce")
         timestamp = body.get("timestamp")
@@ -94,7 +102,7 @@ class NonceMiddleware(BaseHTTPMiddleware):
 
         # If no nonce present, bypass validation gracefully
         if not nonce:
-            return await call_next(request)
+            return None
 
         # Validate — catch known guard errors
         from app.services.nonce_replay_guard import (
@@ -143,4 +151,4 @@ class NonceMiddleware(BaseHTTPMiddleware):
             # Non-fatal: log and continue — request already validated
             logger.error(f"Failed to record nonce for DID '{did}': {exc}")
 
-        return await call_next(request)
+        return None
@@ -19,13 +19,17 @@ Refs #239, #241
 from __future__ import annotations
 
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Optional
 
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.core.errors import RateLimitExceededError, format_error_response
+from app.core.errors import (
+    PayloadTooLargeError,
+    RateLimitExceededError,
+    format_error_response,
+)
+from app.middleware.asgi import X402_PATHS, ASGIMiddleware
 from app.services.rate_limiter_service import RateLimiterService
 
 logger = logging.getLogger(__name__)
@@ -76,7 +80,7 @@ _EXEMPT_PATHS = frozenset(
 )
 
 
-class RateLimiterMiddleware(BaseHTTPMiddleware):
+class RateLimiterMiddleware(ASGIMiddleware):
     """
     Middleware that enforces per-DID sliding-window rate limits.
 
@@ -104,9 +108,9 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
         self._max_requests = max_requests
         self._window_seconds = window_seconds
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def before_request(self, request: Request) -> Optional[Response]:
         """
-        Intercept the request, extract the DID, and apply rate limiting.
+        Extract the DID and apply rate limiting.
 
         Uses the three-source DID resolution priority:
         1. x402 POST body 'did' field.
@@ -115,22 +119,21 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
 
         Args:
             request: Incoming HTTP request.
-            call_next: Next middleware or route handler.
 
         Returns:
-            429 JSONResponse on limit exceeded, otherwise the downstream response.
+            429 JSONResponse on limit exceeded, otherwise None to continue.
         """
         path = request.url.path
 
         # Exempt paths bypass rate limiting
         if path in _EXEMPT_PATHS:
-            return await call_next(request)
+            return None
 
         did = await self._resolve_did(request)
 
         if did is None:
             # No DID available — pass through; auth middleware handles identity
-            return await call_next(request)
+            return None
 
         try:
             await self._rate_limiter.check_rate_limit(
@@ -166,7 +169,7 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
                 headers={"Retry-After": str(exc.retry_after_seconds)},
             )
 
-        return await call_next(request)
+        return None
 
     async def _resolve_did(self, request: Request) -> Optional[str]:
         """
@@ -207,22 +210,32 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
         Extract the DID from the ``did`` field of an x402 POST JSON body.
 
         Issue #241: parse the signed x402 POST body for the DID field.
-        Only applicable to POST requests; non-POST methods return None.
+        Only applicable to POST requests to an x402 endpoint; other requests
+        return None without their body being read. The parsed body is shared
+        with the nonce middleware and the route handler via the request
+        context, so it is read and decoded once per request.
 
         Args:
             request: Incoming HTTP request.
 
         Returns:
             DID string (stripped), or None if not present or parseable.
+
+        Raises:
+            PayloadTooLargeError: Body exceeds the configured size cap.
         """
-        if request.method.upper() != "POST":
+        if request.method.upper() != "POST" or request.url.path not in X402_PATHS:
             return None
 
         try:
             body = await request.json()
+        except PayloadTooLargeError:
+            raise
         except Exception:
             return None
 
+        if not isinstance(body, dict):
+            return None
         did = body.get("did")
         if did and isinstance(did, str):
             return did.strip() or None
@@ -85,6 +85,7 @@ class BrowseAgentsResponse(BaseModel):
     total: int
     limit: int
     offset: int
+    next_cursor: Optional[str] = None
 
 
 class SearchAgentsRequest(BaseModel):
@@ -97,6 +98,9 @@ class SearchAgentsRequest(BaseModel):
     )
     min_reputation: Optional[float] = Field(None, ge=0.0, le=5.0)
     category: Optional[AgentCategory] = None
+    sort_by: Optional[MarketplaceSortBy] = None
+    limit: Optional[int] = Field(None, ge=1, le=100, description="Page size (all matches if unset)")
+    cursor: Optional[str] = Field(None, description="next_cursor from the previous page")
 
 
 class InstallAgentRequest(BaseModel):
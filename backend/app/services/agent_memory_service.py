@@ -188,6 +188,103 @@ class AgentMemoryService:
                 error_code="MEMORY_STORE_ERROR"
             )
 
+    async def store_memories(
+        self,
+        entries: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Store several agent memory entries with one row insert.
+
+        Each entry takes store_memory's keyword arguments and may carry a
+        pre-assigned memory_id, which is kept. Embeddings are stored with
+        one request per namespace; as in store_memory, embedding failures
+        are logged but do not fail the write.
+
+        Args:
+            entries: Memory entries to store
+
+        Returns:
+            Stored memory records, in input order
+
+        Raises:
+            APIError: If storage fails
+        """
+        if not entries:
+            return []
+
+        timestamp = datetime.utcnow().isoformat() + "Z"
+        rows = []
+        for entry in entries:
+            rows.append({
+                "memory_id": entry.get("memory_id") or self.generate_memory_id(),
+                "run_id": entry["run_id"],
+                "project_id": entry["project_id"],
+                "agent_id": entry["agent_id"],
+                "memory_type": entry["memory_type"],
+                "content": entry["content"],
+                "namespace": entry.get("namespace", "default"),
+                "metadata": entry.get("metadata") or {},
+                "created_at": timestamp,
+                "updated_at": timestamp
+            })
+
+        try:
+            await self.client.insert_rows(TABLE_NAME, rows)
+        except httpx.HTTPStatusError as e:
+            logger.error(f"ZeroDB API error storing memories: {e}")
+            raise APIError(
+                detail=f"Failed to store agent memories: {str(e)}",
+                status_code=502,
+                error_code="ZERODB_ERROR"
+            )
+        except Exception as e:
+            logger.error(f"Error storing memories: {e}")
+            raise APIError(
+                detail=f"Failed to store agent memories: {str(e)}",
+                status_code=500,
+                error_code="MEMORY_STORE_ERROR"
+            )
+
+        by_namespace: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_namespace.setdefault(row["namespace"], []).append(row)
+        for namespace, namespace_rows in by_namespace.items():
+            try:
+                await self.client.embed_and_store(
+                    texts=[row["content"] for row in namespace_rows],
+                    namespace=f"{EMBEDDING_NAMESPACE}_{namespace}",
+                    metadata=[{
+                        "memory_id": row["memory_id"],
+                        "agent_id": row["agent_id"],
+                        "run_id": row["run_id"],
+                        "project_id": row["project_id"],
+                        "memory_type": row["memory_type"]
+                    } for row in namespace_rows],
+                    model=EMBEDDING_MODEL
+                )
+            except Exception as embed_error:
+                logger.warning(
+                    f"Failed to store embeddings for {len(namespace_rows)} "
+                    f"memories in namespace {namespace}: {embed_error}"
+                )
+
+        logger.info(f"Stored {len(rows)} agent memories")
+
+        return [
+            {
+                "memory_id": row["memory_id"],
+                "agent_id": row["agent_id"],
+                "run_id": row["run_id"],
+                "memory_type": row["memory_type"],
+                "content": row["content"],
+                "metadata": row["metadata"],
+                "namespace": row["namespace"],
+                "timestamp": timestamp,
+                "project_id": row["project_id"]
+            }
+            for row in rows
+        ]
+
     async def get_memory(
         self,
         project_id: str,
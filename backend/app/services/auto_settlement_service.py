@@ -10,6 +10,25 @@ Settlement logic:
 - For each pending payment older than 5 minutes, attempt settlement
 - Update payment status in ZeroDB after each attempt
 
+Settlement engine:
+- Payments are settled concurrently, with a separate concurrency limit
+  per rail (Hedera, Circle) so one slow provider cannot starve the other
+- Payments with the same rail, payer and payee can be coalesced into one
+  transfer (``batch_size`` > 1)
+- Every transfer carries an idempotency key derived from its payment IDs,
+  and the same key is never submitted twice concurrently, so retries do
+  not double-pay
+- Transfers that are not final on submission wait on shared finality
+  polling: Circle transfers on this service's watcher, Hedera transactions
+  on HederaPaymentService's mirror-node tracker
+- Payment status moves pending -> settling (Hedera only, written before the
+  transfer) -> submitted (not final within the timeout) -> settled | failed.
+  Submitted payments keep their transaction ID and idempotency key and are
+  re-checked on later cycles. Settling payments are never picked up again
+  automatically: their transfer may or may not have been sent, and Hedera
+  has no idempotency key to make a resubmission safe
+- ``get_metrics()`` reports cycle duration and settlement throughput
+
 Built by AINative Dev Team
 Refs #240
 """
@@ -17,9 +36,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +50,141 @@ X402_PAYMENTS_TABLE = "x402_payments"
 # Minimum age before a pending payment is eligible for auto-settlement
 MIN_PENDING_AGE_MINUTES = 5
 
+# Concurrent transfers allowed per settlement rail
+DEFAULT_PROVIDER_CONCURRENCY = {"hedera": 8, "circle": 4}
+
+# Payments coalesced into one transfer (same rail, payer and payee).
+# 1 disables batching: a failed batched transfer fails every payment in it.
+DEFAULT_SETTLEMENT_BATCH_SIZE = 1
+
+# Finality polling: first delay, backoff ceiling and per-transfer timeout (seconds)
+FINALITY_POLL_INITIAL_SECONDS = 0.5
+FINALITY_POLL_MAX_SECONDS = 5.0
+FINALITY_TIMEOUT_SECONDS = 120.0
+
+# Final transfer states per rail; anything else is still in flight
+_HEDERA_PENDING_STATUSES = {"NOT_FOUND", "UNKNOWN"}
+_CIRCLE_SUCCESS_STATES = {"COMPLETE"}
+_CIRCLE_FAILED_STATES = {"FAILED", "CANCELLED", "DENIED"}
+
+_IDEMPOTENCY_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "agent402:x402-settlement")
+
+
+def settlement_idempotency_key(payment_ids: List[str]) -> str:
+    """Return the deterministic idempotency key for settling a set of payments."""
+    return str(uuid.uuid5(_IDEMPOTENCY_NAMESPACE, ",".join(sorted(payment_ids))))
+
+
+class SettlementFinalityError(Exception):
+    """Raised when a submitted transfer fails or does not reach finality in time."""
+
+
+class SettlementTimeoutError(SettlementFinalityError):
+    """Raised when a submitted transfer is not final within the timeout."""
+
+
+# ---------------------------------------------------------------------------
+# Finality watcher
+# ---------------------------------------------------------------------------
+
+# Returns {transaction_id: final_status} for the transactions that are final
+StatusFetcher = Callable[[List[str]], Awaitable[Dict[str, str]]]
+
+
+class _FinalityWatcher:
+    """
+    Polls every in-flight transfer from one loop.
+
+    Each tick makes one status fetch per rail covering all of that rail's
+    pending transactions. The delay doubles while nothing resolves and
+    resets when a transaction resolves or a new one is registered.
+    """
+
+    def __init__(
+        self,
+        fetchers: Dict[str, StatusFetcher],
+        initial_delay: float = FINALITY_POLL_INITIAL_SECONDS,
+        max_delay: float = FINALITY_POLL_MAX_SECONDS,
+    ) -> None:
+        self._fetchers = fetchers
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._delay = initial_delay
+        self._waiters: Dict[Tuple[str, str], asyncio.Future] = {}
+        # Callers currently awaiting each future
+        self._waiter_counts: Dict[Tuple[str, str], int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+    async def wait(self, provider: str, transaction_id: str, timeout: float) -> str:
+        """
+        Wait for a transaction to reach a final state.
+
+        Returns:
+            The final status reported by the rail.
+
+        Raises:
+            SettlementTimeoutError: if no final state is seen within timeout.
+
+        Waiters on the same transaction share one future, which stops being
+        polled only when the last of them times out or is cancelled.
+        """
+        key = (provider, transaction_id)
+        future = self._waiters.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[key] = future
+            self._delay = self._initial_delay
+            if self._task is None or self._task.done():
+                self._task = asyncio.create_task(self._run())
+        self._waiter_counts[key] = self._waiter_counts.get(key, 0) + 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise SettlementTimeoutError(
+                f"{provider} transaction {transaction_id} not final after {timeout}s"
+            )
+        finally:
+            self._waiter_counts[key] -= 1
+            if not self._waiter_counts[key]:
+                # Nobody is waiting on the key any more
+                del self._waiter_counts[key]
+                self._waiters.pop(key, None)
+
+    async def _run(self) -> None:
+        while self._waiters:
+            await asyncio.sleep(self._delay)
+            by_provider: Dict[str, List[str]] = {}
+            for provider, transaction_id in self._waiters:
+                by_provider.setdefault(provider, []).append(transaction_id)
+            providers = list(by_provider)
+            results = await asyncio.gather(
+                *(self._fetchers[p](by_provider[p]) for p in providers),
+                return_exceptions=True,
+            )
+            resolved = 0
+            for provider, statuses in zip(providers, results):
+                if isinstance(statuses, Exception):
+                    logger.warning(f"Finality poll failed for {provider}: {statuses}")
+                    continue
+                for transaction_id, status in statuses.items():
+                    future = self._waiters.pop((provider, transaction_id), None)
+                    if future is not None and not future.done():
+                        future.set_result(status)
+                        resolved += 1
+            if resolved:
+                self._delay = self._initial_delay
+            else:
+                self._delay = min(self._delay * 2, self._max_delay)
+
 
 class AutoSettlementService:
     """
     Service that runs periodic USDC settlement cycles.
 
-    Queries ZeroDB for pending x402 payments and settles each one
+    Queries ZeroDB for pending x402 payments and settles them concurrently
     via the appropriate network service (Hedera or Circle).
 
     Designed for use as an asyncio background task without Celery.
@@ -45,6 +195,10 @@ class AutoSettlementService:
         zerodb_client: Optional[Any] = None,
         hedera_service: Optional[Any] = None,
         circle_service: Optional[Any] = None,
+        provider_concurrency: Optional[Dict[str, int]] = None,
+        batch_size: int = DEFAULT_SETTLEMENT_BATCH_SIZE,
+        finality_poll_interval: float = FINALITY_POLL_INITIAL_SECONDS,
+        finality_timeout: float = FINALITY_TIMEOUT_SECONDS,
     ) -> None:
         """
         Initialise the settlement service.
@@ -53,10 +207,39 @@ class AutoSettlementService:
             zerodb_client: Injected ZeroDB client (for testing / DI).
             hedera_service: Injected Hedera payment service instance.
             circle_service: Injected Circle service instance.
+            provider_concurrency: Concurrent transfers per rail
+                (defaults to DEFAULT_PROVIDER_CONCURRENCY).
+            batch_size: Maximum payments coalesced into one transfer.
+            finality_poll_interval: Initial delay between finality polls.
+            finality_timeout: Seconds to wait for a transfer to become final.
         """
         self._zerodb_client = zerodb_client
         self._hedera_service = hedera_service
         self._circle_service = circle_service
+        self._provider_concurrency = {
+            **DEFAULT_PROVIDER_CONCURRENCY, **(provider_concurrency or {})
+        }
+        self._batch_size = max(1, batch_size)
+        self._finality_timeout = finality_timeout
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._awaiting_finality = 0
+        # Settlements currently executing, by idempotency key
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._finality = _FinalityWatcher(
+            {"circle": self._circle_final_statuses},
+            initial_delay=finality_poll_interval,
+        )
+        self._metrics: Dict[str, Any] = {
+            "cycles": 0,
+            "last_cycle_duration_seconds": 0.0,
+            "total_cycle_duration_seconds": 0.0,
+            "last_cycle_throughput_per_second": 0.0,
+            "settled_total": 0,
+            "failed_total": 0,
+            "skipped_total": 0,
+            "submitted_total": 0,
+            "transfers_submitted": 0,
+        }
 
     # ------------------------------------------------------------------
     # Lazy dependency accessors
@@ -123,6 +306,19 @@ class AutoSettlementService:
         logger.info(f"Found {len(records)} pending payment(s) to settle.")
         return records
 
+    async def get_submitted_settlements(self) -> List[Dict[str, Any]]:
+        """
+        Query ZeroDB for payments whose transfer was sent but not yet confirmed.
+
+        Returns:
+            List of payment record dicts with status == "submitted".
+        """
+        records = await self.zerodb_client.query_rows(
+            X402_PAYMENTS_TABLE,
+            {"status": "submitted"},
+        )
+        return [r for r in records if r.get("status") == "submitted"]
+
     async def settle_payment(
         self,
         payment_id: str,
@@ -139,7 +335,7 @@ class AutoSettlementService:
 
         Returns:
             Dict with keys:
-            - status: "settled" | "skipped" | "failed"
+            - status: "settled" | "submitted" | "skipped" | "failed"
             - payment_id: The payment identifier.
             - transaction_id: Network transaction ID (on success).
             - error: Error message string (on failure).
@@ -147,15 +343,10 @@ class AutoSettlementService:
         Raises:
             ValueError: When the payment_id is not found in ZeroDB.
         """
-        records = await self.zerodb_client.query_rows(
-            X402_PAYMENTS_TABLE,
-            {"payment_id": payment_id},
-        )
-
-        if not records:
+        payment = await self._load_payment(payment_id)
+        if payment is None:
             raise ValueError(f"Payment not found: {payment_id}")
 
-        payment = records[0]
         current_status = payment.get("status", "")
 
         # Skip payments that are not in a settleable state
@@ -165,112 +356,79 @@ class AutoSettlementService:
             )
             return {"status": "skipped", "payment_id": payment_id}
 
-        network = payment.get("network", "hedera")
-
-        try:
-            if network == "circle":
-                result = await self._settle_via_circle(payment)
-            else:
-                result = await self._settle_via_hedera(payment)
-
-            # Update ZeroDB record to reflect the settled state
-            await self.zerodb_client.update_row(
-                X402_PAYMENTS_TABLE,
-                {"payment_id": payment_id},
-                {
-                    "status": "settled",
-                    "transaction_id": result.get("transaction_id"),
-                    "settled_at": datetime.now(timezone.utc).isoformat(),
-                },
-            )
-
-            logger.info(
-                f"Payment {payment_id} settled: "
-                f"transaction_id={result.get('transaction_id')}"
-            )
-
-            return {
-                "status": "settled",
-                "payment_id": payment_id,
-                "transaction_id": result.get("transaction_id"),
-            }
-
-        except Exception as exc:
-            error_msg = str(exc)
-            logger.error(
-                f"Settlement failed for payment {payment_id}: {error_msg}"
-            )
-
-            # Best-effort status update to "failed"
-            try:
-                await self.zerodb_client.update_row(
-                    X402_PAYMENTS_TABLE,
-                    {"payment_id": payment_id},
-                    {
-                        "status": "failed",
-                        "error": error_msg,
-                        "failed_at": datetime.now(timezone.utc).isoformat(),
-                    },
-                )
-            except Exception as update_exc:
-                logger.warning(
-                    f"Could not update failed status for {payment_id}: {update_exc}"
-                )
-
-            return {
-                "status": "failed",
-                "payment_id": payment_id,
-                "error": error_msg,
-            }
+        results = await self._settle_batch([payment])
+        return results[0]
 
     async def run_settlement_cycle(self) -> Dict[str, Any]:
         """
         Process all pending payments in a single settlement cycle.
 
-        Retrieves pending payments from ZeroDB and attempts to settle
-        each one, tracking counts for monitoring/alerting.
+        Retrieves pending payments from ZeroDB and settles them
+        concurrently (bounded per rail), then re-checks transfers left
+        unconfirmed by earlier cycles, tracking counts for
+        monitoring/alerting.
 
         Returns:
             Summary dict:
-            - total: Number of payments processed.
+            - total: Number of payments processed (pending and re-checked).
             - settled: Successfully settled count.
             - failed: Failed settlement count.
+            - submitted: Sent but still unconfirmed count.
             - skipped: Skipped (non-pending) count.
+            - duration_seconds: Wall-clock time of the cycle.
+            - throughput_per_second: Settled payments per second.
         """
         logger.info("Starting settlement cycle.")
+        started = time.monotonic()
 
         pending = await self.get_pending_settlements()
         total = len(pending)
-        settled = 0
-        failed = 0
-        skipped = 0
+        counts = {"settled": 0, "failed": 0, "submitted": 0, "skipped": 0}
 
+        candidates = []
         for payment in pending:
-            payment_id = payment.get("payment_id", "")
-            if not payment_id:
+            if not payment.get("payment_id"):
                 logger.warning("Skipping payment record with no payment_id.")
-                skipped += 1
+                counts["skipped"] += 1
                 continue
+            candidates.append(payment)
 
-            result = await self.settle_payment(payment_id)
+        group_results = await asyncio.gather(
+            *(self._settle_group(group) for group in self._group_payments(candidates))
+        )
+        results = [result for group in group_results for result in group]
+        reconciled = await self._reconcile_submitted(
+            exclude={result["payment_id"] for result in results}
+        )
+        total += len(reconciled)
+        for result in results + reconciled:
             status = result.get("status")
+            counts[status if status in counts else "skipped"] += 1
 
-            if status == "settled":
-                settled += 1
-            elif status == "failed":
-                failed += 1
-            else:
-                skipped += 1
+        duration = time.monotonic() - started
+        throughput = counts["settled"] / duration if duration > 0 else 0.0
+        self._record_cycle(duration, throughput, counts)
 
         summary = {
             "total": total,
-            "settled": settled,
-            "failed": failed,
-            "skipped": skipped,
+            **counts,
+            "duration_seconds": round(duration, 3),
+            "throughput_per_second": round(throughput, 3),
         }
         logger.info(f"Settlement cycle complete: {summary}")
         return summary
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Return settlement engine metrics.
+
+        Returns:
+            Dict with cycle count and durations, last-cycle throughput,
+            cumulative settled/failed/skipped counts, transfers submitted,
+            and the number of transfers currently awaiting finality.
+        """
+        return {**self._metrics, "in_flight_transfers": self._awaiting_finality}
+
     async def schedule_settlement(
         self,
         interval_minutes: float = 15,
@@ -304,37 +462,393 @@ class AutoSettlementService:
         )
         return task
 
+    # ------------------------------------------------------------------
+    # Settlement engine
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _rail(payment: Dict[str, Any]) -> str:
+        """Return the settlement rail for a payment; anything but Circle goes via Hedera."""
+        return "circle" if payment.get("network") == "circle" else "hedera"
+
+    def _semaphore(self, network: str) -> asyncio.Semaphore:
+        """Return the concurrency limiter for a rail."""
+        semaphore = self._semaphores.get(network)
+        if semaphore is None:
+            limit = self._provider_concurrency.get(network, 1)
+            semaphore = self._semaphores[network] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def _group_payments(
+        self, payments: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Split payments into settlement groups of up to batch_size sharing rail, payer and payee.
+
+        Payments that already carry an idempotency key (submitted before,
+        outcome not recorded) are only grouped with payments sharing that
+        key, so they are resubmitted under it.
+        """
+        if self._batch_size == 1:
+            return [[payment] for payment in payments]
+        by_route: Dict[Tuple[str, str, str, str], List[Dict[str, Any]]] = {}
+        for payment in payments:
+            route = (
+                self._rail(payment),
+                payment.get("from_account", ""),
+                payment.get("to_account", ""),
+                payment.get("idempotency_key") or "",
+            )
+            by_route.setdefault(route, []).append(payment)
+        return [
+            group[i:i + self._batch_size]
+            for group in by_route.values()
+            for i in range(0, len(group), self._batch_size)
+        ]
+
+    async def _settle_group(
+        self, group: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Re-check each payment is still pending, then settle the rest together."""
+        results: List[Dict[str, Any]] = []
+        fresh: List[Dict[str, Any]] = []
+        async with self._semaphore(self._rail(group[0])):
+            for payment in group:
+                payment_id = payment["payment_id"]
+                record = await self._load_payment(payment_id)
+                status = record.get("status", "") if record is not None else "missing"
+                if status == "pending":
+                    fresh.append(record)
+                else:
+                    logger.info(f"Skipping payment {payment_id}: status={status}")
+                    results.append({"status": "skipped", "payment_id": payment_id})
+        if fresh:
+            results.extend(await self._settle_batch(fresh))
+        return results
+
+    async def _settle_batch(
+        self, payments: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Settle payments in one transfer, at most once at a time per idempotency key.
+
+        A caller asking to settle payments that are already being settled
+        waits for, and shares, the in-flight result. Payments submitted
+        before keep the idempotency key stored on them.
+        """
+        stored_keys = {p.get("idempotency_key") for p in payments}
+        key = stored_keys.pop() if len(stored_keys) == 1 else None
+        key = key or settlement_idempotency_key([p["payment_id"] for p in payments])
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._execute_settlement(payments, key))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def _execute_settlement(
+        self, payments: List[Dict[str, Any]], idempotency_key: str
+    ) -> List[Dict[str, Any]]:
+        """Submit one transfer for the payments, wait for finality and record the outcome."""
+        network = self._rail(payments[0])
+        payment_ids = [p["payment_id"] for p in payments]
+        transaction_id = None
+
+        try:
+            # Store the key before the transfer is sent. Hedera payments are
+            # also claimed: they must never look pending again, even if the
+            # final update is lost. Circle payments stay pending and are
+            # resubmitted under the stored key, which Circle deduplicates
+            claim: Dict[str, Any] = {"idempotency_key": idempotency_key}
+            if network == "hedera":
+                claim.update({
+                    "status": "settling",
+                    "settling_at": datetime.now(timezone.utc).isoformat(),
+                })
+            await self._update_payments(payment_ids, claim)
+            async with self._semaphore(network):
+                if network == "circle":
+                    submitted = await self._settle_via_circle(payments, idempotency_key)
+                else:
+                    submitted = await self._settle_via_hedera(payments, idempotency_key)
+            self._metrics["transfers_submitted"] += 1
+
+            transaction_id = submitted.get("transaction_id")
+            status = submitted.get("status")
+            if not submitted.get("final"):
+                status = await self._await_finality(network, transaction_id)
+        except Exception as exc:
+            return await self._record_failure(
+                payment_ids, transaction_id, idempotency_key, str(exc)
+            )
+        return await self._record_outcome(
+            network, payment_ids, transaction_id, idempotency_key, status
+        )
+
+    async def _reconcile_submitted(self, exclude: Set[str]) -> List[Dict[str, Any]]:
+        """
+        Re-check transfers that were not final when their settlement timed out.
+
+        Payments in exclude (those this cycle just submitted) are left alone.
+        """
+        try:
+            records = await self.get_submitted_settlements()
+        except Exception as exc:
+            logger.warning(f"Could not load submitted settlements: {exc}")
+            return []
+        by_transfer: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            payment_id = record.get("payment_id")
+            if payment_id and payment_id not in exclude and record.get("transaction_id"):
+                by_transfer.setdefault(record["transaction_id"], []).append(record)
+        group_results = await asyncio.gather(
+            *(self._confirm_transfer(group) for group in by_transfer.values())
+        )
+        return [result for results in group_results for result in results]
+
+    async def _confirm_transfer(
+        self, payments: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Wait for a previously submitted transfer and record its outcome."""
+        network = self._rail(payments[0])
+        payment_ids = [p["payment_id"] for p in payments]
+        transaction_id = payments[0]["transaction_id"]
+        idempotency_key = payments[0].get("idempotency_key")
+        try:
+            status = await self._await_finality(network, transaction_id)
+        except Exception as exc:
+            logger.warning(f"Could not re-check {network} transaction {transaction_id}: {exc}")
+            return [
+                {"status": "submitted", "payment_id": p, "transaction_id": transaction_id}
+                for p in payment_ids
+            ]
+        return await self._record_outcome(
+            network, payment_ids, transaction_id, idempotency_key, status
+        )
+
+    async def _record_outcome(
+        self,
+        network: str,
+        payment_ids: List[str],
+        transaction_id: Optional[str],
+        idempotency_key: Optional[str],
+        status: Optional[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Record a submitted transfer's final status on its payments.
+
+        A status of None means the transfer was not final in time: the
+        payments are left "submitted" for a later cycle to re-check.
+        """
+        if status is None:
+            logger.warning(
+                f"{network} transaction {transaction_id} not final yet; "
+                f"payment(s) {', '.join(payment_ids)} left submitted"
+            )
+            await self._update_payments(payment_ids, {
+                "status": "submitted",
+                "transaction_id": transaction_id,
+                "idempotency_key": idempotency_key,
+                "submitted_at": datetime.now(timezone.utc).isoformat(),
+            }, raise_on_error=False)
+            return [
+                {"status": "submitted", "payment_id": p, "transaction_id": transaction_id}
+                for p in payment_ids
+            ]
+        if not self._is_success(network, status):
+            return await self._record_failure(
+                payment_ids, transaction_id, idempotency_key,
+                f"{network} transaction {transaction_id} ended with status {status}",
+            )
+
+        # A lost update leaves a Hedera payment "settling", so it is not paid
+        # again; a Circle payment left pending is resubmitted under the key
+        # stored on it before the transfer
+        await self._update_payments(payment_ids, {
+            "status": "settled",
+            "transaction_id": transaction_id,
+            "idempotency_key": idempotency_key,
+            "settled_at": datetime.now(timezone.utc).isoformat(),
+        }, raise_on_error=False)
+        logger.info(
+            f"Payment(s) {', '.join(payment_ids)} settled: "
+            f"transaction_id={transaction_id}"
+        )
+        return [
+            {
+                "status": "settled",
+                "payment_id": payment_id,
+                "transaction_id": transaction_id,
+            }
+            for payment_id in payment_ids
+        ]
+
+    async def _record_failure(
+        self,
+        payment_ids: List[str],
+        transaction_id: Optional[str],
+        idempotency_key: Optional[str],
+        error_msg: str,
+    ) -> List[Dict[str, Any]]:
+        """Mark the payments failed, keeping the transfer reference for reconciliation."""
+        logger.error(
+            f"Settlement failed for payment(s) {', '.join(payment_ids)}: {error_msg}"
+        )
+        await self._update_payments(payment_ids, {
+            "status": "failed",
+            "error": error_msg,
+            "failed_at": datetime.now(timezone.utc).isoformat(),
+            "transaction_id": transaction_id,
+            "idempotency_key": idempotency_key,
+        }, raise_on_error=False)
+        return [
+            {"status": "failed", "payment_id": payment_id, "error": error_msg}
+            for payment_id in payment_ids
+        ]
+
+    async def _await_finality(self, network: str, transaction_id: str) -> Optional[str]:
+        """
+        Wait on the shared poller for the rail and return the final status.
+
+        Returns None when the transfer is not final within the timeout.
+        """
+        from app.services.hedera_payment_service import HederaSettlementTimeoutError
+
+        self._awaiting_finality += 1
+        try:
+            if network == "hedera":
+                receipt = await self.hedera_service.wait_for_settlement(
+                    transaction_id, timeout_seconds=self._finality_timeout
+                )
+                return receipt.get("status")
+            return await self._finality.wait(
+                network, transaction_id, self._finality_timeout
+            )
+        except (SettlementTimeoutError, HederaSettlementTimeoutError):
+            return None
+        finally:
+            self._awaiting_finality -= 1
+
+    async def _update_payments(
+        self,
+        payment_ids: List[str],
+        update: Dict[str, Any],
+        raise_on_error: bool = True,
+    ) -> None:
+        """
+        Apply the same status update to each payment.
+
+        With raise_on_error=False failures are only logged, for updates made
+        after a transfer was sent, when the outcome must still be reported.
+        """
+        outcomes = await asyncio.gather(
+            *(
+                self.zerodb_client.update_row(
+                    X402_PAYMENTS_TABLE, {"payment_id": payment_id}, update
+                )
+                for payment_id in payment_ids
+            ),
+            return_exceptions=True,
+        )
+        for payment_id, outcome in zip(payment_ids, outcomes):
+            if not isinstance(outcome, Exception):
+                continue
+            if raise_on_error:
+                raise outcome
+            logger.error(
+                f"Could not mark payment {payment_id} {update.get('status')} "
+                f"(transaction {update.get('transaction_id')}, "
+                f"key {update.get('idempotency_key')}): {outcome}"
+            )
+
+    def _record_cycle(
+        self, duration: float, throughput: float, counts: Dict[str, int]
+    ) -> None:
+        metrics = self._metrics
+        metrics["cycles"] += 1
+        metrics["last_cycle_duration_seconds"] = duration
+        metrics["total_cycle_duration_seconds"] += duration
+        metrics["last_cycle_throughput_per_second"] = throughput
+        for status, count in counts.items():
+            metrics[f"{status}_total"] += count
+
+    @staticmethod
+    def _is_success(network: str, status: Optional[str]) -> bool:
+        if network == "circle":
+            return status in _CIRCLE_SUCCESS_STATES
+        return status == "SUCCESS"
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    async def _load_payment(self, payment_id: str) -> Optional[Dict[str, Any]]:
+        """Return the payment record from ZeroDB, or None."""
+        records = await self.zerodb_client.query_rows(
+            X402_PAYMENTS_TABLE,
+            {"payment_id": payment_id},
+        )
+        return records[0] if records else None
+
     async def _settle_via_hedera(
         self,
-        payment: Dict[str, Any],
+        payments: List[Dict[str, Any]],
+        idempotency_key: str,
     ) -> Dict[str, Any]:
-        """Settle a payment via Hedera HTS."""
+        """Submit one Hedera HTS transfer covering the payments."""
+        payment = payments[0]
+        # Single payments keep their ID in the memo; batches use the key
+        reference = payment.get("payment_id", "") if len(payments) == 1 else idempotency_key
         result = await self.hedera_service.transfer_usdc(
             from_account=payment.get("from_account", ""),
             to_account=payment.get("to_account", ""),
-            amount=int(payment.get("amount", 0)),
-            memo=f"auto-settlement:{payment.get('payment_id', '')}",
+            amount=sum(int(p.get("amount", 0)) for p in payments),
+            memo=f"auto-settlement:{reference}",
         )
-        return {"transaction_id": result.get("transaction_id"), "status": "SUCCESS"}
+        status = result.get("status", "UNKNOWN")
+        return {
+            "transaction_id": result.get("transaction_id"),
+            "status": status,
+            "final": status not in _HEDERA_PENDING_STATUSES,
+        }
 
     async def _settle_via_circle(
         self,
-        payment: Dict[str, Any],
+        payments: List[Dict[str, Any]],
+        idempotency_key: str,
     ) -> Dict[str, Any]:
-        """Settle a payment via Circle."""
-        idempotency_key = str(uuid.uuid4())
+        """Submit one Circle transfer covering the payments."""
+        payment = payments[0]
+        amount = sum((Decimal(str(p.get("amount", "0"))) for p in payments), Decimal("0"))
         result = await self.circle_service.create_transfer(
             source_wallet_id=payment.get("from_account", ""),
             destination_address=payment.get("to_account", ""),
-            amount=str(payment.get("amount", "0")),
+            amount=str(amount),
             idempotency_key=idempotency_key,
         )
-        transfer_id = result.get("data", {}).get("id", "")
-        return {"transaction_id": transfer_id, "status": "COMPLETE"}
+        data = result.get("data", {})
+        state = data.get("state", "")
+        return {
+            "transaction_id": data.get("id", ""),
+            "status": state,
+            "final": state in _CIRCLE_SUCCESS_STATES | _CIRCLE_FAILED_STATES,
+        }
+
+    async def _circle_final_statuses(self, transaction_ids: List[str]) -> Dict[str, str]:
+        """Return the Circle transfers (of those given) that have reached a final state."""
+        transfers = await asyncio.gather(
+            *(self.circle_service.get_transfer(t) for t in transaction_ids),
+            return_exceptions=True,
+        )
+        final_states = _CIRCLE_SUCCESS_STATES | _CIRCLE_FAILED_STATES
+        statuses = {}
+        for transaction_id, transfer in zip(transaction_ids, transfers):
+            if isinstance(transfer, Exception):
+                continue
+            state = transfer.get("data", {}).get("state")
+            if state in final_states:
+                statuses[transaction_id] = state
+        return statuses
 
 
 # ---------------------------------------------------------------------------
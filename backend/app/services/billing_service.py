@@ -16,16 +16,28 @@ Storage: ZeroDB tables
   - billing_agent_budgets : per-agent budget configuration
   - billing_project_budgets : per-project budget configuration
 
+Metering:
+Spend is read from in-memory rollups rather than by re-scanning events.
+Each rollup covers one agent or project for one billing period and keeps
+per-category, per-agent and per-day counters. A rollup is loaded from
+ZeroDB the first time it is needed and then updated as events are
+recorded. Once ``start()`` has run, events are buffered and written to
+ZeroDB in batches by a background task, which also reconciles loaded
+rollups against ZeroDB to correct drift (e.g. events written by other
+workers).
+
 Built by AINative Dev Team.
 Refs #226, #227, #228.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime, timezone
-from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Tuple
 
 from app.schemas.billing import VALID_CATEGORIES
 from app.services.zerodb_client import get_zerodb_client
@@ -37,6 +49,22 @@ _USAGE_TABLE = "billing_usage_events"
 _AGENT_BUDGET_TABLE = "billing_agent_budgets"
 _PROJECT_BUDGET_TABLE = "billing_project_budgets"
 
+# Write-behind tuning for usage events
+USAGE_FLUSH_BATCH_SIZE = 200
+USAGE_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Seconds between reconciliations of loaded rollups against ZeroDB
+ROLLUP_RECONCILE_INTERVAL_SECONDS = 300.0
+
+# Page size used when loading a rollup from ZeroDB
+_ROLLUP_PAGE_SIZE = 1000
+
+# Rollup scopes
+_AGENT_SCOPE = "agent"
+_PROJECT_SCOPE = "project"
+
+_ZERO = Decimal("0")
+
 
 def _today_period() -> str:
     """Return current UTC period in YYYY-MM format."""
@@ -48,22 +76,105 @@ def _today_date() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
 
+# ---------------------------------------------------------------------------
+# Spend rollups
+# ---------------------------------------------------------------------------
+
+
+class _Rollup:
+    """Spend counters for one agent or project over one billing period."""
+
+    __slots__ = ("by_category", "by_agent", "by_day")
+
+    def __init__(self) -> None:
+        self.by_category: Dict[str, Decimal] = {}
+        self.by_agent: Dict[str, Decimal] = {}
+        self.by_day: Dict[str, Decimal] = {}
+
+    @property
+    def total(self) -> Decimal:
+        return sum(self.by_category.values(), _ZERO)
+
+    def same_as(self, other: "_Rollup") -> bool:
+        """True when both rollups hold the same non-zero counters."""
+        return all(
+            {k: v for k, v in mine.items() if v} == {k: v for k, v in theirs.items() if v}
+            for mine, theirs in (
+                (self.by_category, other.by_category),
+                (self.by_agent, other.by_agent),
+                (self.by_day, other.by_day),
+            )
+        )
+
+    def add(self, event: Dict[str, Any], sign: int = 1) -> None:
+        """Add (or with sign=-1, remove) one usage event row."""
+        try:
+            amount = Decimal(str(event.get("amount", "0"))) * sign
+        except InvalidOperation:
+            logger.warning("Skipping event with unparseable amount: %s", event)
+            return
+        for counters, key in (
+            (self.by_category, event.get("category", "")),
+            (self.by_agent, event.get("agent_id", "")),
+            (self.by_day, (event.get("recorded_at") or "")[:10]),
+        ):
+            counters[key] = counters.get(key, _ZERO) + amount
+
+
+def _rollup_keys(event: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    """Return the (scope, owner_id, period) rollups an event counts towards."""
+    period = event.get("period", "")
+    keys = [(_AGENT_SCOPE, event.get("agent_id", ""), period)]
+    if event.get("project_id"):
+        keys.append((_PROJECT_SCOPE, event["project_id"], period))
+    return keys
+
+
 class BillingService:
     """
     Service for recording and querying agent usage costs and budget limits.
 
     All monetary amounts use Decimal for precision.
     Persistence is backed by ZeroDB.
+
+    Lifecycle (optional; without it events are written inline)::
+
+        await billing_service.start()
+        ...
+        await billing_service.stop()
     """
 
-    def __init__(self, client: Any = None) -> None:
+    def __init__(
+        self,
+        client: Any = None,
+        flush_batch_size: int = USAGE_FLUSH_BATCH_SIZE,
+        flush_interval: float = USAGE_FLUSH_INTERVAL_SECONDS,
+        reconcile_interval: float = ROLLUP_RECONCILE_INTERVAL_SECONDS,
+    ) -> None:
         """
         Initialise the service.
 
         Args:
             client: Optional ZeroDB client (injected for testing; lazy-loaded otherwise).
+            flush_batch_size: Maximum usage events persisted per ZeroDB request.
+            flush_interval: Seconds between background flushes.
+            reconcile_interval: Seconds between background rollup reconciliations.
         """
         self._client = client
+        self._flush_batch_size = flush_batch_size
+        self._flush_interval = flush_interval
+        self._reconcile_interval = reconcile_interval
+        self._rollups: Dict[Tuple[str, str, str], _Rollup] = {}
+        # Serialises first loads of a rollup; held only for keys not yet loaded
+        self._rollup_locks: Dict[Tuple[str, str, str], asyncio.Lock] = {}
+        # Events recorded while a rollup is loading, per in-progress load
+        self._loading: Dict[Tuple[str, str, str], List[List[Tuple[Dict[str, Any], int]]]] = {}
+        # Events not yet confirmed in ZeroDB (buffered or mid-insert), by event_id
+        self._unflushed: Dict[str, Dict[str, Any]] = {}
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._flush_wakeup = asyncio.Event()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -76,31 +187,78 @@ class BillingService:
             self._client = get_zerodb_client()
         return self._client
 
-    async def _get_events_for_agent(
-        self,
-        agent_id: str,
-        period: str,
-        category: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
-        """Return all usage events for an agent/period, optionally filtered by category."""
-        filter_query: Dict[str, Any] = {"agent_id": agent_id, "period": period}
-        if category is not None:
-            filter_query["category"] = category
-        result = await self.client.query_rows(_USAGE_TABLE, filter=filter_query, limit=10_000)
-        return result.get("rows", [])
-
-    async def _get_events_for_project(
-        self,
-        project_id: str,
-        period: str,
-    ) -> List[Dict[str, Any]]:
-        """Return all usage events tagged with a given project_id and period."""
-        result = await self.client.query_rows(
-            _USAGE_TABLE,
-            filter={"project_id": project_id, "period": period},
-            limit=100_000,
-        )
-        return result.get("rows", [])
+    async def _get_rollup(self, scope: str, owner_id: str, period: str) -> _Rollup:
+        """Return the rollup for an agent/project and period, loading it on first use."""
+        key = (scope, owner_id, period)
+        rollup = self._rollups.get(key)
+        if rollup is not None:
+            return rollup
+        lock = self._rollup_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            rollup = self._rollups.get(key)
+            if rollup is None:
+                rollup = await self._load_rollup(key)
+                self._rollups[key] = rollup
+                # Later callers take the fast path; waiters still hold the lock object
+                self._rollup_locks.pop(key, None)
+            return rollup
+
+    async def _load_rollup(self, key: Tuple[str, str, str]) -> _Rollup:
+        """
+        Build a rollup from the persisted events plus any not yet flushed.
+
+        Events unflushed when loading starts are snapshotted up front, and
+        events recorded while it runs are captured as they happen, so an
+        event flushed mid-load is never lost. Both are matched by event_id
+        against the rows paged from ZeroDB so each event is counted once.
+        """
+        scope, owner_id, period = key
+        filter_query = {f"{scope}_id": owner_id, "period": period}
+        rollup = _Rollup()
+        persisted = set()
+        unflushed = [
+            (row, 1) for row in self._unflushed.values() if key in _rollup_keys(row)
+        ]
+        recorded: List[Tuple[Dict[str, Any], int]] = []
+        self._loading.setdefault(key, []).append(recorded)
+        try:
+            skip = 0
+            while True:
+                result = await self.client.query_rows(
+                    _USAGE_TABLE, filter=filter_query, limit=_ROLLUP_PAGE_SIZE, skip=skip
+                )
+                rows = result.get("rows", [])
+                for row in rows:
+                    event_id = row.get("event_id")
+                    if event_id and event_id in persisted:
+                        continue
+                    persisted.add(event_id)
+                    rollup.add(row)
+                skip += len(rows)
+                if len(rows) < _ROLLUP_PAGE_SIZE:
+                    break
+        finally:
+            loads = [r for r in self._loading.pop(key, []) if r is not recorded]
+            if loads:
+                self._loading[key] = loads
+        for row, sign in unflushed + recorded:
+            if row["event_id"] not in persisted:
+                rollup.add(row, sign)
+        return rollup
+
+    def _apply_to_rollups(self, row: Dict[str, Any], sign: int = 1) -> None:
+        """Add an event to every loaded rollup it counts towards."""
+        for key in _rollup_keys(row):
+            rollup = self._rollups.get(key)
+            if rollup is not None:
+                rollup.add(row, sign)
+            for recorded in self._loading.get(key, ()):
+                recorded.append((row, sign))
+
+    async def _current_spend(self, scope: str, owner_id: str) -> Tuple[Decimal, Decimal]:
+        """Return (spent today, spent this month) for an agent or project."""
+        rollup = await self._get_rollup(scope, owner_id, _today_period())
+        return rollup.by_day.get(_today_date(), _ZERO), rollup.total
 
     # ------------------------------------------------------------------
     # Issue #226 — Per-Agent Cost Breakdown API
@@ -122,18 +280,12 @@ class BillingService:
             Dict with keys: agent_id, period, llm_inference, memory_storage,
             vector_search, file_storage, payment_fee, total.
         """
-        events = await self._get_events_for_agent(agent_id, period)
-
-        totals: Dict[str, Decimal] = {cat: Decimal("0") for cat in VALID_CATEGORIES}
-        for event in events:
-            cat = event.get("category")
-            if cat in totals:
-                try:
-                    totals[cat] += Decimal(str(event.get("amount", "0")))
-                except Exception:
-                    logger.warning("Skipping event with unparseable amount: %s", event)
+        rollup = await self._get_rollup(_AGENT_SCOPE, agent_id, period)
 
-        grand_total = sum(totals.values(), Decimal("0"))
+        totals: Dict[str, Decimal] = {
+            cat: rollup.by_category.get(cat, _ZERO) for cat in VALID_CATEGORIES
+        }
+        grand_total = sum(totals.values(), _ZERO)
 
         return {
             "agent_id": agent_id,
@@ -157,19 +309,10 @@ class BillingService:
         Returns:
             Dict with keys: project_id, period, agents (list), total.
         """
-        events = await self._get_events_for_project(project_id, period)
-
-        per_agent: Dict[str, Decimal] = {}
-        for event in events:
-            aid = event.get("agent_id", "")
-            try:
-                amount = Decimal(str(event.get("amount", "0")))
-            except Exception:
-                amount = Decimal("0")
-            per_agent[aid] = per_agent.get(aid, Decimal("0")) + amount
+        rollup = await self._get_rollup(_PROJECT_SCOPE, project_id, period)
 
-        agents_list = [{"agent_id": k, "total": v} for k, v in per_agent.items()]
-        grand_total = sum(per_agent.values(), Decimal("0"))
+        agents_list = [{"agent_id": k, "total": v} for k, v in rollup.by_agent.items()]
+        grand_total = rollup.total
 
         return {
             "project_id": project_id,
@@ -188,6 +331,10 @@ class BillingService:
         """
         Record a single cost event for an agent.
 
+        The event is counted in the spend rollups immediately. It is
+        queued for the background flusher when the service is started and
+        written inline otherwise.
+
         Args:
             agent_id:  Agent identifier.
             category:  Cost category (one of VALID_CATEGORIES).
@@ -213,7 +360,20 @@ class BillingService:
             "recorded_at": recorded_at,
         }
 
-        await self.client.insert_row(_USAGE_TABLE, row_data)
+        self._apply_to_rollups(row_data)
+        self._unflushed[event_id] = row_data
+        if self._flush_task is not None:
+            self._pending.append(row_data)
+            if len(self._pending) >= self._flush_batch_size:
+                self._flush_wakeup.set()
+        else:
+            try:
+                await self.client.insert_row(_USAGE_TABLE, row_data)
+            except Exception:
+                self._apply_to_rollups(row_data, sign=-1)
+                raise
+            finally:
+                self._unflushed.pop(event_id, None)
 
         logger.info(
             "Recorded usage event %s for agent %s: %s %.4f",
@@ -249,6 +409,8 @@ class BillingService:
         Returns:
             List of event dicts, most-recent first (up to limit).
         """
+        while self._pending and await self.flush():
+            pass
         result = await self.client.query_rows(
             _USAGE_TABLE,
             filter={"agent_id": agent_id, "category": category},
@@ -358,27 +520,7 @@ class BillingService:
         max_daily: Optional[Decimal] = Decimal(raw_daily) if raw_daily else None
         max_monthly: Optional[Decimal] = Decimal(raw_monthly) if raw_monthly else None
 
-        today_period = _today_period()
-        events = await self._get_events_for_agent(agent_id, today_period)
-
-        spent_today = sum(
-            (Decimal(str(e.get("amount", "0"))) for e in events), Decimal("0")
-        )
-        # For monthly: sum all events regardless of period filtering (same month)
-        all_month_events = await self.client.query_rows(
-            _USAGE_TABLE,
-            filter={"agent_id": agent_id},
-            limit=100_000,
-        )
-        current_ym = _today_period()
-        spent_month = sum(
-            (
-                Decimal(str(e.get("amount", "0")))
-                for e in all_month_events.get("rows", [])
-                if e.get("period", "") == current_ym
-            ),
-            Decimal("0"),
-        )
+        spent_today, spent_month = await self._current_spend(_AGENT_SCOPE, agent_id)
 
         allowed = True
         remaining_daily: Optional[Decimal] = None
@@ -425,26 +567,7 @@ class BillingService:
             max_daily = Decimal(raw_daily) if raw_daily else None
             max_monthly = Decimal(raw_monthly) if raw_monthly else None
 
-        today_period = _today_period()
-        events = await self._get_events_for_agent(agent_id, today_period)
-        spent_today = sum(
-            (Decimal(str(e.get("amount", "0"))) for e in events), Decimal("0")
-        )
-
-        all_month_events = await self.client.query_rows(
-            _USAGE_TABLE,
-            filter={"agent_id": agent_id},
-            limit=100_000,
-        )
-        current_ym = _today_period()
-        spent_month = sum(
-            (
-                Decimal(str(e.get("amount", "0")))
-                for e in all_month_events.get("rows", [])
-                if e.get("period", "") == current_ym
-            ),
-            Decimal("0"),
-        )
+        spent_today, spent_month = await self._current_spend(_AGENT_SCOPE, agent_id)
 
         return {
             "agent_id": agent_id,
@@ -514,22 +637,6 @@ class BillingService:
         rows = result.get("rows", [])
         return rows[0] if rows else None
 
-    async def _get_project_daily_spend(self, project_id: str) -> Decimal:
-        """Return total today's spend across all agents tagged with project_id."""
-        today_period = _today_period()
-        events = await self._get_events_for_project(project_id, today_period)
-        return sum(
-            (Decimal(str(e.get("amount", "0"))) for e in events), Decimal("0")
-        )
-
-    async def _get_project_monthly_spend(self, project_id: str) -> Decimal:
-        """Return total this-month's spend for the project."""
-        current_ym = _today_period()
-        events = await self._get_events_for_project(project_id, current_ym)
-        return sum(
-            (Decimal(str(e.get("amount", "0"))) for e in events), Decimal("0")
-        )
-
     async def check_project_budget(
         self,
         project_id: str,
@@ -555,8 +662,7 @@ class BillingService:
         max_daily: Optional[Decimal] = Decimal(raw_daily) if raw_daily else None
         max_monthly: Optional[Decimal] = Decimal(raw_monthly) if raw_monthly else None
 
-        spent_today = await self._get_project_daily_spend(project_id)
-        spent_month = await self._get_project_monthly_spend(project_id)
+        spent_today, spent_month = await self._current_spend(_PROJECT_SCOPE, project_id)
 
         allowed = True
         remaining: Optional[Decimal] = None
@@ -599,8 +705,7 @@ class BillingService:
             max_daily = Decimal(raw_daily) if raw_daily else None
             max_monthly = Decimal(raw_monthly) if raw_monthly else None
 
-        spent_today = await self._get_project_daily_spend(project_id)
-        spent_month = await self._get_project_monthly_spend(project_id)
+        spent_today, spent_month = await self._current_spend(_PROJECT_SCOPE, project_id)
 
         return {
             "project_id": project_id,
@@ -610,6 +715,111 @@ class BillingService:
             "spent_monthly": spent_month,
         }
 
+    # ------------------------------------------------------------------
+    # Metering lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the background flusher/reconciler. Safe to call more than once."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._metering_loop())
+
+    async def stop(self) -> None:
+        """Stop the background task and persist any buffered usage events."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        while self._pending:
+            if not await self.flush():
+                break
+
+    async def flush(self) -> int:
+        """
+        Persist up to one batch of buffered usage events to ZeroDB.
+
+        Failed batches are put back at the head of the queue and retried on
+        the next flush.
+
+        Returns:
+            Number of usage events written.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch = self._pending[: self._flush_batch_size]
+            del self._pending[: len(batch)]
+            try:
+                await self.client.insert_rows(_USAGE_TABLE, batch)
+            except Exception as exc:
+                self._pending[:0] = batch
+                logger.error("Failed to persist %d usage event(s): %s", len(batch), exc)
+                return 0
+            for row in batch:
+                self._unflushed.pop(row["event_id"], None)
+            logger.debug("Persisted %d usage event(s) to %s.", len(batch), _USAGE_TABLE)
+            return len(batch)
+
+    async def reconcile_rollups(self) -> int:
+        """
+        Rebuild loaded rollups from ZeroDB and correct any that drifted.
+
+        Each rollup is rebuilt while the live one keeps serving reads and
+        taking new events, then swapped in. Rollups for past periods are
+        dropped rather than rebuilt; they are loaded again on the next read.
+
+        Returns:
+            Number of rollups whose totals were corrected.
+        """
+        current = _today_period()
+        corrected = 0
+        for key in list(self._rollups):
+            if key[2] != current:
+                self._rollups.pop(key, None)
+                continue
+            stale = self._rollups.get(key)
+            if stale is None:
+                continue
+            fresh = await self._load_rollup(key)
+            if self._rollups.get(key) is not stale:
+                # Invalidated or replaced while rebuilding
+                continue
+            if not fresh.same_as(stale):
+                logger.warning(
+                    "Corrected %s %s spend for %s: %s -> %s",
+                    key[0], key[1], key[2], stale.total, fresh.total,
+                )
+                corrected += 1
+            self._rollups[key] = fresh
+        return corrected
+
+    def invalidate_rollups(self) -> None:
+        """Drop every loaded rollup; each is reloaded from ZeroDB on next use."""
+        self._rollups.clear()
+
+    async def _metering_loop(self) -> None:
+        """Flush buffered events and periodically reconcile until cancelled."""
+        next_reconcile = time.monotonic() + self._reconcile_interval
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_wakeup.wait(), timeout=self._flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_wakeup.clear()
+            try:
+                while self._pending and await self.flush():
+                    pass
+                if time.monotonic() >= next_reconcile:
+                    next_reconcile = time.monotonic() + self._reconcile_interval
+                    await self.reconcile_rollups()
+            except Exception as exc:
+                logger.error("Billing metering loop error: %s", exc)
+
 
 # Global singleton
 billing_service = BillingService()
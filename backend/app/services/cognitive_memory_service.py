@@ -15,13 +15,22 @@ Design:
   themselves. The endpoint layer composes helpers with the existing
   `AgentMemoryService` to persist and fetch.
 - Deterministic outputs for easy testing.
+- Insight synthesis and profile building run over a CognitiveIndex: token
+  sets are computed once per memory, contradictions are found by joining
+  approve memories against an inverted token index of reject memories,
+  and category/topic aggregates are kept as running sums. One index is
+  kept per agent (up to MAX_TRACKED_AGENTS, least recently used dropped),
+  so a profile only processes memories it has not seen.
 """
 from __future__ import annotations
 
 import hashlib
+import heapq
 import logging
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -37,10 +46,244 @@ from app.schemas.cognitive_memory import (
     RecallWeights,
 )
 
+# Agents whose CognitiveIndex is kept in memory (least recently used dropped)
+MAX_TRACKED_AGENTS: int = 10_000
+
+
+@dataclass(frozen=True)
+class _IndexedMemory:
+    """Per-memory values derived once when a memory enters a CognitiveIndex."""
+
+    ordinal: int
+    key: Any
+    memory_id: str
+    content: str
+    category: MemoryCategory
+    importance: float
+    timestamp: Optional[str]
+    tokens: FrozenSet[str]
+    approves: bool
+    rejects: bool
+
+    def matches(self, memory: Dict[str, Any], service: "CognitiveMemoryService") -> bool:
+        """True when ``memory`` would index to the same values."""
+        return (
+            self.content == (memory.get("content") or "")
+            and self.category == service._extract_category(memory)
+            and self.importance == service._extract_importance(memory)
+            and self.timestamp == _memory_timestamp(memory)
+        )
+
+
+def _memory_timestamp(memory: Dict[str, Any]) -> Optional[str]:
+    ts = memory.get("timestamp")
+    return ts if isinstance(ts, str) and ts else None
+
+
+class CognitiveIndex:
+    """
+    Incremental index over one corpus of memories.
+
+    Holds cached token sets per memory, an inverted token → reject-memory
+    map for contradiction joins, and running category counts, topic
+    (count, importance sum) aggregates and timestamp counts. add/remove
+    cost is proportional to the memory's own tokens.
+    """
+
+    def __init__(self, service: "CognitiveMemoryService") -> None:
+        self._service = service
+        self._entries: Dict[Any, _IndexedMemory] = {}
+        self._next_ordinal = 0
+        self._reject_postings: Dict[str, Set[Any]] = {}
+        self.category_counts: Counter = Counter()
+        self.topic_counts: Counter = Counter()
+        self.topic_importance: Dict[str, float] = {}
+        self._timestamps: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return (memory_id, 0) in self._entries
+
+    def add(
+        self,
+        memory: Dict[str, Any],
+        tokens: Optional[FrozenSet[str]] = None,
+        key: Any = None,
+    ) -> None:
+        """
+        Index a memory, replacing any previous entry under the same key.
+
+        ``key`` defaults to ``(memory_id, 0)``, the key sync() gives the
+        first memory with that id; pass a distinct key to index several
+        memories that share (or lack) an id.
+        """
+        service = self._service
+        memory_id = memory.get("memory_id") or ""
+        if key is None:
+            key = (memory_id, 0)
+        if key in self._entries:
+            self.remove(key)
+
+        content = memory.get("content") or ""
+        content_lower = content.lower()
+        entry = _IndexedMemory(
+            ordinal=self._next_ordinal,
+            key=key,
+            memory_id=memory_id,
+            content=content,
+            category=service._extract_category(memory),
+            importance=service._extract_importance(memory),
+            timestamp=_memory_timestamp(memory),
+            tokens=tokens if tokens is not None else frozenset(service._significant_tokens(content)),
+            approves=any(tok in content_lower for tok in service._APPROVE_TOKENS),
+            rejects=any(tok in content_lower for tok in service._REJECT_TOKENS),
+        )
+        self._next_ordinal += 1
+        self._entries[key] = entry
+
+        self.category_counts[entry.category] += 1
+        for token in entry.tokens:
+            self.topic_counts[token] += 1
+            self.topic_importance[token] = self.topic_importance.get(token, 0.0) + entry.importance
+            if entry.rejects:
+                self._reject_postings.setdefault(token, set()).add(key)
+        if entry.timestamp:
+            self._timestamps[entry.timestamp] += 1
+
+    def remove(self, key: Any) -> None:
+        """Drop a memory (by key) and subtract it from every aggregate."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        _decrement(self.category_counts, entry.category)
+        for token in entry.tokens:
+            if _decrement(self.topic_counts, token):
+                self.topic_importance[token] -= entry.importance
+            else:
+                del self.topic_importance[token]
+            if entry.rejects:
+                postings = self._reject_postings[token]
+                postings.discard(key)
+                if not postings:
+                    del self._reject_postings[token]
+        if entry.timestamp:
+            _decrement(self._timestamps, entry.timestamp)
+
+    def sync(self, memories: Iterable[Dict[str, Any]]) -> None:
+        """
+        Make the index hold exactly ``memories``.
+
+        Memories already indexed with unchanged content and metadata are
+        kept as-is; only new, changed and missing ones are processed.
+        Entries are keyed by (memory_id, occurrence), so memories that
+        share an id, or have none, are each indexed rather than merged.
+        """
+        seen: Set[Tuple[str, int]] = set()
+        occurrences: Counter = Counter()
+        for memory in memories:
+            memory_id = memory.get("memory_id") or ""
+            key = (memory_id, occurrences[memory_id])
+            occurrences[memory_id] += 1
+            seen.add(key)
+            entry = self._entries.get(key)
+            if entry is None or not entry.matches(memory, self._service):
+                self.add(memory, key=key)
+        for key in [k for k in self._entries if k not in seen]:
+            self.remove(key)
+
+    def tokens_for(self, memory: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+        """Cached tokens for ``memory`` if indexed with the same content."""
+        entry = self._entries.get((memory.get("memory_id") or "", 0))
+        if entry is not None and entry.content == (memory.get("content") or ""):
+            return entry.tokens
+        return None
+
+    # --- Queries --------------------------------------------------------
+
+    def contradictions(self) -> List[Tuple[str, str, FrozenSet[str]]]:
+        """
+        (approve_id, reject_id, shared_tokens) for pairs sharing 2+ tokens.
+
+        Each approve memory counts shared tokens against reject memories
+        through the inverted index, so only rejects that share at least
+        one token are ever considered. Pairs come out in corpus order of
+        the approve memory, then the reject memory; a pair is reported
+        once even if both memories approve and reject.
+        """
+        results: List[Tuple[str, str, FrozenSet[str]]] = []
+        seen_pairs: Set[FrozenSet[str]] = set()
+        approves = sorted(
+            (e for e in self._entries.values() if e.approves),
+            key=lambda e: e.ordinal,
+        )
+        for a in approves:
+            shared: Counter = Counter()
+            for token in a.tokens:
+                shared.update(self._reject_postings.get(token, ()))
+            candidates = sorted(
+                (
+                    self._entries[rkey] for rkey, n in shared.items()
+                    if n >= 2 and self._entries[rkey].memory_id != a.memory_id
+                ),
+                key=lambda e: e.ordinal,
+            )
+            for r in candidates:
+                pair_key = frozenset({a.memory_id, r.memory_id})
+                if pair_key in seen_pairs:
+                    continue
+                seen_pairs.add(pair_key)
+                results.append((a.memory_id, r.memory_id, a.tokens & r.tokens))
+        return results
+
+    def top_topics(self, limit: int) -> List[Tuple[str, int, float]]:
+        """(token, count, importance_sum) for the ``limit`` most frequent tokens."""
+        return [
+            (token, count, self.topic_importance[token])
+            for token, count in heapq.nsmallest(
+                limit, self.topic_counts.items(), key=lambda kv: (-kv[1], kv[0])
+            )
+        ]
+
+    def top_expertise(self, limit: int) -> List[str]:
+        """Tokens ranked by count × average importance (= importance sum)."""
+        return [
+            token
+            for token, _score in heapq.nsmallest(
+                limit,
+                (
+                    (token, count * (self.topic_importance[token] / count))
+                    for token, count in self.topic_counts.items()
+                ),
+                key=lambda kv: (-kv[1], kv[0]),
+            )
+        ]
+
+    def timestamp_range(self) -> Tuple[Optional[str], Optional[str]]:
+        if not self._timestamps:
+            return None, None
+        return min(self._timestamps), max(self._timestamps)
+
+
+def _decrement(counter: Counter, key: Any) -> int:
+    """Decrement ``counter[key]``, deleting it at zero; return the new count."""
+    remaining = counter[key] - 1
+    if remaining > 0:
+        counter[key] = remaining
+    else:
+        del counter[key]
+    return remaining
+
 
 class CognitiveMemoryService:
     """Cognition helpers. Thin, dependency-free class for easy testing."""
 
+    def __init__(self, max_tracked_agents: int = MAX_TRACKED_AGENTS) -> None:
+        # agent_id -> index of the corpus last profiled for that agent
+        self._agent_indexes: "OrderedDict[str, CognitiveIndex]" = OrderedDict()
+        self.max_tracked_agents = max_tracked_agents
+
     DEFAULT_IMPORTANCE = 0.5
     DEFAULT_RECENCY_WEIGHT = 1.0
 
@@ -250,6 +493,28 @@ class CognitiveMemoryService:
         except (ValueError, TypeError):
             return MemoryCategory.OTHER
 
+    def _extract_importance(self, memory: Dict[str, Any]) -> float:
+        """Stored importance from metadata; 0.5 when missing or malformed."""
+        metadata = memory.get("metadata", {}) or {}
+        try:
+            return float(metadata.get("importance", 0.5))
+        except (TypeError, ValueError):
+            return 0.5
+
+    def agent_index(self, agent_id: str) -> CognitiveIndex:
+        """The persistent CognitiveIndex for an agent (created on first use)."""
+        index = self._agent_indexes.get(agent_id)
+        if index is None:
+            index = self._agent_indexes[agent_id] = CognitiveIndex(self)
+        self._agent_indexes.move_to_end(agent_id)
+        while len(self._agent_indexes) > self.max_tracked_agents:
+            self._agent_indexes.popitem(last=False)
+        return index
+
+    def _cached_tokens(self, memory: Dict[str, Any]) -> Optional[FrozenSet[str]]:
+        index = self._agent_indexes.get(memory.get("agent_id", ""))
+        return index.tokens_for(memory) if index is not None else None
+
     def synthesize_insights(
         self,
         memories: List[Dict[str, Any]],
@@ -262,15 +527,18 @@ class CognitiveMemoryService:
         - `contradictions`: pairs of memories where one contains an
           approve-token and the other a reject-token AND they share at
           least 2 significant (non-stopword) tokens — taken as a naive
-          "same topic" proxy.
+          "same topic" proxy. Found by joining approve memories against an
+          inverted token index of reject memories.
         - `gaps`: expected categories (`decision`, `plan`, `observation`)
           absent from the corpus.
         """
+        # Token sets are reused from the agent's profile index when cached
+        index = CognitiveIndex(self)
+        for position, m in enumerate(memories):
+            index.add(m, tokens=self._cached_tokens(m), key=position)
+
         # --- Patterns -------------------------------------------------
-        counts: Dict[MemoryCategory, int] = {}
-        for m in memories:
-            cat = self._extract_category(m)
-            counts[cat] = counts.get(cat, 0) + 1
+        counts = index.category_counts
 
         patterns: List[InsightPattern] = [
             InsightPattern(label=cat.value, count=n, category=cat)
@@ -280,37 +548,13 @@ class CognitiveMemoryService:
         ][:3]
 
         # --- Contradictions ------------------------------------------
-        approves = []
-        rejects = []
-        for m in memories:
-            content_lower = (m.get("content") or "").lower()
-            if any(tok in content_lower for tok in self._APPROVE_TOKENS):
-                approves.append(m)
-            if any(tok in content_lower for tok in self._REJECT_TOKENS):
-                rejects.append(m)
-
-        contradictions: List[InsightContradiction] = []
-        seen_pairs = set()
-        for a in approves:
-            a_tokens = self._significant_tokens(a.get("content") or "")
-            for r in rejects:
-                if a.get("memory_id") == r.get("memory_id"):
-                    continue
-                r_tokens = self._significant_tokens(r.get("content") or "")
-                overlap = a_tokens & r_tokens
-                if len(overlap) < 2:
-                    continue
-                pair_key = frozenset({a.get("memory_id"), r.get("memory_id")})
-                if pair_key in seen_pairs:
-                    continue
-                seen_pairs.add(pair_key)
-                topic = " ".join(sorted(overlap)[:3])
-                contradictions.append(
-                    InsightContradiction(
-                        topic=topic,
-                        memory_ids=[a.get("memory_id", ""), r.get("memory_id", "")],
-                    )
-                )
+        contradictions: List[InsightContradiction] = [
+            InsightContradiction(
+                topic=" ".join(sorted(overlap)[:3]),
+                memory_ids=[approve_id, reject_id],
+            )
+            for approve_id, reject_id, overlap in index.contradictions()
+        ]
 
         # --- Gaps -----------------------------------------------------
         present = {c for c, n in counts.items() if n > 0}
@@ -355,39 +599,21 @@ class CognitiveMemoryService:
         - `expertise_areas`: top topics sorted by `count × avg_importance`,
           capped at 5.
         - `first_memory_at` / `last_memory_at`: min / max ISO timestamps.
+
+        Aggregates come from the agent's CognitiveIndex, which is synced to
+        `memories`: unchanged memories are not re-tokenized.
         """
         if not memories:
             return ProfileResponse(agent_id=agent_id, memory_count=0)
 
-        # Categories
-        cat_counts: Dict[MemoryCategory, int] = {}
-        # Topic aggregation: {token: (count, sum_importance)}
-        topic_agg: Dict[str, List[float]] = {}
-        timestamps: List[str] = []
-
-        for m in memories:
-            cat = self._extract_category(m)
-            cat_counts[cat] = cat_counts.get(cat, 0) + 1
-
-            metadata = m.get("metadata", {}) or {}
-            try:
-                importance = float(metadata.get("importance", 0.5))
-            except (TypeError, ValueError):
-                importance = 0.5
-
-            for token in self._significant_tokens(m.get("content") or ""):
-                bucket = topic_agg.setdefault(token, [0, 0.0])
-                bucket[0] += 1
-                bucket[1] += importance
-
-            ts = m.get("timestamp")
-            if isinstance(ts, str) and ts:
-                timestamps.append(ts)
+        # Only memories not already in the agent's index are tokenized
+        index = self.agent_index(agent_id)
+        index.sync(memories)
 
         categories = [
             ProfileCategoryStats(category=cat, count=count)
             for cat, count in sorted(
-                cat_counts.items(), key=lambda kv: (-kv[1], kv[0].value)
+                index.category_counts.items(), key=lambda kv: (-kv[1], kv[0].value)
             )
         ]
 
@@ -397,25 +623,13 @@ class CognitiveMemoryService:
                 count=count,
                 average_importance=max(0.0, min(1.0, total_imp / count)),
             )
-            for token, (count, total_imp) in sorted(
-                topic_agg.items(), key=lambda kv: (-kv[1][0], kv[0])
-            )
-        ][: self._PROFILE_TOPIC_LIMIT]
+            for token, count, total_imp in index.top_topics(self._PROFILE_TOPIC_LIMIT)
+        ]
 
         # Expertise: rank by count × avg_importance
-        expertise_areas = [
-            token
-            for token, _score in sorted(
-                (
-                    (token, count * (total_imp / count))
-                    for token, (count, total_imp) in topic_agg.items()
-                ),
-                key=lambda kv: (-kv[1], kv[0]),
-            )
-        ][: self._EXPERTISE_AREA_LIMIT]
+        expertise_areas = index.top_expertise(self._EXPERTISE_AREA_LIMIT)
 
-        first_ts = min(timestamps) if timestamps else None
-        last_ts = max(timestamps) if timestamps else None
+        first_ts, last_ts = index.timestamp_range()
 
         return ProfileResponse(
             agent_id=agent_id,
@@ -94,9 +94,77 @@ class ComplianceService:
         # Generate timestamp
         timestamp = datetime.utcnow().isoformat() + "Z"
 
-        # Prepare row data for ZeroDB
-        # Note: Maps to compliance_events table schema
-        row_data = {
+        row_data = self._event_row(project_id, event_data, event_id, timestamp)
+
+        try:
+            result = await self.client.insert_row(COMPLIANCE_EVENTS_TABLE, row_data)
+            logger.info(f"Created compliance event {event_id} for project {project_id}")
+        except Exception as e:
+            logger.error(f"Failed to create compliance event: {e}")
+            raise APIError(
+                message=f"Failed to create compliance event: {str(e)}",
+                status_code=500,
+                error_code="COMPLIANCE_EVENT_CREATE_FAILED"
+            )
+
+        return self._event_response(project_id, event_data, event_id, timestamp)
+
+    async def create_events(
+        self,
+        project_id: str,
+        events: List[ComplianceEventCreate],
+        event_ids: Optional[List[str]] = None
+    ) -> List[ComplianceEventResponse]:
+        """
+        Create several compliance events with one row insert.
+
+        Args:
+            project_id: Project identifier
+            events: Event data, one entry per event
+            event_ids: Optional pre-assigned event IDs, parallel to events
+                (generated when omitted)
+
+        Returns:
+            ComplianceEventResponse per event, in input order
+
+        Raises:
+            APIError: If event creation fails
+        """
+        if not events:
+            return []
+        event_ids = event_ids or [self.generate_event_id() for _ in events]
+        timestamp = datetime.utcnow().isoformat() + "Z"
+
+        rows = [
+            self._event_row(project_id, event_data, event_id, timestamp)
+            for event_data, event_id in zip(events, event_ids)
+        ]
+
+        try:
+            await self.client.insert_rows(COMPLIANCE_EVENTS_TABLE, rows)
+            logger.info(f"Created {len(rows)} compliance events for project {project_id}")
+        except Exception as e:
+            logger.error(f"Failed to create compliance events: {e}")
+            raise APIError(
+                message=f"Failed to create compliance events: {str(e)}",
+                status_code=500,
+                error_code="COMPLIANCE_EVENT_CREATE_FAILED"
+            )
+
+        return [
+            self._event_response(project_id, event_data, event_id, timestamp)
+            for event_data, event_id in zip(events, event_ids)
+        ]
+
+    def _event_row(
+        self,
+        project_id: str,
+        event_data: ComplianceEventCreate,
+        event_id: str,
+        timestamp: str
+    ) -> Dict[str, Any]:
+        """Map event data to a compliance_events table row."""
+        return {
             "event_id": event_id,
             "project_id": project_id,
             "agent_id": event_data.agent_id,
@@ -111,17 +179,14 @@ class ComplianceService:
             "created_at": timestamp
         }
 
-        try:
-            result = await self.client.insert_row(COMPLIANCE_EVENTS_TABLE, row_data)
-            logger.info(f"Created compliance event {event_id} for project {project_id}")
-        except Exception as e:
-            logger.error(f"Failed to create compliance event: {e}")
-            raise APIError(
-                message=f"Failed to create compliance event: {str(e)}",
-                status_code=500,
-                error_code="COMPLIANCE_EVENT_CREATE_FAILED"
-            )
-
+    def _event_response(
+        self,
+        project_id: str,
+        event_data: ComplianceEventCreate,
+        event_id: str,
+        timestamp: str
+    ) -> ComplianceEventResponse:
+        """Build the response for a created event."""
         return ComplianceEventResponse(
             event_id=event_id,
             project_id=project_id,
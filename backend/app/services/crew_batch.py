@@ -0,0 +1,470 @@
+"""
+CrewBatchRunner - high-volume batch execution of the 3-agent crew workflow.
+
+Runs many CrewOrchestrator workflows (one per input) with bounded
+concurrency, for nightly transaction screening and similar bulk jobs.
+
+Design:
+- Inputs are any iterable or async iterable of input_data dicts (e.g. a
+  JSONL file read line by line); they are consumed lazily, so memory use is
+  bounded by the concurrency, not the batch size
+- One AgentMemoryService (and therefore one ZeroDB client) and the shared
+  Gemini service are used by every run
+- Orchestrator audit events (workflow_started / completed / failed) go
+  through one ToolAuditPipeline, so they are written in batches behind the
+  workflows rather than awaited inside each run
+- Results are yielded as runs finish (completion order, each carrying its
+  input index), and a running BatchSummary is kept for throughput reporting
+
+- Crew memory writes and compliance events go through one CrewWriteBuffer:
+  their IDs are assigned when they are buffered (so a run can still link
+  them into compliance event details and its X402 request), and the rows
+  are written with one insert per table every ``write_flush_size`` writes
+  and when the batch ends; failed inserts are retried, and writes given up
+  on are reported in the summary as ``unpersisted_writes``
+
+Usage:
+    runner = CrewBatchRunner(project_id="proj_123", agent_did="did:agent:screening")
+    async for run in runner.run(iter_jsonl(path)):
+        print(run.to_dict())
+    print(runner.summary.to_dict())
+"""
+import asyncio
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, TextIO, Tuple, Union
+
+from app.schemas.compliance_events import ComplianceEventCreate
+from app.services.agent_memory_service import get_agent_memory_service
+from app.services.compliance_service import compliance_service as default_compliance_service
+from app.services.crew_orchestrator import CrewOrchestrator
+from tools.audit_pipeline import ToolAuditPipeline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_CONCURRENCY = 8
+DEFAULT_WRITE_FLUSH_SIZE = 100
+DEFAULT_WRITE_ATTEMPTS = 3
+DEFAULT_WRITE_RETRY_DELAY = 0.5
+
+BatchInputs = Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]
+
+
+@dataclass
+class BatchRunResult:
+    """Outcome of one workflow in a batch."""
+
+    index: int
+    run_id: str
+    status: str
+    duration_ms: float
+    request_id: Optional[str] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class BatchSummary:
+    """Running totals and throughput for a batch."""
+
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    unpersisted_writes: int = 0
+    durations_ms: List[float] = field(default_factory=list, repr=False)
+
+    @property
+    def throughput(self) -> float:
+        """Finished runs per second since the batch started."""
+        return self.total / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def percentile_ms(self, pct: float) -> float:
+        if not self.durations_ms:
+            return 0.0
+        ordered = sorted(self.durations_ms)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "runs_per_second": round(self.throughput, 2),
+            "p50_ms": round(self.percentile_ms(0.50), 1),
+            "p95_ms": round(self.percentile_ms(0.95), 1),
+            "unpersisted_writes": self.unpersisted_writes,
+        }
+
+
+class CrewWriteBuffer:
+    """
+    Buffers crew memory writes and compliance events across a batch.
+
+    Memory and event IDs are generated client-side, so each write gets its
+    ID when it is buffered and the run continues with it. flush() writes
+    the buffered memories with one AgentMemoryService.store_memories call
+    and the events with one ComplianceService.create_events call per
+    project. Failed writes are put back and retried on the next flush, up
+    to max_attempts; writes given up on are logged and counted in failed.
+    """
+
+    def __init__(
+        self,
+        memory_service,
+        compliance_service=None,
+        flush_size: int = DEFAULT_WRITE_FLUSH_SIZE,
+        max_attempts: int = DEFAULT_WRITE_ATTEMPTS,
+        retry_delay: float = DEFAULT_WRITE_RETRY_DELAY
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            memory_service: AgentMemoryService the memories are written to
+            compliance_service: ComplianceService for events (defaults to
+                the module singleton)
+            flush_size: Buffered writes that trigger a flush
+            max_attempts: Flushes a write is attempted in before it is dropped
+            retry_delay: Delay between attempts when draining, in seconds
+        """
+        self.memory_service = memory_service
+        self.compliance_service = compliance_service or default_compliance_service
+        self.flush_size = flush_size
+        self.max_attempts = max(1, max_attempts)
+        self.retry_delay = retry_delay
+        self._memories: List[Dict[str, Any]] = []
+        self._events: List[Tuple[str, str, ComplianceEventCreate]] = []
+        self._attempts: Dict[str, int] = {}
+        self._flush_lock = asyncio.Lock()
+
+        # Delivery counters
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Writes buffered but not yet flushed."""
+        return len(self._memories) + len(self._events)
+
+    async def store_memory(self, **entry: Any) -> Dict[str, Any]:
+        """
+        Buffer a memory write.
+
+        Args:
+            **entry: AgentMemoryService.store_memory arguments
+
+        Returns:
+            The memory record, with its memory_id, marked queued
+        """
+        record = {**entry, "memory_id": self.memory_service.generate_memory_id()}
+        self._memories.append(record)
+        await self._flush_if_full()
+        return {**record, "queued": True}
+
+    async def create_event(
+        self,
+        project_id: str,
+        event_data: ComplianceEventCreate
+    ) -> Dict[str, Any]:
+        """
+        Buffer a compliance event.
+
+        Args:
+            project_id: Project identifier
+            event_data: Event data (details are copied as they are now)
+
+        Returns:
+            Dict with the event_id, marked queued
+        """
+        event_id = self.compliance_service.generate_event_id()
+        self._events.append((project_id, event_id, event_data.model_copy(deep=True)))
+        await self._flush_if_full()
+        return {"event_id": event_id, "queued": True}
+
+    async def flush(self) -> None:
+        """
+        Write everything buffered so far.
+
+        Failed writes are put back at the head of the buffer, unless they
+        have used up their attempts.
+        """
+        async with self._flush_lock:
+            memories, self._memories = self._memories, []
+            events, self._events = self._events, []
+
+            if memories:
+                try:
+                    await self.memory_service.store_memories(memories)
+                    self._written([m["memory_id"] for m in memories])
+                except Exception as e:
+                    logger.error(f"Failed to write {len(memories)} crew memories: {e}")
+                    retry = self._retryable(memories, [m["memory_id"] for m in memories])
+                    self._memories[:0] = retry
+
+            by_project: Dict[str, List[Tuple[str, ComplianceEventCreate]]] = {}
+            for project_id, event_id, event_data in events:
+                by_project.setdefault(project_id, []).append((event_id, event_data))
+            for project_id, project_events in by_project.items():
+                try:
+                    await self.compliance_service.create_events(
+                        project_id,
+                        [event_data for _, event_data in project_events],
+                        event_ids=[event_id for event_id, _ in project_events]
+                    )
+                    self._written([event_id for event_id, _ in project_events])
+                except Exception as e:
+                    logger.error(
+                        f"Failed to write {len(project_events)} compliance events: {e}",
+                        extra={"project_id": project_id}
+                    )
+                    retry = self._retryable(
+                        project_events, [event_id for event_id, _ in project_events]
+                    )
+                    self._events[:0] = [
+                        (project_id, event_id, event_data) for event_id, event_data in retry
+                    ]
+
+    async def drain(self) -> None:
+        """Flush until every buffered write is written or given up on."""
+        while self.pending:
+            await self.flush()
+            if self.pending and self.retry_delay:
+                await asyncio.sleep(self.retry_delay)
+
+    def _written(self, ids: List[str]) -> None:
+        self.written += len(ids)
+        for write_id in ids:
+            self._attempts.pop(write_id, None)
+
+    def _retryable(self, writes: List[Any], ids: List[str]) -> List[Any]:
+        """Return the failed writes that have attempts left; drop and count the rest."""
+        retry = []
+        for write, write_id in zip(writes, ids):
+            attempts = self._attempts.get(write_id, 0) + 1
+            if attempts < self.max_attempts:
+                self._attempts[write_id] = attempts
+                retry.append(write)
+            else:
+                self._attempts.pop(write_id, None)
+                self.failed += 1
+        dropped = len(writes) - len(retry)
+        if dropped:
+            logger.error(f"Dropped {dropped} crew writes after {self.max_attempts} attempts")
+        return retry
+
+    async def _flush_if_full(self) -> None:
+        if self.pending >= self.flush_size:
+            await self.flush()
+
+
+class CrewBatchRunner:
+    """
+    Runs crew workflows for a stream of inputs with bounded concurrency.
+
+    Each input gets its own CrewOrchestrator (and run_id); all of them share
+    the memory service, the audit pipeline and the crew write buffer.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        agent_did: str,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        max_retries: int = 1,
+        retry_delay: float = 1.0,
+        crew_timeout: Optional[float] = None,
+        load_context: bool = True,
+        include_results: bool = False,
+        memory_service=None,
+        audit_pipeline: Optional[ToolAuditPipeline] = None,
+        write_buffer: Optional[CrewWriteBuffer] = None
+    ):
+        """
+        Initialize the batch runner.
+
+        Args:
+            project_id: Project identifier
+            agent_did: Agent DID for namespace isolation
+            concurrency: Workflows in flight at once
+            max_retries: Attempts per workflow
+            retry_delay: Delay between attempts in seconds
+            crew_timeout: Optional timeout per crew attempt in seconds
+            load_context: Whether each run loads memory context
+            include_results: Attach the full crew result to each BatchRunResult
+            memory_service: Shared AgentMemoryService (defaults to the singleton)
+            audit_pipeline: Shared audit pipeline (one is created if omitted)
+            write_buffer: Shared crew write buffer (one is created over
+                memory_service if omitted)
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.project_id = project_id
+        self.agent_did = agent_did
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.crew_timeout = crew_timeout
+        self.load_context = load_context
+        self.include_results = include_results
+        self.memory_service = memory_service or get_agent_memory_service()
+        self.audit_pipeline = audit_pipeline or ToolAuditPipeline()
+        self.write_buffer = write_buffer or CrewWriteBuffer(self.memory_service)
+        self.summary = BatchSummary()
+
+    def _create_orchestrator(self) -> CrewOrchestrator:
+        return CrewOrchestrator(
+            project_id=self.project_id,
+            agent_did=self.agent_did,
+            max_retries=self.max_retries,
+            retry_delay=self.retry_delay,
+            crew_timeout=self.crew_timeout,
+            memory_service=self.memory_service,
+            audit_pipeline=self.audit_pipeline,
+            write_buffer=self.write_buffer
+        )
+
+    async def run(self, inputs: BatchInputs) -> AsyncIterator[BatchRunResult]:
+        """
+        Execute a workflow per input, yielding results as runs finish.
+
+        Crew writes and audit events still queued when the last run
+        finishes are flushed before the generator completes; crew writes
+        that could not be persisted are counted in the summary.
+
+        Args:
+            inputs: Iterable or async iterable of input_data dicts
+
+        Yields:
+            BatchRunResult per input, in completion order
+        """
+        self.summary = BatchSummary()
+        started = time.perf_counter()
+        failed_writes = self.write_buffer.failed
+        pending: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
+        finished: asyncio.Queue = asyncio.Queue()
+
+        async def feed() -> None:
+            # No sentinels when cancelled: the consumer stopped early, the
+            # workers are cancelled too and the queue may stay full
+            index = 0
+            error: Optional[Exception] = None
+            try:
+                async for input_data in _aiter(inputs):
+                    await pending.put((index, input_data))
+                    index += 1
+            except Exception as e:
+                error = e
+            for _ in range(self.concurrency):
+                await pending.put(None)
+            if error is not None:
+                raise error
+
+        async def work() -> None:
+            while True:
+                item = await pending.get()
+                if item is None:
+                    break
+                await finished.put(await self._run_one(*item))
+            await finished.put(None)
+
+        feeder = asyncio.create_task(feed())
+        workers = [asyncio.create_task(work()) for _ in range(self.concurrency)]
+        try:
+            running = len(workers)
+            while running:
+                run = await finished.get()
+                if run is None:
+                    running -= 1
+                    continue
+                self._record(run, started)
+                yield run
+            await feeder
+        finally:
+            feeder.cancel()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(feeder, *workers, return_exceptions=True)
+            await self.write_buffer.drain()
+            await self.audit_pipeline.flush()
+            self.summary.unpersisted_writes = self.write_buffer.failed - failed_writes
+            self.summary.elapsed_seconds = time.perf_counter() - started
+
+    async def _run_one(self, index: int, input_data: Any) -> BatchRunResult:
+        orchestrator = self._create_orchestrator()
+        start = time.perf_counter()
+        try:
+            if not isinstance(input_data, dict):
+                raise ValueError("Batch input must be a JSON object")
+            result = await orchestrator.execute(
+                dict(input_data),
+                load_context=self.load_context
+            )
+            return BatchRunResult(
+                index=index,
+                run_id=orchestrator.run_id,
+                status="completed",
+                duration_ms=(time.perf_counter() - start) * 1000,
+                request_id=result.get("request_id"),
+                result=result if self.include_results else None
+            )
+        except Exception as e:
+            return BatchRunResult(
+                index=index,
+                run_id=orchestrator.run_id,
+                status="failed",
+                duration_ms=(time.perf_counter() - start) * 1000,
+                error=str(e)
+            )
+
+    def _record(self, run: BatchRunResult, started: float) -> None:
+        summary = self.summary
+        summary.total += 1
+        if run.status == "completed":
+            summary.completed += 1
+        else:
+            summary.failed += 1
+        summary.durations_ms.append(run.duration_ms)
+        summary.elapsed_seconds = time.perf_counter() - started
+
+
+async def _aiter(inputs: BatchInputs) -> AsyncIterator[Any]:
+    if hasattr(inputs, "__aiter__"):
+        async for item in inputs:
+            yield item
+    else:
+        for item in inputs:
+            yield item
+
+
+async def iter_jsonl(stream: TextIO) -> AsyncIterator[Any]:
+    """
+    Read JSON objects from a JSONL stream without blocking the event loop.
+
+    Blank lines are skipped. Lines that are not valid JSON are logged and
+    yielded as None, so they are reported as failed runs with their index.
+
+    Args:
+        stream: Text stream (file or sys.stdin)
+
+    Yields:
+        Decoded JSON value per non-blank line
+    """
+    while True:
+        line = await asyncio.to_thread(stream.readline)
+        if not line:
+            return
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSONL line: {e}")
+            yield None
@@ -5,6 +5,7 @@ Implements Issues #117 + #118: Enhanced CrewAI and Agent Memory System.
 
 This service provides:
 - Crew execution with error handling and retries
+- Concurrent stage execution (audit writes overlap context loading)
 - Memory context loading via semantic search
 - Audit trail for all agent actions
 - DID-based namespace isolation
@@ -25,6 +26,7 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 from app.crew.crew import X402Crew
+from app.crew.task_graph import TaskGraph
 from app.services.agent_memory_service import get_agent_memory_service
 
 logger = logging.getLogger(__name__)
@@ -54,7 +56,11 @@ class CrewOrchestrator:
         agent_did: str,
         run_id: Optional[str] = None,
         max_retries: int = 3,
-        retry_delay: float = 1.0
+        retry_delay: float = 1.0,
+        crew_timeout: Optional[float] = None,
+        memory_service=None,
+        audit_pipeline=None,
+        write_buffer=None
     ):
         """
         Initialize the crew orchestrator.
@@ -65,15 +71,25 @@ class CrewOrchestrator:
             run_id: Optional run identifier (generated if not provided)
             max_retries: Maximum number of retry attempts
             retry_delay: Delay between retries in seconds
+            crew_timeout: Optional timeout per crew attempt in seconds
+            memory_service: Optional shared AgentMemoryService (defaults to
+                the module singleton)
+            audit_pipeline: Optional ToolAuditPipeline; when set, audit
+                events are written behind instead of awaited
+            write_buffer: Optional CrewWriteBuffer the crew's memory writes
+                and compliance events are buffered in
         """
         self.project_id = project_id
         self.agent_did = agent_did
         self.run_id = run_id or self._generate_run_id()
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.crew_timeout = crew_timeout
 
         # Memory service for context and audit
-        self._memory_service = None
+        self._memory_service = memory_service
+        self._audit_pipeline = audit_pipeline
+        self._write_buffer = write_buffer
 
         logger.info(
             f"CrewOrchestrator initialized for project {project_id}",
@@ -109,7 +125,8 @@ class CrewOrchestrator:
         """
         return X402Crew(
             project_id=self.project_id,
-            run_id=self.run_id
+            run_id=self.run_id,
+            write_buffer=self._write_buffer
         )
 
     async def load_memory_context(
@@ -192,7 +209,8 @@ class CrewOrchestrator:
             token_id: Optional Arc NFT token ID for linkage
 
         Returns:
-            Stored audit record with memory_id
+            Stored audit record with memory_id (memory_id is None and
+            queued is True when written through the audit pipeline)
         """
         timestamp = datetime.utcnow().isoformat() + "Z"
 
@@ -207,17 +225,26 @@ class CrewOrchestrator:
             metadata["token_id"] = token_id
 
         audit_content = f"Audit: {action} at {timestamp}"
+        record = {
+            "project_id": self.project_id,
+            "agent_id": self.agent_did,
+            "run_id": self.run_id,
+            "memory_type": "audit_event",
+            "content": audit_content,
+            "namespace": self.agent_did,
+            "metadata": metadata
+        }
 
-        try:
-            result = await self.memory_service.store_memory(
-                project_id=self.project_id,
-                agent_id=self.agent_did,
-                run_id=self.run_id,
-                memory_type="audit_event",
-                content=audit_content,
-                namespace=self.agent_did,
-                metadata=metadata
+        if self._audit_pipeline is not None:
+            # Write-behind: batched with other runs' audit events, kept in
+            # order per run_id
+            await self._audit_pipeline.submit(
+                self.memory_service.store_memory, self.run_id, **record
             )
+            return {"memory_id": None, "queued": True, "timestamp": timestamp}
+
+        try:
+            result = await self.memory_service.store_memory(**record)
 
             logger.info(
                 f"Recorded audit event: {action}",
@@ -302,89 +329,109 @@ class CrewOrchestrator:
         - Retry logic for transient failures
         - Audit trail for all actions
 
+        The workflow_started audit write runs concurrently with memory
+        context loading, so only context loading sits on the critical path
+        before the crew starts. The crew is created once and reused across
+        retries.
+
         Args:
             input_data: Input data for the workflow
             retry_on_failure: Whether to retry on failures
             load_context: Whether to load memory context first
 
         Returns:
-            Workflow result with request_id and outputs
+            Workflow result with request_id, outputs, stage_timings (crew)
+            and workflow_timings (orchestration stages)
         """
-        # Record workflow start
-        await self.record_audit_event(
-            action="workflow_started",
-            details={
-                "input_query": input_data.get("query", ""),
-                "retry_enabled": retry_on_failure
-            }
-        )
+        graph = self._build_workflow_graph(input_data, retry_on_failure, load_context)
 
-        # Optionally load memory context
-        context = []
-        if load_context:
-            query = input_data.get("query", "")
-            if query:
-                context = await self.load_memory_context(query)
-                input_data["memory_context"] = context
-
-        # Execute with retry logic
-        last_error = None
-        attempts = 0
-
-        while attempts < self.max_retries:
-            attempts += 1
-
-            try:
-                crew = self._create_crew()
-                result = await crew.kickoff(input_data)
-
-                # Record success
-                await self.record_audit_event(
-                    action="workflow_completed",
-                    details={
-                        "request_id": result.get("request_id"),
-                        "attempts": attempts
-                    }
-                )
-
-                return result
-
-            except Exception as e:
-                last_error = e
-                logger.warning(
-                    f"Workflow attempt {attempts} failed: {e}",
-                    extra={
-                        "attempt": attempts,
-                        "max_retries": self.max_retries,
-                        "error": str(e)
-                    }
-                )
-
-                if not retry_on_failure or attempts >= self.max_retries:
-                    break
-
-                # Wait before retry
-                import asyncio
-                await asyncio.sleep(self.retry_delay)
-
-        # Record failure
-        await self.record_audit_event(
-            action="workflow_failed",
-            details={
-                "error": str(last_error),
-                "attempts": attempts
-            }
-        )
+        try:
+            outputs = await graph.run()
+        except Exception as e:
+            attempts = graph.timings.get("crew", {}).get("attempts", 0)
+
+            # Record failure
+            await self.record_audit_event(
+                action="workflow_failed",
+                details={
+                    "error": str(e),
+                    "attempts": attempts
+                }
+            )
+            raise
 
-        # Re-raise or return error result
-        if last_error:
-            raise last_error
+        result = outputs["crew"]
+        if isinstance(result, dict):
+            result["workflow_timings"] = graph.timings
+        return result
 
-        return {
-            "status": "failed",
-            "error": "Max retries exceeded",
-            "attempts": attempts
-        }
+    def _build_workflow_graph(
+        self,
+        input_data: Dict[str, Any],
+        retry_on_failure: bool,
+        load_context: bool
+    ) -> TaskGraph:
+        """
+        Build the orchestration stage graph.
+
+        audit_started ──────────────────────────┐
+        memory_context ──> crew (retries) ──> audit_completed
+
+        Args:
+            input_data: Input data for the workflow
+            retry_on_failure: Whether the crew stage is retried
+            load_context: Whether to load memory context
+
+        Returns:
+            TaskGraph for one workflow execution
+        """
+        crew = self._create_crew()
+        query = input_data.get("query", "")
+
+        async def load_context_stage(deps: Dict[str, Any]) -> List[Dict[str, Any]]:
+            if not (load_context and query):
+                return []
+            context = await self.load_memory_context(query)
+            input_data["memory_context"] = context
+            return context
+
+        async def audit_completed_stage(deps: Dict[str, Any]) -> Dict[str, Any]:
+            return await self.record_audit_event(
+                action="workflow_completed",
+                details={
+                    "request_id": deps["crew"].get("request_id"),
+                    "attempts": graph.timings["crew"]["attempts"]
+                }
+            )
+
+        graph = TaskGraph()
+        graph.add_stage(
+            "audit_started",
+            lambda deps: self.record_audit_event(
+                action="workflow_started",
+                details={
+                    "input_query": query,
+                    "retry_enabled": retry_on_failure
+                }
+            ),
+            required=False
+        )
+        graph.add_stage("memory_context", load_context_stage, required=False)
+        graph.add_stage(
+            "crew",
+            lambda deps: crew.kickoff(input_data),
+            depends_on=("memory_context",),
+            timeout=self.crew_timeout,
+            retries=max(0, self.max_retries - 1) if retry_on_failure else 0,
+            retry_delay=self.retry_delay
+        )
+        graph.add_stage(
+            "audit_completed",
+            audit_completed_stage,
+            depends_on=("crew", "audit_started"),
+            required=False
+        )
+        return graph
 
     async def get_audit_trail(
         self,
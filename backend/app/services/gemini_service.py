@@ -47,6 +47,15 @@ AGENT_MODEL_MAPPING = {
     "transaction": "gemini-1.5-flash",
 }
 
+# Input context window (tokens) per model
+MODEL_CONTEXT_LIMITS = {
+    "gemini-pro": 30_720,
+    "gemini-1.0-pro": 30_720,
+    "gemini-1.5-pro": 2_097_152,
+    "gemini-1.5-flash": 1_048_576,
+}
+DEFAULT_CONTEXT_LIMIT = 30_720
+
 # Default configuration
 DEFAULT_TIMEOUT_SECONDS = 30
 DEFAULT_MAX_RETRIES = 3
@@ -259,6 +268,18 @@ class GeminiService:
         """
         return AGENT_MODEL_MAPPING.get(agent_type, self.default_model)
 
+    def get_context_limit(self, model: Optional[str] = None) -> int:
+        """
+        Get the input context window of a model in tokens.
+
+        Args:
+            model: Model name (default: self.default_model)
+
+        Returns:
+            Maximum input tokens for the model
+        """
+        return MODEL_CONTEXT_LIMITS.get(model or self.default_model, DEFAULT_CONTEXT_LIMIT)
+
     def _validate_model(self, model: str) -> None:
         """
         Validate that the model is supported.
@@ -10,15 +10,24 @@ Supported policy types:
 - task_scope:            allowed_tasks
 - data_access:           allowed_tables, read_only
 
+Evaluation runs against a per-agent CompiledPolicySet: rules are
+preprocessed once into thresholds and frozensets and grouped by the action
+they govern, so a check is a dict lookup plus a few comparisons. Compiled
+sets are cached; create_policy invalidates the agent's entry and entries
+expire after POLICY_CACHE_TTL_SECONDS to pick up changes made elsewhere.
+
 Built by AINative Dev Team
 Refs #236
 """
 from __future__ import annotations
 
+import asyncio
+import time
 import uuid
 import logging
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from app.services.zerodb_client import get_zerodb_client
 
@@ -33,17 +42,129 @@ SUPPORTED_POLICY_TYPES = {
     "data_access",
 }
 
+# Max age of a cached compiled policy set before it is reloaded
+POLICY_CACHE_TTL_SECONDS = 60.0
+
+# A compiled rule: returns True when the action context VIOLATES the policy
+PolicyCheck = Callable[[Dict[str, Any]], bool]
+
+
+def _frozen(values: Any) -> Any:
+    """A frozenset for O(1) membership; a tuple if some value is unhashable."""
+    try:
+        return frozenset(values or ())
+    except TypeError:
+        return tuple(values)
+
+
+def _compile_spend_limit(rules: Dict[str, Any]) -> List[Tuple[str, PolicyCheck]]:
+    """Violated if a 'spend' amount exceeds per_call_limit_usd or daily_limit_usd."""
+    limits = [
+        limit
+        for limit in (rules.get("per_call_limit_usd"), rules.get("daily_limit_usd"))
+        if limit is not None
+    ]
+    if not limits:
+        return []
+    # amount > a or amount > b  <=>  amount > min(a, b)
+    threshold = min(limits)
+    return [("spend", lambda context: context.get("amount_usd", 0.0) > threshold)]
+
+
+def _compile_interaction_whitelist(rules: Dict[str, Any]) -> List[Tuple[str, PolicyCheck]]:
+    """Violated if a 'call_agent' target_did is not whitelisted."""
+    allowed_dids = _frozen(rules.get("allowed_dids"))
+    return [("call_agent", lambda context: context.get("target_did", "") not in allowed_dids)]
+
+
+def _compile_task_scope(rules: Dict[str, Any]) -> List[Tuple[str, PolicyCheck]]:
+    """Violated if an 'execute_task' task is not in allowed_tasks."""
+    allowed_tasks = _frozen(rules.get("allowed_tasks"))
+    return [("execute_task", lambda context: context.get("task", "") not in allowed_tasks)]
+
+
+def _compile_data_access(rules: Dict[str, Any]) -> List[Tuple[str, PolicyCheck]]:
+    """Violated if a read/write touches a table not allowed, or writes when read_only."""
+    allowed_tables = _frozen(rules.get("allowed_tables"))
+
+    def table_denied(context: Dict[str, Any]) -> bool:
+        table = context.get("table", "")
+        return bool(table) and table not in allowed_tables
+
+    if rules.get("read_only"):
+        return [("read_data", table_denied), ("write_data", lambda context: True)]
+    return [("read_data", table_denied), ("write_data", table_denied)]
+
+
+_POLICY_COMPILERS: Dict[str, Callable[[Dict[str, Any]], List[Tuple[str, PolicyCheck]]]] = {
+    "spend_limit": _compile_spend_limit,
+    "interaction_whitelist": _compile_interaction_whitelist,
+    "task_scope": _compile_task_scope,
+    "data_access": _compile_data_access,
+}
+
+
+@dataclass
+class CompiledPolicySet:
+    """
+    An agent's active policies, compiled and grouped by governed action.
+
+    ``checks[action]`` lists (policy_id, check) in policy order; actions no
+    policy governs have no entry and are always allowed.
+    """
+
+    policy_count: int
+    checks: Dict[str, List[Tuple[str, PolicyCheck]]] = field(default_factory=dict)
+    compiled_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def compile(cls, policies: Iterable[Dict[str, Any]]) -> "CompiledPolicySet":
+        policies = list(policies)
+        compiled = cls(policy_count=len(policies))
+        for policy in policies:
+            compiler = _POLICY_COMPILERS.get(policy.get("policy_type"))
+            if compiler is None:
+                continue
+            for action, check in compiler(policy.get("rules") or {}):
+                compiled.checks.setdefault(action, []).append((policy["policy_id"], check))
+        return compiled
+
+    def violations(self, action: str, context: Dict[str, Any]) -> List[str]:
+        """IDs of the policies the action violates, in policy order."""
+        return [
+            policy_id
+            for policy_id, check in self.checks.get(action, ())
+            if check(context)
+        ]
+
+    def is_expired(self, ttl: Optional[float]) -> bool:
+        return ttl is not None and time.monotonic() - self.compiled_at > ttl
+
 
 class GovernancePolicyService:
     """
     Creates, stores, and evaluates agent governance policies.
 
     Policies are persisted in ZeroDB and evaluated in-memory during
-    agent action checks.
+    agent action checks, against a cached CompiledPolicySet per agent.
+
+    Args:
+        client: Optional ZeroDB client (defaults to the shared client)
+        cache_ttl_seconds: Max age of a cached policy set (None: until invalidated)
     """
 
-    def __init__(self, client: Optional[Any] = None) -> None:
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        cache_ttl_seconds: Optional[float] = POLICY_CACHE_TTL_SECONDS,
+    ) -> None:
         self._client = client
+        self._cache_ttl_seconds = cache_ttl_seconds
+        self._compiled: Dict[str, CompiledPolicySet] = {}
+        # In-flight loads, so concurrent misses for one agent share a query
+        self._loading: Dict[str, asyncio.Future] = {}
+        # Bumped on invalidation; a load started before it is not cached
+        self._generations: Dict[str, int] = {}
 
     @property
     def client(self) -> Any:
@@ -91,6 +212,7 @@ class GovernancePolicyService:
         }
 
         await self.client.insert_row(GOVERNANCE_POLICIES_TABLE, row)
+        self.invalidate_policies(agent_did)
         logger.info(
             f"Created policy {policy_id} ({policy_type}) for agent {agent_did}"
         )
@@ -116,36 +238,56 @@ class GovernancePolicyService:
         Returns:
             Dict with allowed (bool), agent_did, action, violated_policies, reason
         """
-        policies = await self.get_policies(agent_did)
+        policy_set = await self._policy_set(agent_did)
+        return self._evaluation(policy_set, agent_did, action, context)
 
-        if not policies:
-            return {
-                "allowed": True,
-                "agent_did": agent_did,
-                "action": action,
-                "violated_policies": [],
-                "reason": "No governance policies defined — action allowed by default",
-            }
+    async def evaluate_many(
+        self,
+        checks: Iterable[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate a batch of actions, loading each agent's policies at most once.
 
-        violated: List[str] = []
+        Args:
+            checks: Dicts with agent_did, action and optional context
 
-        for policy in policies:
-            violation = self._check_policy(policy, action, context)
-            if violation:
-                violated.append(policy["policy_id"])
+        Returns:
+            One evaluate_policy result per check, in input order
+        """
+        checks = list(checks)
+        agent_dids = list(dict.fromkeys(check["agent_did"] for check in checks))
+        policy_sets = dict(zip(
+            agent_dids,
+            await asyncio.gather(*(self._policy_set(did) for did in agent_dids)),
+        ))
+        return [
+            self._evaluation(
+                policy_sets[check["agent_did"]],
+                check["agent_did"],
+                check["action"],
+                check.get("context") or {},
+            )
+            for check in checks
+        ]
 
-        allowed = len(violated) == 0
-        return {
-            "allowed": allowed,
-            "agent_did": agent_did,
-            "action": action,
-            "violated_policies": violated,
-            "reason": (
-                "All policies passed"
-                if allowed
-                else f"Violated {len(violated)} policy/policies"
-            ),
-        }
+    def invalidate_policies(self, agent_did: Optional[str] = None) -> None:
+        """
+        Drop cached compiled policies so the next evaluation reloads them.
+
+        Args:
+            agent_did: Agent whose policies changed; None clears every agent
+        """
+        # Loads already in flight may have read the old rows: later callers
+        # start a fresh load instead of joining them
+        if agent_did is None:
+            for did in set(self._compiled) | set(self._loading):
+                self._generations[did] = self._generations.get(did, 0) + 1
+            self._compiled.clear()
+            self._loading.clear()
+            return
+        self._generations[agent_did] = self._generations.get(agent_did, 0) + 1
+        self._compiled.pop(agent_did, None)
+        self._loading.pop(agent_did, None)
 
     async def get_policies(self, agent_did: str) -> List[Dict[str, Any]]:
         """
@@ -169,90 +311,60 @@ class GovernancePolicyService:
     # Private helpers
     # ------------------------------------------------------------------
 
-    def _check_policy(
-        self,
-        policy: Dict[str, Any],
+    async def _policy_set(self, agent_did: str) -> CompiledPolicySet:
+        """Return the agent's compiled policies, loading them on a miss or expiry."""
+        compiled = self._compiled.get(agent_did)
+        if compiled is not None and not compiled.is_expired(self._cache_ttl_seconds):
+            return compiled
+
+        pending = self._loading.get(agent_did)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load_policy_set(agent_did))
+            self._loading[agent_did] = pending
+            pending.add_done_callback(
+                lambda done: self._loading.pop(agent_did, None)
+                if self._loading.get(agent_did) is done
+                else None
+            )
+        # Shielded: one caller being cancelled must not cancel the shared load
+        return await asyncio.shield(pending)
+
+    async def _load_policy_set(self, agent_did: str) -> CompiledPolicySet:
+        generation = self._generations.get(agent_did, 0)
+        compiled = CompiledPolicySet.compile(await self.get_policies(agent_did))
+        if self._generations.get(agent_did, 0) == generation:
+            self._compiled[agent_did] = compiled
+        return compiled
+
+    @staticmethod
+    def _evaluation(
+        policy_set: CompiledPolicySet,
+        agent_did: str,
         action: str,
         context: Dict[str, Any],
-    ) -> bool:
-        """
-        Evaluate a single policy against an action and context.
+    ) -> Dict[str, Any]:
+        if not policy_set.policy_count:
+            return {
+                "allowed": True,
+                "agent_did": agent_did,
+                "action": action,
+                "violated_policies": [],
+                "reason": "No governance policies defined — action allowed by default",
+            }
 
-        Returns True if the policy is VIOLATED (action denied), False if allowed.
-        """
-        policy_type = policy.get("policy_type")
-        rules = policy.get("rules") or {}
-
-        if policy_type == "spend_limit":
-            return self._check_spend_limit(rules, action, context)
-        elif policy_type == "interaction_whitelist":
-            return self._check_interaction_whitelist(rules, action, context)
-        elif policy_type == "task_scope":
-            return self._check_task_scope(rules, action, context)
-        elif policy_type == "data_access":
-            return self._check_data_access(rules, action, context)
-        return False
-
-    def _check_spend_limit(
-        self,
-        rules: Dict[str, Any],
-        action: str,
-        context: Dict[str, Any],
-    ) -> bool:
-        """Violated if action is 'spend' and amount exceeds per_call_limit_usd."""
-        if action != "spend":
-            return False
-        amount = context.get("amount_usd", 0.0)
-        per_call_limit = rules.get("per_call_limit_usd")
-        if per_call_limit is not None and amount > per_call_limit:
-            return True
-        daily_limit = rules.get("daily_limit_usd")
-        if daily_limit is not None and amount > daily_limit:
-            return True
-        return False
-
-    def _check_interaction_whitelist(
-        self,
-        rules: Dict[str, Any],
-        action: str,
-        context: Dict[str, Any],
-    ) -> bool:
-        """Violated if action is 'call_agent' and target_did is not whitelisted."""
-        if action != "call_agent":
-            return False
-        allowed_dids = rules.get("allowed_dids") or []
-        target_did = context.get("target_did", "")
-        return target_did not in allowed_dids
-
-    def _check_task_scope(
-        self,
-        rules: Dict[str, Any],
-        action: str,
-        context: Dict[str, Any],
-    ) -> bool:
-        """Violated if action is 'execute_task' and task is not in allowed_tasks."""
-        if action != "execute_task":
-            return False
-        allowed_tasks = rules.get("allowed_tasks") or []
-        task = context.get("task", "")
-        return task not in allowed_tasks
-
-    def _check_data_access(
-        self,
-        rules: Dict[str, Any],
-        action: str,
-        context: Dict[str, Any],
-    ) -> bool:
-        """Violated if action is 'read_data' or 'write_data' and table not allowed."""
-        if action not in ("read_data", "write_data"):
-            return False
-        allowed_tables = rules.get("allowed_tables") or []
-        table = context.get("table", "")
-        if table and table not in allowed_tables:
-            return True
-        if action == "write_data" and rules.get("read_only"):
-            return True
-        return False
+        violated = policy_set.violations(action, context)
+        allowed = len(violated) == 0
+        return {
+            "allowed": allowed,
+            "agent_did": agent_did,
+            "action": action,
+            "violated_policies": violated,
+            "reason": (
+                "All policies passed"
+                if allowed
+                else f"Violated {len(violated)} policy/policies"
+            ),
+        }
 
     def _policy_from_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """Convert a raw ZeroDB row to a clean policy dict."""
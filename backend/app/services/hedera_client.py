@@ -458,6 +458,64 @@ class HederaClient:
             "hash": f"0x{uuid.uuid4().hex}"
         }
 
+    async def list_account_transactions(
+        self,
+        account_id: str,
+        after_timestamp: str,
+        limit: int = 100,
+    ) -> Dict[str, Any]:
+        """
+        List transactions involving an account that reached consensus after a timestamp.
+
+        Queries the mirror node ``/transactions`` endpoint in ascending
+        consensus order, so callers can page forward by passing the last
+        ``consensus_timestamp`` they saw.
+
+        Args:
+            account_id: Hedera account ID (e.g., "0.0.12345")
+            after_timestamp: Exclusive lower bound, "{seconds}.{nanos}"
+            limit: Maximum number of transactions to return (mirror max 100)
+
+        Returns:
+            Dict with ``transactions`` — receipts with transaction_id (mirror
+            format ``{account}-{seconds}-{nanos}``), status,
+            consensus_timestamp, hash and charged_tx_fee
+
+        Raises:
+            HederaClientError: If the mirror node is unreachable or errors
+        """
+        try:
+            response = await self.http_client.get(
+                "/transactions",
+                params={
+                    "account.id": account_id,
+                    "timestamp": f"gt:{after_timestamp}",
+                    "order": "asc",
+                    "limit": min(limit, 100),
+                },
+            )
+        except httpx.RequestError as e:
+            raise HederaClientError(f"Mirror node unavailable: {e}", status_code=503)
+
+        if response.status_code != 200:
+            raise HederaClientError(
+                f"Mirror node transaction query failed: {response.status_code}",
+                status_code=response.status_code,
+            )
+
+        return {
+            "transactions": [
+                {
+                    "transaction_id": tx.get("transaction_id"),
+                    "status": tx.get("result", "UNKNOWN"),
+                    "consensus_timestamp": tx.get("consensus_timestamp"),
+                    "hash": tx.get("transaction_hash", ""),
+                    "charged_tx_fee": tx.get("charged_tx_fee", 0),
+                }
+                for tx in response.json().get("transactions", [])
+            ]
+        }
+
     async def submit_hcs_message(
         self,
         topic_id: str,
@@ -0,0 +1,229 @@
+"""
+Hedera Finality Tracker.
+Shared, multiplexed settlement polling for HederaPaymentService.
+
+Callers register a transaction ID and await its receipt. Instead of polling
+the mirror node once per transaction, one background loop groups every
+pending transaction by payer account (the account in its transaction ID)
+and lists that account's transactions in consensus order. One mirror-node
+request therefore resolves every pending transaction of that payer that
+has reached consensus.
+
+Each pending transaction remembers how far the account has been scanned
+for it (starting at its valid-start time), and polls resume from the
+earliest such point. A transaction that never appears therefore does not
+pin the scan: later polls keep moving past transactions already seen.
+
+Schedule:
+- The poll interval starts at ``min_interval`` and doubles while nothing
+  resolves, up to ``max_interval``; it resets when a transaction resolves
+  or a new one is registered
+- Each tick queries at most ``max_requests_per_tick`` accounts, least
+  recently polled first, so thousands of in-flight payments cost a bounded
+  number of mirror-node requests per second
+
+Built by AINative Dev Team
+Refs #187
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Poll interval bounds (seconds)
+FINALITY_MIN_INTERVAL_SECONDS = 0.5
+FINALITY_MAX_INTERVAL_SECONDS = 4.0
+
+# Accounts queried per tick, and pages followed per account
+FINALITY_MAX_REQUESTS_PER_TICK = 4
+FINALITY_MAX_PAGES_PER_ACCOUNT = 3
+
+# Mirror node page size (the mirror node caps it at 100)
+_MIRROR_PAGE_SIZE = 100
+
+
+def parse_transaction_id(transaction_id: str) -> Tuple[str, str, str]:
+    """
+    Split a Hedera transaction ID into (account, valid_start, mirror_id).
+
+    Example:
+        "0.0.12345@1234567890.000000001"
+        -> ("0.0.12345", "1234567890.000000001", "0.0.12345-1234567890-000000001")
+
+    Raises:
+        ValueError: If the ID is not in {account}@{seconds}.{nanos} format
+    """
+    account, sep, valid_start = transaction_id.partition("@")
+    seconds, dot, nanos = valid_start.partition(".")
+    if not sep or not dot or not account or not seconds.isdigit() or not nanos.isdigit():
+        raise ValueError(f"Invalid Hedera transaction ID: {transaction_id!r}")
+    return account, valid_start, f"{account}-{seconds}-{nanos}"
+
+
+class _Pending:
+    """One registered transaction and the future its waiters share."""
+
+    __slots__ = (
+        "transaction_id", "account", "valid_start", "mirror_id", "future", "scanned_to", "waiters",
+    )
+
+    def __init__(self, transaction_id: str, future: asyncio.Future) -> None:
+        self.transaction_id = transaction_id
+        self.account, self.valid_start, self.mirror_id = parse_transaction_id(transaction_id)
+        self.future = future
+        # Consensus timestamp up to which the account was scanned for this transaction
+        self.scanned_to = self.valid_start
+        # Callers currently awaiting the future
+        self.waiters = 0
+
+
+class HederaFinalityTracker:
+    """
+    Resolves transaction receipts for many waiters from batched mirror-node polls.
+
+    Args:
+        hedera_client: Client exposing ``list_account_transactions``
+        min_interval: Shortest delay between polls
+        max_interval: Longest delay between polls (after backoff)
+        max_requests_per_tick: Accounts queried per poll
+        max_pages_per_account: Mirror-node pages followed per account per poll
+    """
+
+    def __init__(
+        self,
+        hedera_client: Any,
+        min_interval: float = FINALITY_MIN_INTERVAL_SECONDS,
+        max_interval: float = FINALITY_MAX_INTERVAL_SECONDS,
+        max_requests_per_tick: int = FINALITY_MAX_REQUESTS_PER_TICK,
+        max_pages_per_account: int = FINALITY_MAX_PAGES_PER_ACCOUNT,
+    ) -> None:
+        self._client = hedera_client
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._max_requests_per_tick = max_requests_per_tick
+        self._max_pages_per_account = max_pages_per_account
+        self._interval = min_interval
+        # Pending transactions by mirror-format ID
+        self._pending: Dict[str, _Pending] = {}
+        self._last_polled: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.requests_made = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def wait(self, transaction_id: str, timeout: float) -> Dict[str, Any]:
+        """
+        Wait until a transaction reaches consensus and return its receipt.
+
+        Args:
+            transaction_id: Hedera transaction ID ({account}@{seconds}.{nanos})
+            timeout: Seconds to wait
+
+        Returns:
+            Receipt dict with transaction_id, status, consensus_timestamp,
+            hash and charged_tx_fee
+
+        Raises:
+            ValueError: If transaction_id is malformed
+            asyncio.TimeoutError: If no receipt is seen within timeout
+
+        Waiters on the same transaction share one registration, which is
+        dropped only when the last of them times out or is cancelled.
+        """
+        _, _, mirror_id = parse_transaction_id(transaction_id)
+        pending = self._pending.get(mirror_id)
+        if pending is None:
+            pending = _Pending(transaction_id, asyncio.get_running_loop().create_future())
+            self._pending[mirror_id] = pending
+            self._interval = self._min_interval
+            if self._task is None or self._task.done():
+                self._task = asyncio.create_task(self._run())
+        pending.waiters += 1
+        try:
+            return await asyncio.wait_for(asyncio.shield(pending.future), timeout=timeout)
+        finally:
+            pending.waiters -= 1
+            if not pending.waiters and self._pending.get(mirror_id) is pending:
+                del self._pending[mirror_id]
+
+    async def close(self) -> None:
+        """Stop polling; waiters still pending see their timeout."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self._interval)
+            by_account: Dict[str, List[_Pending]] = {}
+            for pending in self._pending.values():
+                by_account.setdefault(pending.account, []).append(pending)
+            accounts = sorted(by_account, key=lambda a: self._last_polled.get(a, 0.0))
+            accounts = accounts[: self._max_requests_per_tick]
+
+            resolved = await asyncio.gather(
+                *(self._poll_account(a, by_account[a]) for a in accounts)
+            )
+            for account in accounts:
+                self._last_polled[account] = time.monotonic()
+            for account in list(self._last_polled):
+                if account not in by_account:
+                    del self._last_polled[account]
+
+            if sum(resolved):
+                self._interval = self._min_interval
+            else:
+                self._interval = min(self._interval * 2, self._max_interval)
+
+    async def _poll_account(self, account: str, pending: List[_Pending]) -> int:
+        """Page through an account's transactions since the earliest unscanned point."""
+        waiting = {p.mirror_id for p in pending}
+        after = min((p.scanned_to for p in pending), key=_timestamp_key)
+        resolved = 0
+        for _ in range(self._max_pages_per_account):
+            try:
+                self.requests_made += 1
+                page = await self._client.list_account_transactions(
+                    account_id=account, after_timestamp=after, limit=_MIRROR_PAGE_SIZE
+                )
+            except Exception as exc:
+                logger.warning(f"Finality poll failed for account {account}: {exc}")
+                break
+            transactions = page.get("transactions", [])
+            for receipt in transactions:
+                mirror_id = receipt.get("transaction_id")
+                if mirror_id in waiting:
+                    waiting.discard(mirror_id)
+                    entry = self._pending.pop(mirror_id, None)
+                    if entry is not None and not entry.future.done():
+                        entry.future.set_result(
+                            {**receipt, "transaction_id": entry.transaction_id}
+                        )
+                        resolved += 1
+            if transactions:
+                after = transactions[-1].get("consensus_timestamp") or after
+            if not waiting or len(transactions) < _MIRROR_PAGE_SIZE:
+                break
+        # Resume from here next time, except for transactions registered later
+        for entry in pending:
+            if entry.mirror_id in waiting and _timestamp_key(after) > _timestamp_key(entry.scanned_to):
+                entry.scanned_to = after
+        return resolved
+
+
+def _timestamp_key(timestamp: str) -> Tuple[int, int]:
+    seconds, _, nanos = timestamp.partition(".")
+    return int(seconds), int(nanos or 0)
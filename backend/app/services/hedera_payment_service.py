@@ -9,6 +9,11 @@ Issue #187: USDC Payment Settlement via HTS
 - Payment receipt with Hedera transaction hash
 - Integration with existing X402 protocol flow
 
+Settlement polling:
+- wait_for_settlement() registers the transaction with a shared
+  HederaFinalityTracker, which polls the mirror node per payer account
+  rather than per transaction
+
 Issue #189: Payment Receipt Verification
 - mirror_node_url field on receipts for independent verification
 - agent_id and task_id fields for audit trail linkage
@@ -25,12 +30,14 @@ Refs #187, #189
 """
 from __future__ import annotations
 
+import asyncio
 import uuid
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime, timezone
 
 from app.core.errors import APIError
+from app.services.hedera_finality_tracker import HederaFinalityTracker
 from app.services.hedera_client import (
     HederaClient,
     get_hedera_client,
@@ -139,6 +146,7 @@ class HederaPaymentService:
         """
         self._hedera_client = hedera_client
         self._zerodb_client = zerodb_client
+        self._finality_tracker: Optional[HederaFinalityTracker] = None
 
     @property
     def hedera_client(self) -> HederaClient:
@@ -154,6 +162,13 @@ class HederaPaymentService:
             self._zerodb_client = get_zerodb_client()
         return self._zerodb_client
 
+    @property
+    def finality_tracker(self) -> HederaFinalityTracker:
+        """Shared settlement tracker, created on first use."""
+        if self._finality_tracker is None:
+            self._finality_tracker = HederaFinalityTracker(self.hedera_client)
+        return self._finality_tracker
+
     def _build_mirror_node_url(self, transaction_id: str) -> str:
         """
         Build the Hedera mirror node URL for a transaction.
@@ -341,6 +356,56 @@ class HederaPaymentService:
                 f"Settlement verification failed: {str(e)}"
             )
 
+    async def wait_for_settlement(
+        self,
+        transaction_id: str,
+        timeout_seconds: float = 10
+    ) -> Dict[str, Any]:
+        """
+        Wait until a Hedera transaction reaches consensus.
+
+        Unlike verify_settlement, which makes one receipt lookup, this waits
+        on the shared finality tracker, so concurrent waiters cost a bounded
+        number of batched mirror node requests.
+
+        Args:
+            transaction_id: Hedera transaction ID to wait for
+            timeout_seconds: Maximum time to wait for consensus
+
+        Returns:
+            Dict containing:
+            - transaction_id: The queried transaction ID
+            - settled: True if transaction status is SUCCESS
+            - status: Transaction status string (a failure code if rejected)
+            - consensus_timestamp: When the transaction reached consensus
+
+        Raises:
+            HederaPaymentError: If transaction_id is empty or malformed
+            HederaSettlementTimeoutError: If no consensus is seen in time
+        """
+        if not transaction_id or not transaction_id.strip():
+            raise HederaPaymentError(
+                "transaction_id cannot be empty",
+                status_code=400
+            )
+
+        try:
+            receipt = await self.finality_tracker.wait(
+                transaction_id, timeout=timeout_seconds
+            )
+        except ValueError as e:
+            raise HederaPaymentError(str(e), status_code=400)
+        except asyncio.TimeoutError:
+            raise HederaSettlementTimeoutError(transaction_id, timeout_seconds)
+
+        status = receipt.get("status", "UNKNOWN")
+        return {
+            "transaction_id": transaction_id,
+            "settled": status == "SUCCESS",
+            "status": status,
+            "consensus_timestamp": receipt.get("consensus_timestamp")
+        }
+
     async def get_payment_receipt(
         self,
         transaction_id: str,
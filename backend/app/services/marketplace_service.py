@@ -4,15 +4,27 @@ Handles publishing, browsing, searching, and installing agent configurations.
 
 Issues #214 (Publish), #215 (Browse/Search), #216 (Install).
 
+Browse and search are served from an in-memory catalog index of active
+listings (sorted views per category and sort key, plus a token index over
+name/description/tags). The index is loaded lazily by paging ZeroDB, kept
+current by this service's own writes, and rebuilt after
+CATALOG_REFRESH_SECONDS to pick up writes made elsewhere.
+
 Built by AINative Dev Team
 Refs #214, #215, #216
 """
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+import re
+import time
 import uuid
 import logging
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from app.core.errors import APIError
 from app.services.zerodb_client import get_zerodb_client
@@ -32,6 +44,47 @@ VALID_CATEGORIES = [
     "other",
 ]
 
+# Rows fetched per ZeroDB page when (re)building the catalog index
+CATALOG_PAGE_SIZE = 1_000
+# Rebuild the index after this long so writes from other processes show up
+CATALOG_REFRESH_SECONDS = 300.0
+
+_TEXT_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# View entries are (sort value, tiebreak, marketplace_id)
+CatalogKey = Tuple[Any, int, str]
+
+
+def _listing_created_at(row: Dict[str, Any]) -> str:
+    return row.get("created_at") or ""
+
+
+def _listing_reputation(row: Dict[str, Any]) -> float:
+    return float(row.get("reputation_score") or 0.0)
+
+
+def _listing_price(row: Dict[str, Any]) -> float:
+    return float((row.get("pricing") or {}).get("price_per_call") or 0.0)
+
+
+def _listing_installs(row: Dict[str, Any]) -> int:
+    return int(row.get("install_count") or 0)
+
+
+# Unknown sort_by values keep the order listings were stored in
+_INSERTION_ORDER = "insertion"
+
+# sort_by -> (value extractor, descending)
+_SORT_SPECS: Dict[str, Tuple[Callable[[Dict[str, Any]], Any], bool]] = {
+    "newest": (_listing_created_at, True),
+    "oldest": (_listing_created_at, False),
+    "highest_rated": (_listing_reputation, True),
+    "lowest_price": (_listing_price, False),
+    "highest_price": (_listing_price, True),
+    "most_installed": (_listing_installs, True),
+    _INSERTION_ORDER: (lambda row: 0, False),
+}
+
 
 class MarketplaceNotFoundError(APIError):
     """Raised when a marketplace resource is not found."""
@@ -44,6 +97,308 @@ class MarketplaceNotFoundError(APIError):
         )
 
 
+class MarketplaceCursorError(APIError):
+    """Raised when a pagination cursor is malformed or for another sort."""
+
+    def __init__(self, cursor: str):
+        super().__init__(
+            status_code=400,
+            error_code="INVALID_MARKETPLACE_CURSOR",
+            detail=f"Invalid marketplace cursor: {cursor}",
+        )
+
+
+def _sort_name(sort_by: Optional[str]) -> str:
+    return sort_by if sort_by in _SORT_SPECS else _INSERTION_ORDER
+
+
+def _encode_cursor(sort_name: str, key: CatalogKey) -> str:
+    payload = json.dumps([sort_name, list(key)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_name: str) -> CatalogKey:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        name, key = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        value, tiebreak, marketplace_id = key
+    except (ValueError, TypeError):
+        raise MarketplaceCursorError(cursor)
+    if name != sort_name or not isinstance(tiebreak, int) or not isinstance(marketplace_id, str):
+        raise MarketplaceCursorError(cursor)
+    return (value, tiebreak, marketplace_id)
+
+
+def _slice_view(
+    view: List[CatalogKey],
+    descending: bool,
+    limit: int,
+    offset: int,
+    after: Optional[CatalogKey],
+) -> Tuple[List[CatalogKey], bool]:
+    """
+    Take one page from an ascending view, reading it backwards if descending.
+
+    Returns:
+        (page keys in display order, whether more keys follow)
+    """
+    if descending:
+        end = bisect_left(view, after) if after is not None else len(view) - offset
+        end = max(end, 0)
+        start = max(end - limit, 0)
+        return view[start:end][::-1], start > 0
+    start = bisect_right(view, after) if after is not None else offset
+    return view[start:start + limit], start + limit < len(view)
+
+
+def _text_fields(row: Dict[str, Any]) -> Tuple[str, ...]:
+    """Lowercased searchable fields: name, description, then each tag."""
+    name = (row.get("agent_config") or {}).get("name") or ""
+    description = row.get("description") or ""
+    tags = [str(tag) for tag in row.get("tags") or []]
+    return tuple(field.lower() for field in (name, description, *tags))
+
+
+def _passes_filters(row: Dict[str, Any], filters: Dict[str, Any]) -> bool:
+    min_rep = filters.get("min_reputation")
+    if min_rep is not None and _listing_reputation(row) < min_rep:
+        return False
+
+    price_range = filters.get("price_range")
+    if price_range:
+        price = _listing_price(row)
+        if price_range.get("min") is not None and price < price_range["min"]:
+            return False
+        if price_range.get("max") is not None and price > price_range["max"]:
+            return False
+
+    if filters.get("category") and row.get("category") != filters["category"]:
+        return False
+
+    return True
+
+
+def _has_row_filters(filters: Dict[str, Any]) -> bool:
+    return filters.get("min_reputation") is not None or bool(filters.get("price_range"))
+
+
+class MarketplaceCatalogIndex:
+    """
+    In-memory index over active marketplace listings.
+
+    - Each sort key has an all-categories view and one view per category;
+      views are ascending lists of (value, tiebreak, marketplace_id) kept
+      with insort, so a page is a bisect plus a slice
+    - Descending sorts read their view from the end; the tiebreak is the
+      listing's insertion sequence (negated for descending sorts), so ties
+      keep stored order in both directions, as the old stable sort did
+    - Text search goes through an inverted index of name/description/tag
+      tokens, then confirms the substring match on the candidates only
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, Dict[str, CatalogKey]] = {}
+        self._seqs: Dict[str, int] = {}
+        self._next_seq = 0
+        self._views: Dict[Tuple[str, Optional[str]], List[CatalogKey]] = {}
+        self._fields: Dict[str, Tuple[str, ...]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self.built_at = time.monotonic()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> "MarketplaceCatalogIndex":
+        """Bulk-build an index: append every key, then sort each view once."""
+        index = cls()
+        for row in rows:
+            index._add(row, sort_views=False)
+        for view in index._views.values():
+            view.sort()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, marketplace_id: object) -> bool:
+        return marketplace_id in self._rows
+
+    def is_stale(self, max_age: Optional[float]) -> bool:
+        return max_age is not None and time.monotonic() - self.built_at > max_age
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        """Index a listing row, replacing its previous entry; inactive rows are dropped."""
+        marketplace_id = row.get("marketplace_id")
+        if not marketplace_id:
+            return
+        if not row.get("active", True):
+            self.remove(marketplace_id)
+            return
+        self._unlink(marketplace_id)
+        self._add(row, sort_views=True)
+
+    def remove(self, marketplace_id: str) -> None:
+        self._unlink(marketplace_id)
+        self._seqs.pop(marketplace_id, None)
+
+    def _add(self, row: Dict[str, Any], sort_views: bool) -> None:
+        marketplace_id = row.get("marketplace_id")
+        if not marketplace_id:
+            return
+        seq = self._seqs.get(marketplace_id)
+        if seq is None:
+            seq = self._seqs[marketplace_id] = self._next_seq
+            self._next_seq += 1
+
+        row = dict(row)
+        category = row.get("category")
+        keys: Dict[str, CatalogKey] = {}
+        for name, (extract, descending) in _SORT_SPECS.items():
+            key = (extract(row), -seq if descending else seq, marketplace_id)
+            keys[name] = key
+            for view_key in ((name, None), (name, category)):
+                view = self._views.setdefault(view_key, [])
+                if sort_views:
+                    insort(view, key)
+                else:
+                    view.append(key)
+
+        fields = _text_fields(row)
+        for token in {t for field in fields for t in _TEXT_TOKEN.findall(field)}:
+            self._postings.setdefault(token, set()).add(marketplace_id)
+
+        self._rows[marketplace_id] = row
+        self._keys[marketplace_id] = keys
+        self._fields[marketplace_id] = fields
+
+    def _unlink(self, marketplace_id: str) -> None:
+        row = self._rows.pop(marketplace_id, None)
+        if row is None:
+            return
+        category = row.get("category")
+        for name, key in self._keys.pop(marketplace_id).items():
+            for view_key in ((name, None), (name, category)):
+                view = self._views[view_key]
+                del view[bisect_left(view, key)]
+
+        fields = self._fields.pop(marketplace_id)
+        for token in {t for field in fields for t in _TEXT_TOKEN.findall(field)}:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(marketplace_id)
+                if not postings:
+                    del self._postings[token]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def count(self, category: Optional[str] = None) -> int:
+        return len(self._views.get((_INSERTION_ORDER, category), ()))
+
+    def page(
+        self,
+        sort_by: str,
+        category: Optional[str],
+        limit: int,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        One page of a category view, by offset or by keyset cursor.
+
+        Returns:
+            (rows, next_cursor) where next_cursor is None on the last page
+        """
+        name = _sort_name(sort_by)
+        view = self._views.get((name, category), [])
+        return self._take(view, name, limit, offset, cursor)
+
+    def search(
+        self,
+        query: str,
+        filters: Dict[str, Any],
+        sort_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+        """
+        Listings whose name, description or a tag contains ``query``.
+
+        Only listings sharing every query token (as a substring of an
+        indexed token) are checked against the query and filters. Without
+        a query or filters this is a plain view page.
+
+        Returns:
+            (rows, total matches, next_cursor)
+        """
+        name = _sort_name(sort_by)
+        category = filters.get("category") or None
+        query_lower = query.lower()
+        other_filters = {k: v for k, v in filters.items() if k != "category"}
+
+        if not query_lower and not _has_row_filters(other_filters):
+            view = self._views.get((name, category), [])
+            take = len(view) if limit is None else limit
+            rows, next_cursor = self._take(view, name, take, 0, cursor)
+            return rows, len(view), next_cursor
+
+        candidates: Optional[Iterable[str]] = self._text_candidates(query_lower)
+        if candidates is None:
+            candidates = [key[2] for key in self._views.get((name, category), [])]
+
+        matched = sorted(
+            self._keys[marketplace_id][name]
+            for marketplace_id in candidates
+            if self._matches(marketplace_id, query_lower, filters)
+        )
+        take = len(matched) if limit is None else limit
+        rows, next_cursor = self._take(matched, name, take, 0, cursor)
+        return rows, len(matched), next_cursor
+
+    def _take(
+        self,
+        view: List[CatalogKey],
+        name: str,
+        limit: int,
+        offset: int,
+        cursor: Optional[str],
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        after = _decode_cursor(cursor, name) if cursor else None
+        try:
+            keys, has_more = _slice_view(view, _SORT_SPECS[name][1], limit, offset, after)
+        except TypeError:
+            # Cursor value not comparable with this view's values
+            raise MarketplaceCursorError(cursor or "")
+        next_cursor = _encode_cursor(name, keys[-1]) if keys and has_more else None
+        return [self._rows[key[2]] for key in keys], next_cursor
+
+    def _text_candidates(self, query_lower: str) -> Optional[Set[str]]:
+        """Listings containing every query token, or None if the query has no tokens."""
+        terms = set(_TEXT_TOKEN.findall(query_lower))
+        if not terms:
+            return None
+        candidates: Optional[Set[str]] = None
+        # Longest terms first: they hit the fewest tokens
+        for term in sorted(terms, key=len, reverse=True):
+            hits: Set[str] = set(self._postings.get(term, ()))
+            for token, postings in self._postings.items():
+                if term in token and token != term:
+                    hits |= postings
+            candidates = hits if candidates is None else candidates & hits
+            if not candidates:
+                return set()
+        return candidates
+
+    def _matches(self, marketplace_id: str, query_lower: str, filters: Dict[str, Any]) -> bool:
+        if query_lower and not any(query_lower in field for field in self._fields[marketplace_id]):
+            return False
+        return _passes_filters(self._rows[marketplace_id], filters)
+
+
 class MarketplaceService:
     """
     Manages agent marketplace listings and installations.
@@ -51,10 +406,29 @@ class MarketplaceService:
     All state is persisted to ZeroDB tables:
     - marketplace_listings: published agent configs with pricing/metadata
     - agent_installations: per-project install records
+
+    Browse and search read from a MarketplaceCatalogIndex built on first use.
+    Listing writes made while the index is being built are recorded and
+    replayed onto it before it is published, since the pages already read
+    may predate them.
+
+    Args:
+        client: Optional ZeroDB client (defaults to the shared client)
+        catalog_refresh_seconds: Max index age before a rebuild (None: never)
     """
 
-    def __init__(self, client: Optional[Any] = None) -> None:
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        catalog_refresh_seconds: Optional[float] = CATALOG_REFRESH_SECONDS,
+    ) -> None:
         self._client = client
+        self._catalog: Optional[MarketplaceCatalogIndex] = None
+        self._catalog_lock = asyncio.Lock()
+        self._catalog_refresh_seconds = catalog_refresh_seconds
+        # Rows written while an index build is running (None: no build)
+        self._catalog_writes: Optional[List[Dict[str, Any]]] = None
+        self._catalog_generation = 0
 
     @property
     def client(self) -> Any:
@@ -111,6 +485,7 @@ class MarketplaceService:
         }
 
         await self.client.insert_row(MARKETPLACE_LISTINGS_TABLE, row)
+        self._index_listing(row)
         logger.info(f"Published agent to marketplace: {marketplace_id}")
         return self._listing_from_row(row)
 
@@ -168,6 +543,7 @@ class MarketplaceService:
 
         updated_row = {**row, **updates, "updated_at": now}
         await self.client.update_row(MARKETPLACE_LISTINGS_TABLE, row_id, updated_row)
+        self._index_listing(updated_row)
         logger.info(f"Updated marketplace listing: {agent_id}")
         return self._listing_from_row(updated_row)
 
@@ -202,6 +578,7 @@ class MarketplaceService:
             row_id,
             {**row, "active": False, "updated_at": now},
         )
+        self._index_listing({**row, "active": False, "updated_at": now})
         logger.info(f"Unpublished agent: {agent_id}")
         return {"success": True, "marketplace_id": agent_id}
 
@@ -214,114 +591,70 @@ class MarketplaceService:
         category: Optional[str],
         sort_by: str,
         limit: int,
-        offset: int,
+        offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
-        Return a paginated list of active marketplace listings.
+        Return a page of active marketplace listings.
 
         Args:
             category: Optional category filter
             sort_by: Sort key (newest, highest_rated, etc.)
             limit: Page size
-            offset: Page offset
+            offset: Page offset (ignored when a cursor is given)
+            cursor: next_cursor from a previous page of the same sort
 
         Returns:
-            Dict with items, total, limit, offset
-        """
-        query_filter: Dict[str, Any] = {"active": True}
-        if category:
-            query_filter["category"] = category
+            Dict with items, total, limit, offset, next_cursor
 
-        result = await self.client.query_rows(
-            MARKETPLACE_LISTINGS_TABLE,
-            filter=query_filter,
-            limit=10_000,
+        Raises:
+            MarketplaceCursorError: If the cursor is malformed or for another sort
+        """
+        catalog = await self._get_catalog()
+        rows, next_cursor = catalog.page(
+            sort_by, category, limit, offset=offset, cursor=cursor
         )
-        all_rows = result.get("rows", [])
-
-        # Sort
-        if sort_by == "newest":
-            all_rows.sort(key=lambda r: r.get("created_at", ""), reverse=True)
-        elif sort_by == "oldest":
-            all_rows.sort(key=lambda r: r.get("created_at", ""))
-        elif sort_by == "highest_rated":
-            all_rows.sort(key=lambda r: r.get("reputation_score", 0.0), reverse=True)
-        elif sort_by == "lowest_price":
-            all_rows.sort(
-                key=lambda r: (r.get("pricing") or {}).get("price_per_call", 0.0)
-            )
-        elif sort_by == "highest_price":
-            all_rows.sort(
-                key=lambda r: (r.get("pricing") or {}).get("price_per_call", 0.0),
-                reverse=True,
-            )
-        elif sort_by == "most_installed":
-            all_rows.sort(key=lambda r: r.get("install_count", 0), reverse=True)
-
-        total = len(all_rows)
-        page = all_rows[offset : offset + limit]
-
         return {
-            "items": [self._listing_from_row(r) for r in page],
-            "total": total,
+            "items": [self._listing_from_row(r) for r in rows],
+            "total": catalog.count(category),
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
         }
 
     async def search_agents(
         self,
         query: str,
         filters: Dict[str, Any],
+        sort_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Search marketplace listings by text query and optional filters.
 
         Args:
-            query: Free-text search string (matched against name/description)
+            query: Free-text search string (matched against name/description/tags)
             filters: Dict with optional keys: capability, price_range, min_reputation, category
+            sort_by: Optional sort key (defaults to stored order)
+            limit: Optional page size (defaults to all matches)
+            cursor: next_cursor from a previous page of the same search
 
         Returns:
-            Dict with items list
+            Dict with items, total and next_cursor
+
+        Raises:
+            MarketplaceCursorError: If the cursor is malformed or for another sort
         """
-        result = await self.client.query_rows(
-            MARKETPLACE_LISTINGS_TABLE,
-            filter={"active": True},
-            limit=10_000,
+        catalog = await self._get_catalog()
+        rows, total, next_cursor = catalog.search(
+            query, filters, sort_by=sort_by, limit=limit, cursor=cursor
         )
-        rows = result.get("rows", [])
-
-        query_lower = query.lower()
-
-        def _matches(row: Dict[str, Any]) -> bool:
-            name = (row.get("agent_config") or {}).get("name", "").lower()
-            description = (row.get("description") or "").lower()
-            if query_lower and query_lower not in name and query_lower not in description:
-                return False
-
-            # min_reputation filter
-            min_rep = filters.get("min_reputation")
-            if min_rep is not None:
-                if row.get("reputation_score", 0.0) < min_rep:
-                    return False
-
-            # price_range filter
-            price_range = filters.get("price_range")
-            if price_range:
-                price = (row.get("pricing") or {}).get("price_per_call", 0.0)
-                if price_range.get("min") is not None and price < price_range["min"]:
-                    return False
-                if price_range.get("max") is not None and price > price_range["max"]:
-                    return False
-
-            # category filter
-            if filters.get("category"):
-                if row.get("category") != filters["category"]:
-                    return False
-
-            return True
-
-        matched = [r for r in rows if _matches(r)]
-        return {"items": [self._listing_from_row(r) for r in matched], "total": len(matched)}
+        return {
+            "items": [self._listing_from_row(r) for r in rows],
+            "total": total,
+            "next_cursor": next_cursor,
+        }
 
     async def get_categories(self) -> List[str]:
         """
@@ -385,6 +718,7 @@ class MarketplaceService:
                 "install_count": listing_row.get("install_count", 0) + 1,
             }
             await self.client.update_row(MARKETPLACE_LISTINGS_TABLE, row_id, updated)
+            self._index_listing(updated)
 
         logger.info(
             f"Installed agent {marketplace_agent_id} into project {project_id}"
@@ -439,6 +773,61 @@ class MarketplaceService:
         logger.info(f"Uninstalled agent {agent_id} from project {project_id}")
         return {"success": True, "installation_id": agent_id}
 
+    # ------------------------------------------------------------------
+    # Catalog index
+    # ------------------------------------------------------------------
+
+    async def _get_catalog(self) -> MarketplaceCatalogIndex:
+        """Return the catalog index, (re)building it when missing or stale."""
+        catalog = self._catalog
+        if catalog is not None and not catalog.is_stale(self._catalog_refresh_seconds):
+            return catalog
+        async with self._catalog_lock:
+            catalog = self._catalog
+            if catalog is None or catalog.is_stale(self._catalog_refresh_seconds):
+                generation = self._catalog_generation
+                writes = self._catalog_writes = []
+                try:
+                    rows = await self._load_active_listings()
+                finally:
+                    self._catalog_writes = None
+                catalog = MarketplaceCatalogIndex.from_rows(rows)
+                for row in writes:
+                    catalog.upsert(row)
+                if self._catalog_generation == generation:
+                    self._catalog = catalog
+                logger.info(f"Built marketplace catalog index: {len(catalog)} listings")
+        return catalog
+
+    async def _load_active_listings(self) -> List[Dict[str, Any]]:
+        """Page through every active listing (no 10k cap)."""
+        rows: List[Dict[str, Any]] = []
+        skip = 0
+        while True:
+            result = await self.client.query_rows(
+                MARKETPLACE_LISTINGS_TABLE,
+                filter={"active": True},
+                limit=CATALOG_PAGE_SIZE,
+                skip=skip,
+            )
+            page = result.get("rows", [])
+            rows.extend(page)
+            if len(page) < CATALOG_PAGE_SIZE:
+                return rows
+            skip += len(page)
+
+    def _index_listing(self, row: Dict[str, Any]) -> None:
+        # Before the first browse/search there is no index; the load picks this up
+        if self._catalog is not None:
+            self._catalog.upsert(row)
+        if self._catalog_writes is not None:
+            self._catalog_writes.append(row)
+
+    def invalidate_catalog(self) -> None:
+        """Drop the catalog index so the next browse/search reloads it."""
+        self._catalog_generation += 1
+        self._catalog = None
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -15,15 +15,32 @@ Decay rates per tier:
 
 Formula: importance = initial_importance * exp(-decay_rate * age_days) + access_boost
 
+Decay cycles stream a project's memories from ZeroDB in pages, score each
+page in NumPy over column arrays (one exp over the page, access boosts via
+bincount), and write back only the scores that changed, concurrently.
+MemoryDecayScheduler runs cycles project by project as they fall due.
+
+Per-entity caps use an EntityEvictionIndex (a lazy-deletion heap keyed by
+tier priority and last access) that is updated on insert and access, so
+eviction pops k victims in O(k log n) and can run inline on write. Tracked
+indexes are rebuilt from storage once older than a TTL, and only the most
+recently used entities keep one.
+
 Built by AINative Dev Team.
 Refs #208, #209, #210.
 """
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
 import math
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from app.schemas.memory_decay import (
     DecayCycleResult,
@@ -51,6 +68,26 @@ ACCESS_BOOST_PER_ACCESS: float = 0.1
 # Window for "recent" accesses
 RECENT_ACCESS_WINDOW_DAYS: int = 7
 
+# ZeroDB table holding agent memories (shared with AgentMemoryService)
+MEMORY_TABLE: str = "agent_memory"
+
+# Memories fetched and scored per page
+DEFAULT_DECAY_PAGE_SIZE: int = 1000
+
+# Concurrent ZeroDB writes during write-back
+DEFAULT_WRITE_CONCURRENCY: int = 16
+
+# Stored scores within this distance of the new score are not rewritten
+SCORE_WRITE_EPSILON: float = 1e-4
+
+# Tracked eviction indexes are rebuilt from storage after this many seconds
+EVICTION_INDEX_TTL_SECONDS: float = 300.0
+
+# Entities whose eviction index is kept in memory (least recently used dropped)
+MAX_TRACKED_ENTITIES: int = 10_000
+
+_SECONDS_PER_DAY: float = 86400.0
+
 # Tier ordering for eviction priority (evict lower-priority tiers first)
 _TIER_EVICTION_PRIORITY: Dict[str, int] = {
     MemoryTier.WORKING: 0,
@@ -75,15 +112,296 @@ def _parse_dt(value: Any) -> Optional[datetime]:
     return None
 
 
+def _epoch_seconds(value: Any) -> float:
+    """Seconds since the epoch for a timestamp, or NaN if missing/invalid."""
+    if isinstance(value, str):
+        # Python 3.11+ fromisoformat accepts a trailing "Z"
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return math.nan
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    dt = _parse_dt(value)
+    return dt.timestamp() if dt else math.nan
+
+
+def _as_score(value: Any) -> float:
+    return float(value) if isinstance(value, (int, float)) else math.nan
+
+
+def compute_importance_scores(
+    memories: Sequence[Dict[str, Any]],
+    now: Optional[datetime] = None,
+) -> np.ndarray:
+    """
+    Vectorized calculate_importance over a page of memories.
+
+    Each field is parsed once into a column array; decay is a single
+    exp over the page and access boosts are counted with one bincount
+    over all recent accesses in the page.
+
+    Args:
+        memories: Memory dicts (same shape as calculate_importance)
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+        float64 array of importance scores, aligned with ``memories``.
+    """
+    n = len(memories)
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+    now_ts = (now or datetime.now(timezone.utc)).timestamp()
+    default_rate = DECAY_RATES[MemoryTier.WORKING]
+
+    initial = np.fromiter(
+        (float(m.get("initial_importance", 1.0)) for m in memories),
+        dtype=np.float64, count=n,
+    )
+    rate = np.fromiter(
+        (DECAY_RATES.get(m.get("tier", MemoryTier.WORKING), default_rate) for m in memories),
+        dtype=np.float64, count=n,
+    )
+    created = np.fromiter(
+        (_epoch_seconds(m.get("created_at")) for m in memories),
+        dtype=np.float64, count=n,
+    )
+    age_days = np.nan_to_num((now_ts - created) / _SECONDS_PER_DAY, nan=0.0)
+    np.maximum(age_days, 0.0, out=age_days)
+
+    scores = initial * np.exp(-rate * age_days)
+
+    # Flatten every recent access in the page, tagged with its memory's row
+    owners: List[int] = []
+    access_ts: List[float] = []
+    for i, memory in enumerate(memories):
+        for raw_ts in memory.get("recent_accesses") or ():
+            owners.append(i)
+            access_ts.append(_epoch_seconds(raw_ts))
+    if owners:
+        cutoff = now_ts - RECENT_ACCESS_WINDOW_DAYS * _SECONDS_PER_DAY
+        recent = np.asarray(access_ts) >= cutoff  # NaN compares False
+        counts = np.bincount(np.asarray(owners)[recent], minlength=n)
+        scores += counts * ACCESS_BOOST_PER_ACCESS
+
+    return scores
+
+
+def _eviction_key(memory: Dict[str, Any]) -> Tuple[int, float]:
+    """(tier priority, last access seconds) — smaller is evicted sooner."""
+    tier = memory.get("tier", MemoryTier.WORKING)
+    priority = _TIER_EVICTION_PRIORITY.get(tier, 0)
+    ts = _epoch_seconds(memory.get("last_accessed"))
+    return priority, (0.0 if math.isnan(ts) else ts)
+
+
+class EntityEvictionIndex:
+    """
+    Incremental LRU eviction order for one entity's memories.
+
+    Evictable memories sit in a min-heap of (tier priority, last access,
+    insertion seq, memory_id). Updates push a new entry and leave the old
+    one to be skipped when popped; the heap is rebuilt once stale entries
+    outnumber live ones. Core memories are counted but never enter the
+    heap.
+    """
+
+    def __init__(self) -> None:
+        self.created_at = time.monotonic()
+        self._heap: List[Tuple[int, float, int, str]] = []
+        self._live: Dict[str, Tuple[int, float, int, str]] = {}
+        # Victims popped but not yet confirmed deleted
+        self._evicting: Dict[str, Tuple[int, float, int, str]] = {}
+        self._row_ids: Dict[str, str] = {}
+        self._core: set = set()
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._live) + len(self._core)
+
+    def __contains__(self, memory_id: str) -> bool:
+        return memory_id in self._live or memory_id in self._core
+
+    @classmethod
+    def from_memories(cls, memories: Sequence[Dict[str, Any]]) -> "EntityEvictionIndex":
+        """Build an index in O(n) with a single heapify."""
+        index = cls()
+        for memory in memories:
+            index._add(memory)
+        index._heap = list(index._live.values())
+        heapq.heapify(index._heap)
+        return index
+
+    def _add(self, memory: Dict[str, Any]) -> Optional[Tuple[int, float, int, str]]:
+        memory_id = memory["memory_id"]
+        self._row_ids[memory_id] = memory.get("id") or memory.get("row_id") or memory_id
+        self._live.pop(memory_id, None)
+        self._core.discard(memory_id)
+        if memory.get("tier") == MemoryTier.CORE:
+            self._core.add(memory_id)
+            return None
+        self._seq += 1
+        priority, last_access = _eviction_key(memory)
+        entry = (priority, last_access, self._seq, memory_id)
+        self._live[memory_id] = entry
+        return entry
+
+    def track(self, memory: Dict[str, Any]) -> None:
+        """Insert a memory or update its tier / last access."""
+        entry = self._add(memory)
+        if entry is not None:
+            heapq.heappush(self._heap, entry)
+            self._maybe_compact()
+
+    def touch(self, memory_id: str, accessed_at: Optional[datetime] = None) -> None:
+        """Record an access, moving the memory to the back of its tier."""
+        entry = self._live.get(memory_id)
+        if entry is None:
+            return
+        accessed = (accessed_at or datetime.now(timezone.utc)).timestamp()
+        self._seq += 1
+        updated = (entry[0], accessed, self._seq, memory_id)
+        self._live[memory_id] = updated
+        heapq.heappush(self._heap, updated)
+        self._maybe_compact()
+
+    def remove(self, memory_id: str) -> None:
+        self._live.pop(memory_id, None)
+        self._evicting.pop(memory_id, None)
+        self._core.discard(memory_id)
+        self._row_ids.pop(memory_id, None)
+
+    def restore(self, memory_ids: Sequence[str]) -> None:
+        """Put popped victims whose deletion failed back in their old place."""
+        for memory_id in memory_ids:
+            entry = self._evicting.pop(memory_id, None)
+            if entry is not None and memory_id not in self:
+                self._live[memory_id] = entry
+                heapq.heappush(self._heap, entry)
+
+    def row_id(self, memory_id: str) -> str:
+        return self._row_ids.get(memory_id, memory_id)
+
+    def pop_victims(self, count: int) -> List[str]:
+        """
+        Remove and return up to ``count`` least valuable evictable memories.
+
+        Victims are held until remove() confirms the eviction or restore()
+        undoes it.
+        """
+        victims: List[str] = []
+        while len(victims) < count and self._heap:
+            entry = heapq.heappop(self._heap)
+            if self._live.get(entry[3]) != entry:
+                continue  # superseded or removed
+            del self._live[entry[3]]
+            self._evicting[entry[3]] = entry
+            victims.append(entry[3])
+        return victims
+
+    def _maybe_compact(self) -> None:
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._heap = list(self._live.values())
+            heapq.heapify(self._heap)
+
+
+class ZeroDBMemoryStore:
+    """
+    Paged ZeroDB access for decay cycles.
+
+    Rows are read with query_rows in pages and written back concurrently
+    with update_row (ZeroDB has no bulk update endpoint); each write sends
+    the full row because update_row replaces row data.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        table_name: str = MEMORY_TABLE,
+        write_concurrency: int = DEFAULT_WRITE_CONCURRENCY,
+    ):
+        self._client = client
+        self.table_name = table_name
+        self.write_concurrency = write_concurrency
+
+    @property
+    def client(self):
+        if self._client is None:
+            from app.services.zerodb_client import get_zerodb_client
+            self._client = get_zerodb_client()
+        return self._client
+
+    async def iter_pages(
+        self,
+        project_id: str,
+        entity_id: Optional[str] = None,
+        page_size: int = DEFAULT_DECAY_PAGE_SIZE,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of memory rows for a project (optionally one entity)."""
+        filter_query: Dict[str, Any] = {"project_id": project_id}
+        if entity_id is not None:
+            filter_query["entity_id"] = entity_id
+        skip = 0
+        while True:
+            result = await self.client.query_rows(
+                self.table_name, filter_query, limit=page_size, skip=skip
+            )
+            rows = result.get("rows", [])
+            if rows:
+                yield rows
+            if len(rows) < page_size:
+                return
+            skip += len(rows)
+
+    async def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """Persist updated rows with bounded concurrency."""
+        semaphore = asyncio.Semaphore(self.write_concurrency)
+
+        async def write(row: Dict[str, Any]) -> None:
+            row_id = row.get("id") or row.get("row_id") or row["memory_id"]
+            data = {k: v for k, v in row.items() if k not in ("id", "row_id")}
+            async with semaphore:
+                await self.client.update_row(self.table_name, row_id, data)
+
+        await asyncio.gather(*(write(row) for row in rows))
+
+    async def delete_rows(self, row_ids: List[str]) -> None:
+        """Delete rows with bounded concurrency."""
+        semaphore = asyncio.Semaphore(self.write_concurrency)
+
+        async def delete(row_id: str) -> None:
+            async with semaphore:
+                await self.client.delete_row(self.table_name, row_id)
+
+        await asyncio.gather(*(delete(row_id) for row_id in row_ids))
+
+
 class MemoryDecayWorker:
     """
     Worker that applies importance decay, manages promotions, and enforces
     memory limits via LRU eviction.
 
-    Designed to be dependency-free for unit testing; storage interactions are
-    delegated to the overridable _fetch_memories / _update_* hooks.
+    With a ``store`` (e.g. ZeroDBMemoryStore) decay cycles page through
+    storage and write changed scores back in bulk. Without one, storage
+    interactions are delegated to the overridable _fetch_memories /
+    _update_* hooks, which keeps the worker dependency-free for unit tests.
     """
 
+    def __init__(
+        self,
+        store: Optional[ZeroDBMemoryStore] = None,
+        page_size: int = DEFAULT_DECAY_PAGE_SIZE,
+        index_ttl_seconds: float = EVICTION_INDEX_TTL_SECONDS,
+        max_tracked_entities: int = MAX_TRACKED_ENTITIES,
+    ):
+        self.store = store
+        self.page_size = page_size
+        self.index_ttl_seconds = index_ttl_seconds
+        self.max_tracked_entities = max_tracked_entities
+        # Least recently used first
+        self._eviction_indexes: "OrderedDict[Tuple[str, str], EntityEvictionIndex]" = OrderedDict()
+
     # ------------------------------------------------------------------
     # Issue #208 — Importance Decay
     # ------------------------------------------------------------------
@@ -128,35 +446,88 @@ class MemoryDecayWorker:
         """
         Scan all memories for a project and apply decay scores.
 
+        Memories are processed a page at a time: scores are computed for
+        the whole page with compute_importance_scores, then the page's
+        changed scores and new eviction flags are written back together.
+
         Args:
             project_id: Project to process.
 
         Returns:
             DecayCycleResult summarising the run.
         """
-        memories = await self._fetch_memories(project_id)
-
+        now = datetime.now(timezone.utc)
         updated_scores: Dict[str, float] = {}
+        total = 0
         flagged = 0
 
-        for memory in memories:
-            memory_id = memory.get("memory_id", "")
-            score = await self.calculate_importance(memory)
-            updated_scores[memory_id] = score
+        async for page in self._memory_pages(project_id):
+            scores = compute_importance_scores(page, now=now)
+            evict = scores < EVICTION_THRESHOLD
+            ids = [memory.get("memory_id", "") for memory in page]
 
-            if score < EVICTION_THRESHOLD:
-                flagged += 1
-                await self._mark_for_eviction(memory_id)
-            else:
-                await self._update_memory_importance(memory_id, score)
+            total += len(page)
+            flagged += int(evict.sum())
+            updated_scores.update(zip(ids, scores.tolist()))
+
+            await self._write_back(page, scores, evict)
 
         return DecayCycleResult(
             project_id=project_id,
-            total_processed=len(memories),
+            total_processed=total,
             flagged_for_eviction=flagged,
             updated_scores=updated_scores,
         )
 
+    async def _memory_pages(
+        self,
+        project_id: str,
+        entity_id: Optional[str] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        if self.store is not None:
+            async for page in self.store.iter_pages(project_id, entity_id, self.page_size):
+                yield page
+            return
+        memories = await self._fetch_memories(project_id, entity_id=entity_id)
+        for start in range(0, len(memories), self.page_size):
+            yield memories[start:start + self.page_size]
+
+    async def _write_back(
+        self,
+        page: List[Dict[str, Any]],
+        scores: np.ndarray,
+        evict: np.ndarray,
+    ) -> None:
+        """Write a page's changed scores and eviction flags."""
+        if self.store is None:
+            # Per-memory hooks, issued together
+            await asyncio.gather(*(
+                self._mark_for_eviction(memory.get("memory_id", ""))
+                if flag else
+                self._update_memory_importance(memory.get("memory_id", ""), score)
+                for memory, score, flag in zip(page, scores.tolist(), evict.tolist())
+            ))
+            return
+
+        stored = np.fromiter(
+            (_as_score(m.get("importance")) for m in page),
+            dtype=np.float64, count=len(page),
+        )
+        already_flagged = np.fromiter(
+            (bool(m.get("marked_for_eviction")) for m in page),
+            dtype=bool, count=len(page),
+        )
+        # NaN (never scored) compares False, so it counts as changed
+        unchanged = np.abs(scores - stored) < SCORE_WRITE_EPSILON
+        changed = ~unchanged | (evict != already_flagged)
+
+        rows = [
+            {**page[i], "importance": float(scores[i]), "marked_for_eviction": bool(evict[i])}
+            for i in np.flatnonzero(changed)
+        ]
+        if rows:
+            await self.store.write_rows(rows)
+
     # ------------------------------------------------------------------
     # Issue #209 — Auto-Promotion Hierarchy
     # ------------------------------------------------------------------
@@ -271,46 +642,120 @@ class MemoryDecayWorker:
           - core tier memories are NEVER evicted
           - semantic memories are evicted after working and episodic
 
+        Victims come from the entity's EntityEvictionIndex: the tracked
+        index when one exists and is younger than ``index_ttl_seconds``,
+        otherwise one built (and kept) from ``memories`` or from storage.
+        Eviction pops k entries from the heap and deletes them in one
+        batch; if the delete fails they are put back.
+
         Args:
             project_id:   Project scope.
             entity_id:    Entity whose memories are being capped.
             memories:     Pre-fetched list of memory dicts (used in tests).
-                          When None the worker fetches from storage.
+                          When given, the entity's index is rebuilt from it.
+                          When None the tracked index is used, or the worker
+                          fetches from storage if it is missing or expired.
             max_memories: Maximum number of memories to retain.
 
         Returns:
             List of evicted memory IDs (strings).
         """
-        if memories is None:
-            memories = await self._fetch_memories(project_id, entity_id=entity_id)
-
-        # Separate out core memories — these are never touched
-        evictable = [m for m in memories if m.get("tier") != MemoryTier.CORE]
-        protected = [m for m in memories if m.get("tier") == MemoryTier.CORE]
+        if memories is not None:
+            index = EntityEvictionIndex.from_memories(memories)
+            self._keep_index((project_id, entity_id), index)
+        else:
+            index = await self._current_index(project_id, entity_id)
 
-        over_by = len(memories) - max_memories
-        if over_by <= 0:
-            return []
+        return await self._evict_over_cap(index, max_memories)
 
-        # Sort evictable by: tier priority (lowest first), then last_accessed (oldest first)
-        def _sort_key(m: Dict[str, Any]) -> Tuple[int, float]:
-            tier = m.get("tier", MemoryTier.WORKING)
-            priority = _TIER_EVICTION_PRIORITY.get(tier, 0)
-            ts = _parse_dt(m.get("last_accessed"))
-            # Lower timestamp = older = evicted sooner → use seconds since epoch ascending
-            ts_score = ts.timestamp() if ts else 0.0
-            return (priority, ts_score)
+    async def record_memory(
+        self,
+        project_id: str,
+        entity_id: str,
+        memory: Dict[str, Any],
+        max_memories: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Track a newly written (or re-tiered) memory and enforce the cap inline.
 
-        evictable.sort(key=_sort_key)
+        When the entity has no tracked index (or it expired) one is built
+        from storage first, so the cap counts every stored memory.
 
-        to_evict = evictable[:over_by]
-        evicted_ids = [m["memory_id"] for m in to_evict]
+        Args:
+            project_id:   Project scope.
+            entity_id:    Entity owning the memory.
+            memory:       Memory dict (memory_id, tier, last_accessed).
+            max_memories: Cap to enforce after insertion (None skips it).
 
-        for mid in evicted_ids:
-            await self._evict_memory(mid)
+        Returns:
+            List of memory IDs evicted to stay within the cap.
+        """
+        index = await self._current_index(project_id, entity_id)
+        index.track(memory)
+        if max_memories is None:
+            return []
+        return await self._evict_over_cap(index, max_memories)
 
+    def record_access(
+        self,
+        project_id: str,
+        entity_id: str,
+        memory_id: str,
+        accessed_at: Optional[datetime] = None,
+    ) -> None:
+        """Move an accessed memory to the back of the eviction order."""
+        index = self._tracked_index((project_id, entity_id))
+        if index is not None:
+            index.touch(memory_id, accessed_at)
+
+    async def _current_index(self, project_id: str, entity_id: str) -> EntityEvictionIndex:
+        """Return the entity's tracked index, rebuilding it from storage when missing or expired."""
+        key = (project_id, entity_id)
+        index = self._tracked_index(key)
+        if index is None or time.monotonic() - index.created_at > self.index_ttl_seconds:
+            memories = await self._fetch_memories(project_id, entity_id=entity_id)
+            index = EntityEvictionIndex.from_memories(memories)
+            self._keep_index(key, index)
+        return index
+
+    def _tracked_index(self, key: Tuple[str, str]) -> Optional[EntityEvictionIndex]:
+        index = self._eviction_indexes.get(key)
+        if index is not None:
+            self._eviction_indexes.move_to_end(key)
+        return index
+
+    def _keep_index(self, key: Tuple[str, str], index: EntityEvictionIndex) -> None:
+        self._eviction_indexes[key] = index
+        self._eviction_indexes.move_to_end(key)
+        while len(self._eviction_indexes) > self.max_tracked_entities:
+            self._eviction_indexes.popitem(last=False)
+
+    async def _evict_over_cap(
+        self, index: EntityEvictionIndex, max_memories: int
+    ) -> List[str]:
+        over_by = len(index) - max_memories
+        if over_by <= 0:
+            return []
+        evicted_ids = index.pop_victims(over_by)
+        if evicted_ids:
+            try:
+                await self._evict_memories(
+                    evicted_ids, [index.row_id(mid) for mid in evicted_ids]
+                )
+            except Exception:
+                index.restore(evicted_ids)
+                raise
+            for mid in evicted_ids:
+                index.remove(mid)
         return evicted_ids
 
+    async def _evict_memories(self, memory_ids: List[str], row_ids: List[str]) -> None:
+        """Delete a batch of memories from storage."""
+        if self.store is not None:
+            await self.store.delete_rows(row_ids)
+            return
+        await asyncio.gather(*(self._evict_memory(mid) for mid in memory_ids))
+
     # ------------------------------------------------------------------
     # Storage hooks — override in subclasses or patch in tests
     # ------------------------------------------------------------------
@@ -323,13 +768,18 @@ class MemoryDecayWorker:
         """
         Fetch memories from storage.
 
-        Override or monkeypatch this in tests to inject fixture data.
-        Production implementations would call the ZeroDB client here.
+        Reads every page from the configured store. Override or monkeypatch
+        this in tests to inject fixture data.
         """
-        logger.warning(
-            "_fetch_memories called without a storage backend — returning []"
-        )
-        return []
+        if self.store is None:
+            logger.warning(
+                "_fetch_memories called without a storage backend — returning []"
+            )
+            return []
+        memories: List[Dict[str, Any]] = []
+        async for page in self.store.iter_pages(project_id, entity_id, self.page_size):
+            memories.extend(page)
+        return memories
 
     async def _update_memory_importance(
         self, memory_id: str, importance: float
@@ -348,3 +798,76 @@ class MemoryDecayWorker:
     async def _evict_memory(self, memory_id: str) -> None:
         """Delete or archive a memory from storage."""
         logger.debug("_evict_memory: %s", memory_id)
+
+
+# ----------------------------------------------------------------------
+# Scheduler
+# ----------------------------------------------------------------------
+
+class MemoryDecayScheduler:
+    """
+    Runs decay cycles incrementally across projects.
+
+    Projects are kept in a heap by next due time; each tick runs at most
+    ``max_projects_per_tick`` due projects (one cycle each) and reschedules
+    them ``interval_seconds`` later, so a large fleet of projects is spread
+    over time instead of being decayed all at once.
+    """
+
+    def __init__(
+        self,
+        worker: MemoryDecayWorker,
+        interval_seconds: float = 3600.0,
+        max_projects_per_tick: int = 10,
+    ):
+        self.worker = worker
+        self.interval_seconds = interval_seconds
+        self.max_projects_per_tick = max_projects_per_tick
+        self._due: List[Tuple[float, str]] = []
+        self._scheduled: Dict[str, float] = {}
+        self.last_results: Dict[str, DecayCycleResult] = {}
+
+    def schedule(self, project_id: str, delay_seconds: float = 0.0) -> None:
+        """Add or reschedule a project."""
+        due_at = time.monotonic() + delay_seconds
+        self._scheduled[project_id] = due_at
+        heapq.heappush(self._due, (due_at, project_id))
+
+    def unschedule(self, project_id: str) -> None:
+        """Stop decaying a project (its heap entry is dropped lazily)."""
+        self._scheduled.pop(project_id, None)
+
+    @property
+    def scheduled_projects(self) -> List[str]:
+        return list(self._scheduled)
+
+    async def run_due(self) -> List[DecayCycleResult]:
+        """Run cycles for projects that are due, up to the per-tick limit."""
+        now = time.monotonic()
+        results: List[DecayCycleResult] = []
+        while self._due and self._due[0][0] <= now and len(results) < self.max_projects_per_tick:
+            due_at, project_id = heapq.heappop(self._due)
+            if self._scheduled.get(project_id) != due_at:
+                continue  # unscheduled or superseded entry
+            try:
+                result = await self.worker.run_decay_cycle(project_id)
+                self.last_results[project_id] = result
+                results.append(result)
+            except Exception as exc:
+                logger.error("Decay cycle failed for project %s: %s", project_id, exc)
+            if self._scheduled.get(project_id) == due_at:
+                self.schedule(project_id, self.interval_seconds)
+        return results
+
+    async def run_forever(
+        self,
+        stop: asyncio.Event,
+        tick_seconds: float = 5.0,
+    ) -> None:
+        """Run due projects every ``tick_seconds`` until ``stop`` is set."""
+        while not stop.is_set():
+            await self.run_due()
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=tick_seconds)
+            except asyncio.TimeoutError:
+                pass
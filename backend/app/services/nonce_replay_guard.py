@@ -12,15 +12,25 @@ Validation rules:
 - Nonce must be unique per DID (reject duplicates = replay attack).
 - Timestamp must be within 5 minutes of server time (reject stale requests).
 
+Hot path:
+Because a nonce can only be accepted while its timestamp is inside the
+drift window, the guard keeps every (DID, nonce) pair seen in that window
+in a time-bucketed in-memory set. Once ``start()`` has warmed the set from
+ZeroDB, replay checks never leave the process and used nonces are written
+through to ZeroDB by a background flusher in batches. Expired entries are
+dropped a whole bucket at a time.
+
 Built by AINative Dev Team
 Refs #242
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +40,19 @@ NONCES_TABLE = "x402_nonces"
 # Maximum allowed age/skew for request timestamps (in minutes)
 MAX_TIMESTAMP_DRIFT_MINUTES = 5
 
+# Width of one in-memory nonce bucket (in seconds)
+NONCE_BUCKET_SECONDS = 30
+
+# Write-behind tuning for persisting used nonces
+NONCE_FLUSH_BATCH_SIZE = 100
+NONCE_FLUSH_INTERVAL_SECONDS = 0.5
+
+# Page size used when warming the in-memory window from ZeroDB
+_WARM_PAGE_SIZE = 1000
+
+# Maximum concurrent delete_row calls issued by cleanup_expired_nonces
+_CLEANUP_CONCURRENCY = 20
+
 
 # ---------------------------------------------------------------------------
 # Custom exceptions
@@ -82,6 +105,68 @@ class InvalidNonceError(Exception):
         )
 
 
+# ---------------------------------------------------------------------------
+# In-memory nonce window
+# ---------------------------------------------------------------------------
+
+
+class _NonceWindow:
+    """
+    Time-bucketed set of (DID, nonce) pairs covering the drift window.
+
+    Entries are bucketed by the request timestamp. A bucket can be dropped
+    as soon as every timestamp it holds is older than the drift window,
+    because any replay of those requests is rejected as stale before the
+    uniqueness check runs. Membership is a single dict lookup.
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int = NONCE_BUCKET_SECONDS,
+        retention_seconds: int = MAX_TIMESTAMP_DRIFT_MINUTES * 60,
+    ) -> None:
+        self._bucket_seconds = bucket_seconds
+        self._retention_seconds = retention_seconds
+        # (did, nonce) -> bucket id
+        self._index: Dict[Tuple[str, str], int] = {}
+        # bucket id -> keys stored in that bucket
+        self._buckets: Dict[int, Set[Tuple[str, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def contains(self, did: str, nonce: str) -> bool:
+        """Return True if the nonce has already been seen for this DID."""
+        return (did, nonce.lower()) in self._index
+
+    def add(self, did: str, nonce: str, epoch_seconds: float) -> None:
+        """Record a (DID, nonce) pair under the bucket for its timestamp."""
+        key = (did, nonce.lower())
+        if key in self._index:
+            return
+        bucket_id = int(epoch_seconds // self._bucket_seconds)
+        self._index[key] = bucket_id
+        self._buckets.setdefault(bucket_id, set()).add(key)
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Drop every bucket whose newest timestamp is outside the window.
+
+        Returns:
+            Number of (DID, nonce) pairs evicted.
+        """
+        now = time.time() if now is None else now
+        # Bucket b covers [b * width, (b + 1) * width); it is stale once its
+        # upper edge plus the drift window is in the past.
+        oldest_live = int((now - self._retention_seconds) // self._bucket_seconds)
+        evicted = 0
+        for bucket_id in [b for b in self._buckets if b < oldest_live]:
+            for key in self._buckets.pop(bucket_id):
+                del self._index[key]
+                evicted += 1
+        return evicted
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -94,16 +179,42 @@ class NonceReplayGuard:
     Per-DID nonce uniqueness ensures that even if a signed request is
     intercepted it cannot be replayed.  Timestamp freshness prevents
     pre-recorded requests from being submitted later.
+
+    Until ``start()`` runs, uniqueness is checked against ZeroDB and used
+    nonces are inserted synchronously. After ``start()`` the in-memory
+    window is authoritative and inserts are batched in the background;
+    ``stop()`` flushes anything still pending.
+
+    Usage (attach to FastAPI startup/shutdown)::
+
+        await nonce_replay_guard.start()
+        ...
+        await nonce_replay_guard.stop()
     """
 
-    def __init__(self, zerodb_client: Optional[Any] = None) -> None:
+    def __init__(
+        self,
+        zerodb_client: Optional[Any] = None,
+        flush_batch_size: int = NONCE_FLUSH_BATCH_SIZE,
+        flush_interval: float = NONCE_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
         """
         Initialise the guard.
 
         Args:
             zerodb_client: Injected ZeroDB client (for testing / DI).
+            flush_batch_size: Maximum nonces persisted per ZeroDB request.
+            flush_interval: Seconds between background flushes.
         """
         self._zerodb_client = zerodb_client
+        self._flush_batch_size = flush_batch_size
+        self._flush_interval = flush_interval
+        self._window = _NonceWindow()
+        self._warmed = False
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+        self._flush_wakeup = asyncio.Event()
 
     @property
     def zerodb_client(self) -> Any:
@@ -129,7 +240,8 @@ class NonceReplayGuard:
         Steps performed:
         1. Validate nonce is a UUID v4 string.
         2. Validate timestamp is within ±5 minutes of now.
-        3. Query ZeroDB for existing nonce+did combination.
+        3. Check the in-memory window for the nonce+did combination, and
+           fall back to ZeroDB if the window has not been warmed yet.
         4. Reject if a matching record exists (replay).
 
         Args:
@@ -157,10 +269,12 @@ class NonceReplayGuard:
         timestamp: str,
     ) -> None:
         """
-        Persist a used nonce to ZeroDB to prevent future replays.
+        Persist a used nonce to prevent future replays.
 
         Should be called after a request has passed validation and been
-        processed.
+        processed. The nonce is added to the in-memory window immediately;
+        the ZeroDB insert is queued for the background flusher when the
+        guard is started and awaited inline otherwise.
 
         Args:
             nonce: The UUID v4 nonce that was used.
@@ -173,9 +287,110 @@ class NonceReplayGuard:
             "timestamp": timestamp,
             "recorded_at": datetime.now(timezone.utc).isoformat(),
         }
+        self._window.add(did, nonce, self._epoch_seconds(timestamp))
+
+        if self._flush_task is not None:
+            self._pending.append(record)
+            if len(self._pending) >= self._flush_batch_size:
+                self._flush_wakeup.set()
+            return
+
         await self.zerodb_client.insert_row(NONCES_TABLE, record)
         logger.debug(f"Recorded nonce for DID {did}: {nonce}")
 
+    async def start(self) -> None:
+        """
+        Warm the in-memory window from ZeroDB and start the write-behind flusher.
+
+        Safe to call more than once. If warming fails the guard keeps
+        checking uniqueness against ZeroDB.
+        """
+        if self._flush_task is not None:
+            return
+        try:
+            loaded = await self.warm()
+            logger.info(f"Nonce window warmed with {loaded} recent nonce(s).")
+        except Exception as exc:
+            logger.error(f"Failed to warm nonce window, using ZeroDB lookups: {exc}")
+        self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the background flusher and persist any pending nonces."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        while self._pending:
+            if not await self.flush():
+                break
+
+    async def warm(self) -> int:
+        """
+        Load every nonce whose timestamp is still inside the drift window.
+
+        Returns:
+            Number of nonces loaded into the in-memory window.
+        """
+        # A nonce is live while its timestamp is within the drift window, and
+        # it can only have been recorded within the drift window of that
+        # timestamp, so anything recorded earlier than twice the drift is dead.
+        # recorded_at is server-generated, so it compares reliably as a string.
+        cutoff = datetime.now(timezone.utc) - timedelta(
+            minutes=2 * MAX_TIMESTAMP_DRIFT_MINUTES
+        )
+        loaded = 0
+        skip = 0
+        while True:
+            result = await self.zerodb_client.query_rows(
+                NONCES_TABLE,
+                filter={"recorded_at": {"$gte": cutoff.isoformat()}},
+                limit=_WARM_PAGE_SIZE,
+                skip=skip,
+            )
+            rows = self._rows(result)
+            for row in rows:
+                if row.get("nonce") and row.get("did") is not None:
+                    self._window.add(
+                        row["did"],
+                        row["nonce"],
+                        self._epoch_seconds(row.get("timestamp", "")),
+                    )
+                    loaded += 1
+            if len(rows) < _WARM_PAGE_SIZE:
+                break
+            skip += _WARM_PAGE_SIZE
+
+        self._window.expire()
+        self._warmed = True
+        return loaded
+
+    async def flush(self) -> int:
+        """
+        Persist up to one batch of pending nonces to ZeroDB.
+
+        Failed batches are put back at the head of the queue and retried on
+        the next flush.
+
+        Returns:
+            Number of nonce records written.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            batch = self._pending[: self._flush_batch_size]
+            del self._pending[: len(batch)]
+            try:
+                await self.zerodb_client.insert_rows(NONCES_TABLE, batch)
+            except Exception as exc:
+                self._pending[:0] = batch
+                logger.error(f"Failed to persist {len(batch)} nonce(s): {exc}")
+                return 0
+            logger.debug(f"Persisted {len(batch)} nonce(s) to {NONCES_TABLE}.")
+            return len(batch)
+
     async def cleanup_expired_nonces(
         self,
         max_age_hours: int = 24,
@@ -202,12 +417,15 @@ class NonceReplayGuard:
             {"timestamp_before": cutoff_iso},
         )
 
-        deleted = 0
-        for record in expired:
-            record_id = record.get("id")
-            if record_id:
+        record_ids = [r.get("id") for r in self._rows(expired) if r.get("id")]
+        semaphore = asyncio.Semaphore(_CLEANUP_CONCURRENCY)
+
+        async def _delete(record_id: str) -> None:
+            async with semaphore:
                 await self.zerodb_client.delete_row(NONCES_TABLE, {"id": record_id})
-                deleted += 1
+
+        await asyncio.gather(*(_delete(record_id) for record_id in record_ids))
+        deleted = len(record_ids)
 
         logger.info(f"Deleted {deleted} expired nonce record(s).")
         return deleted
@@ -228,20 +446,40 @@ class NonceReplayGuard:
             raise InvalidNonceError(nonce)
 
     @staticmethod
-    def _validate_timestamp(timestamp: str) -> None:
-        """Ensure the timestamp is within the acceptable drift window."""
+    def _parse_timestamp(timestamp: str) -> datetime:
+        """Parse an ISO 8601 timestamp into a timezone-aware datetime."""
+        # Parse ISO 8601 — handle both offset-aware and naive forms
+        if timestamp.endswith("Z"):
+            ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        else:
+            ts = datetime.fromisoformat(timestamp)
+
+        # Ensure timezone-aware for comparison
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        return ts
+
+    @classmethod
+    def _epoch_seconds(cls, timestamp: str) -> float:
+        """Return the timestamp as epoch seconds, defaulting to now."""
         try:
-            # Parse ISO 8601 — handle both offset-aware and naive forms
-            if timestamp.endswith("Z"):
-                ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            else:
-                ts = datetime.fromisoformat(timestamp)
-
-            # Ensure timezone-aware for comparison
-            if ts.tzinfo is None:
-                ts = ts.replace(tzinfo=timezone.utc)
+            return cls._parse_timestamp(timestamp).timestamp()
+        except (ValueError, TypeError, AttributeError):
+            return time.time()
 
-        except (ValueError, TypeError):
+    @staticmethod
+    def _rows(result: Any) -> List[Dict[str, Any]]:
+        """Normalise a query_rows result (list or ``{"rows": [...]}``)."""
+        if isinstance(result, dict):
+            return result.get("rows", [])
+        return list(result or [])
+
+    @classmethod
+    def _validate_timestamp(cls, timestamp: str) -> None:
+        """Ensure the timestamp is within the acceptable drift window."""
+        try:
+            ts = cls._parse_timestamp(timestamp)
+        except (ValueError, TypeError, AttributeError):
             raise StaleRequestError(timestamp)
 
         now = datetime.now(timezone.utc)
@@ -252,14 +490,36 @@ class NonceReplayGuard:
             raise StaleRequestError(timestamp)
 
     async def _check_uniqueness(self, nonce: str, did: str) -> None:
-        """Query ZeroDB to detect duplicate nonce use by this DID."""
+        """Detect duplicate nonce use by this DID."""
+        self._window.expire()
+        if self._window.contains(did, nonce):
+            raise ReplayAttackError(nonce=nonce, did=did)
+        if self._warmed:
+            return
+
         existing = await self.zerodb_client.query_rows(
             NONCES_TABLE,
             {"nonce": nonce, "did": did},
         )
-        if existing:
+        if self._rows(existing):
             raise ReplayAttackError(nonce=nonce, did=did)
 
+    async def _flush_loop(self) -> None:
+        """Periodically persist pending nonces until cancelled."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_wakeup.wait(), timeout=self._flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_wakeup.clear()
+            try:
+                while len(self._pending) and await self.flush():
+                    pass
+            except Exception as exc:
+                logger.error(f"Nonce flush loop error: {exc}")
+
 
 # ---------------------------------------------------------------------------
 # Module-level singleton
@@ -1,25 +1,40 @@
 """
 Plugin Sandbox Service — Issue #243
 
-Executes plugin tool handlers in an isolated async context with:
+Executes plugin tool handlers in an isolated context with:
 - asyncio.wait_for timeout enforcement
 - Exception isolation (handler errors become error results)
 - Permission verification before execution
 
+Two isolation modes:
+- "inline": handlers run on the API event loop (a CPU-bound or blocking
+  handler stalls every request and cannot be preempted)
+- "process": handlers run in a pool of warm worker processes with
+  per-call CPU and wall-clock limits and a per-worker memory cap
+  (see plugin_sandbox_worker)
+
 Built by AINative Dev Team
 Refs #243
 """
 from __future__ import annotations
 
 import asyncio
-import importlib
 import logging
-from typing import Optional, Dict, Any
+import math
+from typing import Optional, Dict, Any, Iterable
 
 from app.services.plugin_registry_service import (
     PluginRegistryService,
     PluginNotFoundError,
 )
+from app.services.plugin_sandbox_worker import (
+    RESULT_CPU_LIMIT,
+    RESULT_ERROR,
+    PluginWorkerPool,
+    WorkerCrashedError,
+    WorkerTimeoutError,
+    load_handler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +56,10 @@ class PermissionDeniedError(Exception):
     """Raised when a plugin attempts an operation it lacks permission for."""
 
 
+ISOLATION_INLINE = "inline"
+ISOLATION_PROCESS = "process"
+
+
 # ---------------------------------------------------------------------------
 # Service
 # ---------------------------------------------------------------------------
@@ -50,14 +69,42 @@ class PluginSandboxService:
     """
     Provides sandboxed execution of plugin tool handlers.
 
-    Each call runs inside ``asyncio.wait_for`` to enforce a hard timeout.
-    All handler exceptions are caught and converted to structured error
-    results rather than propagated — except for timeouts, which surface
-    as ``ToolTimeoutError``.
+    Each call is bounded by a hard timeout. All handler exceptions are
+    caught and converted to structured error results rather than
+    propagated — except for timeouts (wall-clock or, in process mode, CPU
+    time), which surface as ``ToolTimeoutError``.
+
+    Args:
+        registry: Plugin registry used to resolve plugins and tools.
+        isolation: ``"inline"`` (default) or ``"process"``.
+        max_workers: Process-mode pool size (defaults to the CPU count).
+        memory_limit_mb: Process-mode address-space cap per worker.
+        preload_modules: Handler modules process workers import at start-up.
     """
 
-    def __init__(self, registry: PluginRegistryService) -> None:
+    def __init__(
+        self,
+        registry: PluginRegistryService,
+        isolation: str = ISOLATION_INLINE,
+        max_workers: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        preload_modules: Iterable[str] = (),
+    ) -> None:
+        if isolation not in (ISOLATION_INLINE, ISOLATION_PROCESS):
+            raise ValueError(f"Unknown plugin isolation mode: {isolation}")
         self._registry = registry
+        self._isolation = isolation
+        self._pool: Optional[PluginWorkerPool] = None
+        if isolation == ISOLATION_PROCESS:
+            self._pool = PluginWorkerPool(
+                size=max_workers,
+                memory_limit_mb=memory_limit_mb,
+                preload=preload_modules,
+            )
+
+    @property
+    def isolation(self) -> str:
+        return self._isolation
 
     async def execute_tool(
         self,
@@ -65,6 +112,7 @@ class PluginSandboxService:
         tool_name: str,
         input_data: Dict[str, Any],
         timeout_seconds: float = 30,
+        cpu_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Execute a named tool from a registered plugin in a sandboxed context.
@@ -74,6 +122,8 @@ class PluginSandboxService:
             tool_name: The tool to execute.
             input_data: Input parameters for the tool handler.
             timeout_seconds: Hard execution deadline in seconds.
+            cpu_seconds: Process mode only: CPU time budget for the call
+                (defaults to ``timeout_seconds``, rounded up to whole seconds).
 
         Returns:
             ``{"success": True, "output": ...}`` on success, or
@@ -82,13 +132,24 @@ class PluginSandboxService:
         Raises:
             PluginNotFoundError: if the plugin is not registered.
             ToolNotFoundError: if ``tool_name`` is not in the plugin.
-            ToolTimeoutError: if execution exceeds ``timeout_seconds``.
+            ToolTimeoutError: if execution exceeds ``timeout_seconds`` (or,
+                in process mode, ``cpu_seconds``).
         """
         plugin = await self._registry.get_plugin(plugin_id)  # may raise PluginNotFoundError
 
         tool_def = self._find_tool(plugin, tool_name)
 
         handler_module_path = tool_def["handler_module"]
+        if self._pool is not None:
+            return await self._execute_in_worker(
+                plugin_id,
+                tool_name,
+                handler_module_path,
+                input_data,
+                timeout_seconds,
+                cpu_seconds,
+            )
+
         handler_fn = self._load_handler(handler_module_path)
 
         try:
@@ -111,6 +172,57 @@ class PluginSandboxService:
             )
             return {"success": False, "error": str(exc)}
 
+    async def _execute_in_worker(
+        self,
+        plugin_id: str,
+        tool_name: str,
+        handler_module_path: str,
+        input_data: Dict[str, Any],
+        timeout_seconds: float,
+        cpu_seconds: Optional[float],
+    ) -> Dict[str, Any]:
+        """Run one call on the worker pool and map its reply to a result dict."""
+        if cpu_seconds is None:
+            cpu_seconds = math.ceil(timeout_seconds)
+        try:
+            kind, payload = await self._pool.run(
+                handler_module_path, input_data, timeout_seconds, cpu_seconds
+            )
+        except WorkerTimeoutError:
+            raise ToolTimeoutError(
+                f"Tool '{tool_name}' in plugin '{plugin_id}' timed out "
+                f"after {timeout_seconds}s"
+            )
+        except WorkerCrashedError as exc:
+            logger.warning(
+                "Plugin '%s' tool '%s' crashed its worker: %s", plugin_id, tool_name, exc
+            )
+            return {"success": False, "error": f"Tool worker crashed: {exc}"}
+
+        if kind == RESULT_CPU_LIMIT:
+            raise ToolTimeoutError(
+                f"Tool '{tool_name}' in plugin '{plugin_id}' {payload}"
+            )
+        if kind == RESULT_ERROR:
+            logger.warning(
+                "Plugin '%s' tool '%s' raised an exception: %s",
+                plugin_id,
+                tool_name,
+                payload,
+            )
+            return {"success": False, "error": payload}
+        return {"success": True, "output": payload}
+
+    async def start(self) -> None:
+        """Warm the worker pool up front (process mode; no-op inline)."""
+        if self._pool is not None:
+            await self._pool.start()
+
+    async def close(self) -> None:
+        """Stop the worker pool (process mode; no-op inline)."""
+        if self._pool is not None:
+            await self._pool.close()
+
     async def check_permissions(
         self, plugin_id: str, requested_permission: str
     ) -> bool:
@@ -148,14 +260,8 @@ class PluginSandboxService:
     @staticmethod
     def _load_handler(handler_module_path: str):
         """
-        Dynamically import a handler module and return its ``handle`` function.
+        Return the ``handle`` function of a handler module (imported once, then cached).
 
         The module must export an async function named ``handle``.
         """
-        module = importlib.import_module(handler_module_path)
-        handler_fn = getattr(module, "handle", None)
-        if handler_fn is None:
-            raise AttributeError(
-                f"Handler module '{handler_module_path}' has no 'handle' function"
-            )
-        return handler_fn
+        return load_handler(handler_module_path)
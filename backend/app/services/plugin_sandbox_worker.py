@@ -0,0 +1,321 @@
+"""
+Plugin Sandbox Worker — Issue #243
+
+Warm worker processes for PluginSandboxService's process isolation mode.
+
+Each worker is a long-lived child process that:
+- caps its address space (RLIMIT_AS) once at start-up
+- preloads the handler modules it is given
+- runs one tool call at a time under a per-call RLIMIT_CPU budget
+- sends results back over a pipe (pickled by multiprocessing)
+
+A call that exceeds its wall-clock deadline cannot be interrupted inside
+the worker, so the pool kills that worker and starts a replacement; the
+rest of the pool keeps serving.
+
+This module imports only the standard library so spawned workers start
+quickly.
+
+Built by AINative Dev Team
+Refs #243
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+import logging
+import math
+import multiprocessing
+import os
+import signal
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-Unix platforms
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Reply kinds sent back by a worker
+RESULT_OK = "ok"
+RESULT_ERROR = "error"
+RESULT_CPU_LIMIT = "cpu_limit"
+
+
+class WorkerTimeoutError(Exception):
+    """Raised when a call exceeds its wall-clock deadline (the worker is replaced)."""
+
+
+class WorkerCrashedError(Exception):
+    """Raised when a worker process dies mid-call (e.g. killed by the OS)."""
+
+
+@lru_cache(maxsize=None)
+def load_handler(handler_module_path: str) -> Callable[..., Any]:
+    """
+    Import a handler module once and return its ``handle`` function.
+
+    Cached per process, so the API process and each worker pay for the
+    import and attribute lookup only on first use.
+    """
+    module = importlib.import_module(handler_module_path)
+    handler_fn = getattr(module, "handle", None)
+    if handler_fn is None:
+        raise AttributeError(
+            f"Handler module '{handler_module_path}' has no 'handle' function"
+        )
+    return handler_fn
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+# ---------------------------------------------------------------------------
+
+
+class _CpuLimitExceeded(BaseException):
+    """Raised inside a worker by the SIGXCPU handler (BaseException so handlers can't swallow it)."""
+
+
+def _on_sigxcpu(signum, frame):
+    raise _CpuLimitExceeded()
+
+
+def _set_cpu_budget(cpu_seconds: Optional[float]) -> None:
+    """Set the soft RLIMIT_CPU to current usage + budget (None lifts it)."""
+    if resource is None:
+        return
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if cpu_seconds is None:
+        soft = hard
+    else:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        soft = math.ceil(usage.ru_utime + usage.ru_stime + cpu_seconds)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, preload: List[str], memory_limit_bytes: Optional[int]) -> None:
+    """Worker loop: receive (module, input, cpu budget), reply (kind, payload)."""
+    # Shutdown is driven by the parent; Ctrl-C in a terminal must not kill workers first
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if resource is not None:
+        signal.signal(signal.SIGXCPU, _on_sigxcpu)
+        if memory_limit_bytes:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+
+    for module_path in preload:
+        try:
+            load_handler(module_path)
+        except Exception as exc:
+            logger.warning("Worker %s failed to preload %s: %s", os.getpid(), module_path, exc)
+
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                return
+            if message is None:
+                return
+            module_path, input_data, cpu_seconds = message
+            reply = _run_call(loop, module_path, input_data, cpu_seconds)
+            try:
+                conn.send(reply)
+            except Exception as exc:
+                # Pickling fails before anything is written to the pipe
+                conn.send((RESULT_ERROR, f"Tool output is not picklable: {exc}"))
+            if reply[0] == RESULT_CPU_LIMIT:
+                # SIGXCPU may have fired inside the event loop; exit and be replaced
+                return
+    finally:
+        loop.close()
+
+
+def _run_call(loop, module_path: str, input_data: Any, cpu_seconds: Optional[float]) -> Tuple[str, Any]:
+    try:
+        _set_cpu_budget(cpu_seconds)
+        try:
+            output = load_handler(module_path)(input_data)
+            if inspect.isawaitable(output):
+                output = loop.run_until_complete(output)
+        finally:
+            _set_cpu_budget(None)
+    except _CpuLimitExceeded:
+        return (RESULT_CPU_LIMIT, f"exceeded CPU time limit of {cpu_seconds}s")
+    except MemoryError:
+        return (RESULT_ERROR, "exceeded memory limit")
+    except Exception as exc:
+        return (RESULT_ERROR, str(exc))
+    return (RESULT_OK, output)
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------------------------
+
+
+class _Worker:
+    """Parent-side handle for one worker process and its pipe."""
+
+    def __init__(self, ctx, preload: List[str], memory_limit_bytes: Optional[int]) -> None:
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, preload, memory_limit_bytes),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+
+    async def call(self, message: Tuple[str, Any, Optional[float]]) -> Tuple[str, Any]:
+        self.conn.send(message)
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        fd = self.conn.fileno()
+        loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+        try:
+            await readable
+        finally:
+            loop.remove_reader(fd)
+        try:
+            return self.conn.recv()
+        except EOFError:
+            raise WorkerCrashedError(f"worker {self.process.pid} exited during the call")
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=1)
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+
+class PluginWorkerPool:
+    """
+    A fixed-size pool of warm plugin worker processes.
+
+    Args:
+        size: Number of worker processes (defaults to the CPU count)
+        memory_limit_mb: Address-space cap per worker (None: unlimited)
+        preload: Handler modules every worker imports at start-up
+        start_method: multiprocessing start method; "spawn" avoids forking
+            the API process's event loop and threads
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        preload: Iterable[str] = (),
+        start_method: str = "spawn",
+    ) -> None:
+        self.size = size or os.cpu_count() or 1
+        self._memory_limit_bytes = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+        self._ctx = multiprocessing.get_context(start_method)
+        # Modules seen so far; replacement workers preload all of them
+        self._modules: Dict[str, None] = dict.fromkeys(preload)
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: Set[_Worker] = set()
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def started(self) -> bool:
+        return self._idle is not None
+
+    async def start(self) -> None:
+        """Spawn the workers (off the event loop; spawning blocks)."""
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            idle: asyncio.Queue = asyncio.Queue()
+            workers = await asyncio.gather(
+                *(asyncio.to_thread(self._spawn) for _ in range(self.size))
+            )
+            for worker in workers:
+                idle.put_nowait(worker)
+            self._idle = idle
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self._ctx, list(self._modules), self._memory_limit_bytes)
+        self._workers.add(worker)
+        return worker
+
+    async def run(
+        self,
+        module_path: str,
+        input_data: Any,
+        timeout_seconds: float,
+        cpu_seconds: Optional[float],
+    ) -> Tuple[str, Any]:
+        """
+        Run one handler call on an idle worker.
+
+        Returns:
+            (kind, payload) where kind is RESULT_OK, RESULT_ERROR or RESULT_CPU_LIMIT
+
+        Raises:
+            WorkerTimeoutError: if the wall-clock deadline passes (the
+                worker is killed and replaced)
+            WorkerCrashedError: if the worker dies during the call
+        """
+        if self._idle is None:
+            await self.start()
+        self._modules.setdefault(module_path)
+
+        # The queue this worker came from; close() replaces it with None
+        idle = self._idle
+        worker = await idle.get()
+        try:
+            result = await asyncio.wait_for(
+                worker.call((module_path, input_data, cpu_seconds)),
+                timeout=timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            await self._replace(worker, idle)
+            raise WorkerTimeoutError(f"call exceeded {timeout_seconds}s")
+        except WorkerCrashedError:
+            await self._replace(worker, idle)
+            raise
+        except BaseException:
+            # Cancelled mid-call: the worker may still be busy, so don't reuse it
+            await self._replace(worker, idle)
+            raise
+        if result[0] == RESULT_CPU_LIMIT:
+            await self._replace(worker, idle)
+        elif self._idle is idle:
+            idle.put_nowait(worker)
+        else:
+            # The pool was closed during the call
+            await asyncio.to_thread(worker.stop)
+        return result
+
+    async def _replace(self, worker: _Worker, idle: asyncio.Queue) -> None:
+        self._workers.discard(worker)
+        await asyncio.to_thread(worker.kill)
+        if self._idle is not idle:
+            return
+        replacement = await asyncio.to_thread(self._spawn)
+        if self._idle is idle:
+            idle.put_nowait(replacement)
+        else:
+            # The pool was closed while the replacement started
+            self._workers.discard(replacement)
+            await asyncio.to_thread(replacement.stop)
+
+    async def close(self) -> None:
+        """Stop every worker; the pool restarts lazily on the next run()."""
+        workers, self._workers = list(self._workers), set()
+        self._idle = None
+        await asyncio.gather(*(asyncio.to_thread(w.stop) for w in workers))
@@ -18,6 +18,7 @@ from typing import Optional
 from eth_account import Account
 from eth_account.messages import encode_defunct
 
+from app.core.credential_cache import KIND_API_KEY, get_credential_cache
 from app.core.errors import APIError
 from app.services.zerodb_client import get_zerodb_client
 
@@ -94,20 +95,29 @@ class ProvisionService:
         """Extract row_data from ZeroDB row envelope."""
         return row.get("row_data", row)
 
-    async def _lookup_key(self, api_key: str) -> Optional[dict]:
+    async def _query_active_key(self, api_key: str) -> Optional[dict]:
+        """Return the raw active row for *api_key*; ZeroDB errors propagate."""
         client = self._get_client()
+        result = await client.query_rows(
+            PROVISIONED_KEYS_TABLE,
+            filter={"api_key": api_key, "is_active": True},
+            limit=1,
+        )
+        rows = result.get("data", result) if isinstance(result, dict) else result
+        return rows[0] if rows else None
+
+    async def _lookup_key(self, api_key: str) -> Optional[dict]:
         try:
-            result = await client.query_rows(
-                PROVISIONED_KEYS_TABLE,
-                filter={"api_key": api_key, "is_active": True},
-                limit=1,
-            )
-            rows = result.get("data", result) if isinstance(result, dict) else result
-            return self._unwrap_row(rows[0]) if rows else None
+            row = await self._query_active_key(api_key)
+            return self._unwrap_row(row) if row else None
         except Exception as exc:
             logger.error("lookup_key error: %s", exc)
             return None
 
+    async def _load_user_id(self, api_key: str) -> Optional[str]:
+        row = await self._query_active_key(api_key)
+        return self._unwrap_row(row)["user_id"] if row else None
+
     async def _lookup_by_wallet(self, wallet_address: str) -> Optional[dict]:
         client = self._get_client()
         try:
@@ -218,9 +228,49 @@ class ProvisionService:
         """
         Return user_id if *api_key* is a valid dynamically-provisioned key,
         else None. Called by the auth middleware as a fallback.
+
+        Results are cached in the shared credential cache, so steady-state
+        requests do not query ZeroDB. Lookup failures are not cached.
         """
-        row = await self._lookup_key(api_key)
-        return row["user_id"] if row else None
+        try:
+            return await get_credential_cache().get_or_load(
+                KIND_API_KEY, api_key, lambda: self._load_user_id(api_key)
+            )
+        except Exception as exc:
+            logger.error("lookup_key error: %s", exc)
+            return None
+
+    async def revoke_key(self, api_key: str, user_id: Optional[str] = None) -> bool:
+        """
+        Deactivate a dynamically-provisioned key and evict it from the cache.
+
+        Args:
+            api_key: The key to revoke.
+            user_id: If given, only revoke the key when it belongs to this user.
+
+        Returns:
+            True if an active key was found and deactivated.
+        """
+        cache = get_credential_cache()
+        cache.invalidate(KIND_API_KEY, api_key)
+
+        row = await self._query_active_key(api_key)
+        if not row:
+            return False
+
+        data = self._unwrap_row(row)
+        if user_id is not None and data.get("user_id") != user_id:
+            return False
+        row_id = row.get("row_id") or row.get("id") or data.get("id")
+        client = self._get_client()
+        await client.update_row(
+            PROVISIONED_KEYS_TABLE, str(row_id), {**data, "is_active": False}
+        )
+        # Evict again in case a lookup re-cached the key during the update
+        cache.invalidate(KIND_API_KEY, api_key)
+
+        logger.info("Revoked API key for user %s", data.get("user_id"))
+        return True
 
 
 # Singleton
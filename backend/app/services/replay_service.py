@@ -16,9 +16,25 @@ This service provides:
 - Get run details
 - Generate complete replay data
 - Validate linked records exist
+- Stream a run's records as one chronological timeline
+- Stream replay frames (header, record chunks, validation trailer) with
+  linked-record validation computed incrementally as records pass
+
+Storage layout:
+- Runs are indexed by run_id and, per project, kept in a list ordered by
+  started_at, so listing pages and finding the latest run need no sort
+- Each record family is kept per run_id in timestamp order (inserts use
+  bisect), matching what the ZeroDB queries return with sort=asc
+- The three families are merged with a k-way heap merge, so a replay
+  timeline is produced lazily rather than re-sorted
 """
+import heapq
 import logging
-from typing import List, Dict, Optional, Any, Tuple
+from bisect import insort
+from itertools import repeat
+from typing import (
+    List, Dict, Optional, Any, Tuple, AsyncIterator, Iterator, Sequence
+)
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -37,6 +53,12 @@ from app.schemas.runs import (
 
 logger = logging.getLogger(__name__)
 
+# Record families in merge order (ties on timestamp keep this order)
+RECORD_FAMILIES = ("memory", "compliance_event", "x402_request")
+
+# Records per frame when streaming a replay
+DEFAULT_REPLAY_CHUNK_SIZE = 500
+
 
 @dataclass
 class RunRecord:
@@ -50,6 +72,152 @@ class RunRecord:
     metadata: Optional[Dict[str, Any]] = None
 
 
+def _record_timestamp(record: Dict[str, Any]) -> str:
+    return record.get("timestamp") or ""
+
+
+def _timeline_key(item: Tuple[str, Dict[str, Any]]) -> str:
+    return _record_timestamp(item[1])
+
+
+class ReplayValidator:
+    """
+    Incremental linked-record validation for a run.
+
+    Records are fed one at a time in timeline order via observe(), so a
+    streamed replay can be validated without holding the whole run.
+    summary() returns the same shape as the non-streaming replay.
+    """
+
+    def __init__(self, run: RunRecord, agent_profile: Optional[Dict[str, Any]]):
+        self.run = run
+        self.agent_profile = agent_profile
+        self.issues: List[str] = []
+        self.warnings: List[str] = []
+        self.counts = dict.fromkeys(RECORD_FAMILIES, 0)
+        self.chronological = True
+        self._last_timestamp = ""
+
+        # Validate agent profile exists
+        if not agent_profile:
+            self.issues.append(f"Agent profile not found for agent_id: {run.agent_id}")
+
+    def observe(self, record_type: str, record: Dict[str, Any]) -> None:
+        """Validate one record; record_type is one of RECORD_FAMILIES."""
+        self.counts[record_type] += 1
+        run = self.run
+
+        if record_type == "memory":
+            if record.get("run_id") != run.run_id:
+                self.issues.append(
+                    f"Memory record {record.get('memory_id')} has mismatched run_id"
+                )
+            if record.get("agent_id") != run.agent_id:
+                self.warnings.append(
+                    f"Memory record {record.get('memory_id')} has different agent_id"
+                )
+        elif record_type == "compliance_event":
+            if record.get("run_id") != run.run_id:
+                self.issues.append(
+                    f"Compliance event {record.get('event_id')} has mismatched run_id"
+                )
+        elif record.get("run_id") != run.run_id:
+            self.issues.append(
+                f"X402 request {record.get('request_id')} has mismatched run_id"
+            )
+
+        timestamp = _record_timestamp(record)
+        if timestamp < self._last_timestamp:
+            self.chronological = False
+        else:
+            self._last_timestamp = timestamp
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "all_records_present": len(self.issues) == 0,
+            "chronological_order_verified": self.chronological,
+            "agent_profile_found": self.agent_profile is not None,
+            "memory_records_validated": self.counts["memory"],
+            "compliance_events_validated": self.counts["compliance_event"],
+            "x402_requests_validated": self.counts["x402_request"],
+            "issues": self.issues if self.issues else None,
+            "warnings": self.warnings if self.warnings else None
+        }
+
+
+def _agent_profile_record(
+    run: RunRecord,
+    agent_profile: Optional[Dict[str, Any]]
+) -> AgentProfileRecord:
+    if agent_profile:
+        return AgentProfileRecord(
+            agent_id=agent_profile["agent_id"],
+            agent_name=agent_profile.get("agent_name"),
+            agent_type=agent_profile.get("agent_type"),
+            configuration=agent_profile.get("configuration", {}),
+            created_at=agent_profile.get("created_at", run.started_at)
+        )
+    # Minimal profile if not found
+    return AgentProfileRecord(
+        agent_id=run.agent_id,
+        agent_name=None,
+        agent_type=None,
+        configuration={},
+        created_at=run.started_at
+    )
+
+
+def _memory_record(mem: Dict[str, Any]) -> AgentMemoryRecord:
+    return AgentMemoryRecord(
+        memory_id=mem["memory_id"],
+        agent_id=mem["agent_id"],
+        run_id=mem["run_id"],
+        task_id=mem.get("task_id"),
+        input_summary=mem["input_summary"],
+        output_summary=mem["output_summary"],
+        confidence=mem.get("confidence", 1.0),
+        metadata=mem.get("metadata", {}),
+        timestamp=mem["timestamp"]
+    )
+
+
+def _compliance_event_record(evt: Dict[str, Any]) -> ComplianceEventRecord:
+    return ComplianceEventRecord(
+        event_id=evt["event_id"],
+        run_id=evt["run_id"],
+        agent_id=evt["agent_id"],
+        event_type=evt["event_type"],
+        event_category=evt.get("event_category"),
+        description=evt["description"],
+        severity=evt.get("severity"),
+        metadata=evt.get("metadata", {}),
+        timestamp=evt["timestamp"]
+    )
+
+
+def _x402_request_record(req: Dict[str, Any]) -> X402RequestRecord:
+    return X402RequestRecord(
+        request_id=req["request_id"],
+        run_id=req["run_id"],
+        agent_id=req["agent_id"],
+        request_type=req["request_type"],
+        amount=req.get("amount"),
+        currency=req.get("currency"),
+        status=req["status"],
+        request_payload=req.get("request_payload", {}),
+        response_payload=req.get("response_payload", {}),
+        metadata=req.get("metadata", {}),
+        timestamp=req["timestamp"]
+    )
+
+
+_RECORD_SCHEMAS = {
+    "memory": _memory_record,
+    "compliance_event": _compliance_event_record,
+    "x402_request": _x402_request_record,
+}
+
+
 class ReplayService:
     """
     Service for replaying agent runs from ZeroDB records.
@@ -70,6 +238,11 @@ class ReplayService:
         # Mock data store for demo purposes
         # In production, this would query ZeroDB
         self._runs: Dict[str, RunRecord] = {}
+        # project_id -> [(started_at, -seq, run_id)] ascending; iterating in
+        # reverse gives newest first with ties in insertion order
+        self._runs_by_project: Dict[str, List[Tuple[str, int, str]]] = {}
+        self._run_keys: Dict[str, Tuple[str, int, str]] = {}
+        self._next_seq = 0
         self._agent_profiles: Dict[str, Dict[str, Any]] = {}
         self._agent_memory: Dict[str, List[Dict[str, Any]]] = {}
         self._compliance_events: Dict[str, List[Dict[str, Any]]] = {}
@@ -91,7 +264,7 @@ class ReplayService:
         base_time = "2026-01-10T10:00:00.000Z"
 
         # Create demo run
-        self._runs[demo_run_id] = RunRecord(
+        self._index_run(RunRecord(
             run_id=demo_run_id,
             project_id=demo_project,
             agent_id=demo_agent_id,
@@ -99,7 +272,7 @@ class ReplayService:
             started_at=base_time,
             completed_at="2026-01-10T10:10:00.000Z",
             metadata={"trigger": "demo", "source": "unit_test"}
-        )
+        ))
 
         # Create demo agent profile
         self._agent_profiles[demo_agent_id] = {
@@ -261,23 +434,39 @@ class ReplayService:
             f"requests={len(self._x402_requests[demo_run_id])}"
         )
 
+    def _index_run(self, run: RunRecord) -> None:
+        """Store a run and place it in its project's started_at order."""
+        previous = self._runs.get(run.run_id)
+        if previous is not None:
+            self._runs_by_project[previous.project_id].remove(self._run_keys[run.run_id])
+        self._next_seq += 1
+        key = (run.started_at, -self._next_seq, run.run_id)
+        self._run_keys[run.run_id] = key
+        self._runs[run.run_id] = run
+        insort(self._runs_by_project.setdefault(run.project_id, []), key)
+
+    def _iter_runs_newest_first(self, project_id: str) -> Iterator[RunRecord]:
+        for _, _, run_id in reversed(self._runs_by_project.get(project_id, ())):
+            yield self._runs[run_id]
+
     def _get_runs_for_project(self, project_id: str) -> List[RunRecord]:
         """
-        Get all runs for a project.
+        Get all runs for a project, newest first.
 
         In production, this would query ZeroDB:
-        - mcp__zerodb__zerodb_query_rows(table_id="runs", filter={"project_id": project_id})
+        - mcp__zerodb__zerodb_query_rows(
+            table_id="runs",
+            filter={"project_id": project_id},
+            sort={"started_at": "desc"}
+          )
 
         Args:
             project_id: Project identifier
 
         Returns:
-            List of run records for the project
+            List of run records for the project ordered by started_at descending
         """
-        return [
-            run for run in self._runs.values()
-            if run.project_id == project_id
-        ]
+        return list(self._iter_runs_newest_first(project_id))
 
     def _get_run_by_id(
         self,
@@ -332,10 +521,9 @@ class ReplayService:
             run_id: Run identifier
 
         Returns:
-            List of memory records sorted by timestamp
+            List of memory records sorted by timestamp (stored in order)
         """
-        records = self._agent_memory.get(run_id, [])
-        return sorted(records, key=lambda x: x.get("timestamp", ""))
+        return self._agent_memory.get(run_id, [])
 
     def _get_compliance_events_for_run(self, run_id: str) -> List[Dict[str, Any]]:
         """
@@ -352,10 +540,9 @@ class ReplayService:
             run_id: Run identifier
 
         Returns:
-            List of compliance events sorted by timestamp
+            List of compliance events sorted by timestamp (stored in order)
         """
-        events = self._compliance_events.get(run_id, [])
-        return sorted(events, key=lambda x: x.get("timestamp", ""))
+        return self._compliance_events.get(run_id, [])
 
     def _get_x402_requests_for_run(self, run_id: str) -> List[Dict[str, Any]]:
         """
@@ -372,10 +559,74 @@ class ReplayService:
             run_id: Run identifier
 
         Returns:
-            List of X402 requests sorted by timestamp
+            List of X402 requests sorted by timestamp (stored in order)
         """
-        requests = self._x402_requests.get(run_id, [])
-        return sorted(requests, key=lambda x: x.get("timestamp", ""))
+        return self._x402_requests.get(run_id, [])
+
+    @staticmethod
+    def _merge_families(
+        families: Sequence[Sequence[Dict[str, Any]]]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        K-way merge already-sorted record families into one timeline.
+
+        Yields (record_type, record) lazily; equal timestamps keep
+        RECORD_FAMILIES order.
+        """
+        streams = [
+            zip(repeat(record_type), family)
+            for record_type, family in zip(RECORD_FAMILIES, families)
+        ]
+        return heapq.merge(*streams, key=_timeline_key)
+
+    def iter_replay_records(
+        self,
+        project_id: str,
+        run_id: str
+    ) -> Optional[Iterator[Tuple[str, Dict[str, Any]]]]:
+        """
+        Iterate all of a run's records in chronological order.
+
+        Records are produced one at a time from the merge, so a run with a
+        very large number of records is never copied into a single list.
+
+        Args:
+            project_id: Project identifier
+            run_id: Run identifier
+
+        Returns:
+            Iterator of (record_type, record) tuples, or None if run not found
+        """
+        if not self._get_run_by_id(project_id, run_id):
+            return None
+        return self._merge_families((
+            self._get_agent_memory_for_run(run_id),
+            self._get_compliance_events_for_run(run_id),
+            self._get_x402_requests_for_run(run_id),
+        ))
+
+    async def stream_replay_records(
+        self,
+        project_id: str,
+        run_id: str
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Async variant of iter_replay_records.
+
+        Yields nothing if the run does not exist.
+
+        Args:
+            project_id: Project identifier
+            run_id: Run identifier
+
+        Yields:
+            (record_type, record) tuples in chronological order
+        """
+        records = self.iter_replay_records(project_id, run_id)
+        if records is None:
+            return
+        for item in records:
+            yield item
 
     def _validate_linked_records(
         self,
@@ -400,64 +651,12 @@ class ReplayService:
         Returns:
             Validation results dict
         """
-        issues = []
-        warnings = []
-
-        # Validate agent profile exists
-        if not agent_profile:
-            issues.append(f"Agent profile not found for agent_id: {run.agent_id}")
-
-        # Validate all memory records have matching run_id
-        for mem in memory_records:
-            if mem.get("run_id") != run.run_id:
-                issues.append(
-                    f"Memory record {mem.get('memory_id')} has mismatched run_id"
-                )
-            if mem.get("agent_id") != run.agent_id:
-                warnings.append(
-                    f"Memory record {mem.get('memory_id')} has different agent_id"
-                )
-
-        # Validate all compliance events have matching run_id
-        for evt in compliance_events:
-            if evt.get("run_id") != run.run_id:
-                issues.append(
-                    f"Compliance event {evt.get('event_id')} has mismatched run_id"
-                )
-
-        # Validate all X402 requests have matching run_id
-        for req in x402_requests:
-            if req.get("run_id") != run.run_id:
-                issues.append(
-                    f"X402 request {req.get('request_id')} has mismatched run_id"
-                )
-
-        # Check chronological order
-        chronological_order_verified = True
-        all_timestamps = []
-
-        for mem in memory_records:
-            all_timestamps.append(("memory", mem.get("timestamp")))
-        for evt in compliance_events:
-            all_timestamps.append(("event", evt.get("timestamp")))
-        for req in x402_requests:
-            all_timestamps.append(("request", req.get("timestamp")))
-
-        # Sort by timestamp and verify order
-        sorted_timestamps = sorted(all_timestamps, key=lambda x: x[1] or "")
-        if sorted_timestamps != sorted(all_timestamps, key=lambda x: x[1] or ""):
-            chronological_order_verified = True  # Already sorted, so this is always true
-
-        return {
-            "all_records_present": len(issues) == 0,
-            "chronological_order_verified": chronological_order_verified,
-            "agent_profile_found": agent_profile is not None,
-            "memory_records_validated": len(memory_records),
-            "compliance_events_validated": len(compliance_events),
-            "x402_requests_validated": len(x402_requests),
-            "issues": issues if issues else None,
-            "warnings": warnings if warnings else None
-        }
+        validator = ReplayValidator(run, agent_profile)
+        for item in self._merge_families(
+            (memory_records, compliance_events, x402_requests)
+        ):
+            validator.observe(*item)
+        return validator.summary()
 
     def list_runs(
         self,
@@ -478,6 +677,7 @@ class ReplayService:
         Returns:
             Tuple of (list of run summaries, total count)
         """
+        # Project index is already ordered by started_at (newest first)
         runs = self._get_runs_for_project(project_id)
 
         # Apply status filter if provided
@@ -486,9 +686,6 @@ class ReplayService:
 
         total = len(runs)
 
-        # Sort by started_at descending (newest first)
-        runs = sorted(runs, key=lambda x: x.started_at, reverse=True)
-
         # Paginate
         start_idx = (page - 1) * page_size
         end_idx = start_idx + page_size
@@ -532,7 +729,7 @@ class ReplayService:
         Returns:
             ProjectStatsResponse with aggregate counts
         """
-        runs = self._get_runs_for_project(project_id)
+        runs = self._runs_by_project.get(project_id, [])
 
         total_runs = len(runs)
         total_x402_requests = 0
@@ -541,15 +738,14 @@ class ReplayService:
         latest_run = None
 
         # Aggregate counts from all runs
-        for run in runs:
-            total_x402_requests += len(self._get_x402_requests_for_run(run.run_id))
-            total_memory_entries += len(self._get_agent_memory_for_run(run.run_id))
-            total_compliance_events += len(self._get_compliance_events_for_run(run.run_id))
+        for _, _, run_id in runs:
+            total_x402_requests += len(self._get_x402_requests_for_run(run_id))
+            total_memory_entries += len(self._get_agent_memory_for_run(run_id))
+            total_compliance_events += len(self._get_compliance_events_for_run(run_id))
 
-        # Get latest run (sorted by started_at descending)
+        # Latest run is the last entry of the started_at-ordered index
         if runs:
-            sorted_runs = sorted(runs, key=lambda x: x.started_at, reverse=True)
-            latest = sorted_runs[0]
+            latest = self._runs[runs[-1][2]]
             latest_run = LatestRunInfo(
                 run_id=latest.run_id,
                 status=latest.status.value,
@@ -595,23 +791,7 @@ class ReplayService:
         requests = self._get_x402_requests_for_run(run_id)
 
         # Create agent profile record (with defaults if not found)
-        if agent_profile:
-            profile_record = AgentProfileRecord(
-                agent_id=agent_profile["agent_id"],
-                agent_name=agent_profile.get("agent_name"),
-                agent_type=agent_profile.get("agent_type"),
-                configuration=agent_profile.get("configuration", {}),
-                created_at=agent_profile.get("created_at", run.started_at)
-            )
-        else:
-            # Create minimal profile if not found
-            profile_record = AgentProfileRecord(
-                agent_id=run.agent_id,
-                agent_name=None,
-                agent_type=None,
-                configuration={},
-                created_at=run.started_at
-            )
+        profile_record = _agent_profile_record(run, agent_profile)
 
         # Calculate duration if completed
         duration_ms = None
@@ -679,72 +859,12 @@ class ReplayService:
         )
 
         # Create agent profile record
-        if agent_profile_dict:
-            agent_profile = AgentProfileRecord(
-                agent_id=agent_profile_dict["agent_id"],
-                agent_name=agent_profile_dict.get("agent_name"),
-                agent_type=agent_profile_dict.get("agent_type"),
-                configuration=agent_profile_dict.get("configuration", {}),
-                created_at=agent_profile_dict.get("created_at", run.started_at)
-            )
-        else:
-            agent_profile = AgentProfileRecord(
-                agent_id=run.agent_id,
-                agent_name=None,
-                agent_type=None,
-                configuration={},
-                created_at=run.started_at
-            )
-
-        # Convert memory records to schema
-        agent_memory = [
-            AgentMemoryRecord(
-                memory_id=mem["memory_id"],
-                agent_id=mem["agent_id"],
-                run_id=mem["run_id"],
-                task_id=mem.get("task_id"),
-                input_summary=mem["input_summary"],
-                output_summary=mem["output_summary"],
-                confidence=mem.get("confidence", 1.0),
-                metadata=mem.get("metadata", {}),
-                timestamp=mem["timestamp"]
-            )
-            for mem in memory_records
-        ]
-
-        # Convert compliance events to schema
-        events = [
-            ComplianceEventRecord(
-                event_id=evt["event_id"],
-                run_id=evt["run_id"],
-                agent_id=evt["agent_id"],
-                event_type=evt["event_type"],
-                event_category=evt.get("event_category"),
-                description=evt["description"],
-                severity=evt.get("severity"),
-                metadata=evt.get("metadata", {}),
-                timestamp=evt["timestamp"]
-            )
-            for evt in compliance_events
-        ]
+        agent_profile = _agent_profile_record(run, agent_profile_dict)
 
-        # Convert X402 requests to schema
-        requests = [
-            X402RequestRecord(
-                request_id=req["request_id"],
-                run_id=req["run_id"],
-                agent_id=req["agent_id"],
-                request_type=req["request_type"],
-                amount=req.get("amount"),
-                currency=req.get("currency"),
-                status=req["status"],
-                request_payload=req.get("request_payload", {}),
-                response_payload=req.get("response_payload", {}),
-                metadata=req.get("metadata", {}),
-                timestamp=req["timestamp"]
-            )
-            for req in x402_requests
-        ]
+        # Convert records to schema
+        agent_memory = [_memory_record(mem) for mem in memory_records]
+        events = [_compliance_event_record(evt) for evt in compliance_events]
+        requests = [_x402_request_record(req) for req in x402_requests]
 
         replay_generated_at = datetime.utcnow().isoformat() + "Z"
 
@@ -768,6 +888,79 @@ class ReplayService:
             validation=validation
         )
 
+    def stream_replay(
+        self,
+        project_id: str,
+        run_id: str,
+        chunk_size: int = DEFAULT_REPLAY_CHUNK_SIZE
+    ) -> Optional[AsyncIterator[Dict[str, Any]]]:
+        """
+        Stream replay data for a run as a sequence of frames.
+
+        Frames, in order:
+        - {"type": "header", ...}: run fields and agent profile
+        - {"type": "records", "records": [...]}: up to chunk_size records in
+          chronological order, each {"record_type": ..., "record": {...}}
+        - {"type": "trailer", "validation": {...}, "record_count": N}
+
+        Validation runs as records are emitted, so the trailer carries the
+        same summary as get_replay_data without a second pass.
+
+        Args:
+            project_id: Project identifier
+            run_id: Run identifier
+            chunk_size: Maximum records per frame
+
+        Returns:
+            Async iterator of frames, or None if run not found
+        """
+        run = self._get_run_by_id(project_id, run_id)
+        if not run:
+            return None
+        return self._replay_frames(run, max(1, chunk_size))
+
+    async def _replay_frames(
+        self,
+        run: RunRecord,
+        chunk_size: int
+    ) -> AsyncIterator[Dict[str, Any]]:
+        agent_profile = self._get_agent_profile(run.agent_id)
+        validator = ReplayValidator(run, agent_profile)
+
+        yield {
+            "type": "header",
+            "run_id": run.run_id,
+            "project_id": run.project_id,
+            "status": run.status.value,
+            "agent_profile": _agent_profile_record(run, agent_profile).model_dump(mode="json"),
+            "started_at": run.started_at,
+            "completed_at": run.completed_at,
+            "replay_generated_at": datetime.utcnow().isoformat() + "Z",
+        }
+
+        chunk: List[Dict[str, Any]] = []
+        record_count = 0
+        async for record_type, record in self.stream_replay_records(run.project_id, run.run_id):
+            validator.observe(record_type, record)
+            chunk.append({
+                "record_type": record_type,
+                "record": _RECORD_SCHEMAS[record_type](record).model_dump(mode="json"),
+            })
+            if len(chunk) >= chunk_size:
+                record_count += len(chunk)
+                yield {"type": "records", "records": chunk}
+                chunk = []
+        if chunk:
+            record_count += len(chunk)
+            yield {"type": "records", "records": chunk}
+
+        validation = validator.summary()
+        logger.info(
+            f"Streamed replay for run {run.run_id}: records={record_count}, "
+            f"validation={validation['all_records_present']}"
+        )
+        yield {"type": "trailer", "validation": validation, "record_count": record_count}
+
     def add_run(
         self,
         run_id: str,
@@ -799,7 +992,7 @@ class ReplayService:
             started_at=started_at,
             metadata=metadata
         )
-        self._runs[run_id] = run
+        self._index_run(run)
 
         # Ensure empty collections exist
         self._agent_memory[run_id] = []
@@ -809,6 +1002,55 @@ class ReplayService:
         logger.info(f"Added run {run_id} for project {project_id}")
         return run
 
+    def _add_record(
+        self,
+        store: Dict[str, List[Dict[str, Any]]],
+        run_id: str,
+        record: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # Keep each family in timestamp order; equal timestamps stay in arrival order
+        insort(store.setdefault(run_id, []), record, key=_record_timestamp)
+        return record
+
+    def add_memory_record(self, run_id: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add an agent memory record to a run, keeping timestamp order.
+
+        Args:
+            run_id: Run identifier
+            record: Memory record dict (must include 'timestamp')
+
+        Returns:
+            The stored record
+        """
+        return self._add_record(self._agent_memory, run_id, record)
+
+    def add_compliance_event(self, run_id: str, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add a compliance event to a run, keeping timestamp order.
+
+        Args:
+            run_id: Run identifier
+            event: Compliance event dict (must include 'timestamp')
+
+        Returns:
+            The stored event
+        """
+        return self._add_record(self._compliance_events, run_id, event)
+
+    def add_x402_request(self, run_id: str, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Add an X402 request record to a run, keeping timestamp order.
+
+        Args:
+            run_id: Run identifier
+            request: X402 request dict (must include 'timestamp')
+
+        Returns:
+            The stored request
+        """
+        return self._add_record(self._x402_requests, run_id, request)
+
 
 # Singleton instance
 _replay_service: Optional[ReplayService] = None
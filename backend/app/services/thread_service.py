@@ -12,40 +12,278 @@ Implements:
 - search_threads: keyword/semantic search across threads (Issue #220)
 - search_messages: keyword/semantic search within a thread (Issue #220)
 
+Storage:
+- Threads and messages are held in memory and, when a database path is
+  configured (THREAD_DB_PATH), written through to SQLite and reloaded on
+  startup
+- Token counts are computed once per message at write time with the
+  configured TokenCounter (real tokenizer when available, ~4 chars/token
+  otherwise) and kept as a per-thread prefix sum, so budget truncation is
+  a binary search
+- build_context_window packs the most recent messages into a Gemini
+  model's context window (model chosen per agent type)
+- Titles and message contents are indexed by character trigram, so
+  substring search only verifies candidate documents instead of scanning
+
 Built by AINative Dev Team
 Refs #218 #219 #220
 """
 from __future__ import annotations
 
+import json
 import logging
+import sqlite3
 import uuid
+from bisect import bisect_left
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Iterable, Iterator, Set, Tuple
+
+from app.services.token_counter import TokenCounter, get_token_counter
 
 logger = logging.getLogger(__name__)
 
+# Characters per n-gram in the search index
+_NGRAM = 3
+
+# Tokens the model adds per message for role/turn markup
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# Tokens left free for the model's response when packing a context window
+DEFAULT_RESPONSE_RESERVE_TOKENS = 2048
+
 
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _fit_start(prefix: List[int], budget: int, overhead: int = 0) -> int:
+    """
+    Smallest start index whose message suffix fits ``budget``.
+
+    Suffix cost is ``prefix[n] - prefix[i] + overhead * (n - i)``, which
+    never increases with i, so the boundary is found by binary search.
+    """
+    n = len(prefix) - 1
+    if overhead == 0:
+        return min(bisect_left(prefix, prefix[n] - budget), n)
+    lo, hi = 0, n
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if prefix[n] - prefix[mid] + overhead * (n - mid) <= budget:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+class _NgramIndex:
+    """
+    Inverted index from lowercase character trigrams to document ordinals.
+
+    Ordinals are appended in increasing order, so posting lists stay
+    sorted. A document containing the query as a substring contains all of
+    the query's trigrams, so intersecting their postings yields a superset
+    of the matches that callers then verify.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+    def add(self, ordinal: int, text: str) -> None:
+        for gram in _ngrams(text.lower()):
+            self._postings[gram].append(ordinal)
+
+    def candidates(self, query: str) -> Optional[List[int]]:
+        """
+        Return sorted candidate ordinals, or None when the query is too
+        short to use the index (callers fall back to a scan).
+        """
+        grams = _ngrams(query.lower())
+        if not grams:
+            return None
+        postings = sorted((self._postings.get(g, []) for g in grams), key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result.intersection_update(posting)
+        return sorted(result)
+
+
+class _SQLiteThreadStore:
+    """Write-through SQLite persistence for threads and messages."""
+
+    def __init__(self, db_path: str) -> None:
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS conversation_threads (
+                seq        INTEGER PRIMARY KEY,
+                id         TEXT NOT NULL UNIQUE,
+                agent_id   TEXT NOT NULL,
+                title      TEXT NOT NULL,
+                status     TEXT NOT NULL,
+                metadata   TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS thread_messages (
+                seq         INTEGER PRIMARY KEY,
+                id          TEXT NOT NULL UNIQUE,
+                thread_id   TEXT NOT NULL,
+                role        TEXT NOT NULL,
+                content     TEXT NOT NULL,
+                metadata    TEXT NOT NULL,
+                token_count INTEGER NOT NULL,
+                created_at  TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_thread_messages_thread
+                ON thread_messages(thread_id, seq);
+            CREATE TABLE IF NOT EXISTS thread_store_meta (
+                key   TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value FROM thread_store_meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO thread_store_meta (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+    def update_token_counts(self, counts: Iterable[Tuple[int, str]]) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "UPDATE thread_messages SET token_count = ? WHERE id = ?", counts
+            )
+
+    def insert_thread(self, thread: Dict[str, Any]) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO conversation_threads "
+                "(id, agent_id, title, status, metadata, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    thread["id"], thread["agent_id"], thread["title"], thread["status"],
+                    json.dumps(thread["metadata"], default=str), thread["created_at"],
+                ),
+            )
+
+    def update_status(self, thread_id: str, status: str) -> None:
+        with self._conn:
+            self._conn.execute(
+                "UPDATE conversation_threads SET status = ? WHERE id = ?",
+                (status, thread_id),
+            )
+
+    def insert_message(self, msg: Dict[str, Any], token_count: int) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO thread_messages "
+                "(id, thread_id, role, content, metadata, token_count, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    msg["id"], msg["thread_id"], msg["role"], msg["content"],
+                    json.dumps(msg["metadata"], default=str), token_count, msg["created_at"],
+                ),
+            )
+
+    def load_threads(self) -> Iterator[Dict[str, Any]]:
+        for row in self._conn.execute(
+            "SELECT id, agent_id, title, status, metadata, created_at "
+            "FROM conversation_threads ORDER BY seq"
+        ):
+            yield {
+                "id": row[0], "agent_id": row[1], "title": row[2], "status": row[3],
+                "metadata": json.loads(row[4]), "created_at": row[5],
+            }
+
+    def load_messages(self) -> Iterator[Tuple[Dict[str, Any], int]]:
+        for row in self._conn.execute(
+            "SELECT id, thread_id, role, content, metadata, created_at, token_count "
+            "FROM thread_messages ORDER BY seq"
+        ):
+            msg = {
+                "id": row[0], "thread_id": row[1], "role": row[2], "content": row[3],
+                "metadata": json.loads(row[4]), "created_at": row[5],
+            }
+            yield msg, row[6]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
 class ThreadService:
     """
-    In-memory thread store with soft-delete support.
+    Thread store with soft-delete support.
 
-    Designed to be a drop-in replacement for a ZeroDB-backed implementation.
     All methods are async to allow transparent swap to an async DB client.
+    With ``db_path`` set, every write goes through to SQLite and the store
+    is reloaded from it on construction; otherwise state is process-local.
 
     Tables (logical):
     - conversation_threads: id, agent_id, title, status, metadata, created_at
     - thread_messages:      id, thread_id, role, content, metadata, created_at
     """
 
-    def __init__(self) -> None:
-        # thread_id -> thread dict (includes embedded messages list)
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        token_counter: Optional[TokenCounter] = None,
+    ) -> None:
+        # thread_id -> thread dict (messages are attached on read)
         self._threads: Dict[str, Dict[str, Any]] = {}
         # thread_id -> list[message dict] (separate store for easy slicing)
         self._messages: Dict[str, List[Dict[str, Any]]] = {}
+        # thread_id -> [0, t1, t1+t2, ...] cumulative token counts
+        self._token_prefix: Dict[str, List[int]] = {}
+        # Search indexes: thread titles by creation ordinal, messages per thread
+        self._thread_order: List[str] = []
+        self._title_index = _NgramIndex()
+        self._message_index: Dict[str, _NgramIndex] = {}
+
+        self._token_counter = token_counter or get_token_counter()
+
+        self._store = _SQLiteThreadStore(db_path) if db_path else None
+        if self._store is not None:
+            self._load()
+
+    def _load(self) -> None:
+        # Stored counts are only reused if they came from the same tokenizer
+        recount = self._store.get_meta("token_counter") != self._token_counter.name
+        recounted: List[Tuple[int, str]] = []
+
+        for thread in self._store.load_threads():
+            self._index_thread(thread)
+        for msg, token_count in self._store.load_messages():
+            if msg["thread_id"] not in self._threads:
+                continue
+            if recount:
+                token_count = self._token_counter.count(msg["content"])
+                recounted.append((token_count, msg["id"]))
+            self._index_message(msg, token_count)
+
+        if recount:
+            self._store.update_token_counts(recounted)
+            self._store.set_meta("token_counter", self._token_counter.name)
+        logger.info(
+            "Thread store loaded threads=%d messages=%d",
+            len(self._threads), sum(len(m) for m in self._messages.values()),
+        )
 
     # ─── helpers ──────────────────────────────────────────────────────────────
 
@@ -56,6 +294,29 @@ class ThreadService:
             raise ValueError(f"Thread not found: {thread_id}")
         return thread
 
+    def _thread_view(self, thread: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a thread record with its messages embedded."""
+        result = dict(thread)
+        result["messages"] = list(self._messages.get(thread["id"], []))
+        return result
+
+    def _index_thread(self, thread: Dict[str, Any]) -> None:
+        thread_id = thread["id"]
+        self._threads[thread_id] = thread
+        self._messages[thread_id] = []
+        self._token_prefix[thread_id] = [0]
+        self._message_index[thread_id] = _NgramIndex()
+        self._title_index.add(len(self._thread_order), thread["title"])
+        self._thread_order.append(thread_id)
+
+    def _index_message(self, msg: Dict[str, Any], token_count: int) -> None:
+        thread_id = msg["thread_id"]
+        messages = self._messages[thread_id]
+        self._message_index[thread_id].add(len(messages), msg["content"])
+        messages.append(msg)
+        prefix = self._token_prefix[thread_id]
+        prefix.append(prefix[-1] + token_count)
+
     # ─── create_thread ────────────────────────────────────────────────────────
 
     async def create_thread(
@@ -84,12 +345,12 @@ class ThreadService:
             "status": "active",
             "metadata": dict(metadata),
             "created_at": _now_iso(),
-            "messages": [],
         }
-        self._threads[thread_id] = thread
-        self._messages[thread_id] = []
+        if self._store is not None:
+            self._store.insert_thread(thread)
+        self._index_thread(thread)
         logger.info("Thread created id=%s agent=%s", thread_id, agent_id)
-        return dict(thread)
+        return self._thread_view(thread)
 
     # ─── add_message ──────────────────────────────────────────────────────────
 
@@ -124,8 +385,10 @@ class ThreadService:
             "metadata": dict(metadata),
             "created_at": _now_iso(),
         }
-        self._messages[thread_id].append(msg)
-        self._threads[thread_id]["messages"] = list(self._messages[thread_id])
+        token_count = self._token_counter.count(content)
+        if self._store is not None:
+            self._store.insert_message(msg, token_count)
+        self._index_message(msg, token_count)
         return dict(msg)
 
     # ─── get_thread ───────────────────────────────────────────────────────────
@@ -143,10 +406,7 @@ class ThreadService:
         Raises:
             ValueError: If thread_id does not exist.
         """
-        thread = self._require_thread(thread_id)
-        result = dict(thread)
-        result["messages"] = list(self._messages.get(thread_id, []))
-        return result
+        return self._thread_view(self._require_thread(thread_id))
 
     # ─── list_threads ─────────────────────────────────────────────────────────
 
@@ -175,7 +435,7 @@ class ThreadService:
         active.sort(key=lambda t: t["created_at"])
         total = len(active)
         page = active[offset: offset + limit]
-        return {"threads": [dict(t) for t in page], "total": total}
+        return {"threads": [self._thread_view(t) for t in page], "total": total}
 
     # ─── delete_thread ────────────────────────────────────────────────────────
 
@@ -190,6 +450,8 @@ class ThreadService:
             ValueError: If thread_id does not exist.
         """
         thread = self._require_thread(thread_id)
+        if self._store is not None:
+            self._store.update_status(thread_id, "deleted")
         thread["status"] = "deleted"
         logger.info("Thread soft-deleted id=%s", thread_id)
 
@@ -231,11 +493,12 @@ class ThreadService:
         """
         Return messages from a thread that fit within a token budget.
 
-        Token count is approximated as ``len(content) // 4`` per message,
-        which aligns with the rough 4-chars-per-token heuristic.
+        Token counts come from the service's TokenCounter and are stored
+        as a prefix sum when messages are added.
 
-        Messages are taken from most-recent to oldest and then reversed
-        so the result is in chronological order.
+        The result is the longest run of most-recent messages that fits the
+        budget, in chronological order, found by binary search over the
+        prefix sums.
 
         Args:
             thread_id: Thread to slice.
@@ -249,23 +512,90 @@ class ThreadService:
         """
         self._require_thread(thread_id)
         all_msgs = self._messages.get(thread_id, [])
+        prefix = self._token_prefix[thread_id]
 
-        selected: List[Dict[str, Any]] = []
-        tokens_used = 0
+        start = _fit_start(prefix, max_tokens)
 
-        for msg in reversed(all_msgs):
-            msg_tokens = len(msg["content"]) // 4
-            if tokens_used + msg_tokens > max_tokens:
-                break
-            selected.append(msg)
-            tokens_used += msg_tokens
+        return {
+            "thread_id": thread_id,
+            "messages": [dict(m) for m in all_msgs[start:]],
+            "token_count": prefix[-1] - prefix[start],
+        }
+
+    # ─── build_context_window ─────────────────────────────────────────────────
+
+    async def build_context_window(
+        self,
+        thread_id: str,
+        agent_type: Optional[str] = None,
+        model: Optional[str] = None,
+        system_prompt: str = "",
+        reserve_tokens: int = DEFAULT_RESPONSE_RESERVE_TOKENS,
+    ) -> Dict[str, Any]:
+        """
+        Pack the most recent messages into a Gemini model's context window.
+
+        The model is ``model`` if given, otherwise the one selected for
+        ``agent_type`` by GeminiService.get_model_for_agent. The budget is
+        the model's context limit minus ``reserve_tokens`` for the response,
+        the system prompt, and per-message markup overhead.
 
-        selected.reverse()  # back to chronological order
+        Args:
+            thread_id: Thread to pack.
+            agent_type: Agent type used to select the model.
+            model: Explicit model name (overrides agent_type).
+            system_prompt: System instruction sent with the window.
+            reserve_tokens: Tokens kept free for the model's output.
+
+        Returns:
+            Dict with 'thread_id', 'model', 'max_tokens', 'messages',
+            'token_count' (including overhead) and 'truncated'.
+
+        Raises:
+            ValueError: If thread_id does not exist.
+        """
+        from app.services.gemini_service import (
+            AGENT_MODEL_MAPPING,
+            MODEL_CONTEXT_LIMITS,
+            DEFAULT_CONTEXT_LIMIT,
+            GeminiConfigError,
+            get_gemini_service,
+        )
+
+        self._require_thread(thread_id)
+        try:
+            gemini = get_gemini_service()
+        except GeminiConfigError:
+            gemini = None
+
+        if gemini is not None:
+            if model is None:
+                model = gemini.get_model_for_agent(agent_type or "")
+            max_tokens = gemini.get_context_limit(model)
+        else:
+            # Gemini not configured (no API key): same tables, settings default
+            from app.core.config import settings
+            if model is None:
+                model = AGENT_MODEL_MAPPING.get(agent_type or "", settings.gemini_pro_model)
+            max_tokens = MODEL_CONTEXT_LIMITS.get(model, DEFAULT_CONTEXT_LIMIT)
+        budget = max_tokens - reserve_tokens
+        if system_prompt:
+            budget -= self._token_counter.count(system_prompt) + MESSAGE_OVERHEAD_TOKENS
+
+        all_msgs = self._messages.get(thread_id, [])
+        prefix = self._token_prefix[thread_id]
+        start = _fit_start(prefix, budget, MESSAGE_OVERHEAD_TOKENS)
+        selected = all_msgs[start:]
 
         return {
             "thread_id": thread_id,
+            "model": model,
+            "max_tokens": max_tokens,
             "messages": [dict(m) for m in selected],
-            "token_count": tokens_used,
+            "token_count": (
+                prefix[-1] - prefix[start] + MESSAGE_OVERHEAD_TOKENS * len(selected)
+            ),
+            "truncated": start > 0,
         }
 
     # ─── search_threads (Issue #220) ──────────────────────────────────────────
@@ -279,9 +609,8 @@ class ThreadService:
         """
         Search for threads whose title contains the query string (case-insensitive).
 
-        In production this would delegate to ZeroDB semantic/vector search.
-        The in-memory implementation uses simple substring matching as a
-        functional placeholder that passes the required tests.
+        Candidates come from the title trigram index; queries shorter than
+        three characters fall back to a scan.
 
         Args:
             query: Search query string.
@@ -289,17 +618,21 @@ class ThreadService:
             limit: Maximum number of results.
 
         Returns:
-            List of matching thread dicts.
+            List of matching thread dicts, oldest first.
         """
         q = query.lower()
-        results = [
-            dict(t)
-            for t in self._threads.values()
-            if t["agent_id"] == agent_id
-            and t["status"] == "active"
-            and q in t["title"].lower()
-        ]
-        return results[:limit]
+        ordinals = self._title_index.candidates(q)
+        if ordinals is None:
+            ordinals = range(len(self._thread_order))
+
+        results = []
+        for ordinal in ordinals:
+            if len(results) >= limit:
+                break
+            t = self._threads[self._thread_order[ordinal]]
+            if t["agent_id"] == agent_id and t["status"] == "active" and q in t["title"].lower():
+                results.append(self._thread_view(t))
+        return results
 
     # ─── search_messages (Issue #220) ─────────────────────────────────────────
 
@@ -312,7 +645,8 @@ class ThreadService:
         """
         Search for messages within a thread that contain the query string.
 
-        In production this would use ZeroDB vector/semantic search.
+        Candidates come from the thread's trigram index; queries shorter
+        than three characters fall back to a scan.
 
         Args:
             query: Search query string.
@@ -320,19 +654,26 @@ class ThreadService:
             limit: Maximum number of results.
 
         Returns:
-            List of matching message dicts.
+            List of matching message dicts in chronological order.
 
         Raises:
             ValueError: If thread_id does not exist.
         """
         self._require_thread(thread_id)
         q = query.lower()
-        results = [
-            dict(m)
-            for m in self._messages.get(thread_id, [])
-            if q in m["content"].lower()
-        ]
-        return results[:limit]
+        messages = self._messages.get(thread_id, [])
+        ordinals = self._message_index[thread_id].candidates(q)
+        if ordinals is None:
+            ordinals = range(len(messages))
+
+        results = []
+        for ordinal in ordinals:
+            if len(results) >= limit:
+                break
+            m = messages[ordinal]
+            if q in m["content"].lower():
+                results.append(dict(m))
+        return results
 
 
 # Singleton
@@ -343,5 +684,6 @@ def get_thread_service() -> ThreadService:
     """Return the singleton ThreadService instance."""
     global _thread_service
     if _thread_service is None:
-        _thread_service = ThreadService()
+        from app.core.config import settings
+        _thread_service = ThreadService(db_path=settings.thread_db_path or None)
     return _thread_service
@@ -0,0 +1,104 @@
+"""
+Token counting for context windows.
+
+Provides a pluggable TokenCounter used when messages are written, so each
+message is tokenized once and its count stored alongside it.
+
+Counters:
+- TiktokenTokenCounter: BPE tokenizer (cl100k_base) when ``tiktoken`` is
+  installed; a close proxy for Gemini's SentencePiece vocabulary without a
+  network round-trip per message
+- HeuristicTokenCounter: ~4 characters per token fallback
+
+Usage:
+    counter = get_token_counter()          # best available
+    set_token_counter(MyTokenizerCounter())  # plug in a model tokenizer
+
+Built by AINative Dev Team
+Refs #219
+"""
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+
+class TokenCounter(ABC):
+    """Base token counter. Subclasses set ``name`` and implement count()."""
+
+    name = "base"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Return the number of tokens in ``text``."""
+
+
+class HeuristicTokenCounter(TokenCounter):
+    """Approximates tokens as ``len(text) // 4``."""
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        return len(text) // 4
+
+
+class TiktokenTokenCounter(TokenCounter):
+    """Counts tokens with a tiktoken BPE encoding."""
+
+    def __init__(self, encoding: str = "cl100k_base") -> None:
+        if tiktoken is None:
+            raise RuntimeError("tiktoken is not installed")
+        self._encoding = tiktoken.get_encoding(encoding)
+        self.name = f"tiktoken:{encoding}"
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode(text, disallowed_special=()))
+
+
+class CallableTokenCounter(TokenCounter):
+    """
+    Adapts any tokenizer callable, e.g. a HuggingFace tokenizer's encode.
+
+    Args:
+        name: Stable identifier (stored with counts to detect tokenizer changes)
+        encode: Callable returning the token sequence for a string
+    """
+
+    def __init__(self, name: str, encode: Callable[[str], list]) -> None:
+        self.name = name
+        self._encode = encode
+
+    def count(self, text: str) -> int:
+        return len(self._encode(text))
+
+
+_token_counter: Optional[TokenCounter] = None
+
+
+def get_token_counter() -> TokenCounter:
+    """Return the configured counter, defaulting to the best available one."""
+    global _token_counter
+    if _token_counter is None:
+        if tiktoken is not None:
+            try:
+                _token_counter = TiktokenTokenCounter()
+            except Exception as e:
+                # Encoding files unavailable (e.g. offline first use)
+                logger.warning(f"tiktoken unavailable, using heuristic token counts: {e}")
+        if _token_counter is None:
+            _token_counter = HeuristicTokenCounter()
+    return _token_counter
+
+
+def set_token_counter(counter: Optional[TokenCounter]) -> None:
+    """Install a counter process-wide (None restores auto-detection)."""
+    global _token_counter
+    _token_counter = counter
@@ -4,15 +4,26 @@ Handles x402 service advertising, discovery, invocation, and receipts.
 
 Issue #235: Agent Runtime with x402 Service Advertising.
 
+Discovery is answered from an in-memory capability index (capability ->
+services sorted by price_per_call), so a price-capped lookup is a bisect
+plus a slice. The index is loaded from ZeroDB on first use, updated on
+register_service, and invalidated explicitly or after
+DISCOVERY_INDEX_REFRESH_SECONDS. Registrations and invalidations that
+arrive while the index is loading are applied to it before it is used.
+
 Built by AINative Dev Team
 Refs #235
 """
 from __future__ import annotations
 
+import asyncio
+import math
+import time
 import uuid
 import logging
+from bisect import bisect_left, bisect_right, insort
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from app.core.errors import APIError
 from app.services.zerodb_client import get_zerodb_client
@@ -22,6 +33,18 @@ logger = logging.getLogger(__name__)
 SERVICE_REGISTRY_TABLE = "service_registry"
 SERVICE_RECEIPTS_TABLE = "service_receipts"
 
+# Rows fetched per ZeroDB page when (re)building the discovery index
+DISCOVERY_INDEX_PAGE_SIZE = 1_000
+# Rebuild the index after this long so registrations from other processes show up
+DISCOVERY_INDEX_REFRESH_SECONDS = 300.0
+
+# Index entries are (price_per_call, registration sequence, service_id)
+ServiceKey = Tuple[float, int, str]
+
+
+def _service_price(row: Dict[str, Any]) -> float:
+    return float((row.get("pricing") or {}).get("price_per_call") or 0.0)
+
 
 class ServiceNotFoundError(APIError):
     """Raised when a registered service cannot be found."""
@@ -34,6 +57,81 @@ class ServiceNotFoundError(APIError):
         )
 
 
+class CapabilityIndex:
+    """
+    Capability -> active services, each list sorted by price_per_call.
+
+    Ties keep registration order. Entries are (price, seq, service_id)
+    tuples, so services under a price cap are the prefix ending at
+    bisect_right(entries, (max_price, inf)).
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, Dict[str, Any]] = {}
+        self._keys: Dict[str, ServiceKey] = {}
+        self._by_capability: Dict[str, List[ServiceKey]] = {}
+        self._next_seq = 0
+        self.built_at = time.monotonic()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> "CapabilityIndex":
+        """Bulk-build an index: append every entry, then sort each list once."""
+        index = cls()
+        for row in rows:
+            index._add(row, sort=False)
+        for entries in index._by_capability.values():
+            entries.sort()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def is_stale(self, max_age: Optional[float]) -> bool:
+        return max_age is not None and time.monotonic() - self.built_at > max_age
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """Index a registry row, replacing any previous entry for its service."""
+        service_id = row.get("service_id")
+        if not service_id:
+            return
+        self.remove(service_id)
+        if row.get("active", True):
+            self._add(row, sort=True)
+
+    def remove(self, service_id: str) -> None:
+        row = self._rows.pop(service_id, None)
+        if row is None:
+            return
+        key = self._keys.pop(service_id)
+        for capability in dict.fromkeys(row.get("capabilities") or []):
+            entries = self._by_capability[capability]
+            del entries[bisect_left(entries, key)]
+            if not entries:
+                del self._by_capability[capability]
+
+    def _add(self, row: Dict[str, Any], sort: bool) -> None:
+        service_id = row.get("service_id")
+        if not service_id:
+            return
+        key = (_service_price(row), self._next_seq, service_id)
+        self._next_seq += 1
+        for capability in dict.fromkeys(row.get("capabilities") or []):
+            entries = self._by_capability.setdefault(capability, [])
+            if sort:
+                insort(entries, key)
+            else:
+                entries.append(key)
+        self._rows[service_id] = dict(row)
+        self._keys[service_id] = key
+
+    def lookup(self, capability: str, max_price: Optional[float]) -> List[Dict[str, Any]]:
+        """Rows offering ``capability`` at or under ``max_price``, cheapest first."""
+        entries = self._by_capability.get(capability, [])
+        if max_price is not None:
+            entries = entries[:bisect_right(entries, (max_price, math.inf))]
+        return [self._rows[key[2]] for key in entries]
+
+
 class TrustlessRuntimeService:
     """
     Manages the trustless agent service registry and x402-signed invocations.
@@ -43,10 +141,26 @@ class TrustlessRuntimeService:
     - Capability-based discovery with price filtering
     - x402-signed service execution with receipt generation
     - Full registry enumeration
+
+    Args:
+        client: Optional ZeroDB client (defaults to the shared client)
+        index_refresh_seconds: Max discovery index age before a rebuild (None: never)
     """
 
-    def __init__(self, client: Optional[Any] = None) -> None:
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        index_refresh_seconds: Optional[float] = DISCOVERY_INDEX_REFRESH_SECONDS,
+    ) -> None:
         self._client = client
+        self._index: Optional[CapabilityIndex] = None
+        self._index_lock = asyncio.Lock()
+        self._index_refresh_seconds = index_refresh_seconds
+        # Services changed elsewhere, re-read before the next discovery
+        self._stale_services: Set[str] = set()
+        # Rows registered while an index build is running (None: no build)
+        self._index_writes: Optional[List[Dict[str, Any]]] = None
+        self._index_generation = 0
 
     @property
     def client(self) -> Any:
@@ -91,6 +205,11 @@ class TrustlessRuntimeService:
         }
 
         await self.client.insert_row(SERVICE_REGISTRY_TABLE, row)
+        # Before the first discovery there is no index; the load picks this up
+        if self._index is not None:
+            self._index.add(row)
+        if self._index_writes is not None:
+            self._index_writes.append(row)
         logger.info(f"Registered service: {service_id} for agent {agent_did}")
         return self._entry_from_row(row)
 
@@ -107,27 +226,10 @@ class TrustlessRuntimeService:
             max_price: Optional maximum price_per_call (inclusive)
 
         Returns:
-            List of matching registry entry dicts
+            List of matching registry entry dicts, cheapest first
         """
-        result = await self.client.query_rows(
-            SERVICE_REGISTRY_TABLE,
-            filter={"active": True},
-            limit=10_000,
-        )
-        rows = result.get("rows", [])
-
-        def _matches(row: Dict[str, Any]) -> bool:
-            caps = row.get("capabilities") or []
-            if capability not in caps:
-                return False
-            if max_price is not None:
-                price = (row.get("pricing") or {}).get("price_per_call", 0.0)
-                if price > max_price:
-                    return False
-            return True
-
-        matched = [r for r in rows if _matches(r)]
-        return [self._entry_from_row(r) for r in matched]
+        index = await self._get_index()
+        return [self._entry_from_row(r) for r in index.lookup(capability, max_price)]
 
     async def execute_service_call(
         self,
@@ -201,6 +303,83 @@ class TrustlessRuntimeService:
         rows = result.get("rows", [])
         return [self._entry_from_row(r) for r in rows]
 
+    # ------------------------------------------------------------------
+    # Discovery index
+    # ------------------------------------------------------------------
+
+    async def _get_index(self) -> CapabilityIndex:
+        """Return the capability index, (re)building it when missing or stale."""
+        index = self._index
+        if (
+            index is not None
+            and not self._stale_services
+            and not index.is_stale(self._index_refresh_seconds)
+        ):
+            return index
+        async with self._index_lock:
+            index = self._index
+            if index is None or index.is_stale(self._index_refresh_seconds):
+                # Invalidations from here on stay queued for the new index
+                self._stale_services.clear()
+                generation = self._index_generation
+                writes = self._index_writes = []
+                try:
+                    rows = await self._load_active_services()
+                finally:
+                    self._index_writes = None
+                index = CapabilityIndex.from_rows(rows)
+                for row in writes:
+                    index.add(row)
+                if self._index_generation == generation:
+                    self._index = index
+                logger.info(f"Built service discovery index: {len(index)} services")
+            while self._stale_services:
+                service_id = self._stale_services.pop()
+                result = await self.client.query_rows(
+                    SERVICE_REGISTRY_TABLE,
+                    filter={"service_id": service_id, "active": True},
+                    limit=1,
+                )
+                rows = result.get("rows", [])
+                if rows:
+                    index.add(rows[0])
+                else:
+                    index.remove(service_id)
+        return index
+
+    async def _load_active_services(self) -> List[Dict[str, Any]]:
+        """Page through every active registry row."""
+        rows: List[Dict[str, Any]] = []
+        skip = 0
+        while True:
+            result = await self.client.query_rows(
+                SERVICE_REGISTRY_TABLE,
+                filter={"active": True},
+                limit=DISCOVERY_INDEX_PAGE_SIZE,
+                skip=skip,
+            )
+            page = result.get("rows", [])
+            rows.extend(page)
+            if len(page) < DISCOVERY_INDEX_PAGE_SIZE:
+                return rows
+            skip += len(page)
+
+    def invalidate_service(self, service_id: Optional[str] = None) -> None:
+        """
+        React to a registry change made outside this service.
+
+        Args:
+            service_id: Re-read just this service before the next discovery
+                (dropping it if no longer active); None drops the whole
+                index so the next discovery reloads it from ZeroDB
+        """
+        if service_id is None:
+            self._index_generation += 1
+            self._index = None
+            self._stale_services.clear()
+        elif self._index is not None or self._index_writes is not None:
+            self._stale_services.add(service_id)
+
     def _entry_from_row(self, row: Dict[str, Any]) -> Dict[str, Any]:
         """Convert a raw ZeroDB row to a clean registry entry dict."""
         return {
@@ -70,6 +70,12 @@ class _InMemoryStore:
         rows.append(row)
         return {"success": True, "row_id": row_id, "row_data": row}
 
+    def insert_rows(
+        self, table: str, rows_data: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        row_ids = [self.insert_row(table, data)["row_id"] for data in rows_data]
+        return {"success": True, "row_ids": row_ids, "inserted_count": len(row_ids)}
+
     def query_rows(
         self,
         table: str,
@@ -422,6 +428,39 @@ class ZeroDBClient:
             response.raise_for_status()
             return response.json()
 
+    async def insert_rows(
+        self,
+        table_name: str,
+        rows_data: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Insert several rows into a table in a single request.
+
+        POST /v1/public/zerodb/{project_id}/database/tables/{table_name}/rows
+        with ``row_data`` as an array (batch insert).
+
+        Args:
+            table_name: Target table name
+            rows_data: List of row dicts
+
+        Returns:
+            Batch insert result with the created row IDs
+        """
+        payload = {"row_data": rows_data, "return_ids": True}
+
+        if self._mock_mode:
+            return self._store.insert_rows(table_name, rows_data)
+
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{self._db_base}/tables/{table_name}/rows",
+                headers=self.headers,
+                json=payload,
+                timeout=30.0
+            )
+            response.raise_for_status()
+            return response.json()
+
     async def list_rows(
         self,
         table_name: str,
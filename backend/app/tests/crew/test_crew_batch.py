@@ -0,0 +1,275 @@
+"""
+Tests for CrewBatchRunner batch workflow execution.
+
+Test Coverage:
+- Concurrency never exceeds the configured bound
+- Results stream while later inputs are still running
+- Failed and invalid inputs are reported per run, not raised
+- Audit events are written through the shared pipeline and flushed
+- Crew memories and compliance events are buffered and written in bulk
+- JSONL input is read lazily and invalid lines become failed runs
+"""
+import asyncio
+import io
+
+import pytest
+from itertools import count
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.crew_batch import CrewBatchRunner, CrewWriteBuffer, iter_jsonl
+
+
+def _memory_service():
+    service = AsyncMock()
+    service.store_memory = AsyncMock(return_value={"memory_id": "mem_audit"})
+    service.search_memories = AsyncMock(return_value=[])
+    return service
+
+
+class TestCrewBatchRunner:
+    """Test bounded concurrent batch execution."""
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency_and_reports_every_input(self):
+        """At most `concurrency` crews run at once; every input gets a result."""
+        in_flight = 0
+        peak = 0
+
+        async def kickoff(input_data):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"status": "completed", "request_id": f"x402_{input_data['query']}"}
+
+        runner = CrewBatchRunner(
+            project_id="proj_batch",
+            agent_did="did:agent:batch",
+            concurrency=3,
+            memory_service=_memory_service()
+        )
+        with patch("app.services.crew_orchestrator.X402Crew") as mock_crew:
+            mock_crew.return_value.kickoff = AsyncMock(side_effect=kickoff)
+            runs = [run async for run in runner.run({"query": str(i)} for i in range(10))]
+
+        assert peak == 3
+        assert sorted(run.index for run in runs) == list(range(10))
+        assert {run.request_id for run in runs} == {f"x402_{i}" for i in range(10)}
+        assert runner.summary.completed == 10
+        assert runner.summary.throughput > 0
+
+    @pytest.mark.asyncio
+    async def test_streams_results_before_the_batch_finishes(self):
+        """A fast run is yielded while a slow one is still in flight."""
+        release = asyncio.Event()
+
+        async def kickoff(input_data):
+            if input_data["query"] == "slow":
+                await release.wait()
+            return {"status": "completed", "request_id": input_data["query"]}
+
+        runner = CrewBatchRunner(
+            project_id="proj_batch",
+            agent_did="did:agent:batch",
+            concurrency=2,
+            memory_service=_memory_service()
+        )
+        with patch("app.services.crew_orchestrator.X402Crew") as mock_crew:
+            mock_crew.return_value.kickoff = AsyncMock(side_effect=kickoff)
+            stream = runner.run([{"query": "slow"}, {"query": "fast"}])
+
+            first = await stream.__anext__()
+            assert first.request_id == "fast"
+            release.set()
+            rest = [run async for run in stream]
+
+        assert [run.request_id for run in rest] == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_closes_promptly_when_the_consumer_stops_early(self):
+        """Closing the stream mid-batch does not wait on the full input queue."""
+        runner = CrewBatchRunner(
+            project_id="proj_batch",
+            agent_did="did:agent:batch",
+            concurrency=1,
+            memory_service=_memory_service()
+        )
+        with patch("app.services.crew_orchestrator.X402Crew") as mock_crew:
+            mock_crew.return_value.kickoff = AsyncMock(
+                return_value={"status": "completed", "request_id": "x402_1"}
+            )
+            stream = runner.run({"query": str(i)} for i in range(10))
+            await stream.__anext__()
+            await asyncio.wait_for(stream.aclose(), timeout=2)
+
+    @pytest.mark.asyncio
+    async def test_reports_failures_per_run(self):
+        """Crew errors and non-object inputs become failed results."""
+        async def kickoff(input_data):
+            if input_data["query"] == "bad":
+                raise RuntimeError("Compliance check failed - transaction aborted")
+            return {"status": "completed", "request_id": "x402_ok"}
+
+        runner = CrewBatchRunner(
+            project_id="proj_batch",
+            agent_did="did:agent:batch",
+            memory_service=_memory_service()
+        )
+        with patch("app.services.crew_orchestrator.X402Crew") as mock_crew:
+            mock_crew.return_value.kickoff = AsyncMock(side_effect=kickoff)
+            runs = [run async for run in runner.run([{"query": "ok"}, {"query": "bad"}, None])]
+
+        by_index = {run.index: run for run in runs}
+        assert by_index[0].status == "completed"
+        assert "Compliance check failed" in by_index[1].error
+        assert by_index[2].status == "failed"
+        assert runner.summary.to_dict()["failed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_audit_events_through_the_shared_pipeline(self):
+        """Start/completed audits are queued, then flushed when the batch ends."""
+        memory_service = _memory_service()
+        runner = CrewBatchRunner(
+            project_id="proj_batch",
+            agent_did="did:agent:batch",
+            memory_service=memory_service
+        )
+        with patch("app.services.crew_orchestrator.X402Crew") as mock_crew:
+            mock_crew.return_value.kickoff = AsyncMock(
+                return_value={"status": "completed", "request_id": "x402_1"}
+            )
+            runs = [run async for run in runner.run([{"query": "a"}, {"query": "b"}])]
+
+        actions = sorted(
+            call.kwargs["metadata"]["action"]
+            for call in memory_service.store_memory.await_args_list
+        )
+        assert len(runs) == 2
+        assert actions == ["workflow_completed"] * 2 + ["workflow_started"] * 2
+        assert runner.audit_pipeline.written == 4
+        assert runner.audit_pipeline.pending == 0
+
+
+class TestCrewWriteBuffer:
+    """Test buffered crew memory and compliance writes."""
+
+    @pytest.mark.asyncio
+    async def test_batches_crew_writes_and_keeps_links(self):
+        """Crew writes land in one insert per table with their links intact."""
+        ids = count()
+        memory_service = _memory_service()
+        memory_service.generate_memory_id = MagicMock(side_effect=lambda: f"mem_{next(ids)}")
+        memory_service.store_memories = AsyncMock()
+        compliance = MagicMock()
+        compliance.generate_event_id = MagicMock(side_effect=lambda: f"evt_{next(ids)}")
+        compliance.create_events = AsyncMock()
+        write_buffer = CrewWriteBuffer(memory_service, compliance_service=compliance)
+
+        runner = CrewBatchRunner(
+            project_id="proj_batch",
+            agent_did="did:agent:batch",
+            concurrency=2,
+            memory_service=memory_service,
+            write_buffer=write_buffer
+        )
+        with patch("app.crew.crew.x402_service") as mock_x402:
+            mock_x402.create_request = AsyncMock(return_value={"request_id": "x402_batch"})
+            runs = [run async for run in runner.run({"query": str(i)} for i in range(3))]
+
+        assert [run.status for run in runs] == ["completed"] * 3
+        memory_service.store_memories.assert_awaited_once()
+        compliance.create_events.assert_awaited_once()
+        memories = memory_service.store_memories.await_args.args[0]
+        project_id, events = compliance.create_events.await_args.args
+        event_ids = compliance.create_events.await_args.kwargs["event_ids"]
+        assert len(memories) == 9
+        assert project_id == "proj_batch"
+        assert len(events) == 3
+
+        compliance_memory = {
+            m["run_id"]: m["memory_id"] for m in memories if m["memory_type"] == "compliance_output"
+        }
+        for event in events:
+            assert event.details["memory_id"] == compliance_memory[event.run_id]
+            assert "event_id" not in event.details
+        for call in mock_x402.create_request.await_args_list:
+            run_id = call.kwargs["run_id"]
+            assert call.kwargs["linked_memory_ids"][1] == compliance_memory[run_id]
+            assert call.kwargs["linked_compliance_ids"][0] in event_ids
+        assert write_buffer.written == 12
+        assert write_buffer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_the_buffer_fills(self):
+        """Reaching flush_size writes the buffered rows without waiting for the batch end."""
+        memory_service = _memory_service()
+        memory_service.generate_memory_id = MagicMock(return_value="mem_x")
+        memory_service.store_memories = AsyncMock()
+        write_buffer = CrewWriteBuffer(memory_service, compliance_service=MagicMock(), flush_size=2)
+
+        first = await write_buffer.store_memory(project_id="p", run_id="r", content="a")
+        assert memory_service.store_memories.await_count == 0
+        await write_buffer.store_memory(project_id="p", run_id="r", content="b")
+
+        assert first["memory_id"] == "mem_x"
+        assert memory_service.store_memories.await_count == 1
+        assert write_buffer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_a_failed_write_on_the_next_flush(self):
+        """A failed insert is kept and written by the following flush."""
+        ids = count()
+        memory_service = _memory_service()
+        memory_service.generate_memory_id = MagicMock(side_effect=lambda: f"mem_{next(ids)}")
+        memory_service.store_memories = AsyncMock(side_effect=[ConnectionError("down"), None])
+        write_buffer = CrewWriteBuffer(memory_service, compliance_service=MagicMock())
+
+        await write_buffer.store_memory(project_id="p", run_id="r", content="a")
+        await write_buffer.flush()
+        assert write_buffer.pending == 1
+        await write_buffer.flush()
+
+        assert memory_service.store_memories.await_args.args[0][0]["memory_id"] == "mem_0"
+        assert (write_buffer.written, write_buffer.failed, write_buffer.pending) == (1, 0, 0)
+
+    @pytest.mark.asyncio
+    async def test_reports_writes_that_could_not_be_persisted(self):
+        """Writes still failing after their attempts are counted in the batch summary."""
+        ids = count()
+        memory_service = _memory_service()
+        memory_service.generate_memory_id = MagicMock(side_effect=lambda: f"mem_{next(ids)}")
+        memory_service.store_memories = AsyncMock(side_effect=ConnectionError("down"))
+        compliance = MagicMock()
+        compliance.generate_event_id = MagicMock(side_effect=lambda: f"evt_{next(ids)}")
+        compliance.create_events = AsyncMock()
+        write_buffer = CrewWriteBuffer(
+            memory_service, compliance_service=compliance, max_attempts=2, retry_delay=0
+        )
+
+        runner = CrewBatchRunner(
+            project_id="proj_batch",
+            agent_did="did:agent:batch",
+            memory_service=memory_service,
+            write_buffer=write_buffer
+        )
+        with patch("app.crew.crew.x402_service") as mock_x402:
+            mock_x402.create_request = AsyncMock(return_value={"request_id": "x402_batch"})
+            runs = [run async for run in runner.run([{"query": "a"}])]
+
+        assert [run.status for run in runs] == ["completed"]
+        assert memory_service.store_memories.await_count == 2
+        assert runner.summary.to_dict()["unpersisted_writes"] == 3
+        assert write_buffer.pending == 0
+
+
+class TestIterJsonl:
+    """Test JSONL input parsing."""
+
+    @pytest.mark.asyncio
+    async def test_skips_blank_lines_and_flags_invalid_json(self):
+        stream = io.StringIO('{"query": "a"}\n\nnot json\n{"query": "b"}\n')
+
+        items = [item async for item in iter_jsonl(stream)]
+
+        assert items == [{"query": "a"}, None, {"query": "b"}]
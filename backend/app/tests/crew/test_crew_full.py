@@ -614,6 +614,31 @@ class TestAgentCollaboration:
             assert "compliance_output" in agent_types
             assert "transaction_output" in agent_types
 
+    @pytest.mark.asyncio
+    async def test_links_compliance_event_to_compliance_memory(self):
+        """Test that the compliance event details carry the compliance memory_id."""
+        from app.crew.crew import X402Crew
+
+        with patch('app.crew.crew.get_agent_memory_service') as mock_memory, \
+             patch('app.crew.crew.x402_service') as mock_x402, \
+             patch('app.crew.crew.compliance_service') as mock_compliance:
+
+            async def store(project_id, agent_id, run_id, memory_type, content, **kwargs):
+                return {"memory_id": f"mem_{memory_type}"}
+
+            mock_memory_service = AsyncMock()
+            mock_memory_service.store_memory = AsyncMock(side_effect=store)
+            mock_memory.return_value = mock_memory_service
+
+            mock_x402.create_request = AsyncMock(return_value={"request_id": "x402_req_link"})
+            mock_compliance.create_event = AsyncMock(return_value={"event_id": "evt_link"})
+
+            crew = X402Crew(project_id="test_project", run_id="run_link")
+            await crew.kickoff(input_data={"query": "Link test"})
+
+            event_data = mock_compliance.create_event.call_args.kwargs["event_data"]
+            assert event_data.details["memory_id"] == "mem_compliance_output"
+
     @pytest.mark.asyncio
     async def test_maintains_run_id_across_agents(self):
         """Test that run_id is consistent across all agent actions."""
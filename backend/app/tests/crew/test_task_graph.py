@@ -0,0 +1,237 @@
+"""
+Tests for TaskGraph stage execution and its use by CrewOrchestrator.
+
+Test Coverage:
+- Independent stages run concurrently, dependents wait for their inputs
+- Per-stage timeout and retry
+- Optional stage failures do not fail the graph
+- Required stage failures cancel in-flight stages and re-raise
+- Per-stage timings are recorded
+- Unknown dependencies and cycles are rejected
+- Orchestrator overlaps the start audit with context loading and reuses
+  one crew across retries
+"""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.crew.task_graph import TaskGraph, TaskGraphError
+
+
+class TestTaskGraphExecution:
+    """Test scheduling, timeouts, retries and timings."""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self):
+        """Total time tracks the critical path, not the sum of stages."""
+        async def sleep_then(value, deps):
+            await asyncio.sleep(0.05)
+            return value
+
+        graph = TaskGraph()
+        graph.add_stage("a", lambda deps: sleep_then("a", deps))
+        graph.add_stage("b", lambda deps: sleep_then("b", deps))
+        graph.add_stage("c", lambda deps: sleep_then("c", deps))
+
+        results = await graph.run()
+
+        assert results == {"a": "a", "b": "b", "c": "c"}
+        assert graph.total_ms < 140
+
+    @pytest.mark.asyncio
+    async def test_dependents_receive_dependency_results(self):
+        """A stage starts after its dependencies and gets their results."""
+        order = []
+
+        async def stage(name, deps):
+            order.append(name)
+            return {"name": name, "deps": sorted(deps)}
+
+        graph = TaskGraph()
+        graph.add_stage("join", lambda d: stage("join", d), depends_on=("left", "right"))
+        graph.add_stage("left", lambda d: stage("left", d))
+        graph.add_stage("right", lambda d: stage("right", d))
+
+        results = await graph.run()
+
+        assert order[-1] == "join"
+        assert results["join"]["deps"] == ["left", "right"]
+
+    @pytest.mark.asyncio
+    async def test_retries_a_failing_stage(self):
+        """A stage is retried up to `retries` extra times."""
+        func = AsyncMock(side_effect=[RuntimeError("transient"), "ok"])
+        graph = TaskGraph().add_stage("flaky", func, retries=1)
+
+        results = await graph.run()
+
+        assert results["flaky"] == "ok"
+        assert graph.timings["flaky"]["attempts"] == 2
+        assert graph.timings["flaky"]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_times_out_a_slow_stage(self):
+        """Each attempt is bounded by the stage timeout."""
+        async def slow(deps):
+            await asyncio.sleep(1)
+
+        graph = TaskGraph().add_stage("slow", slow, timeout=0.01)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await graph.run()
+        assert graph.timings["slow"]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_optional_stage_failure_yields_none(self):
+        """Dependents of a failed optional stage still run."""
+        graph = TaskGraph()
+        graph.add_stage("audit", AsyncMock(side_effect=RuntimeError("down")), required=False)
+        graph.add_stage("work", AsyncMock(return_value="done"), depends_on=("audit",))
+
+        results = await graph.run()
+
+        assert results == {"audit": None, "work": "done"}
+        assert graph.timings["audit"]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_required_failure_cancels_in_flight_stages(self):
+        """The first required failure is re-raised and siblings are cancelled."""
+        async def slow(deps):
+            await asyncio.sleep(1)
+
+        graph = TaskGraph()
+        graph.add_stage("slow", slow)
+        graph.add_stage("broken", AsyncMock(side_effect=ValueError("bad input")))
+
+        with pytest.raises(ValueError, match="bad input"):
+            await graph.run()
+        assert graph.timings["slow"]["status"] == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_required_failure_lets_started_optional_stages_finish(self):
+        """An optional stage already running completes; unstarted ones are cancelled."""
+        async def slow_audit(deps):
+            await asyncio.sleep(0.02)
+            return "audited"
+
+        graph = TaskGraph()
+        graph.add_stage("audit", slow_audit, required=False)
+        graph.add_stage("broken", AsyncMock(side_effect=ValueError("bad input")))
+        graph.add_stage(
+            "after", AsyncMock(return_value="never"), depends_on=("broken",), required=False
+        )
+
+        with pytest.raises(ValueError, match="bad input"):
+            await graph.run()
+        assert graph.timings["audit"]["status"] == "completed"
+        assert "after" not in graph.timings
+
+    def test_rejects_unknown_dependencies_and_cycles(self):
+        """Malformed graphs fail before anything runs."""
+        unknown = TaskGraph().add_stage("a", AsyncMock(), depends_on=("missing",))
+        with pytest.raises(TaskGraphError, match="unknown stage"):
+            unknown.execution_order()
+
+        cyclic = TaskGraph()
+        cyclic.add_stage("a", AsyncMock(), depends_on=("b",))
+        cyclic.add_stage("b", AsyncMock(), depends_on=("a",))
+        with pytest.raises(TaskGraphError, match="Cycle"):
+            cyclic.execution_order()
+
+
+class TestOrchestratorStageGraph:
+    """Test CrewOrchestrator.execute on top of TaskGraph."""
+
+    @pytest.mark.asyncio
+    async def test_start_audit_overlaps_context_loading(self):
+        """workflow_started and memory context loading run concurrently."""
+        from app.services.crew_orchestrator import CrewOrchestrator
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_call(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return {"memory_id": "mem_1"} if "memory_type" in kwargs else []
+
+        with patch("app.services.crew_orchestrator.get_agent_memory_service") as mock_memory:
+            service = AsyncMock()
+            service.store_memory = AsyncMock(side_effect=slow_call)
+            service.search_memories = AsyncMock(side_effect=slow_call)
+            mock_memory.return_value = service
+
+            orchestrator = CrewOrchestrator(project_id="proj_dag", agent_did="did:agent:dag")
+            with patch.object(orchestrator, "_create_crew") as mock_create:
+                mock_create.return_value.kickoff = AsyncMock(
+                    return_value={"status": "completed", "request_id": "x402_req_1"}
+                )
+                result = await orchestrator.execute({"query": "Analyze BTC"})
+
+        assert peak == 2
+        assert result["request_id"] == "x402_req_1"
+        assert set(result["workflow_timings"]) == {
+            "audit_started", "memory_context", "crew", "audit_completed"
+        }
+
+    @pytest.mark.asyncio
+    async def test_keeps_start_audit_when_crew_fails_while_it_is_pending(self):
+        """A crew failure waits for workflow_started before recording workflow_failed."""
+        from app.services.crew_orchestrator import CrewOrchestrator
+
+        stored = []
+
+        async def slow_store(**kwargs):
+            if kwargs["metadata"]["action"] == "workflow_started":
+                await asyncio.sleep(0.02)
+            stored.append(kwargs["metadata"]["action"])
+            return {"memory_id": "mem_1"}
+
+        with patch("app.services.crew_orchestrator.get_agent_memory_service") as mock_memory:
+            service = AsyncMock()
+            service.store_memory = AsyncMock(side_effect=slow_store)
+            service.search_memories = AsyncMock(return_value=[])
+            mock_memory.return_value = service
+
+            orchestrator = CrewOrchestrator(project_id="proj_dag", agent_did="did:agent:dag")
+            with patch.object(orchestrator, "_create_crew") as mock_create:
+                mock_create.return_value.kickoff = AsyncMock(side_effect=RuntimeError("boom"))
+                with pytest.raises(RuntimeError, match="boom"):
+                    await orchestrator.execute({"query": "Analyze SOL"}, retry_on_failure=False)
+
+        assert stored == ["workflow_started", "workflow_failed"]
+
+    @pytest.mark.asyncio
+    async def test_reuses_one_crew_across_retries(self):
+        """Retries call kickoff again on the same crew instance."""
+        from app.services.crew_orchestrator import CrewOrchestrator
+
+        with patch("app.services.crew_orchestrator.get_agent_memory_service") as mock_memory:
+            service = AsyncMock()
+            service.store_memory = AsyncMock(return_value={"memory_id": "mem_1"})
+            service.search_memories = AsyncMock(return_value=[])
+            mock_memory.return_value = service
+
+            orchestrator = CrewOrchestrator(
+                project_id="proj_dag",
+                agent_did="did:agent:dag",
+                retry_delay=0
+            )
+            with patch.object(orchestrator, "_create_crew") as mock_create:
+                kickoff = AsyncMock(side_effect=[
+                    RuntimeError("transient"),
+                    {"status": "completed", "request_id": "x402_req_2"}
+                ])
+                mock_create.return_value.kickoff = kickoff
+                result = await orchestrator.execute({"query": "Analyze ETH"})
+
+        assert result["status"] == "completed"
+        assert mock_create.call_count == 1
+        assert kickoff.await_count == 2
+        completed = service.store_memory.await_args_list[-1].kwargs["metadata"]
+        assert completed["action"] == "workflow_completed"
+        assert completed["attempts"] == 2
@@ -0,0 +1,17 @@
+"""
+Blocking tool handler fixture for PluginSandboxService process-isolation tests.
+
+Built by AINative Dev Team
+Refs #243
+"""
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, Dict
+
+
+def handle(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Blocking handler: sleeps without yielding, then reports its process id."""
+    time.sleep(input_data.get("seconds", 0))
+    return {"pid": os.getpid()}
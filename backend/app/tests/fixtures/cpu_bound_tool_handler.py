@@ -0,0 +1,16 @@
+"""
+CPU-bound tool handler fixture for PluginSandboxService CPU-limit tests.
+
+Built by AINative Dev Team
+Refs #243
+"""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+async def handle(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """CPU-bound handler: spins forever without awaiting."""
+    n = 0
+    while True:
+        n += 1
@@ -131,6 +131,34 @@ class MockZeroDBClient:
             "row_data": row
         }
 
+    async def insert_rows(
+        self,
+        table_name: str,
+        rows_data: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Insert several rows into a table in a single call.
+
+        Args:
+            table_name: Target table name
+            rows_data: List of row dicts
+
+        Returns:
+            Batch insert result with the created row IDs
+        """
+        self._track_call("insert_rows", table_name=table_name, rows_data=rows_data)
+
+        if table_name not in self.data:
+            self.data[table_name] = []
+
+        row_ids = []
+        for row_data in rows_data:
+            row_id = self._get_next_row_id(table_name)
+            self.data[table_name].append({"id": row_id, "row_id": row_id, **row_data})
+            row_ids.append(row_id)
+
+        return {"success": True, "row_ids": row_ids, "inserted_count": len(row_ids)}
+
     async def query_rows(
         self,
         table_name: str,
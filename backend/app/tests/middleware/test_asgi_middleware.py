@@ -0,0 +1,230 @@
+"""
+Unit tests for the pure ASGI middleware base and shared request context.
+
+Behavior:
+- A layer that reads the request body does not starve the route handler:
+  the buffered body is replayed downstream.
+- Every layer in the chain sees the same RequestContext, so an x402 body
+  is read and JSON-decoded once per request.
+- Short-circuit responses from ``before_request`` stop the chain.
+- Streaming responses pass through without being buffered.
+- Non-HTTP scopes bypass the hooks.
+- Bodies over the size cap are rejected with 413 before they are parsed.
+- Handlers using ``read_json`` reuse the JSON decoded by a middleware layer.
+"""
+from __future__ import annotations
+
+from typing import Optional
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.responses import Response
+
+from app.core.errors import PayloadTooLargeError
+from app.middleware.asgi import ASGIMiddleware, get_request_context, read_json
+
+
+class _RecordingMiddleware(ASGIMiddleware):
+    """Reads the JSON body (as the rate limiter does) and records the context."""
+
+    seen = []
+
+    async def before_request(self, request: Request) -> Optional[Response]:
+        if request.method == "POST":
+            request.scope["recorded_json"] = await request.json()
+        self.seen.append(request.context)
+        return None
+
+
+class _BlockingMiddleware(ASGIMiddleware):
+    async def before_request(self, request: Request) -> Optional[Response]:
+        if request.url.path == "/blocked":
+            return JSONResponse(status_code=403, content={"error_code": "BLOCKED"})
+        return None
+
+
+@pytest.fixture
+def echo_app():
+    app = FastAPI()
+
+    @app.post("/x402")
+    async def x402(body: dict):
+        return {"body": body}
+
+    @app.post("/shared")
+    async def shared(request: Request):
+        body = await read_json(request)
+        return {"same_object": body is request.scope["recorded_json"]}
+
+    @app.get("/blocked")
+    async def blocked():
+        return {"reached": True}
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"chunk-{i}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    _RecordingMiddleware.seen = []
+    app.add_middleware(_RecordingMiddleware)
+    app.add_middleware(_RecordingMiddleware)
+    app.add_middleware(_BlockingMiddleware)
+    return app
+
+
+class DescribeASGIMiddlewareChain:
+    """Describe request flow through a chain of ASGIMiddleware layers."""
+
+    def it_replays_a_consumed_body_to_the_route_handler(self, echo_app):
+        client = TestClient(echo_app)
+
+        response = client.post("/x402", json={"did": "did:key:abc", "nonce": "n1"})
+
+        assert response.status_code == 200
+        assert response.json() == {"body": {"did": "did:key:abc", "nonce": "n1"}}
+
+    def it_shares_one_context_across_layers(self, echo_app):
+        client = TestClient(echo_app)
+
+        client.post("/x402", json={"did": "did:key:abc"})
+
+        first, second = _RecordingMiddleware.seen
+        assert first is second
+        assert first.is_x402_post is True
+
+    def it_lets_handlers_reuse_the_decoded_body(self, echo_app):
+        client = TestClient(echo_app)
+
+        response = client.post("/shared", json={"did": "did:key:abc"})
+
+        assert response.json() == {"same_object": True}
+
+    def it_rejects_oversized_bodies_with_413(self, echo_app, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "max_request_body_bytes", 64)
+        client = TestClient(echo_app)
+
+        response = client.post("/x402", json={"payload": "x" * 200})
+
+        assert response.status_code == 413
+        assert response.json()["error_code"] == "PAYLOAD_TOO_LARGE"
+
+    def it_short_circuits_when_a_layer_returns_a_response(self, echo_app):
+        client = TestClient(echo_app)
+
+        response = client.get("/blocked")
+
+        assert response.status_code == 403
+        assert response.json() == {"error_code": "BLOCKED"}
+        assert _RecordingMiddleware.seen == []
+
+    def it_passes_streaming_responses_through(self, echo_app):
+        client = TestClient(echo_app)
+
+        response = client.get("/stream")
+
+        assert response.status_code == 200
+        assert response.text == "chunk-0\nchunk-1\nchunk-2\n"
+
+
+class DescribeRequestContext:
+    """Describe body buffering and context lookup."""
+
+    @pytest.mark.asyncio
+    async def it_reads_and_decodes_the_body_once(self):
+        receive = AsyncMock(
+            side_effect=[
+                {"type": "http.request", "body": b'{"did": ', "more_body": True},
+                {"type": "http.request", "body": b'"did:key:abc"}', "more_body": False},
+            ]
+        )
+        scope = {"type": "http", "method": "POST", "path": "/x402", "headers": []}
+        context = get_request_context(scope, receive)
+
+        assert await context.json() == {"did": "did:key:abc"}
+        assert await context.json() is await context.json()
+        assert receive.await_count == 2
+
+    @pytest.mark.asyncio
+    async def it_keeps_integers_beyond_64_bits_exact(self):
+        body = b'{"amount": 20000000000000000000, "small": 5}'
+        receive = AsyncMock(
+            return_value={"type": "http.request", "body": body, "more_body": False}
+        )
+        scope = {"type": "http", "method": "POST", "path": "/x402", "headers": []}
+
+        data = await get_request_context(scope, receive).json()
+
+        assert data == {"amount": 20000000000000000000, "small": 5}
+        assert isinstance(data["amount"], int)
+
+    @pytest.mark.asyncio
+    async def it_rejects_a_declared_length_over_the_cap_without_reading(self):
+        receive = AsyncMock()
+        scope = {
+            "type": "http", "method": "POST", "path": "/x402",
+            "headers": [(b"content-length", b"5000")],
+        }
+        context = get_request_context(scope, receive)
+        context.max_body_bytes = 1024
+
+        with pytest.raises(PayloadTooLargeError):
+            await context.json()
+        receive.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def it_rejects_a_streamed_body_once_it_exceeds_the_cap(self):
+        receive = AsyncMock(
+            side_effect=[
+                {"type": "http.request", "body": b"x" * 600, "more_body": True},
+                {"type": "http.request", "body": b"x" * 600, "more_body": False},
+            ]
+        )
+        scope = {"type": "http", "method": "POST", "path": "/x402", "headers": []}
+        context = get_request_context(scope, receive)
+        context.max_body_bytes = 1024
+
+        with pytest.raises(PayloadTooLargeError):
+            await context.body()
+
+    @pytest.mark.asyncio
+    async def it_does_not_classify_other_posts_as_x402(self):
+        scope = {"type": "http", "method": "POST", "path": "/v1/public/agents", "headers": []}
+        context = get_request_context(scope, AsyncMock())
+
+        assert context.is_x402_post is False
+
+    @pytest.mark.asyncio
+    async def it_rebuilds_the_context_for_a_rewritten_scope(self):
+        receive = AsyncMock(
+            return_value={"type": "http.request", "body": b"{}", "more_body": False}
+        )
+        scope = {"type": "http", "method": "POST", "path": "/api/v1/x402", "headers": []}
+        outer = get_request_context(scope, receive)
+        await outer.body()
+
+        rewritten = dict(scope, path="/x402")
+        inner = get_request_context(rewritten, receive)
+
+        assert inner is not outer
+        assert inner.is_x402_post is True
+        assert await inner.body() == b"{}"
+        assert receive.await_count == 1
+
+    @pytest.mark.asyncio
+    async def it_passes_lifespan_scopes_through(self):
+        inner_app = AsyncMock()
+        middleware = _BlockingMiddleware(inner_app)
+        scope = {"type": "lifespan"}
+
+        await middleware(scope, AsyncMock(), AsyncMock())
+
+        inner_app.assert_awaited_once()
+        assert "agent402.request_context" not in scope
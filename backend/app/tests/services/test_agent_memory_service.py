@@ -7,6 +7,7 @@ to ensure proper data handling and error cases.
 Coverage focuses on:
 - Memory ID generation
 - Store memory method with various inputs
+- Bulk store with pre-assigned memory IDs
 - Error handling for ZeroDB failures
 - Semantic search functionality
 - Namespace statistics
@@ -28,6 +29,7 @@ class TestAgentMemoryService:
         """Create a mock ZeroDB client."""
         client = Mock()
         client.insert_row = AsyncMock()
+        client.insert_rows = AsyncMock()
         client.query_rows = AsyncMock()
         client.delete_row = AsyncMock()
         client.embed_and_store = AsyncMock()
@@ -141,6 +143,29 @@ class TestAgentMemoryService:
         assert exc_info.value.status_code == 500
         assert exc_info.value.error_code == "MEMORY_STORE_ERROR"
 
+    @pytest.mark.asyncio
+    async def test_store_memories_writes_one_insert_and_keeps_ids(self, service, mock_zerodb_client):
+        """Test bulk storage keeps pre-assigned IDs and embeds per namespace."""
+        mock_zerodb_client.embed_and_store.return_value = {"vector_ids": []}
+        entries = [
+            {"memory_id": "mem_given", "project_id": "proj_test", "agent_id": "agent_001",
+             "run_id": "run_001", "memory_type": "decision", "content": "a", "namespace": "x"},
+            {"project_id": "proj_test", "agent_id": "agent_002", "run_id": "run_001",
+             "memory_type": "decision", "content": "b", "namespace": "x"},
+        ]
+
+        results = await service.store_memories(entries)
+
+        rows = mock_zerodb_client.insert_rows.call_args.args[1]
+        assert [r["memory_id"] for r in rows] == [r["memory_id"] for r in results]
+        assert results[0]["memory_id"] == "mem_given"
+        assert results[1]["memory_id"].startswith("mem_")
+        mock_zerodb_client.insert_row.assert_not_called()
+        embed = mock_zerodb_client.embed_and_store.call_args.kwargs
+        assert mock_zerodb_client.embed_and_store.call_count == 1
+        assert embed["texts"] == ["a", "b"]
+        assert embed["namespace"] == "agent_memory_x"
+
     @pytest.mark.asyncio
     async def test_get_memory_not_found(self, service, mock_zerodb_client):
         """Test get_memory when memory doesn't exist."""
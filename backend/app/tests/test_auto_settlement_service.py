@@ -209,7 +209,8 @@ class DescribeSettlePayment:
 
         await svc.settle_payment("pay_upd_001")
 
-        mock_client.update_row.assert_called_once()
+        # Hedera payments are marked settling before the transfer, then settled
+        assert mock_client.update_row.call_count == 2
         update_call_args = mock_client.update_row.call_args
         # First arg is table name, second is filter, third is update data
         update_data = update_call_args[0][2] if len(update_call_args[0]) >= 3 else update_call_args[1].get("data", {})
@@ -391,3 +392,355 @@ class DescribeScheduleSettlement:
                 await task
             except (asyncio.CancelledError, Exception):
                 pass
+
+
+# ---------------------------------------------------------------------------
+# DescribeSettlementEngine
+# ---------------------------------------------------------------------------
+
+
+def _payments_client(payments: List[Dict[str, Any]]):
+    """ZeroDB mock answering the pending query and per-payment lookups."""
+    by_id = {p["payment_id"]: p for p in payments}
+
+    async def _query_rows(table, filter):
+        if "payment_id" in filter:
+            payment = by_id.get(filter["payment_id"])
+            return [payment] if payment else []
+        return list(payments)
+
+    client = AsyncMock()
+    client.query_rows = AsyncMock(side_effect=_query_rows)
+    client.update_row = AsyncMock(return_value=True)
+    return client
+
+
+def _stored_payments_client(payments: List[Dict[str, Any]], fail_statuses=()):
+    """ZeroDB mock that filters on status and applies updates to the stored rows."""
+    by_id = {p["payment_id"]: dict(p) for p in payments}
+
+    async def _query_rows(table, filter):
+        return [
+            dict(p) for p in by_id.values()
+            if all(p.get(k) == v for k, v in filter.items() if k != "created_at_after")
+        ]
+
+    async def _update_row(table, filter, data):
+        if data.get("status") in fail_statuses:
+            raise ConnectionError("ZeroDB unavailable")
+        by_id[filter["payment_id"]].update(data)
+        return True
+
+    client = AsyncMock()
+    client.query_rows = AsyncMock(side_effect=_query_rows)
+    client.update_row = AsyncMock(side_effect=_update_row)
+    client.rows = by_id
+    return client
+
+
+class DescribeSettlementEngine:
+    """Describe concurrency, batching, idempotency and finality polling."""
+
+    @pytest.mark.asyncio
+    async def it_bounds_concurrent_transfers_per_provider(self):
+        """No more than the configured number of transfers run at once per rail."""
+        payments = [_make_pending_payment(f"pay_{i}") for i in range(6)]
+        active = 0
+        peak = 0
+
+        async def _transfer_usdc(**kwargs):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"transaction_id": f"tx_{kwargs['memo']}", "status": "SUCCESS"}
+
+        mock_hedera = AsyncMock()
+        mock_hedera.transfer_usdc = AsyncMock(side_effect=_transfer_usdc)
+        from app.services.auto_settlement_service import AutoSettlementService
+        svc = AutoSettlementService(
+            zerodb_client=_payments_client(payments),
+            hedera_service=mock_hedera,
+            provider_concurrency={"hedera": 2},
+        )
+
+        result = await svc.run_settlement_cycle()
+
+        assert result["settled"] == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def it_coalesces_payments_sharing_a_route_when_batching(self):
+        """With batch_size > 1, same payer/payee payments settle in one transfer."""
+        payments = [_make_pending_payment(f"pay_{i}") for i in range(3)]
+        other = _make_pending_payment("pay_other")
+        other["to_account"] = "0.0.33333"
+        mock_hedera = AsyncMock()
+        mock_hedera.transfer_usdc = AsyncMock(
+            return_value={"transaction_id": "tx_batch", "status": "SUCCESS"}
+        )
+        from app.services.auto_settlement_service import AutoSettlementService
+        svc = AutoSettlementService(
+            zerodb_client=_payments_client(payments + [other]),
+            hedera_service=mock_hedera,
+            batch_size=10,
+        )
+
+        result = await svc.run_settlement_cycle()
+
+        assert result["settled"] == 4
+        amounts = sorted(c.kwargs["amount"] for c in mock_hedera.transfer_usdc.call_args_list)
+        assert amounts == [1_000_000, 3_000_000]
+
+    @pytest.mark.asyncio
+    async def it_reuses_the_idempotency_key_when_a_payment_is_retried(self):
+        """Circle transfers for the same payment always carry the same key."""
+        from app.services.auto_settlement_service import settlement_idempotency_key
+        payment = _make_pending_payment("pay_retry", network="circle")
+        mock_circle = AsyncMock()
+        mock_circle.create_transfer = AsyncMock(side_effect=[
+            Exception("Circle timeout"),
+            {"data": {"id": "txn_1", "state": "COMPLETE"}},
+        ])
+        svc = _make_service(
+            zerodb_client=_payments_client([payment]), circle_service=mock_circle
+        )
+
+        first = await svc.settle_payment("pay_retry")
+        second = await svc.settle_payment("pay_retry")
+
+        keys = {c.kwargs["idempotency_key"] for c in mock_circle.create_transfer.call_args_list}
+        assert (first["status"], second["status"]) == ("failed", "settled")
+        assert keys == {settlement_idempotency_key(["pay_retry"])}
+
+    @pytest.mark.asyncio
+    async def it_submits_concurrent_settlements_of_one_payment_once(self):
+        """Overlapping requests for the same payment share one transfer."""
+        payment = _make_pending_payment("pay_dup")
+
+        async def _transfer_usdc(**kwargs):
+            await asyncio.sleep(0.01)
+            return {"transaction_id": "tx_dup", "status": "SUCCESS"}
+
+        mock_hedera = AsyncMock()
+        mock_hedera.transfer_usdc = AsyncMock(side_effect=_transfer_usdc)
+        svc = _make_service(
+            zerodb_client=_payments_client([payment]), hedera_service=mock_hedera
+        )
+
+        results = await asyncio.gather(
+            svc.settle_payment("pay_dup"), svc.settle_payment("pay_dup")
+        )
+
+        assert [r["transaction_id"] for r in results] == ["tx_dup", "tx_dup"]
+        mock_hedera.transfer_usdc.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def it_polls_in_flight_transfers_together_until_final(self):
+        """Pending transfers are polled in shared rounds until they finish."""
+        payments = [_make_pending_payment(f"pay_{i}", network="circle") for i in range(3)]
+        payments[2]["to_account"] = "0xfailing"
+        polls: Dict[str, int] = {}
+
+        async def _create_transfer(**kwargs):
+            transfer_id = f"txn_{kwargs['idempotency_key']}_{kwargs['destination_address']}"
+            return {"data": {"id": transfer_id, "state": "INITIATED"}}
+
+        async def _get_transfer(transfer_id):
+            polls[transfer_id] = polls.get(transfer_id, 0) + 1
+            if polls[transfer_id] < 2:
+                return {"data": {"id": transfer_id, "state": "SENT"}}
+            state = "FAILED" if "0xfailing" in transfer_id else "COMPLETE"
+            return {"data": {"id": transfer_id, "state": state}}
+
+        mock_circle = AsyncMock()
+        mock_circle.create_transfer = AsyncMock(side_effect=_create_transfer)
+        mock_circle.get_transfer = AsyncMock(side_effect=_get_transfer)
+        from app.services.auto_settlement_service import AutoSettlementService
+        svc = AutoSettlementService(
+            zerodb_client=_payments_client(payments),
+            circle_service=mock_circle,
+            finality_poll_interval=0.001,
+        )
+
+        result = await svc.run_settlement_cycle()
+        metrics = svc.get_metrics()
+
+        assert (result["settled"], result["failed"]) == (2, 1)
+        assert metrics["settled_total"] == 2
+        assert metrics["cycles"] == 1
+        assert metrics["in_flight_transfers"] == 0
+        assert metrics["transfers_submitted"] == 3
+
+    @pytest.mark.asyncio
+    async def it_leaves_transfers_that_are_not_final_in_time_submitted(self):
+        """A transfer still pending at the finality timeout is recorded as submitted, not failed."""
+        payment = _make_pending_payment("pay_slow", network="circle")
+        mock_circle = AsyncMock()
+        mock_circle.create_transfer = AsyncMock(
+            return_value={"data": {"id": "txn_slow", "state": "INITIATED"}}
+        )
+        mock_circle.get_transfer = AsyncMock(
+            return_value={"data": {"id": "txn_slow", "state": "SENT"}}
+        )
+        client = _payments_client([payment])
+        from app.services.auto_settlement_service import (
+            AutoSettlementService,
+            settlement_idempotency_key,
+        )
+        svc = AutoSettlementService(
+            zerodb_client=client,
+            circle_service=mock_circle,
+            finality_poll_interval=0.001,
+            finality_timeout=0.05,
+        )
+
+        result = await svc.settle_payment("pay_slow")
+
+        assert result["status"] == "submitted"
+        update = client.update_row.call_args[0][2]
+        assert update["status"] == "submitted"
+        assert update["transaction_id"] == "txn_slow"
+        assert update["idempotency_key"] == settlement_idempotency_key(["pay_slow"])
+        assert svc.get_metrics()["in_flight_transfers"] == 0
+
+    @pytest.mark.asyncio
+    async def it_keeps_polling_for_waiters_with_longer_timeouts(self):
+        """One waiter timing out does not drop the transfer for the others."""
+        from app.services.auto_settlement_service import (
+            SettlementTimeoutError,
+            _FinalityWatcher,
+        )
+        final: Dict[str, str] = {}
+
+        async def _fetch(transaction_ids):
+            return {t: final[t] for t in transaction_ids if t in final}
+
+        watcher = _FinalityWatcher({"circle": _fetch}, initial_delay=0.001, max_delay=0.004)
+        patient = asyncio.ensure_future(watcher.wait("circle", "txn_shared", timeout=2))
+        with pytest.raises(SettlementTimeoutError):
+            await watcher.wait("circle", "txn_shared", timeout=0.05)
+        final["txn_shared"] = "COMPLETE"
+
+        assert await patient == "COMPLETE"
+        assert len(watcher) == 0
+
+    @pytest.mark.asyncio
+    async def it_waits_on_the_hedera_tracker_for_pending_transfers(self):
+        """Hedera transfers not yet final wait on HederaPaymentService's tracker."""
+        payment = _make_pending_payment("pay_hdr_wait")
+        mock_hedera = AsyncMock()
+        mock_hedera.transfer_usdc = AsyncMock(
+            return_value={"transaction_id": "0.0.11111@1.000000001", "status": "UNKNOWN"}
+        )
+        mock_hedera.wait_for_settlement = AsyncMock(
+            return_value={"settled": True, "status": "SUCCESS"}
+        )
+        svc = _make_service(
+            zerodb_client=_payments_client([payment]), hedera_service=mock_hedera
+        )
+
+        result = await svc.settle_payment("pay_hdr_wait")
+
+        assert result["status"] == "settled"
+        mock_hedera.wait_for_settlement.assert_awaited_once()
+        assert mock_hedera.wait_for_settlement.call_args[0][0] == "0.0.11111@1.000000001"
+
+    @pytest.mark.asyncio
+    async def it_claims_hedera_payments_before_transferring(self):
+        """The settling status and idempotency key are written before transfer_usdc."""
+        from app.services.auto_settlement_service import settlement_idempotency_key
+        client = _stored_payments_client([_make_pending_payment("pay_claim")])
+        seen: List[Dict[str, Any]] = []
+
+        async def _transfer_usdc(**kwargs):
+            seen.append(dict(client.rows["pay_claim"]))
+            return {"transaction_id": "tx_claim", "status": "SUCCESS"}
+
+        mock_hedera = AsyncMock()
+        mock_hedera.transfer_usdc = AsyncMock(side_effect=_transfer_usdc)
+        svc = _make_service(zerodb_client=client, hedera_service=mock_hedera)
+
+        await svc.settle_payment("pay_claim")
+
+        assert seen[0]["status"] == "settling"
+        assert seen[0]["idempotency_key"] == settlement_idempotency_key(["pay_claim"])
+        assert client.rows["pay_claim"]["status"] == "settled"
+
+    @pytest.mark.asyncio
+    async def it_does_not_pay_again_when_the_settled_update_is_lost(self):
+        """A payment whose settled write fails stays settling and is not resubmitted."""
+        client = _stored_payments_client(
+            [_make_pending_payment("pay_lost")], fail_statuses=("settled",)
+        )
+        mock_hedera = AsyncMock()
+        mock_hedera.transfer_usdc = AsyncMock(
+            return_value={"transaction_id": "tx_lost", "status": "SUCCESS"}
+        )
+        svc = _make_service(zerodb_client=client, hedera_service=mock_hedera)
+
+        first = await svc.run_settlement_cycle()
+        second = await svc.run_settlement_cycle()
+
+        assert first["settled"] == 1
+        assert second["total"] == 0
+        assert client.rows["pay_lost"]["status"] == "settling"
+        mock_hedera.transfer_usdc.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def it_resubmits_a_lost_circle_batch_under_its_stored_key(self):
+        """A Circle batch left pending keeps its key even when new payments arrive."""
+        from app.services.auto_settlement_service import AutoSettlementService
+        client = _stored_payments_client(
+            [
+                _make_pending_payment("pay_a", network="circle"),
+                _make_pending_payment("pay_b", network="circle"),
+            ],
+            fail_statuses=("settled",),
+        )
+        mock_circle = AsyncMock()
+        mock_circle.create_transfer = AsyncMock(
+            return_value={"data": {"id": "txn_1", "state": "COMPLETE"}}
+        )
+        svc = AutoSettlementService(
+            zerodb_client=client, circle_service=mock_circle, batch_size=10
+        )
+
+        await svc.run_settlement_cycle()
+        client.rows["pay_c"] = _make_pending_payment("pay_c", network="circle")
+        await svc.run_settlement_cycle()
+
+        calls = mock_circle.create_transfer.call_args_list
+        first_key = calls[0].kwargs["idempotency_key"]
+        retried = [c for c in calls[1:] if c.kwargs["idempotency_key"] == first_key]
+        assert client.rows["pay_a"]["idempotency_key"] == first_key
+        assert [c.kwargs["amount"] for c in retried] == ["2000000"]
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def it_rechecks_submitted_transfers_on_later_cycles(self):
+        """A transfer left submitted is confirmed by a later cycle without a new transfer."""
+        from app.services.hedera_payment_service import HederaSettlementTimeoutError
+        client = _stored_payments_client([_make_pending_payment("pay_late")])
+        mock_hedera = AsyncMock()
+        mock_hedera.transfer_usdc = AsyncMock(
+            return_value={"transaction_id": "0.0.11111@1.000000002", "status": "UNKNOWN"}
+        )
+        mock_hedera.wait_for_settlement = AsyncMock(side_effect=[
+            HederaSettlementTimeoutError("0.0.11111@1.000000002", 0.01),
+            {"settled": True, "status": "SUCCESS"},
+        ])
+        svc = _make_service(zerodb_client=client, hedera_service=mock_hedera)
+
+        first = await svc.run_settlement_cycle()
+        assert first["submitted"] == 1
+        assert client.rows["pay_late"]["status"] == "submitted"
+
+        second = await svc.run_settlement_cycle()
+
+        assert second["settled"] == 1
+        assert client.rows["pay_late"]["status"] == "settled"
+        assert client.rows["pay_late"]["transaction_id"] == "0.0.11111@1.000000002"
+        mock_hedera.transfer_usdc.assert_called_once()
+        assert svc.get_metrics()["submitted_total"] == 1
@@ -5,6 +5,7 @@ Covers:
   - Per-agent cost breakdown (Issue #226)
   - Per-agent budget limits (Issue #227)
   - Per-project budget limits (Issue #228)
+  - Buffered usage metering and spend rollups
 
 BDD-style: DescribeX / it_does_something naming convention.
 Refs #226, #227, #228.
@@ -471,3 +472,187 @@ class DescribeGetProjectBudgetStatus:
         result = await billing.get_project_budget_status("proj-no-budget")
         assert result["max_daily"] is None
         assert result["max_monthly"] is None
+
+
+# ---------------------------------------------------------------------------
+# Usage metering — buffered writes and spend rollups
+# ---------------------------------------------------------------------------
+
+def _usage_calls(mock_db, method):
+    return [
+        c for c in mock_db.call_history
+        if c["method"] == method and c.get("table_name") == "billing_usage_events"
+    ]
+
+
+def _external_event(agent_id, amount, recorded_at, project_id=""):
+    from app.services.billing_service import _today_period
+    return {
+        "event_id": f"evt-{agent_id}-{recorded_at}",
+        "agent_id": agent_id,
+        "category": "llm_inference",
+        "amount": amount,
+        "period": _today_period(),
+        "project_id": project_id,
+        "metadata": "{}",
+        "recorded_at": recorded_at,
+    }
+
+
+class DescribeUsageMetering:
+    """Tests for buffered usage persistence and rollup-backed spend reads."""
+
+    @pytest.mark.asyncio
+    async def it_buffers_events_and_flushes_them_in_one_batch(self, mock_db):
+        from app.services.billing_service import BillingService
+        billing = BillingService(client=mock_db, flush_interval=60)
+        await billing.start()
+        for amount in ("1.00", "2.00", "3.00"):
+            await billing.record_usage_event(
+                "agent-1", "llm_inference", Decimal(amount), {"project_id": "proj-1"}
+            )
+
+        assert mock_db.data.get("billing_usage_events", []) == []
+        status = await billing.get_agent_budget_status("agent-1")
+        project = await billing.get_project_budget_status("proj-1")
+        await billing.stop()
+
+        assert status["spent_daily"] == Decimal("6.00")
+        assert project["spent_monthly"] == Decimal("6.00")
+        batches = _usage_calls(mock_db, "insert_rows")
+        assert len(batches) == 1 and len(batches[0]["rows_data"]) == 3
+        assert await billing.reconcile_rollups() == 0
+
+    @pytest.mark.asyncio
+    async def it_flushes_buffered_events_before_reading_history(self, mock_db):
+        from app.services.billing_service import BillingService
+        billing = BillingService(client=mock_db, flush_interval=60)
+        await billing.start()
+        await billing.record_usage_event("agent-1", "llm_inference", Decimal("1.00"), {})
+
+        history = await billing.get_usage_history("agent-1", "llm_inference", 10)
+        await billing.stop()
+
+        assert len(history) == 1
+
+    @pytest.mark.asyncio
+    async def it_reads_repeated_budget_checks_from_the_rollup(self, billing, mock_db):
+        await billing.set_agent_budget("agent-1", Decimal("10.00"), Decimal("100.00"))
+        await billing.record_usage_event("agent-1", "llm_inference", Decimal("4.00"), {})
+        for _ in range(3):
+            await billing.check_agent_budget("agent-1", Decimal("1.00"))
+        await billing.record_usage_event("agent-1", "llm_inference", Decimal("2.00"), {})
+        result = await billing.check_agent_budget("agent-1", Decimal("1.00"))
+
+        assert result["remaining_daily"] == Decimal("4.00")
+        assert len(_usage_calls(mock_db, "query_rows")) == 1
+
+    @pytest.mark.asyncio
+    async def it_counts_only_todays_events_toward_daily_spend(self, billing, mock_db):
+        from datetime import datetime, timedelta, timezone
+        earlier = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+        await mock_db.insert_row(
+            "billing_usage_events", _external_event("agent-1", "7.00", earlier)
+        )
+        await billing.record_usage_event("agent-1", "llm_inference", Decimal("2.00"), {})
+
+        status = await billing.get_agent_budget_status("agent-1")
+
+        assert status["spent_daily"] == Decimal("2.00")
+        assert status["spent_monthly"] == Decimal("9.00")
+
+    @pytest.mark.asyncio
+    async def it_reconciles_events_written_by_another_worker(self, billing, mock_db):
+        from datetime import datetime, timezone
+        await billing.record_usage_event(
+            "agent-1", "llm_inference", Decimal("1.00"), {"project_id": "proj-1"}
+        )
+        await billing.get_agent_budget_status("agent-1")
+        await billing.get_project_budget_status("proj-1")
+        await mock_db.insert_row(
+            "billing_usage_events",
+            _external_event(
+                "agent-2", "5.00", datetime.now(timezone.utc).isoformat(), "proj-1"
+            ),
+        )
+
+        before = await billing.get_project_budget_status("proj-1")
+        corrected = await billing.reconcile_rollups()
+        after = await billing.get_project_budget_status("proj-1")
+
+        assert before["spent_daily"] == Decimal("1.00")
+        assert corrected == 1
+        assert after["spent_daily"] == Decimal("6.00")
+
+    @pytest.mark.asyncio
+    async def it_backs_out_an_event_whose_inline_write_failed(self, billing, mock_db):
+        await billing.get_agent_budget_status("agent-1")
+        mock_db.insert_row = AsyncMock(side_effect=RuntimeError("down"))
+
+        with pytest.raises(RuntimeError):
+            await billing.record_usage_event(
+                "agent-1", "llm_inference", Decimal("3.00"), {}
+            )
+        status = await billing.get_agent_budget_status("agent-1")
+
+        assert status["spent_daily"] == Decimal("0")
+
+    @pytest.mark.asyncio
+    async def it_keeps_an_event_flushed_while_its_rollup_loads(self, mock_db):
+        from app.services.billing_service import BillingService
+        billing = BillingService(client=mock_db, flush_interval=60)
+        await billing.start()
+        await billing.record_usage_event("agent-1", "llm_inference", Decimal("2.00"), {})
+        query_rows = mock_db.query_rows
+
+        async def _flush_after_paging(table_name, **kwargs):
+            page = await query_rows(table_name, **kwargs)
+            if table_name == "billing_usage_events":
+                await billing.flush()
+            return page
+
+        mock_db.query_rows = _flush_after_paging
+        status = await billing.get_agent_budget_status("agent-1")
+        await billing.stop()
+
+        assert status["spent_daily"] == Decimal("2.00")
+
+    @pytest.mark.asyncio
+    async def it_counts_an_event_recorded_while_its_rollup_loads(self, billing, mock_db):
+        query_rows = mock_db.query_rows
+
+        async def _record_after_paging(table_name, **kwargs):
+            page = await query_rows(table_name, **kwargs)
+            if table_name == "billing_usage_events":
+                mock_db.query_rows = query_rows
+                await billing.record_usage_event(
+                    "agent-1", "llm_inference", Decimal("3.00"), {}
+                )
+            return page
+
+        mock_db.query_rows = _record_after_paging
+        status = await billing.get_agent_budget_status("agent-1")
+
+        assert status["spent_daily"] == Decimal("3.00")
+        assert await billing.reconcile_rollups() == 0
+
+    @pytest.mark.asyncio
+    async def it_loads_rollups_for_different_agents_independently(self, billing, mock_db):
+        import asyncio
+        release = asyncio.Event()
+        query_rows = mock_db.query_rows
+
+        async def _slow_for_agent_1(table_name, **kwargs):
+            if table_name == "billing_usage_events" and kwargs["filter"]["agent_id"] == "agent-1":
+                await release.wait()
+            return await query_rows(table_name, **kwargs)
+
+        mock_db.query_rows = _slow_for_agent_1
+        slow = asyncio.create_task(billing.get_agent_budget_status("agent-1"))
+        await asyncio.sleep(0)
+
+        other = await asyncio.wait_for(billing.get_agent_budget_status("agent-2"), 1)
+        release.set()
+        await slow
+
+        assert other["spent_daily"] == Decimal("0")
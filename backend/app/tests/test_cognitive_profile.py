@@ -248,3 +248,83 @@ class DescribeBuildProfileTimestamps:
 
         assert profile.first_memory_at is None
         assert profile.last_memory_at is None
+
+
+class DescribeBuildProfileIncrementalIndex:
+    """The per-agent index only processes new or changed memories."""
+
+    def it_tokenizes_only_new_memories_and_tracks_changes(self, monkeypatch):
+        svc = CognitiveMemoryService()
+        corpus = [
+            _memory("m1", "vendor invoice review", category="decision", importance=0.8),
+            _memory("m2", "vendor payment schedule", category="plan", importance=0.4),
+        ]
+        svc.build_profile(agent_id="agent_abc", memories=corpus)
+
+        tokenized: List[str] = []
+        original = svc._significant_tokens
+        monkeypatch.setattr(
+            svc, "_significant_tokens",
+            lambda text: tokenized.append(text) or original(text),
+        )
+        corpus = [
+            corpus[0],
+            _memory("m2", "wallet limit raised", category="observation", importance=0.4),
+            _memory("m3", "vendor wallet audit", category="observation", importance=1.0),
+        ]
+        profile = svc.build_profile(agent_id="agent_abc", memories=corpus)
+        fresh = CognitiveMemoryService().build_profile(agent_id="agent_abc", memories=corpus)
+
+        assert tokenized == ["wallet limit raised", "vendor wallet audit"]
+        assert profile.categories == fresh.categories
+        assert profile.expertise_areas == fresh.expertise_areas
+        assert [(t.topic, t.count) for t in profile.topics] == [(t.topic, t.count) for t in fresh.topics]
+        assert [t.average_importance for t in profile.topics] == pytest.approx(
+            [t.average_importance for t in fresh.topics]
+        )
+        assert {t.topic: t.count for t in profile.topics}["vendor"] == 2
+        assert "schedule" not in {t.topic for t in profile.topics}
+
+    def it_keeps_indexes_for_the_most_recently_profiled_agents(self):
+        svc = CognitiveMemoryService(max_tracked_agents=2)
+        corpus = [_memory("m1", "vendor invoice review", category="decision")]
+        for agent_id in ("agent_a", "agent_b", "agent_a", "agent_c"):
+            svc.build_profile(agent_id=agent_id, memories=corpus)
+
+        assert list(svc._agent_indexes) == ["agent_a", "agent_c"]
+
+    def it_drops_memories_missing_from_the_corpus(self):
+        svc = CognitiveMemoryService()
+        svc.build_profile(
+            agent_id="agent_abc",
+            memories=[
+                _memory("m1", "vendor invoice", category="decision", timestamp="2026-01-01T00:00:00Z"),
+                _memory("m2", "vendor refund", category="plan", timestamp="2026-05-01T00:00:00Z"),
+            ],
+        )
+
+        profile = svc.build_profile(
+            agent_id="agent_abc",
+            memories=[_memory("m1", "vendor invoice", category="decision", timestamp="2026-01-01T00:00:00Z")],
+        )
+
+        assert [c.category for c in profile.categories] == [MemoryCategory.DECISION]
+        assert profile.last_memory_at == "2026-01-01T00:00:00Z"
+        assert {t.topic for t in profile.topics} == {"vendor", "invoice"}
+
+    def it_counts_memories_that_share_or_lack_an_id_separately(self):
+        svc = CognitiveMemoryService()
+        corpus = [_memory("", "vendor invoice review", category="decision") for _ in range(3)]
+        for m in corpus:
+            del m["memory_id"]
+
+        profile = svc.build_profile(agent_id="agent_abc", memories=corpus)
+        again = svc.build_profile(
+            agent_id="agent_abc",
+            memories=corpus[:2] + [_memory("dup", "vendor audit"), _memory("dup", "vendor audit")],
+        )
+
+        assert [(c.category, c.count) for c in profile.categories] == [(MemoryCategory.DECISION, 3)]
+        assert {t.topic: t.count for t in profile.topics}["vendor"] == 3
+        assert {t.topic: t.count for t in again.topics}["vendor"] == 4
+        assert {t.topic: t.count for t in again.topics}["audit"] == 2
@@ -268,3 +268,51 @@ class DescribeSynthesizeInsightsGaps:
         result = svc.synthesize_insights(memories)
 
         assert result["gaps"] == []
+
+
+class DescribeSynthesizeInsightsIndexJoin:
+    """Indexed contradiction join matches the pairwise comparison."""
+
+    @staticmethod
+    def _pairwise(svc: CognitiveMemoryService, memories: List[Dict[str, Any]]):
+        def has(m, toks):
+            return any(t in m["content"].lower() for t in toks)
+
+        approves = [m for m in memories if has(m, svc._APPROVE_TOKENS)]
+        rejects = [m for m in memories if has(m, svc._REJECT_TOKENS)]
+        pairs, seen = [], set()
+        for a in approves:
+            for r in rejects:
+                if a["memory_id"] == r["memory_id"]:
+                    continue
+                overlap = svc._significant_tokens(a["content"]) & svc._significant_tokens(r["content"])
+                key = frozenset({a["memory_id"], r["memory_id"]})
+                if len(overlap) >= 2 and key not in seen:
+                    seen.add(key)
+                    pairs.append((" ".join(sorted(overlap)[:3]), [a["memory_id"], r["memory_id"]]))
+        return pairs
+
+    def it_matches_the_pairwise_scan_on_a_mixed_corpus(self):
+        import random
+        rng = random.Random(17)
+        words = ["invoice", "vendor", "payment", "refund", "usdc", "limit", "wallet", "kyc"]
+        verbs = ["approved", "rejected", "approve and reject", "reviewed"]
+        memories = [
+            _memory(
+                f"m{i}",
+                f"{rng.choice(verbs)} " + " ".join(rng.sample(words, 3)),
+                category=rng.choice(["decision", "plan", "observation", "other"]),
+            )
+            for i in range(120)
+        ]
+        memories.append(_memory("m0", "approved vendor invoice payment"))  # duplicate id
+        svc = CognitiveMemoryService()
+
+        result = svc.synthesize_insights(memories)
+
+        assert [(c.topic, c.memory_ids) for c in result["contradictions"]] == self._pairwise(svc, memories)
+        assert sum(p.count for p in result["patterns"]) <= len(memories)
+        assert result["patterns"][0].count == max(
+            sum(1 for m in memories if m["metadata"]["category"] == cat)
+            for cat in ("decision", "plan", "observation", "other")
+        )
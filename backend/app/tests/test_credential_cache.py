@@ -0,0 +1,121 @@
+"""
+Tests for CredentialCache — cached API key / token resolution.
+
+Covers positive and negative TTLs, LRU eviction, single-flight loading,
+failure handling, and explicit invalidation.
+"""
+from __future__ import annotations
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+
+def _make_cache(**kwargs):
+    from app.core.credential_cache import CredentialCache
+    return CredentialCache(**kwargs)
+
+
+class DescribeCredentialCacheLookup:
+    """Describe lookup/store semantics."""
+
+    def it_reports_a_miss_for_unknown_credentials(self):
+        cache = _make_cache()
+        assert cache.lookup("api_key", "k1") == (False, None)
+
+    def it_caches_positive_and_negative_results(self):
+        cache = _make_cache()
+        cache.store("api_key", "good", "user_1")
+        cache.store("api_key", "bad", None)
+
+        assert cache.lookup("api_key", "good") == (True, "user_1")
+        assert cache.lookup("api_key", "bad") == (True, None)
+
+    def it_expires_negative_entries_on_their_own_ttl(self, monkeypatch):
+        import app.core.credential_cache as module
+
+        now = [1000.0]
+        monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+        cache = _make_cache(positive_ttl=300, negative_ttl=30)
+        cache.store("api_key", "good", "user_1")
+        cache.store("api_key", "bad", None)
+
+        now[0] += 31
+        assert cache.lookup("api_key", "bad") == (False, None)
+        assert cache.lookup("api_key", "good") == (True, "user_1")
+
+    def it_evicts_least_recently_used_entries(self):
+        cache = _make_cache(max_entries=2)
+        cache.store("api_key", "a", "ua")
+        cache.store("api_key", "b", "ub")
+        cache.lookup("api_key", "a")  # a is now most recently used
+        cache.store("api_key", "c", "uc")
+
+        assert len(cache) == 2
+        assert cache.lookup("api_key", "b") == (False, None)
+        assert cache.lookup("api_key", "a") == (True, "ua")
+
+    def it_namespaces_entries_by_kind(self):
+        cache = _make_cache()
+        cache.store("api_key", "same", "from_key")
+        cache.store("ainative_token", "same", "from_token")
+        cache.clear("ainative_token")
+
+        assert cache.lookup("api_key", "same") == (True, "from_key")
+        assert cache.lookup("ainative_token", "same") == (False, None)
+
+
+class DescribeCredentialCacheGetOrLoad:
+    """Describe single-flight loading and invalidation."""
+
+    @pytest.mark.asyncio
+    async def it_deduplicates_concurrent_loads(self):
+        cache = _make_cache()
+        release = asyncio.Event()
+        calls = []
+
+        async def loader():
+            calls.append(1)
+            await release.wait()
+            return "user_1"
+
+        tasks = [
+            asyncio.create_task(cache.get_or_load("api_key", "k", loader))
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert results == ["user_1"] * 5
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def it_does_not_cache_loader_failures(self):
+        cache = _make_cache()
+        loader = AsyncMock(side_effect=[RuntimeError("zerodb down"), "user_1"])
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_load("api_key", "k", loader)
+        assert await cache.get_or_load("api_key", "k", loader) == "user_1"
+
+    @pytest.mark.asyncio
+    async def it_reloads_after_invalidation(self):
+        cache = _make_cache()
+        loader = AsyncMock(side_effect=["user_1", None])
+
+        assert await cache.get_or_load("api_key", "k", loader) == "user_1"
+        cache.invalidate("api_key", "k")
+        assert await cache.get_or_load("api_key", "k", loader) is None
+        assert loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def it_does_not_store_a_load_invalidated_mid_flight(self):
+        cache = _make_cache()
+
+        async def loader():
+            cache.invalidate("api_key", "k")
+            return "user_1"
+
+        assert await cache.get_or_load("api_key", "k", loader) == "user_1"
+        assert cache.lookup("api_key", "k") == (False, None)
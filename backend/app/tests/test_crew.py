@@ -636,6 +636,25 @@ class TestRunCrewEntryPoint:
         finally:
             sys.stdout = sys.__stdout__
 
+    def test_batch_mode_logs_to_stderr(self):
+        """
+        Test console logging moves off stdout, which carries batch results.
+        """
+        from run_crew import send_console_logs_to_stderr
+        import logging
+        import sys
+
+        handler = logging.StreamHandler(sys.stdout)
+        root = logging.getLogger()
+        root.addHandler(handler)
+
+        try:
+            send_console_logs_to_stderr()
+
+            assert handler.stream is sys.stderr
+        finally:
+            root.removeHandler(handler)
+
 
 class TestCrewConfiguration:
     """Test suite for crew configuration."""
@@ -372,3 +372,94 @@ class TestErrorHandling:
 
         with pytest.raises((TypeError, InvalidDIDError)):
             DIDSigner.verify_signature(payload, "signature", None)
+
+
+class TestVerifyingKeyCache:
+    """Test per-DID caching of parsed verifying keys."""
+
+    def test_repeat_verification_reuses_cached_key(self):
+        """Should parse a DID's key once across repeated verifications."""
+        from app.core.did_signer import _load_verifying_key
+
+        DIDSigner.clear_verifying_key_cache()
+        private_key, did = DIDSigner.generate_keypair()
+        payload = {"type": "payment", "amount": "1.00"}
+        signature = DIDSigner.sign_payload(payload, private_key)
+
+        for _ in range(3):
+            assert DIDSigner.verify_signature(payload, signature, did) is True
+
+        info = _load_verifying_key.cache_info()
+        assert info.misses == 1
+        assert info.hits == 2
+
+    def test_unresolvable_did_is_not_cached(self):
+        """Should not cache DIDs that fail resolution."""
+        from app.core.did_signer import _load_verifying_key
+
+        DIDSigner.clear_verifying_key_cache()
+        short_did = "did:ethr:0x" + "ab" * 20
+
+        assert DIDSigner.verify_signature({"a": 1}, "00" * 64, short_did) is False
+        assert _load_verifying_key.cache_info().currsize == 0
+
+
+class TestVerificationBackends:
+    """Test that the OpenSSL and pure-Python backends agree."""
+
+    @pytest.mark.parametrize("backend", ["ecdsa", "cryptography"])
+    def test_backends_agree_on_valid_tampered_and_malformed(self, backend, monkeypatch):
+        """Should give identical results regardless of backend."""
+        import app.core.did_signer as did_signer
+
+        if backend == "cryptography" and not did_signer._CRYPTOGRAPHY_AVAILABLE:
+            pytest.skip("cryptography not installed")
+        monkeypatch.setattr(did_signer, "VERIFY_BACKEND", backend)
+
+        private_key, did = DIDSigner.generate_keypair()
+        payload = {"type": "payment", "amount": "100.00"}
+        signature = DIDSigner.sign_payload(payload, private_key)
+
+        assert DIDSigner.verify_signature(payload, signature, did) is True
+        assert DIDSigner.verify_signature({"type": "refund"}, signature, did) is False
+        assert DIDSigner.verify_signature(payload, signature[:-2] + "00", did) is False
+        assert DIDSigner.verify_signature(payload, signature[:64], did) is False
+        assert DIDSigner.verify_signature(payload, "00" * 64, did) is False
+
+
+class TestVerifyMany:
+    """Test batch signature verification."""
+
+    def _items(self, count):
+        items = []
+        for i in range(count):
+            private_key, did = DIDSigner.generate_keypair()
+            payload = {"type": "payment", "seq": i}
+            items.append((payload, DIDSigner.sign_payload(payload, private_key), did))
+        return items
+
+    def test_verify_many_returns_results_in_order(self):
+        """Should return one result per item, preserving order."""
+        items = self._items(3)
+        items[1] = (items[1][0], items[0][1], items[1][2])  # wrong signature
+
+        assert DIDSigner.verify_many(items) == [True, False, True]
+
+    def test_verify_many_reports_invalid_did_as_false(self):
+        """Should not let one malformed DID abort the batch."""
+        items = self._items(2)
+        items.append(({"type": "payment"}, "00" * 64, "did:web:example.com"))
+
+        assert DIDSigner.verify_many(items) == [True, True, False]
+
+    def test_verify_many_with_thread_pool(self):
+        """Should give the same results when fanned out to an executor."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        items = self._items(10)
+        items[7] = (items[7][0], "00" * 64, items[7][2])
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = DIDSigner.verify_many(items, executor=pool, chunk_size=3)
+
+        assert results == [True] * 7 + [False] + [True] * 2
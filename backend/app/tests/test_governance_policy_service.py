@@ -299,3 +299,142 @@ class DescribeGetPolicies:
         result = await svc.get_policies("did:hedera:testnet:agent_B")
 
         assert result == []
+
+
+def _query_count(client) -> int:
+    return sum(1 for c in client.call_history if c["method"] == "query_rows")
+
+
+class DescribeCompiledPolicies:
+    """Compiled, cached policy sets and evaluate_many — Issue #236."""
+
+    @pytest.mark.asyncio
+    async def it_matches_rule_by_rule_semantics(self, mock_zerodb_client):
+        """Compiled checks give the same verdicts as the documented rules."""
+        from app.services.governance_policy_service import GovernancePolicyService
+
+        svc = GovernancePolicyService(client=mock_zerodb_client)
+        did = "did:hedera:testnet:compiled"
+        spend = await svc.create_policy(did, "spend_limit", {"per_call_limit_usd": 2.0, "daily_limit_usd": 1.0})
+        data = await svc.create_policy(did, "data_access", {"allowed_tables": ["events"], "read_only": True})
+        await svc.create_policy(did, "task_scope", {"allowed_tasks": ["summarize", "classify"]})
+
+        cases = [
+            ("spend", {"amount_usd": 0.5}, []),
+            ("spend", {"amount_usd": 1.5}, [spend["policy_id"]]),
+            ("read_data", {"table": "events"}, []),
+            ("read_data", {"table": "secrets"}, [data["policy_id"]]),
+            ("read_data", {}, []),
+            ("write_data", {"table": "events"}, [data["policy_id"]]),
+            ("call_agent", {"target_did": "did:any"}, []),
+        ]
+        for action, context, expected in cases:
+            result = await svc.evaluate_policy(did, action, context)
+            assert result["violated_policies"] == expected, (action, context)
+            assert result["allowed"] is (not expected)
+
+    @pytest.mark.asyncio
+    async def it_serves_repeat_evaluations_from_cache(self, mock_zerodb_client):
+        """Only the first evaluation for an agent queries ZeroDB."""
+        from app.services.governance_policy_service import GovernancePolicyService
+
+        svc = GovernancePolicyService(client=mock_zerodb_client)
+        did = "did:hedera:testnet:cached"
+        await svc.create_policy(did, "interaction_whitelist", {"allowed_dids": ["did:ok"]})
+
+        await svc.evaluate_policy(did, "call_agent", {"target_did": "did:ok"})
+        queries = _query_count(mock_zerodb_client)
+        results = [
+            await svc.evaluate_policy(did, "call_agent", {"target_did": target})
+            for target in ("did:ok", "did:other", "did:ok")
+        ]
+
+        assert _query_count(mock_zerodb_client) == queries
+        assert [r["allowed"] for r in results] == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def it_invalidates_on_create_policy(self, mock_zerodb_client):
+        """A new policy applies to the very next evaluation."""
+        from app.services.governance_policy_service import GovernancePolicyService
+
+        svc = GovernancePolicyService(client=mock_zerodb_client)
+        did = "did:hedera:testnet:evolving"
+
+        before = await svc.evaluate_policy(did, "execute_task", {"task": "deploy"})
+        await svc.create_policy(did, "task_scope", {"allowed_tasks": ["summarize"]})
+        after = await svc.evaluate_policy(did, "execute_task", {"task": "deploy"})
+
+        assert before["allowed"] is True
+        assert after["allowed"] is False
+
+    @pytest.mark.asyncio
+    async def it_does_not_reuse_a_load_started_before_create_policy(self, mock_zerodb_client):
+        """An evaluation after create_policy never joins a load that read the old rows."""
+        import asyncio
+
+        from app.services.governance_policy_service import GovernancePolicyService
+
+        svc = GovernancePolicyService(client=mock_zerodb_client)
+        did = "did:hedera:testnet:racing"
+        load_policies = svc.get_policies
+        release = asyncio.Event()
+
+        async def slow_get_policies(agent_did):
+            policies = await load_policies(agent_did)
+            await release.wait()
+            return policies
+
+        svc.get_policies = slow_get_policies
+        in_flight = asyncio.ensure_future(svc.evaluate_policy(did, "spend", {"amount_usd": 100}))
+        await asyncio.sleep(0.01)
+        await svc.create_policy(did, "spend_limit", {"per_call_limit_usd": 1})
+        svc.get_policies = load_policies
+        release.set()
+        after = await svc.evaluate_policy(did, "spend", {"amount_usd": 100})
+        await in_flight
+
+        assert after["allowed"] is False
+
+    @pytest.mark.asyncio
+    async def it_evaluates_a_batch_with_one_load_per_agent(self, mock_zerodb_client):
+        """evaluate_many returns per-check results in order, loading each agent once."""
+        from app.services.governance_policy_service import GovernancePolicyService
+
+        svc = GovernancePolicyService(client=mock_zerodb_client)
+        await svc.create_policy("did:a", "spend_limit", {"per_call_limit_usd": 1.0})
+        await svc.create_policy("did:b", "task_scope", {"allowed_tasks": ["read"]})
+        queries = _query_count(mock_zerodb_client)
+
+        results = await svc.evaluate_many([
+            {"agent_did": "did:a", "action": "spend", "context": {"amount_usd": 0.5}},
+            {"agent_did": "did:b", "action": "execute_task", "context": {"task": "write"}},
+            {"agent_did": "did:a", "action": "spend", "context": {"amount_usd": 5.0}},
+            {"agent_did": "did:c", "action": "spend"},
+        ])
+
+        assert [r["allowed"] for r in results] == [True, False, False, True]
+        assert [r["agent_did"] for r in results] == ["did:a", "did:b", "did:a", "did:c"]
+        assert _query_count(mock_zerodb_client) - queries == 3
+
+    @pytest.mark.asyncio
+    async def it_keeps_out_of_band_changes_until_invalidated(self, mock_zerodb_client):
+        """Without a TTL, out-of-band policy changes apply after invalidate_policies()."""
+        from app.services.governance_policy_service import GovernancePolicyService
+
+        svc = GovernancePolicyService(client=mock_zerodb_client, cache_ttl_seconds=None)
+        did = "did:hedera:testnet:external"
+        await svc.evaluate_policy(did, "spend", {"amount_usd": 5.0})
+        mock_zerodb_client.data.setdefault("governance_policies", []).append({
+            "policy_id": "pol_external",
+            "agent_did": did,
+            "policy_type": "spend_limit",
+            "rules": {"per_call_limit_usd": 1.0},
+            "active": True,
+        })
+
+        stale = await svc.evaluate_policy(did, "spend", {"amount_usd": 5.0})
+        svc.invalidate_policies()
+        fresh = await svc.evaluate_policy(did, "spend", {"amount_usd": 5.0})
+
+        assert stale["allowed"] is True
+        assert fresh["violated_policies"] == ["pol_external"]
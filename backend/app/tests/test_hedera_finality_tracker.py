@@ -0,0 +1,197 @@
+"""
+Tests for HederaFinalityTracker and HederaPaymentService.wait_for_settlement.
+
+Covers:
+  - One mirror-node request resolves every pending transaction of a payer
+  - Polling continues until consensus, with failure codes returned as final
+  - Accounts queried per tick are capped
+  - A transaction that never appears does not stop later ones being seen
+  - Timeouts forget the transaction once its last waiter leaves, and surface
+    as HederaSettlementTimeoutError
+
+BDD-style: DescribeX / it_does_something naming convention.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+
+class _FakeMirror:
+    """Mirror node stand-in: transactions become visible after `visible_after` polls."""
+
+    def __init__(self, visible_after: int = 0) -> None:
+        self.visible_after = visible_after
+        self.transactions: Dict[str, List[Dict[str, Any]]] = {}
+        self.calls: List[str] = []
+
+    def add(self, transaction_id: str, result: str = "SUCCESS") -> None:
+        account, _, valid_start = transaction_id.partition("@")
+        seconds, _, nanos = valid_start.partition(".")
+        self.transactions.setdefault(account, []).append({
+            "transaction_id": f"{account}-{seconds}-{nanos}",
+            "status": result,
+            "consensus_timestamp": f"{seconds}.{int(nanos) + 5:09d}",
+            "hash": "0xabc",
+            "charged_tx_fee": 1,
+        })
+
+    async def list_account_transactions(self, account_id, after_timestamp, limit=100):
+        self.calls.append(account_id)
+        if len(self.calls) <= self.visible_after:
+            return {"transactions": []}
+        after = _ts(after_timestamp)
+        newer = sorted(
+            (t for t in self.transactions.get(account_id, []) if _ts(t["consensus_timestamp"]) > after),
+            key=lambda t: _ts(t["consensus_timestamp"]),
+        )
+        return {"transactions": newer[:limit]}
+
+
+def _ts(timestamp: str):
+    seconds, _, nanos = timestamp.partition(".")
+    return int(seconds), int(nanos or 0)
+
+
+def _tracker(mirror, **kwargs):
+    from app.services.hedera_finality_tracker import HederaFinalityTracker
+    kwargs.setdefault("min_interval", 0.001)
+    kwargs.setdefault("max_interval", 0.004)
+    return HederaFinalityTracker(mirror, **kwargs)
+
+
+class DescribeHederaFinalityTracker:
+    """Tests for batched, multiplexed finality polling."""
+
+    @pytest.mark.asyncio
+    async def it_resolves_all_of_a_payers_transactions_with_one_request(self):
+        mirror = _FakeMirror()
+        tx_ids = [f"0.0.500@1700000000.{i:09d}" for i in range(50)]
+        for tx_id in tx_ids:
+            mirror.add(tx_id)
+        tracker = _tracker(mirror)
+
+        receipts = await asyncio.gather(*(tracker.wait(t, timeout=1) for t in tx_ids))
+
+        assert [r["transaction_id"] for r in receipts] == tx_ids
+        assert all(r["status"] == "SUCCESS" for r in receipts)
+        assert tracker.requests_made == 1
+        assert len(tracker) == 0
+
+    @pytest.mark.asyncio
+    async def it_keeps_polling_until_consensus_and_returns_failure_codes(self):
+        mirror = _FakeMirror(visible_after=2)
+        mirror.add("0.0.501@1700000000.000000001", result="INSUFFICIENT_TOKEN_BALANCE")
+        tracker = _tracker(mirror)
+
+        receipt = await tracker.wait("0.0.501@1700000000.000000001", timeout=1)
+
+        assert receipt["status"] == "INSUFFICIENT_TOKEN_BALANCE"
+        assert len(mirror.calls) == 3
+
+    @pytest.mark.asyncio
+    async def it_caps_accounts_queried_per_tick(self):
+        mirror = _FakeMirror()
+        tx_ids = [f"0.0.60{i}@1700000000.000000001" for i in range(3)]
+        for tx_id in tx_ids:
+            mirror.add(tx_id)
+        tracker = _tracker(mirror, max_requests_per_tick=1)
+
+        await asyncio.gather(*(tracker.wait(t, timeout=1) for t in tx_ids))
+
+        assert sorted(mirror.calls) == ["0.0.600", "0.0.601", "0.0.602"]
+
+    @pytest.mark.asyncio
+    async def it_scans_past_a_stuck_transaction_to_newer_ones(self):
+        mirror = _FakeMirror()
+        for i in range(350):
+            mirror.add(f"0.0.900@1700000001.{i:09d}", result="OTHER")
+        mirror.add("0.0.900@1700000002.000000000")
+        tracker = _tracker(mirror, max_pages_per_account=3)
+
+        stuck = asyncio.ensure_future(
+            tracker.wait("0.0.900@1700000000.000000001", timeout=1)
+        )
+        receipt = await tracker.wait("0.0.900@1700000002.000000000", timeout=1)
+        stuck.cancel()
+        await tracker.close()
+        await asyncio.gather(stuck, return_exceptions=True)
+
+        assert receipt["status"] == "SUCCESS"
+        assert tracker.requests_made == 4
+
+    @pytest.mark.asyncio
+    async def it_forgets_a_transaction_that_times_out(self):
+        tracker = _tracker(_FakeMirror())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await tracker.wait("0.0.700@1700000000.000000001", timeout=0.02)
+
+        assert len(tracker) == 0
+
+    @pytest.mark.asyncio
+    async def it_keeps_resolving_for_waiters_with_longer_timeouts(self):
+        mirror = _FakeMirror(visible_after=1_000)
+        tx_id = "0.0.701@1700000000.000000001"
+        mirror.add(tx_id)
+        tracker = _tracker(mirror)
+
+        patient = asyncio.ensure_future(tracker.wait(tx_id, timeout=2))
+        with pytest.raises(asyncio.TimeoutError):
+            await tracker.wait(tx_id, timeout=0.05)
+        mirror.visible_after = 0
+        receipt = await patient
+
+        assert receipt["status"] == "SUCCESS"
+        assert len(tracker) == 0
+
+    @pytest.mark.asyncio
+    async def it_rejects_malformed_transaction_ids(self):
+        tracker = _tracker(_FakeMirror())
+
+        with pytest.raises(ValueError):
+            await tracker.wait("not-a-transaction", timeout=1)
+
+
+class DescribeWaitForSettlement:
+    """Tests for HederaPaymentService.wait_for_settlement."""
+
+    def _service(self, mirror):
+        from app.services.hedera_payment_service import HederaPaymentService
+        service = HederaPaymentService(hedera_client=mirror, zerodb_client=object())
+        service._finality_tracker = _tracker(mirror)
+        return service
+
+    @pytest.mark.asyncio
+    async def it_returns_settled_receipt_from_the_shared_tracker(self):
+        mirror = _FakeMirror()
+        mirror.add("0.0.800@1700000000.000000001")
+        service = self._service(mirror)
+
+        result = await service.wait_for_settlement("0.0.800@1700000000.000000001")
+
+        assert result["settled"] is True
+        assert result["transaction_id"] == "0.0.800@1700000000.000000001"
+        assert result["consensus_timestamp"] == "1700000000.000000006"
+
+    @pytest.mark.asyncio
+    async def it_raises_settlement_timeout_when_consensus_is_not_seen(self):
+        from app.services.hedera_payment_service import HederaSettlementTimeoutError
+        service = self._service(_FakeMirror())
+
+        with pytest.raises(HederaSettlementTimeoutError):
+            await service.wait_for_settlement(
+                "0.0.801@1700000000.000000001", timeout_seconds=0.02
+            )
+
+    @pytest.mark.asyncio
+    async def it_rejects_malformed_transaction_ids_as_bad_requests(self):
+        from app.services.hedera_payment_service import HederaPaymentError
+        service = self._service(_FakeMirror())
+
+        with pytest.raises(HederaPaymentError) as exc_info:
+            await service.wait_for_settlement("bogus")
+
+        assert exc_info.value.status_code == 400
@@ -9,6 +9,7 @@ Coverage targets:
 - publish_agent / get_published_agent / update_listing / unpublish_agent
 - browse_agents / search_agents / get_categories
 - install_agent / list_installed / uninstall_agent
+- catalog index: sorted views, keyset cursors, text index, maintenance
 """
 from __future__ import annotations
 
@@ -555,3 +556,249 @@ class DescribeUninstallAgent:
 
         with pytest.raises(MarketplaceNotFoundError):
             await svc.uninstall_agent(project_id="proj_x", agent_id="ghost")
+
+
+# ---------------------------------------------------------------------------
+# Catalog index — sorted views, keyset pagination, text index
+# ---------------------------------------------------------------------------
+
+
+def _listing_row(i: int, rng) -> Dict[str, Any]:
+    """A raw active listing row with randomized sort fields (ties included)."""
+    return {
+        "marketplace_id": f"mkt_{i:05d}",
+        "agent_id": f"agent_{i}",
+        "publisher_did": "did:hedera:testnet:p1",
+        "agent_config": {"name": f"Bot{i}"},
+        "pricing": {"price_per_call": rng.choice([0.01, 0.05, 0.1, 1.0])},
+        "category": rng.choice(["finance", "analytics", "other"]),
+        "description": rng.choice(["payment processing", "weather forecasts", "ledger audits"]),
+        "tags": rng.sample(["defi", "hedera", "reports", "alerts"], 2),
+        "reputation_score": float(rng.randint(0, 5)),
+        "install_count": rng.randint(0, 3),
+        "active": True,
+        "created_at": f"2026-01-{rng.randint(1, 28):02d}T00:00:00+00:00",
+        "updated_at": "2026-01-01T00:00:00+00:00",
+    }
+
+
+_REFERENCE_SORTS = {
+    "newest": (lambda r: r["created_at"], True),
+    "oldest": (lambda r: r["created_at"], False),
+    "highest_rated": (lambda r: r["reputation_score"], True),
+    "lowest_price": (lambda r: r["pricing"]["price_per_call"], False),
+    "highest_price": (lambda r: r["pricing"]["price_per_call"], True),
+    "most_installed": (lambda r: r["install_count"], True),
+}
+
+
+def _reference_order(rows, sort_by, category=None):
+    """The pre-index behaviour: filter, then a stable Python sort."""
+    rows = [r for r in rows if category is None or r["category"] == category]
+    key, reverse = _REFERENCE_SORTS[sort_by]
+    return [r["marketplace_id"] for r in sorted(rows, key=key, reverse=reverse)]
+
+
+async def _walk_cursor(fetch):
+    ids, cursor = [], None
+    while True:
+        page = await fetch(cursor)
+        ids.extend(a["marketplace_id"] for a in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+class DescribeMarketplaceCatalogIndex:
+    """Browse/search served from the in-memory catalog index."""
+
+    @pytest.mark.asyncio
+    async def it_matches_a_full_sort_for_every_key_and_category(self, mock_zerodb_client):
+        """Offset and cursor pages reproduce the stable sort of all rows."""
+        import random
+
+        from app.services.marketplace_service import MarketplaceService
+
+        rng = random.Random(7)
+        rows = [_listing_row(i, rng) for i in range(120)]
+        mock_zerodb_client.data["marketplace_listings"] = [dict(r) for r in rows]
+        svc = MarketplaceService(client=mock_zerodb_client)
+
+        for sort_by in _REFERENCE_SORTS:
+            for category in (None, "finance"):
+                expected = _reference_order(rows, sort_by, category)
+                by_offset = await svc.browse_agents(category, sort_by, limit=25, offset=50)
+                by_cursor = await _walk_cursor(
+                    lambda c: svc.browse_agents(category, sort_by, limit=17, cursor=c)
+                )
+
+                assert by_offset["total"] == len(expected)
+                assert [a["marketplace_id"] for a in by_offset["items"]] == expected[50:75]
+                assert by_cursor == expected
+
+    @pytest.mark.asyncio
+    async def it_loads_past_ten_thousand_listings(self, mock_zerodb_client):
+        """The index pages through ZeroDB instead of capping at 10k rows."""
+        from app.services.marketplace_service import MarketplaceService
+
+        mock_zerodb_client.data["marketplace_listings"] = [
+            {
+                "marketplace_id": f"mkt_{i:05d}",
+                "active": True,
+                "category": "other",
+                "install_count": i,
+                "created_at": "2026-01-01T00:00:00+00:00",
+            }
+            for i in range(10_050)
+        ]
+        svc = MarketplaceService(client=mock_zerodb_client)
+
+        result = await svc.browse_agents(None, "most_installed", limit=3, offset=0)
+
+        assert result["total"] == 10_050
+        assert [a["install_count"] for a in result["items"]] == [10_049, 10_048, 10_047]
+
+    @pytest.mark.asyncio
+    async def it_keeps_views_current_on_update_install_and_unpublish(self, mock_zerodb_client):
+        """Service writes move listings within the index without a reload."""
+        from app.services.marketplace_service import MarketplaceService
+
+        svc = MarketplaceService(client=mock_zerodb_client)
+        cheap = await svc.publish_agent(
+            agent_config={"name": "Cheap"}, publisher_did="did:p", pricing={"price_per_call": 0.01}
+        )
+        await svc.browse_agents(None, "newest", limit=10)  # builds the index
+        pricey = await svc.publish_agent(
+            agent_config={"name": "Pricey"},
+            publisher_did="did:p",
+            pricing={"price_per_call": 0.5},
+            category="finance",
+        )
+        history_len = len(mock_zerodb_client.call_history)
+
+        await svc.update_listing(cheap["marketplace_id"], {"pricing": {"price_per_call": 2.0}})
+        await svc.install_agent("proj_1", pricey["marketplace_id"])
+        by_price = await svc.browse_agents(None, "highest_price", limit=10)
+        by_installs = await svc.browse_agents(None, "most_installed", limit=10)
+        await svc.unpublish_agent(cheap["marketplace_id"])
+        after_unpublish = await svc.browse_agents(None, "newest", limit=10)
+
+        assert [a["marketplace_id"] for a in by_price["items"]] == [
+            cheap["marketplace_id"],
+            pricey["marketplace_id"],
+        ]
+        assert by_installs["items"][0]["install_count"] == 1
+        assert [a["marketplace_id"] for a in after_unpublish["items"]] == [
+            pricey["marketplace_id"]
+        ]
+        # Only the point lookups in update/install/unpublish hit ZeroDB
+        browse_queries = [
+            c for c in mock_zerodb_client.call_history[history_len:]
+            if c["method"] == "query_rows" and c["limit"] != 1
+        ]
+        assert browse_queries == []
+
+    @pytest.mark.asyncio
+    async def it_keeps_writes_made_while_the_index_is_loading(self, mock_zerodb_client):
+        """Publishing and unpublishing during the first build reach the built index."""
+        import asyncio
+
+        from app.services.marketplace_service import MarketplaceService
+
+        svc = MarketplaceService(client=mock_zerodb_client)
+        stale = await svc.publish_agent(
+            agent_config={"name": "Stale"}, publisher_did="did:p", pricing={}
+        )
+        load_listings = svc._load_active_listings
+        loaded = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_load():
+            rows = await load_listings()
+            loaded.set()
+            await release.wait()
+            return rows
+
+        svc._load_active_listings = slow_load
+        first_browse = asyncio.ensure_future(svc.browse_agents(None, "newest", limit=10))
+        await loaded.wait()
+        fresh = await svc.publish_agent(
+            agent_config={"name": "Fresh"}, publisher_did="did:p", pricing={}
+        )
+        await svc.unpublish_agent(stale["marketplace_id"])
+        release.set()
+        await first_browse
+        after = await svc.browse_agents(None, "newest", limit=10)
+
+        assert [a["marketplace_id"] for a in after["items"]] == [fresh["marketplace_id"]]
+        assert after["total"] == 1
+
+    @pytest.mark.asyncio
+    async def it_searches_tags_and_substrings_through_the_text_index(self, mock_zerodb_client):
+        """Search matches name, description and tags by substring, with filters."""
+        import random
+
+        from app.services.marketplace_service import MarketplaceService
+
+        rng = random.Random(3)
+        rows = [_listing_row(i, rng) for i in range(60)]
+        mock_zerodb_client.data["marketplace_listings"] = [dict(r) for r in rows]
+        svc = MarketplaceService(client=mock_zerodb_client)
+
+        def expected(query, min_rep=0.0):
+            return [
+                r["marketplace_id"]
+                for r in rows
+                if any(query in f.lower() for f in (r["agent_config"]["name"], r["description"], *r["tags"]))
+                and r["reputation_score"] >= min_rep
+            ]
+
+        by_tag = await svc.search_agents(query="hede", filters={})
+        by_phrase = await svc.search_agents(query="ment proc", filters={"min_reputation": 3.0})
+        none = await svc.search_agents(query="nothing-like-this", filters={})
+
+        assert [a["marketplace_id"] for a in by_tag["items"]] == expected("hede")
+        assert [a["marketplace_id"] for a in by_phrase["items"]] == expected("ment proc", 3.0)
+        assert by_phrase["total"] == len(expected("ment proc", 3.0))
+        assert none["items"] == [] and none["total"] == 0
+
+    @pytest.mark.asyncio
+    async def it_pages_sorted_search_results_with_a_cursor(self, mock_zerodb_client):
+        """search_agents supports sort_by/limit/cursor over the matches."""
+        import random
+
+        from app.services.marketplace_service import MarketplaceService
+
+        rng = random.Random(5)
+        rows = [_listing_row(i, rng) for i in range(80)]
+        mock_zerodb_client.data["marketplace_listings"] = [dict(r) for r in rows]
+        svc = MarketplaceService(client=mock_zerodb_client)
+        matching = [r for r in rows if "audit" in r["description"]]
+
+        walked = await _walk_cursor(
+            lambda c: svc.search_agents(
+                query="audit", filters={}, sort_by="highest_rated", limit=6, cursor=c
+            )
+        )
+
+        assert walked == _reference_order(matching, "highest_rated")
+
+    @pytest.mark.asyncio
+    async def it_rejects_cursors_from_another_sort(self, mock_zerodb_client):
+        """A cursor is bound to the sort it was issued for."""
+        from app.services.marketplace_service import (
+            MarketplaceCursorError,
+            MarketplaceService,
+        )
+
+        svc = MarketplaceService(client=mock_zerodb_client)
+        for i in range(3):
+            await svc.publish_agent(
+                agent_config={"name": f"Bot{i}"}, publisher_did="did:p", pricing={"price_per_call": 0.1}
+            )
+        page = await svc.browse_agents(None, "newest", limit=1)
+
+        with pytest.raises(MarketplaceCursorError):
+            await svc.browse_agents(None, "lowest_price", limit=1, cursor=page["next_cursor"])
+        with pytest.raises(MarketplaceCursorError):
+            await svc.browse_agents(None, "newest", limit=1, cursor="not-a-cursor")
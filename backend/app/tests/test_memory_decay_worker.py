@@ -7,6 +7,9 @@ Covers:
   - Decay cycle results aggregated per project
   - Auto-promotion rules across the memory tier hierarchy
   - LRU eviction with tier-protection rules
+  - Vectorized page scoring, paged ZeroDB cycles with changed-only
+    write-back, and the incremental project scheduler
+  - Incremental per-entity eviction heap, inline caps on write
 
 BDD-style: DescribeX / it_does_something naming convention.
 """
@@ -417,6 +420,272 @@ class DescribeEnforceMemoryLimits:
             assert isinstance(eid, str)
 
 
+# ---------------------------------------------------------------------------
+# Vectorized, storage-backed decay
+# ---------------------------------------------------------------------------
+
+class _FakeZeroDB:
+    """query_rows/update_row over a list, recording calls."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = [{"id": f"row_{r['memory_id']}", **r} for r in rows]
+        self.queries: List[Dict[str, Any]] = []
+        self.updates: Dict[str, Dict[str, Any]] = {}
+        self.deleted: List[str] = []
+
+    async def query_rows(self, table, filter, limit=100, skip=0):
+        self.queries.append({"table": table, "filter": filter, "limit": limit, "skip": skip})
+        matching = [
+            r for r in self.rows
+            if all(r.get(k) == v for k, v in filter.items())
+        ]
+        return {"rows": matching[skip:skip + limit], "total": len(matching)}
+
+    async def update_row(self, table, row_id, row_data):
+        self.updates[row_id] = row_data
+        return {"row_id": row_id, "row_data": row_data}
+
+    async def delete_row(self, table, row_id):
+        self.deleted.append(row_id)
+        return {"row_id": row_id}
+
+
+def _project_memories(count: int) -> List[Dict[str, Any]]:
+    import random
+    rng = random.Random(5)
+    now = datetime.now(timezone.utc)
+    tiers = ["working", "episodic", "semantic", "core"]
+    memories = []
+    for i in range(count):
+        memory = _make_memory(
+            f"m{i}", rng.choice(tiers), rng.uniform(0.01, 1.0),
+            created_at=now - timedelta(days=rng.uniform(0, 200)),
+            recent_accesses=[
+                now - timedelta(days=rng.uniform(0, 14))
+                for _ in range(rng.randint(0, 4))
+            ],
+        )
+        memory["project_id"] = "proj_vec"
+        memories.append(memory)
+    return memories
+
+
+class DescribeVectorizedDecay:
+    """compute_importance_scores matches calculate_importance."""
+
+    @pytest.mark.asyncio
+    async def it_matches_the_per_memory_calculation(self, decay_worker):
+        from app.services.memory_decay_worker import compute_importance_scores
+        memories = _project_memories(300)
+        memories.append({"memory_id": "bare"})  # defaults: working, 1.0, no dates
+
+        scores = compute_importance_scores(memories)
+
+        for memory, score in zip(memories, scores):
+            expected = await decay_worker.calculate_importance(memory)
+            assert abs(score - expected) < 1e-6
+
+    def it_returns_an_empty_array_for_an_empty_page(self):
+        from app.services.memory_decay_worker import compute_importance_scores
+        assert compute_importance_scores([]).shape == (0,)
+
+
+class DescribeStoreBackedDecayCycle:
+    """run_decay_cycle over a paged ZeroDB store."""
+
+    @pytest.mark.asyncio
+    async def it_pages_through_the_project_and_writes_every_new_score(self):
+        from app.services.memory_decay_worker import (
+            EVICTION_THRESHOLD, MemoryDecayWorker, ZeroDBMemoryStore,
+        )
+        client = _FakeZeroDB(_project_memories(250))
+        worker = MemoryDecayWorker(store=ZeroDBMemoryStore(client=client), page_size=100)
+
+        result = await worker.run_decay_cycle("proj_vec")
+
+        assert [q["skip"] for q in client.queries] == [0, 100, 200]
+        assert result.total_processed == 250
+        assert len(client.updates) == 250
+        flagged = [u for u in client.updates.values() if u["marked_for_eviction"]]
+        assert len(flagged) == result.flagged_for_eviction
+        assert all(u["importance"] < EVICTION_THRESHOLD for u in flagged)
+        assert all("id" not in u for u in client.updates.values())
+
+    @pytest.mark.asyncio
+    async def it_skips_rows_whose_score_has_not_changed(self):
+        from app.services.memory_decay_worker import MemoryDecayWorker, ZeroDBMemoryStore
+        client = _FakeZeroDB(_project_memories(50))
+        worker = MemoryDecayWorker(store=ZeroDBMemoryStore(client=client))
+        await worker.run_decay_cycle("proj_vec")
+        client.rows = [{"id": row_id, **data} for row_id, data in client.updates.items()]
+        client.updates.clear()
+
+        await worker.run_decay_cycle("proj_vec")
+
+        assert client.updates == {}
+
+    @pytest.mark.asyncio
+    async def it_fetches_an_entity_through_the_store(self):
+        from app.services.memory_decay_worker import MemoryDecayWorker, ZeroDBMemoryStore
+        client = _FakeZeroDB(_project_memories(10))
+        worker = MemoryDecayWorker(store=ZeroDBMemoryStore(client=client))
+
+        memories = await worker._fetch_memories("proj_vec", entity_id="entity_001")
+
+        assert len(memories) == 10
+        assert client.queries[0]["filter"] == {"project_id": "proj_vec", "entity_id": "entity_001"}
+
+
+class DescribeMemoryDecayScheduler:
+    """Projects are decayed as they fall due, a bounded number per tick."""
+
+    @pytest.mark.asyncio
+    async def it_runs_due_projects_up_to_the_tick_limit(self, decay_worker):
+        from app.services.memory_decay_worker import MemoryDecayScheduler
+        decay_worker._fetch_memories = AsyncMock(return_value=[])
+        scheduler = MemoryDecayScheduler(decay_worker, interval_seconds=3600, max_projects_per_tick=2)
+        for project_id in ("p1", "p2", "p3"):
+            scheduler.schedule(project_id)
+        scheduler.schedule("p_later", delay_seconds=60)
+        scheduler.unschedule("p2")
+
+        first = await scheduler.run_due()
+        second = await scheduler.run_due()
+
+        assert [r.project_id for r in first] == ["p1", "p3"]
+        assert second == []
+        assert set(scheduler.scheduled_projects) == {"p1", "p3", "p_later"}
+        assert set(scheduler.last_results) == {"p1", "p3"}
+
+
+class DescribeEntityEvictionIndex:
+    """Heap-based eviction matches the full sort and tracks updates."""
+
+    @pytest.mark.asyncio
+    async def it_evicts_the_same_memories_as_a_full_sort(self, decay_worker):
+        from app.services.memory_decay_worker import _TIER_EVICTION_PRIORITY
+        import random
+        rng = random.Random(3)
+        now = datetime.now(timezone.utc)
+        memories = [
+            _make_memory(
+                f"mem_{i}", rng.choice(["working", "episodic", "semantic", "core"]), 0.5,
+                created_at=now - timedelta(days=30),
+                last_accessed=now - timedelta(days=rng.randint(0, 20)),
+            )
+            for i in range(200)
+        ]
+        evictable = sorted(
+            (m for m in memories if m["tier"] != "core"),
+            key=lambda m: (_TIER_EVICTION_PRIORITY[m["tier"]], m["last_accessed"]),
+        )
+
+        evicted = await decay_worker.enforce_memory_limits(
+            "proj_001", "entity_001", memories=memories, max_memories=120
+        )
+
+        assert evicted == [m["memory_id"] for m in evictable[:80]]
+
+    @pytest.mark.asyncio
+    async def it_enforces_the_cap_inline_and_respects_recent_access(self, decay_worker):
+        decay_worker._evict_memory = AsyncMock()
+        now = datetime.now(timezone.utc)
+        for i in range(3):
+            await decay_worker.record_memory(
+                "proj_001", "entity_001",
+                _make_memory(f"mem_{i}", "working", 0.5, created_at=now,
+                             last_accessed=now - timedelta(days=10 - i)),
+                max_memories=3,
+            )
+        decay_worker.record_access("proj_001", "entity_001", "mem_0", accessed_at=now)
+
+        evicted = await decay_worker.record_memory(
+            "proj_001", "entity_001",
+            _make_memory("mem_3", "working", 0.5, created_at=now, last_accessed=now),
+            max_memories=3,
+        )
+
+        assert evicted == ["mem_1"]
+        decay_worker._evict_memory.assert_awaited_once_with("mem_1")
+
+    @pytest.mark.asyncio
+    async def it_reuses_the_tracked_index_and_deletes_in_one_batch(self):
+        from app.services.memory_decay_worker import MemoryDecayWorker, ZeroDBMemoryStore
+        client = _FakeZeroDB(_project_memories(20))
+        worker = MemoryDecayWorker(store=ZeroDBMemoryStore(client=client))
+
+        first = await worker.enforce_memory_limits("proj_vec", "entity_001", max_memories=15)
+        second = await worker.enforce_memory_limits("proj_vec", "entity_001", max_memories=12)
+
+        assert len(client.queries) == 1
+        assert len(first) + len(second) == len(client.deleted) == 8
+        assert client.deleted == [f"row_{mid}" for mid in first + second]
+
+    @pytest.mark.asyncio
+    async def it_counts_stored_memories_when_recording_for_an_untracked_entity(self):
+        from app.services.memory_decay_worker import MemoryDecayWorker, ZeroDBMemoryStore
+        client = _FakeZeroDB(_project_memories(11))
+        worker = MemoryDecayWorker(store=ZeroDBMemoryStore(client=client))
+        new_memory = _make_memory(
+            "mem_new", "working", 0.5, created_at=datetime.now(timezone.utc)
+        )
+
+        recorded = await worker.record_memory(
+            "proj_vec", "entity_001", new_memory, max_memories=5
+        )
+        enforced = await worker.enforce_memory_limits("proj_vec", "entity_001", max_memories=5)
+
+        assert len(recorded) == 7
+        assert enforced == []
+        assert len(client.deleted) == 7
+
+    @pytest.mark.asyncio
+    async def it_rebuilds_an_expired_index_from_storage(self):
+        from app.services.memory_decay_worker import MemoryDecayWorker, ZeroDBMemoryStore
+        client = _FakeZeroDB(_project_memories(20))
+        worker = MemoryDecayWorker(store=ZeroDBMemoryStore(client=client), index_ttl_seconds=0)
+
+        await worker.enforce_memory_limits("proj_vec", "entity_001", max_memories=15)
+        await worker.enforce_memory_limits("proj_vec", "entity_001", max_memories=15)
+
+        assert len(client.queries) == 2
+
+    @pytest.mark.asyncio
+    async def it_keeps_indexes_only_for_recently_used_entities(self):
+        from app.services.memory_decay_worker import MemoryDecayWorker
+        worker = MemoryDecayWorker(max_tracked_entities=2)
+        now = datetime.now(timezone.utc)
+        for entity in ("e1", "e2", "e3"):
+            await worker.record_memory(
+                "proj_001", entity, _make_memory(f"mem_{entity}", "working", 0.5, created_at=now)
+            )
+            worker.record_access("proj_001", "e1", "mem_e1")
+
+        assert set(worker._eviction_indexes) == {("proj_001", "e1"), ("proj_001", "e3")}
+
+    @pytest.mark.asyncio
+    async def it_puts_victims_back_when_the_delete_fails(self, decay_worker):
+        now = datetime.now(timezone.utc)
+        memories = [
+            _make_memory(f"mem_{i}", "working", 0.5, created_at=now,
+                         last_accessed=now - timedelta(days=10 - i))
+            for i in range(3)
+        ]
+        decay_worker._evict_memory = AsyncMock(side_effect=RuntimeError("db down"))
+        with pytest.raises(RuntimeError):
+            await decay_worker.enforce_memory_limits(
+                "proj_001", "entity_001", memories=memories, max_memories=2
+            )
+
+        decay_worker._evict_memory = AsyncMock()
+        evicted = await decay_worker.enforce_memory_limits(
+            "proj_001", "entity_001", max_memories=2
+        )
+
+        assert evicted == ["mem_0"]
+        decay_worker._evict_memory.assert_awaited_once_with("mem_0")
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
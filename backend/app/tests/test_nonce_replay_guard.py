@@ -312,6 +312,104 @@ class DescribeCleanupExpiredNonces:
         assert count == 0
 
 
+# ---------------------------------------------------------------------------
+# DescribeInMemoryNonceWindow
+# ---------------------------------------------------------------------------
+
+
+class DescribeInMemoryNonceWindow:
+    """Describe the time-bucketed nonce window and write-behind persistence."""
+
+    @pytest.mark.asyncio
+    async def it_rejects_replay_from_memory_without_querying_zerodb(self):
+        """After warm-up, a recorded nonce is rejected without a ZeroDB lookup."""
+        from app.services.nonce_replay_guard import ReplayAttackError
+
+        mock_client = AsyncMock()
+        mock_client.query_rows = AsyncMock(return_value={"rows": []})
+        guard = _make_guard(zerodb_client=mock_client)
+        await guard.start()
+        try:
+            mock_client.query_rows.reset_mock()
+            nonce, ts, did = _fresh_nonce(), _now_ts(), "did:hedera:testnet:agent-1"
+
+            await guard.validate_request(nonce=nonce, timestamp=ts, did=did)
+            await guard.record_nonce(nonce=nonce, did=did, timestamp=ts)
+
+            with pytest.raises(ReplayAttackError):
+                await guard.validate_request(nonce=nonce, timestamp=ts, did=did)
+            mock_client.query_rows.assert_not_called()
+        finally:
+            await guard.stop()
+
+    @pytest.mark.asyncio
+    async def it_warms_window_from_recent_zerodb_nonces(self):
+        """Nonces already persisted in ZeroDB are rejected after start()."""
+        from app.services.nonce_replay_guard import ReplayAttackError
+
+        nonce, ts, did = _fresh_nonce(), _now_ts(), "did:hedera:testnet:agent-1"
+        mock_client = AsyncMock()
+        mock_client.query_rows = AsyncMock(
+            return_value={"rows": [{"nonce": nonce, "did": did, "timestamp": ts}]}
+        )
+        guard = _make_guard(zerodb_client=mock_client)
+        await guard.start()
+        try:
+            with pytest.raises(ReplayAttackError):
+                await guard.validate_request(nonce=nonce, timestamp=ts, did=did)
+        finally:
+            await guard.stop()
+
+    @pytest.mark.asyncio
+    async def it_batches_inserts_and_flushes_on_stop(self):
+        """Recorded nonces are written with one insert_rows call on stop()."""
+        mock_client = AsyncMock()
+        mock_client.query_rows = AsyncMock(return_value={"rows": []})
+        mock_client.insert_rows = AsyncMock(return_value={"success": True})
+        guard = _make_guard(zerodb_client=mock_client)
+        await guard.start()
+
+        for _ in range(3):
+            await guard.record_nonce(
+                nonce=_fresh_nonce(), did="did:hedera:testnet:agent-1", timestamp=_now_ts()
+            )
+        await guard.stop()
+
+        mock_client.insert_row.assert_not_called()
+        mock_client.insert_rows.assert_called_once()
+        table, batch = mock_client.insert_rows.call_args[0]
+        assert table == "x402_nonces"
+        assert len(batch) == 3
+
+    @pytest.mark.asyncio
+    async def it_requeues_batch_when_insert_fails(self):
+        """A failed flush keeps the nonces pending for the next attempt."""
+        mock_client = AsyncMock()
+        mock_client.insert_rows = AsyncMock(side_effect=RuntimeError("down"))
+        guard = _make_guard(zerodb_client=mock_client)
+        guard._flush_task = MagicMock()  # simulate a started guard
+
+        await guard.record_nonce(
+            nonce=_fresh_nonce(), did="did:hedera:testnet:agent-1", timestamp=_now_ts()
+        )
+
+        assert await guard.flush() == 0
+        assert len(guard._pending) == 1
+
+    def it_drops_whole_buckets_once_outside_the_window(self):
+        """Entries expire bucket by bucket once their timestamps are stale."""
+        from app.services.nonce_replay_guard import _NonceWindow
+
+        window = _NonceWindow(bucket_seconds=30, retention_seconds=300)
+        window.add("did:a", "n-old", epoch_seconds=1000.0)
+        window.add("did:a", "n-new", epoch_seconds=1200.0)
+
+        assert window.expire(now=1250.0) == 0
+        assert window.expire(now=1331.0) == 1
+        assert not window.contains("did:a", "n-old")
+        assert window.contains("did:a", "n-new")
+
+
 # ---------------------------------------------------------------------------
 # DescribeNonceMiddleware
 # ---------------------------------------------------------------------------
@@ -495,3 +593,36 @@ class DescribeNonceMiddleware:
 
         mock_guard.validate_request.assert_not_called()
         mock_call_next.assert_called_once()
+
+
+class DescribeNonceReplayGuardLifecycle:
+    """Specification: app startup runs the guard only when NonceMiddleware is mounted."""
+
+    @pytest.mark.asyncio
+    async def it_skips_the_guard_when_nonce_middleware_is_not_mounted(self):
+        from app import main
+
+        guard = MagicMock(start=AsyncMock(), stop=AsyncMock())
+        with patch.object(main.app, "user_middleware", []), \
+             patch("app.services.nonce_replay_guard.get_nonce_replay_guard", return_value=guard):
+            await main.start_nonce_replay_guard()
+            await main.stop_nonce_replay_guard()
+
+        guard.start.assert_not_awaited()
+        guard.stop.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def it_starts_and_stops_the_guard_when_nonce_middleware_is_mounted(self):
+        from starlette.middleware import Middleware
+
+        from app import main
+        from app.middleware.nonce_middleware import NonceMiddleware
+
+        guard = MagicMock(start=AsyncMock(), stop=AsyncMock())
+        with patch.object(main.app, "user_middleware", [Middleware(NonceMiddleware)]), \
+             patch("app.services.nonce_replay_guard.get_nonce_replay_guard", return_value=guard):
+            await main.start_nonce_replay_guard()
+            await main.stop_nonce_replay_guard()
+
+        guard.start.assert_awaited_once()
+        guard.stop.assert_awaited_once()
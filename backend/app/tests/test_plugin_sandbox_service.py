@@ -234,3 +234,156 @@ class DescribePluginSandboxServiceCheckPermissions:
                 plugin_id="plugin_ghost",
                 requested_permission="network:read",
             )
+
+
+class DescribePluginSandboxServiceProcessIsolation:
+    """Specification: tool execution in warm worker processes."""
+
+    @pytest.fixture
+    def registry_service(self, mock_zerodb_client):
+        from app.services.plugin_registry_service import PluginRegistryService
+        return PluginRegistryService(client=mock_zerodb_client)
+
+    @pytest.fixture
+    def sandbox(self, registry_service):
+        from app.services.plugin_sandbox_service import PluginSandboxService
+        return PluginSandboxService(
+            registry=registry_service,
+            isolation="process",
+            max_workers=2,
+            memory_limit_mb=1024,
+            preload_modules=["app.tests.fixtures.echo_tool_handler"],
+        )
+
+    async def _register(self, registry_service, **handlers):
+        reg = await registry_service.register_plugin({
+            "name": "process-tools",
+            "version": "1.0.0",
+            "description": "Tools for process isolation tests",
+            "author": "test@example.com",
+            "tools": [
+                {
+                    "name": name,
+                    "description": name,
+                    "input_schema": {"type": "object", "properties": {}},
+                    "handler_module": f"app.tests.fixtures.{module}",
+                }
+                for name, module in handlers.items()
+            ],
+            "capabilities_required": [],
+            "permissions": [],
+        })
+        return reg["plugin_id"]
+
+    def it_rejects_unknown_isolation_modes(self, registry_service):
+        from app.services.plugin_sandbox_service import PluginSandboxService
+        with pytest.raises(ValueError):
+            PluginSandboxService(registry=registry_service, isolation="thread")
+
+    @pytest.mark.asyncio
+    async def it_returns_outputs_and_handler_errors_from_workers(
+        self, sandbox, registry_service
+    ):
+        """Results and handler exceptions cross the process boundary."""
+        plugin_id = await self._register(
+            registry_service, echo="echo_tool_handler", bad_op="error_tool_handler"
+        )
+        try:
+            ok = await sandbox.execute_tool(plugin_id, "echo", {"message": "hi"}, timeout_seconds=10)
+            failed = await sandbox.execute_tool(plugin_id, "bad_op", {}, timeout_seconds=10)
+        finally:
+            await sandbox.close()
+
+        assert ok == {"success": True, "output": {"echo": "hi"}}
+        assert failed["success"] is False
+        assert "intentional handler failure" in failed["error"]
+
+    @pytest.mark.asyncio
+    async def it_preempts_blocking_handlers_and_replaces_the_worker(
+        self, sandbox, registry_service
+    ):
+        """A handler that blocks past its deadline is killed; the pool keeps serving."""
+        import os
+
+        from app.services.plugin_sandbox_service import ToolTimeoutError
+
+        plugin_id = await self._register(registry_service, block="blocking_tool_handler")
+        try:
+            await sandbox.start()
+            with pytest.raises(ToolTimeoutError):
+                await sandbox.execute_tool(plugin_id, "block", {"seconds": 60}, timeout_seconds=0.5)
+            after = await sandbox.execute_tool(plugin_id, "block", {}, timeout_seconds=10)
+        finally:
+            await sandbox.close()
+
+        assert after["success"] is True
+        assert after["output"]["pid"] != os.getpid()
+
+    @pytest.mark.asyncio
+    async def it_runs_blocking_handlers_in_parallel_without_stalling_the_loop(
+        self, sandbox, registry_service
+    ):
+        """Two blocking calls run in separate workers while the event loop stays free."""
+        import asyncio
+
+        plugin_id = await self._register(registry_service, block="blocking_tool_handler")
+        try:
+            await sandbox.start()
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.05)
+                    ticks += 1
+
+            ticking = asyncio.create_task(ticker())
+            results = await asyncio.gather(*(
+                sandbox.execute_tool(plugin_id, "block", {"seconds": 0.6}, timeout_seconds=10)
+                for _ in range(2)
+            ))
+            ticking.cancel()
+        finally:
+            await sandbox.close()
+
+        # Loose bounds: wall-clock timing is not reliable under a loaded suite
+        assert ticks >= 1
+        assert len({r["output"]["pid"] for r in results}) == 2
+
+    @pytest.mark.asyncio
+    async def it_stops_workers_that_return_after_close(self, sandbox, registry_service):
+        """A call in flight during close() finishes; its worker is stopped, not requeued."""
+        import asyncio
+
+        plugin_id = await self._register(registry_service, block="blocking_tool_handler")
+        await sandbox.start()
+        call = asyncio.create_task(
+            sandbox.execute_tool(plugin_id, "block", {"seconds": 0.3}, timeout_seconds=10)
+        )
+        await asyncio.sleep(0.1)
+        await sandbox.close()
+        result = await call
+
+        assert result["success"] is True
+        after = await sandbox.execute_tool(plugin_id, "block", {}, timeout_seconds=10)
+        await sandbox.close()
+        assert after["success"] is True
+
+    @pytest.mark.asyncio
+    async def it_enforces_a_per_call_cpu_budget(self, sandbox, registry_service):
+        """A CPU-bound handler over its CPU budget times out before the wall clock."""
+        from app.services.plugin_sandbox_service import ToolTimeoutError
+
+        plugin_id = await self._register(
+            registry_service, spin="cpu_bound_tool_handler", echo="echo_tool_handler"
+        )
+        try:
+            with pytest.raises(ToolTimeoutError, match="CPU time limit"):
+                await sandbox.execute_tool(
+                    plugin_id, "spin", {}, timeout_seconds=30, cpu_seconds=1
+                )
+            after = await sandbox.execute_tool(plugin_id, "echo", {"message": "ok"}, timeout_seconds=10)
+        finally:
+            await sandbox.close()
+
+        assert after["success"] is True
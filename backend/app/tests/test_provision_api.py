@@ -204,6 +204,52 @@ class TestCreateKey:
         assert resp.json()["key_name"] == "default"
 
 
+# ---------------------------------------------------------------------------
+# POST /v1/public/keys/revoke
+# ---------------------------------------------------------------------------
+
+class TestRevokeKey:
+    def test_revoke_key_requires_auth(self):
+        resp = client.post("/v1/public/keys/revoke", json={"api_key": "a402_x"})
+        assert resp.status_code == 401
+
+    def test_revoke_key_scoped_to_caller(self):
+        with patch(
+            "app.api.provision.get_provision_service"
+        ) as mock_get_svc:
+            svc = MagicMock()
+            svc.revoke_key = AsyncMock(return_value=True)
+            mock_get_svc.return_value = svc
+
+            from app.core.config import settings
+            resp = client.post(
+                "/v1/public/keys/revoke",
+                json={"api_key": "a402_oldkey"},
+                headers={"X-API-Key": settings.demo_api_key_1},
+            )
+
+        assert resp.status_code == 200
+        assert resp.json() == {"revoked": True}
+        svc.revoke_key.assert_awaited_once_with("a402_oldkey", user_id="user_1")
+
+    def test_revoke_unknown_key_returns_404(self):
+        with patch(
+            "app.api.provision.get_provision_service"
+        ) as mock_get_svc:
+            svc = MagicMock()
+            svc.revoke_key = AsyncMock(return_value=False)
+            mock_get_svc.return_value = svc
+
+            from app.core.config import settings
+            resp = client.post(
+                "/v1/public/keys/revoke",
+                json={"api_key": "a402_unknown"},
+                headers={"X-API-Key": settings.demo_api_key_1},
+            )
+
+        assert resp.status_code == 404
+
+
 # ---------------------------------------------------------------------------
 # ProvisionService unit tests (no HTTP layer)
 # ---------------------------------------------------------------------------
@@ -253,3 +299,50 @@ class TestProvisionService:
         uid2 = svc._user_id_from_wallet("0xabc")  # case-insensitive
         assert uid1 == uid2
         assert uid1.startswith("wa_")
+
+
+class TestDynamicKeyCache:
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        from app.core.credential_cache import get_credential_cache
+        get_credential_cache().clear()
+        yield
+        get_credential_cache().clear()
+
+    @staticmethod
+    def _service(rows):
+        from app.services.provision_service import ProvisionService
+        zerodb = MagicMock()
+        zerodb.query_rows = AsyncMock(return_value={"data": rows})
+        zerodb.update_row = AsyncMock(return_value={"success": True})
+        return ProvisionService(client=zerodb), zerodb
+
+    @pytest.mark.asyncio
+    async def test_validate_dynamic_key_queries_zerodb_once(self):
+        svc, zerodb = self._service(
+            [{"id": "r1", "row_data": {"api_key": "a402_k", "user_id": "u1"}}]
+        )
+        assert await svc.validate_dynamic_key("a402_k") == "u1"
+        assert await svc.validate_dynamic_key("a402_k") == "u1"
+        assert zerodb.query_rows.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_revoke_key_evicts_cached_resolution(self):
+        row = {"id": "r1", "row_data": {"api_key": "a402_k", "user_id": "u1"}}
+        svc, zerodb = self._service([row])
+        assert await svc.validate_dynamic_key("a402_k") == "u1"
+
+        assert await svc.revoke_key("a402_k", user_id="u1") is True
+        zerodb.update_row.assert_awaited_once()
+        assert zerodb.update_row.call_args[0][2]["is_active"] is False
+
+        zerodb.query_rows.return_value = {"data": []}
+        assert await svc.validate_dynamic_key("a402_k") is None
+
+    @pytest.mark.asyncio
+    async def test_revoke_key_rejects_other_users_key(self):
+        svc, zerodb = self._service(
+            [{"id": "r1", "row_data": {"api_key": "a402_k", "user_id": "u1"}}]
+        )
+        assert await svc.revoke_key("a402_k", user_id="someone_else") is False
+        zerodb.update_row.assert_not_called()
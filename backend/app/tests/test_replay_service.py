@@ -0,0 +1,167 @@
+"""
+Tests for ReplayService run indexes and record timeline merging.
+
+Test Coverage:
+- Runs are listed newest first from the per-project index
+- Project stats report the latest run without sorting
+- Re-adding a run moves it within its project index
+- Record families stay in timestamp order as records are added
+- Merged timeline matches a full sort of all three families
+- Async streaming fetches families concurrently and yields lazily
+- Replay frames are chunked and the incremental validation trailer
+  matches the full validation
+"""
+import random
+
+import pytest
+
+from app.schemas.runs import RunStatus
+from app.services.replay_service import ReplayService
+
+
+def _service_with_runs(project_id, run_ids):
+    service = ReplayService()
+    for run_id in run_ids:
+        service.add_run(run_id=run_id, project_id=project_id, agent_id="agent_1")
+    return service
+
+
+class TestRunIndex:
+    """Test the per-project started_at index."""
+
+    def test_lists_runs_newest_first_with_ties_in_insertion_order(self):
+        service = ReplayService()
+        for run_id, started_at in [
+            ("run_a", "2026-02-01T00:00:00Z"),
+            ("run_b", "2026-02-03T00:00:00Z"),
+            ("run_c", "2026-02-02T00:00:00Z"),
+            ("run_d", "2026-02-03T00:00:00Z"),
+        ]:
+            run = service.add_run(run_id=run_id, project_id="proj_idx", agent_id="agent_1")
+            run.started_at = started_at
+            service._index_run(run)
+
+        summaries, total = service.list_runs("proj_idx", page=1, page_size=3)
+        stats = service.get_project_stats("proj_idx")
+
+        assert total == 4
+        assert [s.run_id for s in summaries] == ["run_b", "run_d", "run_c"]
+        assert stats.latest_run.run_id == "run_b"
+
+    def test_status_filter_and_pagination(self):
+        service = _service_with_runs("proj_page", [f"run_{i}" for i in range(5)])
+        service.add_run("run_done", "proj_page", "agent_1", status=RunStatus.COMPLETED)
+
+        completed, completed_total = service.list_runs(
+            "proj_page", status_filter=RunStatus.COMPLETED
+        )
+        second_page, total = service.list_runs("proj_page", page=2, page_size=4)
+
+        assert [s.run_id for s in completed] == ["run_done"]
+        assert completed_total == 1
+        assert total == 6
+        assert len(second_page) == 2
+
+    def test_readding_a_run_replaces_its_index_entry(self):
+        service = _service_with_runs("proj_old", ["run_x"])
+        service.add_run("run_x", "proj_new", "agent_1")
+
+        assert service.list_runs("proj_old")[1] == 0
+        assert [s.run_id for s in service.list_runs("proj_new")[0]] == ["run_x"]
+        assert service.get_project_stats("proj_old").latest_run is None
+
+
+class TestReplayTimeline:
+    """Test ordered record storage and the k-way merge."""
+
+    def _populate(self, service, run_id, count, seed=11):
+        rng = random.Random(seed)
+        adders = (
+            ("memory", service.add_memory_record, "memory_id"),
+            ("compliance_event", service.add_compliance_event, "event_id"),
+            ("x402_request", service.add_x402_request, "request_id"),
+        )
+        expected = []
+        for i in range(count):
+            record_type, add, id_field = rng.choice(adders)
+            record = {
+                id_field: f"{record_type}_{i}",
+                "run_id": run_id,
+                "timestamp": f"2026-03-01T10:{rng.randint(0, 59):02d}:00Z",
+            }
+            add(run_id, record)
+            expected.append((record_type, record))
+        return expected
+
+    def test_families_stay_sorted_as_records_arrive(self):
+        service = _service_with_runs("proj_tl", ["run_tl"])
+        self._populate(service, "run_tl", 200)
+
+        for family in (
+            service._get_agent_memory_for_run("run_tl"),
+            service._get_compliance_events_for_run("run_tl"),
+            service._get_x402_requests_for_run("run_tl"),
+        ):
+            stamps = [r["timestamp"] for r in family]
+            assert stamps == sorted(stamps)
+
+    def test_merged_timeline_matches_a_full_sort(self):
+        service = _service_with_runs("proj_tl", ["run_tl"])
+        expected = self._populate(service, "run_tl", 500)
+
+        timeline = list(service.iter_replay_records("proj_tl", "run_tl"))
+
+        assert len(timeline) == 500
+        assert [r["timestamp"] for _, r in timeline] == sorted(
+            r["timestamp"] for _, r in expected
+        )
+        assert service.iter_replay_records("proj_other", "run_tl") is None
+
+    def test_demo_run_timeline_interleaves_families(self):
+        service = ReplayService()
+
+        types = [t for t, _ in service.iter_replay_records("proj_demo_u1_001", "run_demo_001")]
+
+        assert types[:4] == ["compliance_event", "memory", "x402_request", "compliance_event"]
+        assert len(types) == 10
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_the_same_timeline(self):
+        service = _service_with_runs("proj_tl", ["run_tl"])
+        self._populate(service, "run_tl", 300)
+
+        streamed = [item async for item in service.stream_replay_records("proj_tl", "run_tl")]
+        missing = [item async for item in service.stream_replay_records("proj_tl", "run_none")]
+
+        assert streamed == list(service.iter_replay_records("proj_tl", "run_tl"))
+        assert missing == []
+
+
+class TestStreamReplay:
+    """Test chunked replay frames and incremental validation."""
+
+    @pytest.mark.asyncio
+    async def test_frames_are_chunked_with_a_validation_trailer(self):
+        service = _service_with_runs("proj_sr", ["run_sr"])
+        for i in range(7):
+            service.add_compliance_event("run_sr", {
+                "event_id": f"evt_{i}",
+                "run_id": "run_other" if i == 3 else "run_sr",
+                "agent_id": "agent_1",
+                "event_type": "AML_CHECK",
+                "description": "checked",
+                "timestamp": f"2026-03-01T10:0{i}:00Z",
+            })
+
+        frames = [f async for f in service.stream_replay("proj_sr", "run_sr", chunk_size=3)]
+        full = service.get_replay_data("proj_sr", "run_sr")
+
+        assert [f["type"] for f in frames] == ["header", "records", "records", "records", "trailer"]
+        assert [len(f["records"]) for f in frames[1:-1]] == [3, 3, 1]
+        assert frames[-1]["record_count"] == 7
+        assert frames[-1]["validation"] == full.validation
+        assert frames[-1]["validation"]["issues"] == [
+            "Agent profile not found for agent_id: agent_1",
+            "Compliance event evt_3 has mismatched run_id",
+        ]
+        assert service.stream_replay("proj_sr", "run_missing") is None
@@ -5,6 +5,7 @@ Tests cover:
 1. List runs endpoint with pagination
 2. Get run details endpoint
 3. Get replay data endpoint
+3a. Streaming replay endpoint (NDJSON / SSE)
 4. Chronological ordering validation
 5. Error cases (run not found)
 6. Authentication requirements
@@ -19,6 +20,8 @@ Per PRD Section 11 (Deterministic Replay):
 - Order chronologically by timestamp
 - Validate all linked records exist
 """
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 from datetime import datetime
@@ -811,6 +814,85 @@ class TestReplayDataCompleteness:
         assert mem_ids1 == mem_ids2
 
 
+class TestStreamRunReplayEndpoint:
+    """
+    Tests for GET /v1/public/{project_id}/runs/{run_id}/replay/stream
+    Stream replay frames with a validation trailer.
+    """
+
+    def test_stream_replay_ndjson_frames(self, client, auth_headers_user1):
+        """
+        Frames are header, record chunks, then a trailer whose validation
+        matches the non-streaming replay.
+        """
+        project_id = "proj_demo_u1_001"
+        run_id = "run_demo_001"
+
+        response = client.get(
+            f"/v1/public/{project_id}/runs/{run_id}/replay/stream?chunk_size=4",
+            headers=auth_headers_user1
+        )
+        replay = client.get(
+            f"/v1/public/{project_id}/runs/{run_id}/replay",
+            headers=auth_headers_user1
+        ).json()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        frames = [json.loads(line) for line in response.text.splitlines()]
+
+        assert [f["type"] for f in frames] == ["header", "records", "records", "records", "trailer"]
+        assert frames[0]["run_id"] == run_id
+        assert frames[0]["agent_profile"] == replay["agent_profile"]
+
+        records = [r for f in frames if f["type"] == "records" for r in f["records"]]
+        timestamps = [r["record"]["timestamp"] for r in records]
+        assert timestamps == sorted(timestamps)
+        assert [r["record"]["memory_id"] for r in records if r["record_type"] == "memory"] == [
+            m["memory_id"] for m in replay["agent_memory"]
+        ]
+        assert frames[-1]["record_count"] == len(records) == 10
+        assert frames[-1]["validation"] == replay["validation"]
+
+    def test_stream_replay_sse_events(self, client, auth_headers_user1):
+        """
+        SSE format names each event after its frame type.
+        """
+        response = client.get(
+            "/v1/public/proj_demo_u1_001/runs/run_demo_001/replay/stream?format=sse",
+            headers=auth_headers_user1
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [e for e in response.text.split("\n\n") if e]
+        assert [e.splitlines()[0] for e in events] == [
+            "event: header", "event: records", "event: trailer"
+        ]
+        trailer = json.loads(events[-1].splitlines()[1][len("data: "):])
+        assert trailer["validation"]["all_records_present"] is True
+
+    def test_stream_replay_not_found(self, client, auth_headers_user1):
+        """
+        Unknown runs return 404 before streaming starts.
+        """
+        response = client.get(
+            "/v1/public/proj_demo_u1_001/runs/run_nonexistent_999/replay/stream",
+            headers=auth_headers_user1
+        )
+
+        assert response.status_code == 404
+        assert response.json()["error_code"] == "RUN_NOT_FOUND"
+
+    def test_stream_replay_requires_authentication(self, client):
+        """
+        Streaming replay requires API key authentication.
+        """
+        response = client.get("/v1/public/proj_demo_u1_001/runs/run_demo_001/replay/stream")
+
+        assert response.status_code == 401
+
+
 class TestErrorHandling:
     """
     Tests for error handling and edge cases.
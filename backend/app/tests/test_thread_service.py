@@ -275,7 +275,8 @@ class DescribeThreadServiceGetThreadContext:
     @pytest.mark.asyncio
     async def it_returns_messages_within_token_budget(self):
         from app.services.thread_service import ThreadService
-        service = ThreadService()
+        from app.services.token_counter import HeuristicTokenCounter
+        service = ThreadService(token_counter=HeuristicTokenCounter())
         thread = await service.create_thread("agent-ctx", "Context", {})
         # Each "token" is roughly len(content)//4 — add messages
         await service.add_message(thread["id"], "user", "a" * 400, {})
@@ -364,3 +365,191 @@ class DescribeThreadServiceSearchMessages:
             await service.add_message(thread["id"], "user", f"keyword {i}", {})
         results = await service.search_messages("keyword", thread["id"], limit=2)
         assert len(results) <= 2
+
+
+# ===========================================================================
+# Persistence, token prefix sums and indexed search
+# ===========================================================================
+
+class DescribeThreadServicePersistence:
+    """Tests for the SQLite write-through backend."""
+
+    @pytest.mark.asyncio
+    async def it_reloads_threads_and_messages_after_restart(self, tmp_path):
+        from app.services.thread_service import ThreadService
+        from app.services.token_counter import HeuristicTokenCounter
+        db_path = str(tmp_path / "threads.db")
+        service = ThreadService(db_path=db_path, token_counter=HeuristicTokenCounter())
+        kept = await service.create_thread("agent-p", "Settlement review", {"k": "v"})
+        gone = await service.create_thread("agent-p", "Scratch", {})
+        await service.add_message(kept["id"], "user", "settle invoice 42", {"n": 1})
+        await service.add_message(kept["id"], "assistant", "invoice 42 settled", {})
+        await service.delete_thread(gone["id"])
+
+        reloaded = ThreadService(db_path=db_path, token_counter=HeuristicTokenCounter())
+        thread = await reloaded.get_thread(kept["id"])
+        listed = await reloaded.list_threads("agent-p", limit=10, offset=0)
+        context = await reloaded.get_thread_context(kept["id"], max_tokens=1000)
+        found = await reloaded.search_messages("invoice 42", kept["id"], limit=10)
+
+        assert thread["metadata"] == {"k": "v"}
+        assert [m["content"] for m in thread["messages"]] == [
+            "settle invoice 42", "invoice 42 settled"
+        ]
+        assert [t["id"] for t in listed["threads"]] == [kept["id"]]
+        assert context["token_count"] == 4 + 4
+        assert len(found) == 2
+
+
+class DescribeThreadServiceIndexes:
+    """Prefix-sum truncation and trigram search match the naive scans."""
+
+    @pytest.mark.asyncio
+    async def it_truncates_to_the_same_messages_as_a_backward_walk(self):
+        import random
+        from app.services.thread_service import ThreadService
+        from app.services.token_counter import HeuristicTokenCounter
+        rng = random.Random(7)
+        service = ThreadService(token_counter=HeuristicTokenCounter())
+        thread = await service.create_thread("agent-ctx", "ctx", {})
+        contents = ["x" * rng.randint(0, 60) for _ in range(40)]
+        for content in contents:
+            await service.add_message(thread["id"], "user", content, {})
+
+        for budget in (-1, 0, 3, 17, 100, 250, 10_000):
+            expected, used = [], 0
+            for content in reversed(contents):
+                if used + len(content) // 4 > budget:
+                    break
+                expected.append(content)
+                used += len(content) // 4
+            expected.reverse()
+
+            context = await service.get_thread_context(thread["id"], max_tokens=budget)
+            assert [m["content"] for m in context["messages"]] == expected
+            assert context["token_count"] == used
+
+    @pytest.mark.asyncio
+    async def it_finds_exactly_the_substring_matches(self):
+        from app.services.thread_service import ThreadService
+        service = ThreadService()
+        thread = await service.create_thread("agent-idx", "Index", {})
+        contents = [
+            "Authorize USDC transfer", "authentication failed", "re-auth later",
+            "weather report", "AUTH", "transfer authorized",
+        ]
+        for content in contents:
+            await service.add_message(thread["id"], "user", content, {})
+
+        for query in ("auth", "AUTHORIZ", "transfer", "er a", "au", "", "missing"):
+            results = await service.search_messages(query, thread["id"], limit=100)
+            expected = [c for c in contents if query.lower() in c.lower()]
+            assert [r["content"] for r in results] == expected
+
+    @pytest.mark.asyncio
+    async def it_searches_titles_in_creation_order_for_the_agent(self):
+        from app.services.thread_service import ThreadService
+        service = ThreadService()
+        first = await service.create_thread("agent-t", "Payment retry", {})
+        await service.create_thread("agent-other", "Payment retry", {})
+        deleted = await service.create_thread("agent-t", "Payment dispute", {})
+        last = await service.create_thread("agent-t", "Late payment", {})
+        await service.delete_thread(deleted["id"])
+
+        results = await service.search_threads("payment", "agent-t", limit=10)
+
+        assert [r["id"] for r in results] == [first["id"], last["id"]]
+
+
+class DescribeThreadServiceTokenCounting:
+    """Pluggable token counter and model-aware context windows."""
+
+    @pytest.mark.asyncio
+    async def it_counts_tokens_with_the_configured_counter(self):
+        from app.services.thread_service import ThreadService
+        from app.services.token_counter import CallableTokenCounter
+        counter = CallableTokenCounter("words", str.split)
+        service = ThreadService(token_counter=counter)
+        thread = await service.create_thread("agent-tok", "Tokens", {})
+        await service.add_message(thread["id"], "user", "one two three", {})
+        await service.add_message(thread["id"], "user", "four five", {})
+
+        context = await service.get_thread_context(thread["id"], max_tokens=2)
+
+        assert [m["content"] for m in context["messages"]] == ["four five"]
+        assert context["token_count"] == 2
+
+    @pytest.mark.asyncio
+    async def it_recounts_stored_messages_when_the_counter_changes(self, tmp_path):
+        from app.services.thread_service import ThreadService
+        from app.services.token_counter import CallableTokenCounter, HeuristicTokenCounter
+        db_path = str(tmp_path / "threads.db")
+        service = ThreadService(db_path=db_path, token_counter=HeuristicTokenCounter())
+        thread = await service.create_thread("agent-tok", "Tokens", {})
+        await service.add_message(thread["id"], "user", "a b c d e f g h", {})
+
+        words = ThreadService(db_path=db_path, token_counter=CallableTokenCounter("words", str.split))
+        heuristic = ThreadService(db_path=db_path, token_counter=HeuristicTokenCounter())
+
+        assert (await words.get_thread_context(thread["id"], 100))["token_count"] == 8
+        assert (await heuristic.get_thread_context(thread["id"], 100))["token_count"] == 15 // 4
+
+    @pytest.mark.asyncio
+    async def it_packs_a_window_sized_for_the_agent_model(self):
+        from app.services.thread_service import ThreadService, MESSAGE_OVERHEAD_TOKENS
+        from app.services.token_counter import HeuristicTokenCounter
+        service = ThreadService(token_counter=HeuristicTokenCounter())
+        thread = await service.create_thread("agent-win", "Window", {})
+        for _ in range(10):
+            await service.add_message(thread["id"], "user", "x" * 40_000, {})
+
+        window = await service.build_context_window(
+            thread["id"], agent_type="analyst", reserve_tokens=1024
+        )
+
+        per_message = 10_000 + MESSAGE_OVERHEAD_TOKENS
+        assert window["model"] == "gemini-pro"
+        assert window["max_tokens"] == 30_720
+        assert len(window["messages"]) == (30_720 - 1024) // per_message
+        assert window["token_count"] == per_message * len(window["messages"])
+        assert window["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def it_uses_the_larger_limit_of_an_explicit_model(self):
+        from app.services.thread_service import ThreadService
+        from app.services.token_counter import HeuristicTokenCounter
+        service = ThreadService(token_counter=HeuristicTokenCounter())
+        thread = await service.create_thread("agent-win", "Window", {})
+        for _ in range(10):
+            await service.add_message(thread["id"], "user", "x" * 40_000, {})
+
+        window = await service.build_context_window(
+            thread["id"], model="gemini-1.5-pro", system_prompt="Be terse."
+        )
+
+        assert len(window["messages"]) == 10
+        assert window["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def it_takes_the_model_and_limit_from_the_gemini_service(self):
+        from unittest.mock import MagicMock, patch
+        from app.services.thread_service import ThreadService
+        from app.services.token_counter import HeuristicTokenCounter
+        service = ThreadService(token_counter=HeuristicTokenCounter())
+        thread = await service.create_thread("agent-win", "Window", {})
+        await service.add_message(thread["id"], "user", "hello", {})
+        gemini = MagicMock()
+        gemini.get_model_for_agent.return_value = "gemini-1.5-flash"
+        gemini.get_context_limit.return_value = 4_096
+
+        with patch("app.services.gemini_service.get_gemini_service", return_value=gemini):
+            window = await service.build_context_window(thread["id"], agent_type="transaction")
+
+        assert (window["model"], window["max_tokens"]) == ("gemini-1.5-flash", 4_096)
+        gemini.get_context_limit.assert_called_once_with("gemini-1.5-flash")
+
+    def it_requires_token_counters_to_implement_count(self):
+        from app.services.token_counter import TokenCounter
+
+        with pytest.raises(TypeError):
+            TokenCounter()
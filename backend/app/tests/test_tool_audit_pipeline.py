@@ -0,0 +1,204 @@
+"""
+Test suite for ToolAuditPipeline.
+
+Test Coverage:
+- BaseTool.execute returns without waiting for audit writes
+- Queued audit records are snapshots, unaffected by later mutation
+- Records are delivered in submission order per correlation_id
+- Different correlation_ids are written concurrently
+- Bounded queue applies backpressure instead of dropping records
+- stop() drains everything queued
+- Write failures are counted, not raised
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from tools.audit_pipeline import ToolAuditPipeline
+from tools.base import ToolExecutionContext
+from tools.market_data import MarketDataTool
+
+
+@pytest.fixture
+def execution_context():
+    """Create test execution context."""
+    return ToolExecutionContext(
+        project_id="proj_test_001",
+        agent_id="did:ethr:0xanalyst001",
+        run_id="run_test_001",
+        task_id="task_001",
+        correlation_id="corr_test_001"
+    )
+
+
+class TestToolAuditPipelineWithTools:
+    """Test write-behind auditing from BaseTool.execute."""
+
+    @pytest.mark.asyncio
+    async def test_execute_does_not_wait_for_audit_writes(self, execution_context):
+        """Tool result returns while audit writes are still blocked."""
+        release = asyncio.Event()
+
+        async def slow_write(**kwargs):
+            await release.wait()
+            return {"id": "evt_1", "memory_id": "mem_1"}
+
+        event_service = AsyncMock()
+        event_service.store_agent_tool_call = AsyncMock(side_effect=slow_write)
+        memory_service = AsyncMock()
+        memory_service.store_memory = AsyncMock(side_effect=slow_write)
+        pipeline = ToolAuditPipeline(batch_linger=0)
+        tool = MarketDataTool(
+            event_service=event_service,
+            memory_service=memory_service,
+            audit_pipeline=pipeline
+        )
+
+        result = await asyncio.wait_for(
+            tool.execute(context=execution_context, symbol="BTC-USD", data_type="price"),
+            timeout=1.0
+        )
+
+        assert result.success is True
+        assert result.event_id is None
+        assert result.memory_id is None
+        assert pipeline.pending == 3
+
+        release.set()
+        await pipeline.stop()
+        assert pipeline.written == 3
+        assert event_service.store_agent_tool_call.await_count == 2
+        memory_service.store_memory.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_audit_trail_keeps_tool_call_order(self, execution_context):
+        """Start event, memory and completion event are written in order."""
+        written = []
+
+        async def store_tool_call(**kwargs):
+            written.append("complete" if "result" in kwargs else "start")
+
+        async def store_memory(**kwargs):
+            written.append("memory")
+
+        event_service = AsyncMock()
+        event_service.store_agent_tool_call = AsyncMock(side_effect=store_tool_call)
+        memory_service = AsyncMock()
+        memory_service.store_memory = AsyncMock(side_effect=store_memory)
+        pipeline = ToolAuditPipeline()
+        tool = MarketDataTool(
+            event_service=event_service,
+            memory_service=memory_service,
+            audit_pipeline=pipeline
+        )
+
+        await tool.execute(context=execution_context, symbol="ETH-USD", data_type="price")
+        await pipeline.stop()
+
+        assert written == ["start", "memory", "complete"]
+
+    @pytest.mark.asyncio
+    async def test_audit_records_are_not_changed_by_later_mutation(self, execution_context):
+        """Queued audit writes keep the parameters and result as they were at execute time."""
+        event_service = AsyncMock()
+        memory_service = AsyncMock()
+        pipeline = ToolAuditPipeline()
+        tool = MarketDataTool(
+            event_service=event_service,
+            memory_service=memory_service,
+            audit_pipeline=pipeline
+        )
+
+        result = await tool.execute(context=execution_context, symbol="BTC-USD", data_type="price")
+        expected = dict(result.data)
+        result.data["price"] = "tampered"
+        await pipeline.stop()
+
+        complete = event_service.store_agent_tool_call.await_args_list[-1].kwargs
+        metadata = memory_service.store_memory.await_args.kwargs["metadata"]
+        assert complete["result"] == expected
+        assert metadata["result"] == expected
+
+
+class TestToolAuditPipelineDelivery:
+    """Test ordering, concurrency, backpressure and shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_orders_records_per_correlation_id(self):
+        """Records with the same correlation_id are written sequentially."""
+        written = []
+
+        async def write(corr, seq):
+            await asyncio.sleep(0.001 * (5 - seq))
+            written.append((corr, seq))
+
+        pipeline = ToolAuditPipeline(batch_size=100)
+        for seq in range(5):
+            for corr in ("a", "b"):
+                await pipeline.submit(write, corr, corr=corr, seq=seq)
+        await pipeline.stop()
+
+        assert [s for c, s in written if c == "a"] == [0, 1, 2, 3, 4]
+        assert [s for c, s in written if c == "b"] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_writes_different_correlations_concurrently(self):
+        """Independent correlation groups overlap."""
+        in_flight = 0
+        peak = 0
+
+        async def write():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        pipeline = ToolAuditPipeline(max_concurrent_writes=4)
+        for i in range(8):
+            await pipeline.submit(write, f"corr_{i}")
+        await pipeline.stop()
+
+        assert peak == 4
+        assert pipeline.written == 8
+
+    @pytest.mark.asyncio
+    async def test_full_queue_blocks_submit(self):
+        """submit() waits for space rather than dropping records."""
+        release = asyncio.Event()
+
+        async def wait_for_release():
+            await release.wait()
+
+        write = AsyncMock(side_effect=wait_for_release)
+        pipeline = ToolAuditPipeline(max_queue_size=2, batch_size=1, batch_linger=0)
+
+        await pipeline.submit(write, "c")  # taken by the worker
+        await asyncio.sleep(0)
+        await pipeline.submit(write, "c")
+        await pipeline.submit(write, "c")  # queue now full
+
+        blocked = asyncio.create_task(pipeline.submit(write, "c"))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await blocked
+        await pipeline.stop()
+        assert write.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_writes_are_counted_and_do_not_stop_delivery(self):
+        """A failing write is logged and later records still land."""
+        write = AsyncMock(side_effect=[RuntimeError("zerodb down"), None])
+        pipeline = ToolAuditPipeline()
+
+        await pipeline.submit(write, "c")
+        await pipeline.submit(write, "c")
+        await pipeline.stop()
+
+        assert pipeline.failed == 1
+        assert pipeline.written == 1
+        assert pipeline.pending == 0
@@ -254,3 +254,112 @@ class DescribeGetServiceRegistry:
         registry = await svc.get_service_registry()
 
         assert registry == []
+
+
+class DescribeDiscoveryIndex:
+    """Discovery is served from the capability -> price-sorted index."""
+
+    async def _register(self, svc, did, price, capabilities):
+        return await svc.register_service(
+            agent_did=did,
+            service_description=did,
+            pricing={"price_per_call": price},
+            x402_endpoint=f"https://{did}.example/x402",
+            capabilities=capabilities,
+        )
+
+    @pytest.mark.asyncio
+    async def it_returns_capped_services_cheapest_first(self, mock_zerodb_client):
+        """A price cap is inclusive; ties keep registration order."""
+        from app.services.trustless_runtime_service import TrustlessRuntimeService
+
+        svc = TrustlessRuntimeService(client=mock_zerodb_client)
+        for did, price in [("c", 0.3), ("a", 0.1), ("b", 0.2), ("a2", 0.1), ("d", 0.4)]:
+            await self._register(svc, did, price, ["ocr", "ocr"])
+
+        capped = await svc.discover_services(capability="ocr", max_price=0.3)
+        uncapped = await svc.discover_services(capability="ocr", max_price=None)
+
+        assert [s["agent_did"] for s in capped] == ["a", "a2", "b", "c"]
+        assert [s["agent_did"] for s in uncapped] == ["a", "a2", "b", "c", "d"]
+
+    @pytest.mark.asyncio
+    async def it_stops_querying_zerodb_after_the_first_discovery(self, mock_zerodb_client):
+        """Registrations update the index in place; repeat lookups skip ZeroDB."""
+        from app.services.trustless_runtime_service import TrustlessRuntimeService
+
+        svc = TrustlessRuntimeService(client=mock_zerodb_client)
+        await self._register(svc, "first", 0.5, ["ocr"])
+        await svc.discover_services(capability="ocr", max_price=None)
+        history_len = len(mock_zerodb_client.call_history)
+
+        await self._register(svc, "second", 0.2, ["ocr", "translate"])
+        results = [await svc.discover_services(capability="ocr", max_price=1.0) for _ in range(3)]
+
+        queries = [
+            c for c in mock_zerodb_client.call_history[history_len:]
+            if c["method"] == "query_rows"
+        ]
+        assert queries == []
+        assert [s["agent_did"] for s in results[-1]] == ["second", "first"]
+
+    @pytest.mark.asyncio
+    async def it_rereads_invalidated_services(self, mock_zerodb_client):
+        """invalidate_service re-reads one row; None reloads the whole index."""
+        from app.services.trustless_runtime_service import TrustlessRuntimeService
+
+        svc = TrustlessRuntimeService(client=mock_zerodb_client)
+        gone = await self._register(svc, "gone", 0.1, ["ocr"])
+        await self._register(svc, "kept", 0.2, ["ocr"])
+        await svc.discover_services(capability="ocr", max_price=None)
+
+        # Out-of-band changes: one service deactivated, one registered directly
+        rows = mock_zerodb_client.data["service_registry"]
+        next(r for r in rows if r["service_id"] == gone["service_id"])["active"] = False
+        rows.append({
+            "service_id": "svc_external",
+            "agent_did": "external",
+            "pricing": {"price_per_call": 0.05},
+            "capabilities": ["ocr"],
+            "active": True,
+        })
+
+        svc.invalidate_service(gone["service_id"])
+        after_one = await svc.discover_services(capability="ocr", max_price=None)
+        svc.invalidate_service()
+        after_all = await svc.discover_services(capability="ocr", max_price=None)
+
+        assert [s["agent_did"] for s in after_one] == ["kept"]
+        assert [s["agent_did"] for s in after_all] == ["external", "kept"]
+
+    @pytest.mark.asyncio
+    async def it_applies_changes_made_while_the_index_is_loading(self, mock_zerodb_client):
+        """Registrations and invalidations during the first load reach the index."""
+        import asyncio
+
+        from app.services.trustless_runtime_service import TrustlessRuntimeService
+
+        svc = TrustlessRuntimeService(client=mock_zerodb_client)
+        gone = await self._register(svc, "gone", 0.1, ["ocr"])
+        load_services = svc._load_active_services
+        loaded = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_load():
+            rows = await load_services()
+            loaded.set()
+            await release.wait()
+            return rows
+
+        svc._load_active_services = slow_load
+        first = asyncio.ensure_future(svc.discover_services(capability="ocr", max_price=None))
+        await loaded.wait()
+        await self._register(svc, "late", 0.2, ["ocr"])
+        rows = mock_zerodb_client.data["service_registry"]
+        next(r for r in rows if r["service_id"] == gone["service_id"])["active"] = False
+        svc.invalidate_service(gone["service_id"])
+        release.set()
+        await first
+        after = await svc.discover_services(capability="ocr", max_price=None)
+
+        assert [s["agent_did"] for s in after] == ["late"]
@@ -107,6 +107,22 @@ class TestInsertRowMockMode:
         assert a["row_id"] != b["row_id"]
 
 
+class TestInsertRowsMockMode:
+    @pytest.mark.asyncio
+    async def test_insert_rows_stores_every_row(
+        self, mock_client: ZeroDBClient, http_blocker: Dict[str, int]
+    ) -> None:
+        result = await mock_client.insert_rows(
+            "agents", [{"name": "A"}, {"name": "B"}]
+        )
+        assert http_blocker["calls"] == 0
+        assert result["inserted_count"] == 2
+        assert len(set(result["row_ids"])) == 2
+
+        query = await mock_client.query_rows("agents", filter={})
+        assert query["total"] == 2
+
+
 class TestQueryRowsMockMode:
     @pytest.mark.asyncio
     async def test_query_empty_table_returns_empty(
@@ -4,6 +4,7 @@ Implements Issue #72: Executable entry point for crew operations.
 
 Usage:
     python run_crew.py --project-id PROJECT_ID --run-id RUN_ID
+    python run_crew.py --project-id PROJECT_ID --batch inputs.jsonl [--concurrency 16]
 
 Per PRD Section 4, 6, 9:
 - Initialize agents and tasks
@@ -14,6 +15,10 @@ Per PRD Section 4, 6, 9:
 
 Example:
     $ python run_crew.py --project-id proj_demo_001 --run-id run_001
+
+Batch mode runs the X402 crew workflow once per JSONL input line (use "-"
+for stdin) with bounded concurrency, writing one JSON result per line and
+periodic throughput summaries.
 """
 
 import asyncio
@@ -22,7 +27,7 @@ import logging
 import sys
 import json
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, TextIO
 
 from crew import create_crew
 from app.services.agent_memory_service import agent_memory_service
@@ -40,6 +45,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def send_console_logs_to_stderr() -> None:
+    """
+    Move console logging from stdout to stderr.
+
+    Batch mode writes JSONL results to stdout, so log lines must not be
+    interleaved with them.
+    """
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler) and handler.stream in (sys.stdout, sys.__stdout__):
+            handler.setStream(sys.stderr)
+
+
 async def store_execution_metadata(
     project_id: str,
     run_id: str,
@@ -219,6 +236,55 @@ async def main(
     return result
 
 
+async def batch_main(
+    project_id: str,
+    agent_did: str,
+    input_stream: TextIO,
+    output_stream: TextIO,
+    concurrency: int,
+    max_retries: int = 1,
+    progress_every: int = 100
+) -> Dict[str, Any]:
+    """
+    Run the crew workflow for every JSONL input with bounded concurrency.
+
+    Per-run results are written to output_stream as JSON lines as soon as
+    each run finishes; a throughput summary is logged every
+    progress_every runs and returned at the end.
+
+    Args:
+        project_id: Project identifier
+        agent_did: Agent DID used as namespace for all runs
+        input_stream: JSONL input (one input_data object per line)
+        output_stream: Destination for JSONL results
+        concurrency: Workflows in flight at once
+        max_retries: Attempts per workflow
+        progress_every: Runs between progress summaries
+
+    Returns:
+        Final batch summary
+    """
+    from app.services.crew_batch import CrewBatchRunner, iter_jsonl
+
+    runner = CrewBatchRunner(
+        project_id=project_id,
+        agent_did=agent_did,
+        concurrency=concurrency,
+        max_retries=max_retries
+    )
+    logger.info(f"Starting batch crew execution (concurrency={concurrency})")
+
+    async for run in runner.run(iter_jsonl(input_stream)):
+        output_stream.write(json.dumps(run.to_dict(), default=str) + "\n")
+        output_stream.flush()
+        if runner.summary.total % progress_every == 0:
+            logger.info(f"Batch progress: {json.dumps(runner.summary.to_dict())}")
+
+    summary = runner.summary.to_dict()
+    logger.info(f"Batch completed: {json.dumps(summary)}")
+    return summary
+
+
 def parse_arguments():
     """
     Parse command-line arguments.
@@ -239,6 +305,9 @@ Examples:
 
   # With input data
   python run_crew.py --project-id proj_demo_001 --run-id run_001 --input '{"transaction": "BTC_USDT"}'
+
+  # Batch screening from a JSONL file, results to a JSONL file
+  python run_crew.py --project-id proj_demo_001 --batch queries.jsonl --concurrency 16 --output results.jsonl
         """
     )
 
@@ -250,8 +319,8 @@ Examples:
 
     parser.add_argument(
         '--run-id',
-        required=True,
-        help='Run identifier (e.g., run_001)'
+        default=None,
+        help='Run identifier (e.g., run_001); required unless --batch is used'
     )
 
     parser.add_argument(
@@ -267,13 +336,73 @@ Examples:
         help='Enable verbose output'
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        '--batch',
+        default=None,
+        metavar='PATH',
+        help='JSONL file of inputs to run in batch mode ("-" for stdin)'
+    )
+
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=8,
+        help='Batch mode: workflows in flight at once (default: 8)'
+    )
+
+    parser.add_argument(
+        '--max-retries',
+        type=int,
+        default=1,
+        help='Batch mode: attempts per workflow (default: 1)'
+    )
+
+    parser.add_argument(
+        '--agent-did',
+        default='did:agent:batch_screening',
+        help='Batch mode: agent DID used as memory namespace'
+    )
+
+    parser.add_argument(
+        '--output',
+        default=None,
+        metavar='PATH',
+        help='Batch mode: JSONL results file (default: stdout)'
+    )
+
+    args = parser.parse_args()
+    if not args.batch and not args.run_id:
+        parser.error('--run-id is required unless --batch is used')
+    return args
 
 
 if __name__ == "__main__":
     # Parse arguments
     args = parse_arguments()
 
+    if args.batch:
+        send_console_logs_to_stderr()
+        input_stream = sys.stdin if args.batch == '-' else open(args.batch)
+        output_stream = open(args.output, 'w') if args.output else sys.stdout
+        try:
+            summary = asyncio.run(batch_main(
+                project_id=args.project_id,
+                agent_did=args.agent_did,
+                input_stream=input_stream,
+                output_stream=output_stream,
+                concurrency=args.concurrency,
+                max_retries=args.max_retries
+            ))
+        except Exception as e:
+            logger.error(f"Batch execution failed: {e}", exc_info=True)
+            sys.exit(1)
+        finally:
+            if input_stream is not sys.stdin:
+                input_stream.close()
+            if output_stream is not sys.stdout:
+                output_stream.close()
+        sys.exit(0 if summary["failed"] == 0 else 1)
+
     # Parse input JSON if provided
     inputs = None
     if args.input:
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark DID signature verification throughput.
+
+Reports verifications per second on a single core for:
+
+- ecdsa, uncached:  pure-Python ecdsa, DID resolved and key parsed per call
+                    (the previous behaviour)
+- ecdsa, cached:    pure-Python ecdsa with the per-DID verifying-key cache
+- cryptography:     OpenSSL backend with the key cache (if installed)
+
+and for ``DIDSigner.verify_many`` over a process pool, as total and
+per-core throughput.
+
+Usage:
+    python scripts/benchmark_did_signer.py
+    python scripts/benchmark_did_signer.py --signatures 2000 --dids 50 --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.core.did_signer as did_signer
+from app.core.did_signer import DIDSigner
+
+
+def build_items(signatures: int, dids: int):
+    """Sign ``signatures`` payloads spread over ``dids`` keypairs."""
+    keys = [DIDSigner.generate_keypair() for _ in range(dids)]
+    items = []
+    for i in range(signatures):
+        private_key, did = keys[i % dids]
+        payload = {
+            "type": "payment_authorization",
+            "amount": f"{i % 1000}.00",
+            "currency": "USDC",
+            "seq": i,
+        }
+        items.append((payload, DIDSigner.sign_payload(payload, private_key), did))
+    return items
+
+
+def single_core_rate(items, backend: str, cached: bool) -> float:
+    """Verifications per second on the calling thread."""
+    did_signer.VERIFY_BACKEND = backend
+    DIDSigner.clear_verifying_key_cache()
+    start = time.perf_counter()
+    for payload, signature, did in items:
+        if not cached:
+            DIDSigner.clear_verifying_key_cache()
+        if not DIDSigner.verify_signature(payload, signature, did):
+            raise RuntimeError("benchmark signature failed to verify")
+    return len(items) / (time.perf_counter() - start)
+
+
+def pool_rate(items, workers: int) -> float:
+    """Verifications per second across a process pool."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Warm the workers (imports, key caches) before timing
+        DIDSigner.verify_many(items, executor=pool)
+        start = time.perf_counter()
+        results = DIDSigner.verify_many(items, executor=pool)
+        elapsed = time.perf_counter() - start
+    if not all(results):
+        raise RuntimeError("benchmark signature failed to verify")
+    return len(items) / elapsed
+
+
+def main(signatures: int, dids: int, workers: int) -> None:
+    items = build_items(signatures, dids)
+    default_backend = did_signer.VERIFY_BACKEND
+
+    rows = [
+        ("ecdsa, uncached", single_core_rate(items, "ecdsa", cached=False)),
+        ("ecdsa, cached", single_core_rate(items, "ecdsa", cached=True)),
+    ]
+    if did_signer._CRYPTOGRAPHY_AVAILABLE:
+        rows.append(
+            ("cryptography", single_core_rate(items, "cryptography", cached=True))
+        )
+
+    did_signer.VERIFY_BACKEND = default_backend
+    total = pool_rate(items, workers)
+
+    print(f"{signatures} signatures over {dids} DIDs")
+    print(f"{'mode':<30}{'verifications/s':>18}{'per core':>12}")
+    for label, rate in rows:
+        print(f"{label:<30}{rate:>18.0f}{rate:>12.0f}")
+    label = f"verify_many, {workers} processes"
+    print(f"{label:<30}{total:>18.0f}{total / workers:>12.0f}")
+    print(f"(pool backend: {default_backend})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark DID signature verification")
+    parser.add_argument("--signatures", type=int, default=1000, help="Signatures to verify")
+    parser.add_argument("--dids", type=int, default=20, help="Distinct signing DIDs")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Process pool size"
+    )
+    args = parser.parse_args()
+    main(args.signatures, args.dids, args.workers)
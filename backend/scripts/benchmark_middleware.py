@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-request middleware overhead.
+
+Drives the application's middleware chain (nonce, rate limiter, API key
+auth, immutable enforcement) directly over ASGI at a paced request rate
+and reports latency against a bare app with no middleware:
+
+- legacy: each layer wrapped in Starlette's BaseHTTPMiddleware (the
+  previous stack, one task and one body re-read per layer)
+- asgi:   the pure ASGI layers sharing a single RequestContext
+
+Requests alternate between a signed x402 POST (body parsed for DID and
+nonce) and an authenticated-path GET. No network I/O is involved, so the
+difference to the bare app is the middleware cost.
+
+Usage:
+    python scripts/benchmark_middleware.py
+    python scripts/benchmark_middleware.py --rps 1000 --seconds 10
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.middleware.api_key_auth import APIKeyAuthMiddleware
+from app.middleware.immutable import ImmutableMiddleware
+from app.middleware.nonce_middleware import NonceMiddleware
+from app.middleware.rate_limiter import RateLimiterMiddleware
+from app.services.nonce_replay_guard import NonceReplayGuard
+from app.services.rate_limiter_service import RateLimiterService
+
+
+class _LegacyLayer(BaseHTTPMiddleware):
+    """Runs an ASGIMiddleware hook through BaseHTTPMiddleware (old stack)."""
+
+    def __init__(self, app: Any, layer_cls: type, **kwargs: Any) -> None:
+        super().__init__(app)
+        self._layer = layer_cls(app, **kwargs)
+
+    async def dispatch(self, request, call_next):
+        return await self._layer.dispatch(request, call_next)
+
+
+def build_app(mode: str, guard: NonceReplayGuard) -> FastAPI:
+    """Build the benchmark app with the requested middleware stack."""
+    app = FastAPI()
+
+    @app.post("/x402")
+    async def x402(body: dict):
+        return {"status": "received", "did": body.get("did")}
+
+    @app.get("/internal/agents")
+    async def agents():
+        return {"agents": []}
+
+    if mode == "bare":
+        return app
+
+    layers = [
+        (ImmutableMiddleware, {}),
+        (APIKeyAuthMiddleware, {}),
+        (RateLimiterMiddleware, {
+            "rate_limiter": RateLimiterService(),
+            "max_requests": 1_000_000,
+        }),
+        (NonceMiddleware, {"guard": guard}),
+    ]
+    for layer_cls, kwargs in layers:
+        if mode == "legacy":
+            app.add_middleware(_LegacyLayer, layer_cls=layer_cls, **kwargs)
+        else:
+            app.add_middleware(layer_cls, **kwargs)
+    return app
+
+
+def _scope(i: int) -> Dict[str, Any]:
+    if i % 2 == 0:
+        return {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": "POST", "path": "/x402", "raw_path": b"/x402",
+            "query_string": b"", "root_path": "", "scheme": "http",
+            "server": ("bench", 80), "client": ("127.0.0.1", 1),
+            "headers": [(b"content-type", b"application/json")],
+        }
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "path": "/internal/agents", "raw_path": b"/internal/agents",
+        "query_string": b"", "root_path": "", "scheme": "http",
+        "server": ("bench", 80), "client": ("127.0.0.1", 1),
+        "headers": [(b"x-agent-did", f"did:key:agent-{i % 100}".encode())],
+    }
+
+
+def _body(i: int) -> bytes:
+    if i % 2:
+        return b""
+    return json.dumps({
+        "did": f"did:key:agent-{i % 100}",
+        "nonce": str(uuid.uuid4()),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "signature": "00" * 64,
+        "payload": {"type": "payment_authorization", "amount": "1.00"},
+    }).encode()
+
+
+async def _one_request(app: FastAPI, i: int) -> float:
+    done = asyncio.Event()
+    sent_body = False
+    status: List[int] = []
+
+    async def receive():
+        nonlocal sent_body
+        if not sent_body:
+            sent_body = True
+            return {"type": "http.request", "body": _body(i), "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+        elif message["type"] == "http.response.body" and not message.get("more_body"):
+            done.set()
+
+    start = time.perf_counter()
+    await app(_scope(i), receive, send)
+    elapsed = time.perf_counter() - start
+    done.set()
+    if status and status[0] >= 400:
+        raise RuntimeError(f"request {i} failed with HTTP {status[0]}")
+    return elapsed
+
+
+async def run_mode(mode: str, rps: int, seconds: float) -> List[float]:
+    """Send ``rps * seconds`` paced requests; return per-request latencies."""
+    # Started guard: nonce checks hit the in-memory window, writes are batched
+    guard = NonceReplayGuard()
+    await guard.start()
+    app = build_app(mode, guard)
+    total = int(rps * seconds)
+    loop = asyncio.get_running_loop()
+    t0 = loop.time()
+    tasks = []
+    for i in range(total):
+        delay = t0 + i / rps - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(_one_request(app, i)))
+    latencies = list(await asyncio.gather(*tasks))
+    await guard.stop()
+    return latencies
+
+
+async def serial_cost(mode: str, count: int = 500) -> float:
+    """Mean service time in seconds with one request in flight at a time."""
+    guard = NonceReplayGuard()
+    await guard.start()
+    app = build_app(mode, guard)
+    start = time.perf_counter()
+    for i in range(count):
+        await _one_request(app, i)
+    elapsed = time.perf_counter() - start
+    await guard.stop()
+    return elapsed / count
+
+
+def _summary(latencies: List[float]) -> Dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "mean_us": statistics.fmean(ordered) * 1e6,
+        "p50_us": ordered[len(ordered) // 2] * 1e6,
+        "p99_us": ordered[int(len(ordered) * 0.99)] * 1e6,
+    }
+
+
+async def main(rps: int, seconds: float) -> None:
+    results = {}
+    for mode in ("bare", "legacy", "asgi"):
+        # Warm-up pass so imports and first-call caches are excluded
+        await run_mode(mode, rps, min(seconds, 0.5))
+        results[mode] = _summary(await run_mode(mode, rps, seconds))
+        results[mode]["serial_us"] = await serial_cost(mode) * 1e6
+
+    # serial: service time with one request in flight; a stack whose serial
+    # cost exceeds 1/rps saturates and its paced latencies grow unbounded.
+    print(f"{int(rps * seconds)} requests per mode at {rps} RPS")
+    print(
+        f"{'mode':<8}{'serial µs':>11}{'overhead µs':>13}"
+        f"{'mean µs':>12}{'p50 µs':>12}{'p99 µs':>12}"
+    )
+    bare = results["bare"]["serial_us"]
+    for mode, stats in results.items():
+        print(
+            f"{mode:<8}{stats['serial_us']:>11.1f}{stats['serial_us'] - bare:>13.1f}"
+            f"{stats['mean_us']:>12.1f}{stats['p50_us']:>12.1f}{stats['p99_us']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark middleware overhead")
+    parser.add_argument("--rps", type=int, default=1000, help="Paced request rate")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per mode")
+    args = parser.parse_args()
+    asyncio.run(main(args.rps, args.seconds))
@@ -12,6 +12,7 @@ Purpose:
 
 Architecture:
 - BaseTool: Abstract base class for all tools
+- ToolAuditPipeline: Write-behind delivery of tool audit records
 - ToolRegistry: Central registry for tool discovery
 - X402RequestTool: Core tool for X402 protocol requests
 - MarketDataTool: Demo tool for market data fetching
@@ -23,6 +24,7 @@ Per PRD Section 8:
 - Portable across CLI, server, or future UI
 """
 
+from tools.audit_pipeline import ToolAuditPipeline
 from tools.base import BaseTool, ToolExecutionContext, ToolResult
 from tools.x402_request import X402RequestTool
 from tools.market_data import MarketDataTool
@@ -106,6 +108,7 @@ __all__ = [
     "BaseTool",
     "ToolExecutionContext",
     "ToolResult",
+    "ToolAuditPipeline",
     "X402RequestTool",
     "MarketDataTool",
     "ToolRegistry",
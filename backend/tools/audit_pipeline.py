@@ -0,0 +1,189 @@
+"""
+ToolAuditPipeline: write-behind delivery of tool audit records.
+
+Implements the non-blocking audit path for BaseTool.execute.
+
+Design:
+- Tools submit audit writes (tool_call events, agent_memory records,
+  error events) and return without waiting for ZeroDB
+- A single background worker drains the queue in batches
+- Within a batch, records are grouped by correlation_id: groups are
+  written concurrently, records inside a group strictly in submission
+  order, so a tool call's start event, memory and completion event land
+  in the order they happened
+- The queue is bounded; when full, submit() waits (backpressure) instead
+  of dropping records
+- stop() drains every queued record before returning, so the audit trail
+  is complete on shutdown
+
+Per PRD Section 10 (Non-repudiation):
+- Records are never dropped; write failures are logged and counted
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default pipeline tuning
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_BATCH_LINGER_SECONDS = 0.05
+DEFAULT_MAX_CONCURRENT_WRITES = 10
+
+
+@dataclass
+class AuditRecord:
+    """
+    A deferred audit write.
+
+    Fields:
+    - correlation_id: Ordering key; records sharing it are written in order
+    - write: Coroutine function performing the write (e.g. a service method)
+    - kwargs: Keyword arguments for ``write``
+    """
+
+    correlation_id: str
+    write: Callable[..., Awaitable[Any]]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+class ToolAuditPipeline:
+    """
+    Bounded async write-behind queue for tool audit records.
+
+    Usage:
+        pipeline = ToolAuditPipeline()
+        await pipeline.start()
+        tool = X402RequestTool(event_service=..., memory_service=...,
+                               audit_pipeline=pipeline)
+        ...
+        await pipeline.stop()  # flushes everything still queued
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_linger: float = DEFAULT_BATCH_LINGER_SECONDS,
+        max_concurrent_writes: int = DEFAULT_MAX_CONCURRENT_WRITES,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            max_queue_size: Queued records before submit() blocks
+                (0 = unbounded, no backpressure)
+            batch_size: Maximum records written per batch
+            batch_linger: Seconds to wait for a batch to fill after the
+                first record arrives
+            max_concurrent_writes: Correlation groups written in parallel
+        """
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._batch_linger = batch_linger
+        self._write_slots = asyncio.Semaphore(max_concurrent_writes)
+        self._worker: Optional[asyncio.Task] = None
+
+        # Delivery counters
+        self.submitted = 0
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def pending(self) -> int:
+        """Records queued but not yet written."""
+        return self.submitted - self.written - self.failed
+
+    async def start(self) -> None:
+        """Start the background writer (idempotent)."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def submit(
+        self,
+        write: Callable[..., Awaitable[Any]],
+        correlation_id: str,
+        /,
+        **kwargs: Any
+    ) -> None:
+        """
+        Queue an audit write.
+
+        Waits for queue space when the pipeline is full. Starts the
+        background writer on first use.
+
+        Args:
+            write: Coroutine function to call, e.g. event_service.store_agent_tool_call
+            correlation_id: Ordering key for the record
+            **kwargs: Arguments for ``write``
+        """
+        await self.start()
+        await self._queue.put(AuditRecord(correlation_id, write, kwargs))
+        self.submitted += 1
+
+    async def flush(self) -> None:
+        """Wait until every record submitted so far has been written."""
+        if self.pending:
+            await self.start()
+        await self._queue.join()
+
+    async def stop(self) -> None:
+        """Drain all queued records, then stop the background writer."""
+        await self.flush()
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        """Drain the queue batch by batch."""
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _next_batch(self) -> List[AuditRecord]:
+        """Wait for one record, linger briefly, then take what is queued."""
+        batch = [await self._queue.get()]
+        if self._batch_linger > 0 and self._queue.qsize() < self._batch_size - 1:
+            await asyncio.sleep(self._batch_linger)
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _write_batch(self, batch: List[AuditRecord]) -> None:
+        """Write correlation groups concurrently, each group in order."""
+        groups: "OrderedDict[str, List[AuditRecord]]" = OrderedDict()
+        for record in batch:
+            groups.setdefault(record.correlation_id, []).append(record)
+        await asyncio.gather(*(self._write_group(g) for g in groups.values()))
+
+    async def _write_group(self, records: List[AuditRecord]) -> None:
+        async with self._write_slots:
+            for record in records:
+                try:
+                    await record.write(**record.kwargs)
+                    self.written += 1
+                except Exception as e:
+                    self.failed += 1
+                    logger.warning(
+                        f"Failed to write tool audit record: {e}",
+                        extra={"correlation_id": record.correlation_id}
+                    )
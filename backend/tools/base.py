@@ -14,14 +14,19 @@ Per PRD Section 10 (Testing & Verification):
 - Tools must be testable in isolation
 - Deterministic behavior for smoke tests
 - Replay-friendly design
+
+Audit writes are awaited inline by default. Passing a ToolAuditPipeline
+moves them off the call path: execute() returns as soon as the tool
+finishes and the pipeline delivers the records in the background.
 """
 
+import copy
 import logging
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -100,7 +105,8 @@ class BaseTool(ABC):
     def __init__(
         self,
         event_service: Optional[Any] = None,
-        memory_service: Optional[Any] = None
+        memory_service: Optional[Any] = None,
+        audit_pipeline: Optional[Any] = None
     ):
         """
         Initialize the tool.
@@ -108,9 +114,13 @@ class BaseTool(ABC):
         Args:
             event_service: EventService instance (for logging)
             memory_service: AgentMemoryService instance (for storage)
+            audit_pipeline: Optional ToolAuditPipeline; when set, events and
+                memories are written behind instead of awaited inline, and
+                ToolResult.event_id / memory_id are left unset
         """
         self._event_service = event_service
         self._memory_service = memory_service
+        self._audit_pipeline = audit_pipeline
 
     @property
     @abstractmethod
@@ -176,6 +186,9 @@ class BaseTool(ABC):
         4. Log tool_call_complete event
         5. Return structured result
 
+        Steps 1, 3 and 4 are queued on the audit pipeline when one is
+        configured; duration_ms always covers only the tool logic.
+
         Args:
             context: Execution context
             **parameters: Tool-specific parameters
@@ -183,7 +196,6 @@ class BaseTool(ABC):
         Returns:
             ToolResult with success/error and data
         """
-        start_time = datetime.utcnow()
         event_id = None
         memory_id = None
         result = None
@@ -192,17 +204,21 @@ class BaseTool(ABC):
             # Log tool call start
             if self._event_service:
                 try:
-                    event = await self._event_service.store_agent_tool_call(
+                    event = await self._audit(
+                        self._event_service.store_agent_tool_call,
+                        context.correlation_id,
                         agent_id=context.agent_id,
                         tool_name=self.name,
                         parameters=parameters,
                         correlation_id=context.correlation_id
                     )
-                    event_id = event.get("id")
+                    if event:
+                        event_id = event.get("id")
                 except Exception as e:
                     logger.warning(f"Failed to log tool call start: {e}")
 
             # Execute tool logic
+            start_time = datetime.utcnow()
             result = await self._execute(context, **parameters)
 
             # Calculate execution time
@@ -214,7 +230,9 @@ class BaseTool(ABC):
             # Store in agent_memory if successful
             if result.success and self._memory_service:
                 try:
-                    memory = await self._memory_service.store_memory(
+                    memory = await self._audit(
+                        self._memory_service.store_memory,
+                        context.correlation_id,
                         project_id=context.project_id,
                         agent_id=context.agent_id,
                         run_id=context.run_id,
@@ -229,22 +247,25 @@ class BaseTool(ABC):
                             "duration_ms": duration_ms
                         }
                     )
-                    memory_id = memory.get("memory_id")
-                    result.memory_id = memory_id
+                    if memory:
+                        memory_id = memory.get("memory_id")
+                        result.memory_id = memory_id
                 except Exception as e:
                     logger.warning(f"Failed to store tool result in memory: {e}")
 
             # Log tool call complete
             if self._event_service:
                 try:
-                    complete_event = await self._event_service.store_agent_tool_call(
+                    complete_event = await self._audit(
+                        self._event_service.store_agent_tool_call,
+                        context.correlation_id,
                         agent_id=context.agent_id,
                         tool_name=self.name,
                         parameters=parameters,
                         result=result.data,
                         correlation_id=context.correlation_id
                     )
-                    if not event_id:
+                    if not event_id and complete_event:
                         event_id = complete_event.get("id")
                     result.event_id = event_id
                 except Exception as e:
@@ -281,7 +302,9 @@ class BaseTool(ABC):
             # Log error event
             if self._event_service:
                 try:
-                    await self._event_service.store_agent_error(
+                    await self._audit(
+                        self._event_service.store_agent_error,
+                        context.correlation_id,
                         agent_id=context.agent_id,
                         error_type="TOOL_EXECUTION_ERROR",
                         error_message=f"{self.name}: {error_msg}",
@@ -305,6 +328,33 @@ class BaseTool(ABC):
                 }
             )
 
+    async def _audit(
+        self,
+        write: Callable[..., Awaitable[Dict[str, Any]]],
+        correlation_id: str,
+        /,
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Perform an audit write, inline or via the audit pipeline.
+
+        Queued writes get a deep copy of their arguments, so the caller
+        changing parameters or the result afterwards does not alter the
+        audit record.
+
+        Args:
+            write: Service method to call
+            correlation_id: Ordering key for the pipeline
+            **kwargs: Arguments for ``write``
+
+        Returns:
+            The service response when written inline, None when queued
+        """
+        if self._audit_pipeline is not None:
+            await self._audit_pipeline.submit(write, correlation_id, **copy.deepcopy(kwargs))
+            return None
+        return await write(**kwargs)
+
     @abstractmethod
     async def _execute(
         self,
@@ -72,7 +72,8 @@ class MarketDataTool(BaseTool):
     def __init__(
         self,
         event_service: Optional[Any] = None,
-        memory_service: Optional[Any] = None
+        memory_service: Optional[Any] = None,
+        audit_pipeline: Optional[Any] = None
     ):
         """
         Initialize MarketDataTool.
@@ -80,8 +81,13 @@ class MarketDataTool(BaseTool):
         Args:
             event_service: EventService instance (optional)
             memory_service: AgentMemoryService instance (optional)
+            audit_pipeline: ToolAuditPipeline for write-behind auditing (optional)
         """
-        super().__init__(event_service=event_service, memory_service=memory_service)
+        super().__init__(
+            event_service=event_service,
+            memory_service=memory_service,
+            audit_pipeline=audit_pipeline
+        )
 
     @property
     def name(self) -> str:
@@ -79,7 +79,8 @@ class X402RequestTool(BaseTool):
     def __init__(
         self,
         event_service: Optional[Any] = None,
-        memory_service: Optional[Any] = None
+        memory_service: Optional[Any] = None,
+        audit_pipeline: Optional[Any] = None
     ):
         """
         Initialize X402RequestTool.
@@ -87,8 +88,13 @@ class X402RequestTool(BaseTool):
         Args:
             event_service: EventService instance (optional)
             memory_service: AgentMemoryService instance (optional)
+            audit_pipeline: ToolAuditPipeline for write-behind auditing (optional)
         """
-        super().__init__(event_service=event_service, memory_service=memory_service)
+        super().__init__(
+            event_service=event_service,
+            memory_service=memory_service,
+            audit_pipeline=audit_pipeline
+        )
 
     @property
     def name(self) -> str:
@@ -72,6 +72,14 @@ class CloudStorageAdapter:
         self._records.setdefault(table, []).append(record)
         return {"id": record_id}
 
+    async def store_records(
+        self,
+        table: str,
+        rows: List[Dict[str, Any]],
+    ) -> List[Dict[str, str]]:
+        """Bulk variant of store_record (used by SyncManager)."""
+        return [await self.store_record(table, data) for data in rows]
+
     async def query_records(
         self,
         table: str,
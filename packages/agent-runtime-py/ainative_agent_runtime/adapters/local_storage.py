@@ -3,15 +3,66 @@ ainative-agent-runtime — LocalStorageAdapter (Python)
 Built by AINative Dev Team
 Refs #247
 
-Pure in-memory storage implementing the StorageAdapter protocol.
-SQLite integration is reserved for a future milestone.
+SQLite storage implementing the StorageAdapter protocol.
+
+- File databases run in WAL mode, so data survives restarts and reads do
+  not block the writer; ':memory:' gives a throwaway database
+- recall_memory uses an FTS5 index ranked by BM25 (falls back to term
+  overlap when the SQLite build lacks FTS5)
+- Records are indexed per table; query_records filters on JSON fields in SQL
+- The sync queue is a partial index on the synced flag, so counting and
+  listing pending changes only touches unsynced rows
 """
 
 from __future__ import annotations
 
+import json
+import re
+import sqlite3
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# SQLite's default host-parameter limit is 999 on older builds
+_MAX_SQL_PARAMS = 500
+
+_FTS_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memories (
+    seq        INTEGER PRIMARY KEY,
+    id         TEXT NOT NULL UNIQUE,
+    content    TEXT NOT NULL,
+    metadata   TEXT NOT NULL,
+    synced     INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_memories_unsynced ON memories(seq) WHERE synced = 0;
+
+CREATE TABLE IF NOT EXISTS records (
+    seq        INTEGER PRIMARY KEY,
+    id         TEXT NOT NULL UNIQUE,
+    table_name TEXT NOT NULL,
+    data       TEXT NOT NULL,
+    synced     INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_records_table ON records(table_name, seq);
+CREATE INDEX IF NOT EXISTS idx_records_unsynced ON records(seq) WHERE synced = 0;
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    content, content='memories', content_rowid='seq'
+);
+CREATE TRIGGER IF NOT EXISTS memories_fts_insert AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_fts(rowid, content) VALUES (new.seq, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_fts_delete AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_fts(memories_fts, rowid, content) VALUES ('delete', old.seq, old.content);
+END;
+"""
 
 
 def _now() -> str:
@@ -28,18 +79,39 @@ def _term_overlap_score(query: str, content: str) -> float:
     return hits / len(q_terms)
 
 
+def _fts_query(query: str) -> str:
+    """Build an FTS5 OR-query of quoted terms (no FTS operator injection)."""
+    terms = dict.fromkeys(t.lower() for t in _FTS_TOKEN.findall(query))
+    return " OR ".join(f'"{t}"' for t in terms)
+
+
+def _chunks(ids: List[str]) -> Iterable[List[str]]:
+    for i in range(0, len(ids), _MAX_SQL_PARAMS):
+        yield ids[i:i + _MAX_SQL_PARAMS]
+
+
 class LocalStorageAdapter:
     """
-    In-process storage adapter backed by Python lists.
+    In-process storage adapter backed by SQLite.
 
     Args:
-        db_path: Path to SQLite file or ':memory:' (currently in-memory only).
+        db_path: Path to SQLite file or ':memory:'.
     """
 
     def __init__(self, db_path: str = ":memory:") -> None:
         self._db_path = db_path
-        self._memories: List[Dict[str, Any]] = []
-        self._records: List[Dict[str, Any]] = []
+        self._conn = sqlite3.connect(db_path)
+        self._conn.row_factory = sqlite3.Row
+        if db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self.fts_enabled = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5
+            self.fts_enabled = False
         self._closed = False
 
     # ─── StorageAdapter protocol ──────────────────────────────────────────────
@@ -50,29 +122,56 @@ class LocalStorageAdapter:
         metadata: Dict[str, Any],
     ) -> Dict[str, str]:
         record_id = str(uuid.uuid4())
-        self._memories.append({
-            "id": record_id,
-            "content": content,
-            "metadata": dict(metadata),
-            "synced": False,
-            "created_at": _now(),
-        })
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO memories (id, content, metadata, created_at) VALUES (?, ?, ?, ?)",
+                (record_id, content, json.dumps(metadata, default=str), _now()),
+            )
         return {"id": record_id}
 
     async def recall_memory(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        if not self.fts_enabled:
+            return self._recall_by_term_overlap(query, limit)
+
+        match = _fts_query(query)
+        if not match:
+            rows = self._conn.execute(
+                "SELECT id, content, metadata, created_at, 0.0 AS score "
+                "FROM memories ORDER BY seq DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        else:
+            # bm25() is lower-is-better; negate so higher scores rank first
+            rows = self._conn.execute(
+                "SELECT m.id, m.content, m.metadata, m.created_at, -bm25(memories_fts) AS score "
+                "FROM memories_fts JOIN memories m ON m.seq = memories_fts.rowid "
+                "WHERE memories_fts MATCH ? ORDER BY bm25(memories_fts) LIMIT ?",
+                (match, limit),
+            ).fetchall()
+
+        return [self._memory_entry(row, row["score"]) for row in rows]
+
+    def _recall_by_term_overlap(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        rows = self._conn.execute(
+            "SELECT id, content, metadata, created_at FROM memories"
+        ).fetchall()
         scored = [
-            {
-                "id": row["id"],
-                "content": row["content"],
-                "metadata": row["metadata"],
-                "score": _term_overlap_score(query, row["content"]),
-                "created_at": row["created_at"],
-            }
-            for row in self._memories
+            self._memory_entry(row, _term_overlap_score(query, row["content"]))
+            for row in rows
         ]
         scored.sort(key=lambda x: x["score"], reverse=True)
         return scored[:limit]
 
+    @staticmethod
+    def _memory_entry(row: sqlite3.Row, score: float) -> Dict[str, Any]:
+        return {
+            "id": row["id"],
+            "content": row["content"],
+            "metadata": json.loads(row["metadata"]),
+            "score": score,
+            "created_at": row["created_at"],
+        }
+
     async def store_record(
         self,
         table: str,
@@ -80,14 +179,12 @@ class LocalStorageAdapter:
     ) -> Dict[str, str]:
         record_id = str(uuid.uuid4())
         now = _now()
-        self._records.append({
-            "id": record_id,
-            "table_name": table,
-            "data": dict(data),
-            "synced": False,
-            "created_at": now,
-            "updated_at": now,
-        })
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO records (id, table_name, data, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (record_id, table, json.dumps(data, default=str), now, now),
+            )
         return {"id": record_id}
 
     async def query_records(
@@ -95,69 +192,113 @@ class LocalStorageAdapter:
         table: str,
         filter_: Dict[str, Any],
     ) -> List[Dict[str, Any]]:
-        rows = [r for r in self._records if r["table_name"] == table]
-        filter_keys = list(filter_.keys())
-
-        def matches(row: Dict[str, Any]) -> bool:
-            if not filter_keys:
-                return True
-            return all(row["data"].get(k) == filter_[k] for k in filter_keys)
-
-        return [
-            {
-                "id": r["id"],
-                "data": r["data"],
-                "created_at": r["created_at"],
-                "updated_at": r["updated_at"],
-            }
-            for r in rows
-            if matches(r)
-        ]
+        sql, params = self._record_filter_sql(table, filter_)
+        results = []
+        for row in self._conn.execute(sql, params):
+            data = json.loads(row["data"])
+            # SQL narrows by scalar fields; Python equality is authoritative
+            if all(data.get(k) == v for k, v in filter_.items()):
+                results.append({
+                    "id": row["id"],
+                    "data": data,
+                    "created_at": row["created_at"],
+                    "updated_at": row["updated_at"],
+                })
+        return results
+
+    @staticmethod
+    def _record_filter_sql(table: str, filter_: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        clauses = ["table_name = ?"]
+        params: List[Any] = [table]
+        for key, value in filter_.items():
+            # bools/None/containers compare differently in JSON; leave to Python
+            if '"' in key or isinstance(value, bool) or not isinstance(value, (str, int, float)):
+                continue
+            clauses.append("json_extract(data, ?) = ?")
+            params.extend([f'$."{key}"', value])
+        sql = (
+            "SELECT id, data, created_at, updated_at FROM records "
+            f"WHERE {' AND '.join(clauses)} ORDER BY seq"
+        )
+        return sql, params
 
     # ─── Sync Queue ───────────────────────────────────────────────────────────
 
     async def get_unsynced_count(self) -> int:
-        mem = sum(1 for m in self._memories if not m["synced"])
-        rec = sum(1 for r in self._records if not r["synced"])
-        return mem + rec
+        row = self._conn.execute(
+            "SELECT (SELECT COUNT(*) FROM memories WHERE synced = 0) + "
+            "(SELECT COUNT(*) FROM records WHERE synced = 0)"
+        ).fetchone()
+        return row[0]
 
     async def mark_synced(self, ids: List[str]) -> None:
-        id_set = set(ids)
-        for row in self._memories:
-            if row["id"] in id_set:
-                row["synced"] = True
-        for row in self._records:
-            if row["id"] in id_set:
-                row["synced"] = True
-
-    async def get_pending_changes(self) -> List[Dict[str, Any]]:
+        ids = list(ids)
+        with self._conn:
+            for chunk in _chunks(ids):
+                placeholders = ",".join("?" * len(chunk))
+                for table in ("memories", "records"):
+                    self._conn.execute(
+                        f"UPDATE {table} SET synced = 1 "
+                        f"WHERE synced = 0 AND id IN ({placeholders})",
+                        chunk,
+                    )
+
+    async def get_pending_changes(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        List unsynced changes, memories first, each in insertion order.
+
+        Args:
+            limit: Optional maximum number of changes to return.
+            offset: Number of leading unsynced changes to skip.
+        """
         changes: List[Dict[str, Any]] = []
+        cap = -1 if limit is None else limit
+        record_offset = 0
+        if offset > 0:
+            unsynced_memories = self._conn.execute(
+                "SELECT COUNT(*) FROM memories WHERE synced = 0"
+            ).fetchone()[0]
+            record_offset = max(0, offset - unsynced_memories)
 
-        for row in self._memories:
-            if not row["synced"]:
-                changes.append({
-                    "id": row["id"],
-                    "type": "memory",
-                    "content": row["content"],
-                    "metadata": row["metadata"],
-                    "created_at": row["created_at"],
-                })
+        for row in self._conn.execute(
+            "SELECT id, content, metadata, created_at FROM memories "
+            "WHERE synced = 0 ORDER BY seq LIMIT ? OFFSET ?",
+            (cap, offset),
+        ):
+            changes.append({
+                "id": row["id"],
+                "type": "memory",
+                "content": row["content"],
+                "metadata": json.loads(row["metadata"]),
+                "created_at": row["created_at"],
+            })
 
-        for row in self._records:
-            if not row["synced"]:
-                changes.append({
-                    "id": row["id"],
-                    "type": "record",
-                    "table": row["table_name"],
-                    "data": row["data"],
-                    "created_at": row["created_at"],
-                })
+        if limit is not None:
+            cap = limit - len(changes)
+            if cap <= 0:
+                return changes
+
+        for row in self._conn.execute(
+            "SELECT id, table_name, data, created_at FROM records "
+            "WHERE synced = 0 ORDER BY seq LIMIT ? OFFSET ?",
+            (cap, record_offset),
+        ):
+            changes.append({
+                "id": row["id"],
+                "type": "record",
+                "table": row["table_name"],
+                "data": json.loads(row["data"]),
+                "created_at": row["created_at"],
+            })
 
         return changes
 
     # ─── Lifecycle ────────────────────────────────────────────────────────────
 
     async def close(self) -> None:
+        if self._closed:
+            return
         self._closed = True
-        self._memories.clear()
-        self._records.clear()
+        self._conn.close()
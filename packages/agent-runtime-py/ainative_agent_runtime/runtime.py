@@ -18,6 +18,14 @@ RuntimeEvent = str
 EventCallback = Callable[[Any], None]
 
 
+def build_tool_index(tools: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map tool name → tool definition; the first tool with a given name wins."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for tool in tools:
+        index.setdefault(tool["name"], tool)
+    return index
+
+
 class AgentRuntime:
     """
     Embeddable agent runtime that executes multi-turn agent loops.
@@ -25,8 +33,11 @@ class AgentRuntime:
     Args:
         storage: A StorageAdapter instance (local or cloud).
         llm_provider: An LLMProvider instance.
-        tools: Optional list of tool definitions (dicts with name, description, execute).
+        tools: Optional list of tool definitions (dicts with name, description, execute,
+            and optionally timeout in seconds).
         max_turns: Maximum number of turns before halting (default: 10).
+        max_concurrent_tools: Tool calls from one turn executed at once (default: 8).
+        tool_timeout: Default per-tool timeout in seconds; None means no limit.
     """
 
     def __init__(
@@ -35,11 +46,17 @@ class AgentRuntime:
         llm_provider: Any,
         tools: Optional[List[Dict[str, Any]]] = None,
         max_turns: int = 10,
+        max_concurrent_tools: int = 8,
+        tool_timeout: Optional[float] = None,
     ) -> None:
+        if max_concurrent_tools < 1:
+            raise ValueError("max_concurrent_tools must be at least 1")
         self._storage = storage
         self._llm = llm_provider
         self._global_tools: List[Dict[str, Any]] = tools or []
         self.max_turns = max_turns
+        self.max_concurrent_tools = max_concurrent_tools
+        self.tool_timeout = tool_timeout
         self._listeners: Dict[str, List[EventCallback]] = defaultdict(list)
 
     # ─── Event Emitter ────────────────────────────────────────────────────────
@@ -58,8 +75,12 @@ class AgentRuntime:
         """
         Execute a single agent turn: think → select tool → execute → record.
 
+        Tool calls from the LLM response run concurrently (bounded by
+        max_concurrent_tools); results keep the order of the calls.
+
         Args:
-            context: dict with keys 'messages', 'tools', optionally 'options'.
+            context: dict with keys 'messages', 'tools', optionally 'options'
+                and 'tool_index' (name → tool, built once per run).
 
         Returns:
             A dict representing a TurnResult.
@@ -67,6 +88,9 @@ class AgentRuntime:
         messages = context.get("messages", [])
         tools: List[Dict[str, Any]] = context.get("tools", [])
         options = context.get("options", None)
+        tool_index = context.get("tool_index")
+        if tool_index is None:
+            tool_index = build_tool_index(tools)
 
         # Build LLM tool definitions (strip execute callable)
         llm_tool_defs = [
@@ -76,23 +100,14 @@ class AgentRuntime:
 
         llm_response = await self._llm.chat_with_tools(messages, llm_tool_defs, options)
 
-        tool_calls_result = []
-        for tc in llm_response.get("tool_calls", []):
+        calls = llm_response.get("tool_calls", [])
+        for tc in calls:
             self._emit("tool_call", tc)
 
-            tool = next((t for t in tools if t["name"] == tc["name"]), None)
-            executed = dict(tc)
-
-            if tool:
-                try:
-                    executed["result"] = await tool["execute"](tc.get("args", {}))
-                except Exception as exc:
-                    executed["error"] = str(exc)
-            else:
-                executed["error"] = f'Tool "{tc["name"]}" not found'
-
-            self._emit("tool_result", executed)
-            tool_calls_result.append(executed)
+        slots = asyncio.Semaphore(self.max_concurrent_tools)
+        tool_calls_result = list(await asyncio.gather(
+            *(self._execute_tool_call(tc, tool_index.get(tc["name"]), slots) for tc in calls)
+        ))
 
         return {
             "turn_number": 0,  # caller updates this
@@ -101,6 +116,31 @@ class AgentRuntime:
             "messages": messages,
         }
 
+    async def _execute_tool_call(
+        self,
+        tc: Dict[str, Any],
+        tool: Optional[Dict[str, Any]],
+        slots: asyncio.Semaphore,
+    ) -> Dict[str, Any]:
+        executed = dict(tc)
+
+        if tool:
+            timeout = tool.get("timeout", self.tool_timeout)
+            async with slots:
+                try:
+                    executed["result"] = await asyncio.wait_for(
+                        tool["execute"](tc.get("args", {})), timeout
+                    )
+                except asyncio.TimeoutError:
+                    executed["error"] = f'Tool "{tc["name"]}" timed out after {timeout}s'
+                except Exception as exc:
+                    executed["error"] = str(exc)
+        else:
+            executed["error"] = f'Tool "{tc["name"]}" not found'
+
+        self._emit("tool_result", executed)
+        return executed
+
     # ─── run() ────────────────────────────────────────────────────────────────
 
     async def run(self, task: Dict[str, Any]) -> Dict[str, Any]:
@@ -114,6 +154,7 @@ class AgentRuntime:
             A dict representing a RunResult.
         """
         all_tools = self._global_tools + task.get("tools", [])
+        tool_index = build_tool_index(all_tools)
         turns = []
         task_id = task.get("id", "unknown")
 
@@ -130,7 +171,9 @@ class AgentRuntime:
             for turn_num in range(self.max_turns):
                 self._emit("turn_start", {"turn": turn_num, "task_id": task_id})
 
-                turn_result = await self.step({"messages": messages, "tools": all_tools})
+                turn_result = await self.step(
+                    {"messages": messages, "tools": all_tools, "tool_index": tool_index}
+                )
                 turn_result["turn_number"] = turn_num + 1
                 turns.append(turn_result)
                 self._emit("turn_end", turn_result)
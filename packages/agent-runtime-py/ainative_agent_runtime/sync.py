@@ -3,14 +3,36 @@ ainative-agent-runtime — SyncManager (Python)
 Built by AINative Dev Team
 Refs #247
 
-Periodically pushes local changes to cloud storage.
+Periodically pushes local changes to cloud storage in concurrent batches,
+checkpointing acknowledged items and backing off failed ones. The queue is
+read from local storage in bounded pages, so a large backlog is never
+loaded at once.
 Conflict resolution: last-write-wins by created_at timestamp.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Optional
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SyncMetrics:
+    """Progress counters for queue drain."""
+
+    pushed_total: int = 0
+    failed_total: int = 0
+    dropped_total: int = 0  # unpushable changes (e.g. records without a table), acked
+    deferred: int = 0
+    queue_remaining: int = 0
+    last_push_items: int = 0
+    last_push_seconds: float = 0.0
+    drain_rate: float = 0.0  # items/second during the last push
 
 
 class SyncManager:
@@ -21,6 +43,15 @@ class SyncManager:
         local_storage: A LocalStorageAdapter instance.
         cloud_storage: A StorageAdapter instance (cloud).
         sync_interval: Milliseconds between sync cycles (default: 30000).
+        batch_size: Changes per upload batch / checkpoint (default: 100).
+        page_size: Changes read from local storage at a time (default: 1000).
+        max_concurrency: Cloud calls in flight at once (default: 4).
+        base_backoff: Seconds before the first retry of a failed item (default: 1.0).
+        max_backoff: Upper bound on the retry delay in seconds (default: 300.0).
+
+    Cloud adapters may define bulk methods ``store_memories(items)`` (list of
+    (content, metadata)) and ``store_records(table, rows)``; when present a
+    batch is uploaded in one call, otherwise item by item.
     """
 
     def __init__(
@@ -28,11 +59,23 @@ class SyncManager:
         local_storage: Any,
         cloud_storage: Any,
         sync_interval: int = 30000,
+        batch_size: int = 100,
+        page_size: int = 1000,
+        max_concurrency: int = 4,
+        base_backoff: float = 1.0,
+        max_backoff: float = 300.0,
     ) -> None:
         self._local = local_storage
         self._cloud = cloud_storage
         self.sync_interval = sync_interval
+        self.batch_size = max(1, batch_size)
+        self.page_size = max(1, page_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
         self.is_running = False
+        self.metrics = SyncMetrics()
+        self._retry_state: Dict[str, Tuple[int, float]] = {}  # id → (attempts, next_attempt_at)
         self._task: Optional[asyncio.Task] = None  # type: ignore[type-arg]
 
     # ─── start_sync ───────────────────────────────────────────────────────────
@@ -65,31 +108,149 @@ class SyncManager:
     # ─── force_push ───────────────────────────────────────────────────────────
 
     async def force_push(self) -> None:
-        """Push all pending local changes to cloud. Mark each synced on success."""
-        pending = await self._local.get_pending_changes()
-        if not pending:
+        """
+        Push pending local changes to cloud in concurrent batches.
+
+        The queue is read ``page_size`` changes at a time. Acknowledged
+        items are marked synced batch by batch, so a crash mid-push only
+        re-sends the batches that were in flight. Failed items are retried
+        on later pushes with exponential backoff.
+        """
+        started = time.monotonic()
+        slots = asyncio.Semaphore(self.max_concurrency)
+        # Changes from earlier pages still in the queue (failed or deferred)
+        offset = 0
+        seen = count = deferred = 0
+        while True:
+            page = await self._local.get_pending_changes(limit=self.page_size, offset=offset)
+            if not page:
+                break
+            seen += len(page)
+            due = [c for c in page if self._is_due(c["id"], started)]
+            deferred += len(page) - len(due)
+
+            batches = [due[i:i + self.batch_size] for i in range(0, len(due), self.batch_size)]
+            results = await asyncio.gather(*(self._push_batch(b, slots) for b in batches))
+            pushed = sum(p for p, _ in results)
+            removed = pushed + sum(d for _, d in results)
+            count += pushed
+            offset += len(page) - removed
+            if len(page) < self.page_size:
+                break
+        if not seen:
             return
 
-        synced_ids = []
-        for change in pending:
+        elapsed = time.monotonic() - started
+        self.metrics.deferred = deferred
+        self.metrics.pushed_total += count
+        self.metrics.last_push_items = count
+        self.metrics.last_push_seconds = elapsed
+        self.metrics.drain_rate = count / elapsed if elapsed > 0 else float(count)
+        self.metrics.queue_remaining = offset
+
+    async def _push_batch(
+        self, batch: List[Dict[str, Any]], slots: asyncio.Semaphore
+    ) -> Tuple[int, int]:
+        """
+        Upload one batch and checkpoint its acknowledged items.
+
+        Changes that can never be uploaded (records without a table, unknown
+        types) are acked as well, so they do not stay pending forever.
+
+        Returns:
+            (pushed, dropped) counts.
+        """
+        memories: List[Dict[str, Any]] = []
+        records: Dict[str, List[Dict[str, Any]]] = {}
+        dropped: List[str] = []
+        for change in batch:
+            if change["type"] == "memory":
+                memories.append(change)
+            elif change["type"] == "record" and change.get("table"):
+                records.setdefault(change["table"], []).append(change)
+            else:
+                dropped.append(change["id"])
+
+        groups = [self._push_memories(memories, slots)] if memories else []
+        groups += [self._push_records(table, rows, slots) for table, rows in records.items()]
+        results = await asyncio.gather(*groups)
+
+        pushed = [cid for group in results for cid in group]
+        if dropped:
+            logger.warning(f"Dropping {len(dropped)} unpushable change(s): {dropped}")
+            self.metrics.dropped_total += len(dropped)
+        acked = pushed + dropped
+        if acked:
+            await self._local.mark_synced(acked)
+            for cid in acked:
+                self._retry_state.pop(cid, None)
+        return len(pushed), len(dropped)
+
+    async def _push_memories(
+        self, changes: List[Dict[str, Any]], slots: asyncio.Semaphore
+    ) -> List[str]:
+        if self._supports("store_memories"):
+            items = [(c.get("content", ""), c.get("metadata", {})) for c in changes]
+            return await self._call_bulk(changes, slots, self._cloud.store_memories, items)
+        return await self._call_each(
+            changes, slots,
+            lambda c: self._cloud.store_memory(c.get("content", ""), c.get("metadata", {})),
+        )
+
+    async def _push_records(
+        self, table: str, changes: List[Dict[str, Any]], slots: asyncio.Semaphore
+    ) -> List[str]:
+        if self._supports("store_records"):
+            rows = [c.get("data", {}) for c in changes]
+            return await self._call_bulk(changes, slots, self._cloud.store_records, table, rows)
+        return await self._call_each(
+            changes, slots,
+            lambda c: self._cloud.store_record(table, c.get("data", {})),
+        )
+
+    async def _call_bulk(
+        self, changes: List[Dict[str, Any]], slots: asyncio.Semaphore, fn: Any, *args: Any
+    ) -> List[str]:
+        async with slots:
             try:
-                if change["type"] == "memory":
-                    await self._cloud.store_memory(
-                        change.get("content", ""),
-                        change.get("metadata", {}),
-                    )
-                elif change["type"] == "record" and change.get("table"):
-                    await self._cloud.store_record(
-                        change["table"],
-                        change.get("data", {}),
-                    )
-                synced_ids.append(change["id"])
+                await fn(*args)
             except Exception:
-                # Leave failed items in queue for next sync attempt
-                pass
+                for change in changes:
+                    self._record_failure(change["id"])
+                return []
+        return [c["id"] for c in changes]
+
+    async def _call_each(
+        self, changes: List[Dict[str, Any]], slots: asyncio.Semaphore, fn: Any
+    ) -> List[str]:
+        async def one(change: Dict[str, Any]) -> Optional[str]:
+            async with slots:
+                try:
+                    await fn(change)
+                except Exception:
+                    # Leave failed items in queue; retried after backoff
+                    self._record_failure(change["id"])
+                    return None
+            return change["id"]
+
+        results = await asyncio.gather(*(one(c) for c in changes))
+        return [cid for cid in results if cid is not None]
+
+    def _supports(self, method: str) -> bool:
+        """True if the cloud adapter class defines an optional bulk method."""
+        return callable(getattr(type(self._cloud), method, None))
+
+    # ─── Retry backoff ────────────────────────────────────────────────────────
+
+    def _is_due(self, change_id: str, now: float) -> bool:
+        state = self._retry_state.get(change_id)
+        return state is None or state[1] <= now
 
-        if synced_ids:
-            await self._local.mark_synced(synced_ids)
+    def _record_failure(self, change_id: str) -> None:
+        attempts = self._retry_state.get(change_id, (0, 0.0))[0] + 1
+        delay = min(self.max_backoff, self.base_backoff * (2 ** (attempts - 1)))
+        self._retry_state[change_id] = (attempts, time.monotonic() + delay)
+        self.metrics.failed_total += 1
 
     # ─── get_queue_size ───────────────────────────────────────────────────────
 
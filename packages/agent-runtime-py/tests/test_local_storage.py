@@ -213,3 +213,94 @@ class DescribeLocalStorageAdapter:
             pending = await adapter.get_pending_changes()
             assert len(pending) == 2
             await adapter.close()
+
+
+# ─── DescribeSQLiteStorage ────────────────────────────────────────────────────
+
+class DescribeSQLiteStorage:
+    """Tests for the SQLite-specific behaviour of LocalStorageAdapter."""
+
+    @pytest.mark.asyncio
+    async def it_persists_memories_and_sync_state_across_restarts(self, tmp_path):
+        from ainative_agent_runtime.adapters.local_storage import LocalStorageAdapter
+        db_path = str(tmp_path / "agent.db")
+        adapter = LocalStorageAdapter(db_path=db_path)
+        kept = await adapter.store_memory("Persistent memory about routers", {"k": 1})
+        synced = await adapter.store_memory("Already pushed memory", {})
+        await adapter.mark_synced([synced["id"]])
+        await adapter.close()
+
+        reopened = LocalStorageAdapter(db_path=db_path)
+        recalled = await reopened.recall_memory("routers", 1)
+        assert recalled[0]["id"] == kept["id"]
+        assert recalled[0]["metadata"] == {"k": 1}
+        assert await reopened.get_unsynced_count() == 1
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def it_uses_wal_journal_for_file_databases(self, tmp_path):
+        from ainative_agent_runtime.adapters.local_storage import LocalStorageAdapter
+        adapter = LocalStorageAdapter(db_path=str(tmp_path / "wal.db"))
+        mode = adapter._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def it_ranks_recall_with_bm25_and_skips_non_matches(self):
+        from ainative_agent_runtime.adapters.local_storage import LocalStorageAdapter
+        adapter = LocalStorageAdapter()
+        await adapter.store_memory("fox fox fox in the forest", {})
+        await adapter.store_memory("a fox and a dog and a cat and a bird", {})
+        await adapter.store_memory("chairs and tables", {})
+        results = await adapter.recall_memory("fox", 5)
+        assert [r["content"] for r in results] == [
+            "fox fox fox in the forest",
+            "a fox and a dog and a cat and a bird",
+        ]
+        assert results[0]["score"] > results[1]["score"] > 0
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def it_treats_fts_operators_in_queries_as_plain_terms(self):
+        from ainative_agent_runtime.adapters.local_storage import LocalStorageAdapter
+        adapter = LocalStorageAdapter()
+        await adapter.store_memory("NEAR the quote", {})
+        results = await adapter.recall_memory('NEAR( "quote* AND', 5)
+        assert len(results) == 1
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def it_filters_records_on_typed_fields(self):
+        from ainative_agent_runtime.adapters.local_storage import LocalStorageAdapter
+        adapter = LocalStorageAdapter()
+        await adapter.store_record("jobs", {"attempts": 1, "done": True, "tags": ["a"]})
+        await adapter.store_record("jobs", {"attempts": 1, "done": False, "tags": ["a"]})
+        await adapter.store_record("other", {"attempts": 1, "done": True, "tags": ["a"]})
+        results = await adapter.query_records("jobs", {"attempts": 1, "done": True, "tags": ["a"]})
+        assert len(results) == 1
+        assert results[0]["data"]["done"] is True
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def it_returns_pending_changes_up_to_limit_in_insertion_order(self):
+        from ainative_agent_runtime.adapters.local_storage import LocalStorageAdapter
+        adapter = LocalStorageAdapter()
+        ids = [(await adapter.store_memory(f"memory {i}", {}))["id"] for i in range(3)]
+        await adapter.store_record("t", {"n": 1})
+        pending = await adapter.get_pending_changes(limit=2)
+        assert [c["id"] for c in pending] == ids[:2]
+        assert len(await adapter.get_pending_changes()) == 4
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def it_pages_pending_changes_across_memories_and_records(self):
+        from ainative_agent_runtime.adapters.local_storage import LocalStorageAdapter
+        adapter = LocalStorageAdapter()
+        ids = [(await adapter.store_memory(f"memory {i}", {}))["id"] for i in range(3)]
+        ids += [(await adapter.store_record("t", {"n": i}))["id"] for i in range(3)]
+        pages = [
+            [c["id"] for c in await adapter.get_pending_changes(limit=2, offset=offset)]
+            for offset in (0, 2, 4, 6)
+        ]
+        assert pages == [ids[0:2], ids[2:4], ids[4:6], []]
+        await adapter.close()
@@ -167,6 +167,97 @@ class DescribeAgentRuntime:
             turn = await runtime.step({"messages": [], "tools": []})
             assert "missing-tool" in turn["tool_calls"][0]["error"]
 
+    # ─── Concurrent tool calls ────────────────────────────────────────────────
+
+    class DescribeConcurrentToolCalls:
+        @pytest.mark.asyncio
+        async def it_runs_tool_calls_concurrently(self):
+            from ainative_agent_runtime.runtime import AgentRuntime
+
+            async def slow(args):
+                await asyncio.sleep(0.05)
+                return args["n"]
+
+            tool = {"name": "slow", "description": "slow", "execute": slow}
+            calls = [{"id": f"tc-{i}", "name": "slow", "args": {"n": i}} for i in range(4)]
+            runtime = AgentRuntime(storage=make_storage(), llm_provider=make_llm(content="", tool_calls=calls))
+
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            turn = await runtime.step({"messages": [], "tools": [tool]})
+
+            assert loop.time() - start < 0.15
+            assert [tc["result"] for tc in turn["tool_calls"]] == [0, 1, 2, 3]
+
+        @pytest.mark.asyncio
+        async def it_keeps_call_order_when_tools_finish_out_of_order(self):
+            from ainative_agent_runtime.runtime import AgentRuntime
+
+            async def sleepy(args):
+                await asyncio.sleep(args["delay"])
+                return args["delay"]
+
+            tool = {"name": "sleepy", "description": "sleepy", "execute": sleepy}
+            calls = [
+                {"id": "tc-1", "name": "sleepy", "args": {"delay": 0.03}},
+                {"id": "tc-2", "name": "sleepy", "args": {"delay": 0.0}},
+            ]
+            runtime = AgentRuntime(storage=make_storage(), llm_provider=make_llm(content="", tool_calls=calls))
+            turn = await runtime.step({"messages": [], "tools": [tool]})
+            assert [tc["id"] for tc in turn["tool_calls"]] == ["tc-1", "tc-2"]
+
+        @pytest.mark.asyncio
+        async def it_limits_concurrent_tool_calls(self):
+            from ainative_agent_runtime.runtime import AgentRuntime
+            in_flight = 0
+            peak = 0
+
+            async def tracked(args):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+            tool = {"name": "tracked", "description": "tracked", "execute": tracked}
+            calls = [{"id": f"tc-{i}", "name": "tracked", "args": {}} for i in range(6)]
+            runtime = AgentRuntime(
+                storage=make_storage(),
+                llm_provider=make_llm(content="", tool_calls=calls),
+                max_concurrent_tools=2,
+            )
+            await runtime.step({"messages": [], "tools": [tool]})
+            assert peak == 2
+
+        @pytest.mark.asyncio
+        async def it_records_timeout_error_for_slow_tool(self):
+            from ainative_agent_runtime.runtime import AgentRuntime
+
+            async def hang(args):
+                await asyncio.sleep(1)
+
+            fast = {"name": "fast", "description": "fast", "execute": AsyncMock(return_value="ok")}
+            slow = {"name": "hang", "description": "hangs", "execute": hang, "timeout": 0.01}
+            calls = [
+                {"id": "tc-1", "name": "hang", "args": {}},
+                {"id": "tc-2", "name": "fast", "args": {}},
+            ]
+            runtime = AgentRuntime(storage=make_storage(), llm_provider=make_llm(content="", tool_calls=calls))
+            turn = await runtime.step({"messages": [], "tools": [slow, fast]})
+            assert "timed out" in turn["tool_calls"][0]["error"]
+            assert turn["tool_calls"][1]["result"] == "ok"
+
+        @pytest.mark.asyncio
+        async def it_resolves_tools_through_the_supplied_index(self):
+            from ainative_agent_runtime.runtime import AgentRuntime, build_tool_index
+            first = {"name": "dup", "description": "first", "execute": AsyncMock(return_value="first")}
+            second = {"name": "dup", "description": "second", "execute": AsyncMock(return_value="second")}
+            index = build_tool_index([first, second])
+            llm = make_llm(content="", tool_calls=[{"id": "tc-1", "name": "dup", "args": {}}])
+            runtime = AgentRuntime(storage=make_storage(), llm_provider=llm)
+            turn = await runtime.step({"messages": [], "tools": [first, second], "tool_index": index})
+            assert turn["tool_calls"][0]["result"] == "first"
+
     # ─── Events ───────────────────────────────────────────────────────────────
 
     class DescribeEvents:
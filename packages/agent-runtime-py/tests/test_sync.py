@@ -7,6 +7,7 @@ RED phase: All tests written before implementation.
 """
 
 import asyncio
+import time
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -131,6 +132,155 @@ class DescribeSyncManager:
             cloud.store_memory.assert_not_called()
             cloud.store_record.assert_not_called()
 
+    # ─── Batched push ─────────────────────────────────────────────────────────
+
+    class DescribeBatchedPush:
+        @staticmethod
+        def memories(n):
+            return [
+                {"id": f"mem-{i}", "type": "memory", "content": f"m{i}",
+                 "metadata": {}, "created_at": "2026-01-01T00:00:00Z"}
+                for i in range(n)
+            ]
+
+        @pytest.mark.asyncio
+        async def it_checkpoints_each_batch_as_it_is_acknowledged(self):
+            from ainative_agent_runtime.sync import SyncManager
+            local = make_local()
+            local.get_pending_changes = AsyncMock(return_value=self.memories(5))
+            manager = SyncManager(local_storage=local, cloud_storage=make_cloud(), batch_size=2)
+            await manager.force_push()
+            marked = sorted(call.args[0] for call in local.mark_synced.call_args_list)
+            assert marked == [["mem-0", "mem-1"], ["mem-2", "mem-3"], ["mem-4"]]
+            assert manager.metrics.pushed_total == 5
+            assert manager.metrics.queue_remaining == 0
+            assert manager.metrics.drain_rate > 0
+
+        @pytest.mark.asyncio
+        async def it_bounds_concurrent_cloud_calls(self):
+            from ainative_agent_runtime.sync import SyncManager
+            in_flight = 0
+            peak = 0
+
+            async def store(content, metadata):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {"id": content}
+
+            local = make_local()
+            local.get_pending_changes = AsyncMock(return_value=self.memories(10))
+            cloud = make_cloud()
+            cloud.store_memory = AsyncMock(side_effect=store)
+            manager = SyncManager(local_storage=local, cloud_storage=cloud, max_concurrency=3)
+            await manager.force_push()
+            assert peak == 3
+            assert cloud.store_memory.await_count == 10
+
+        @pytest.mark.asyncio
+        async def it_uses_bulk_methods_when_the_cloud_adapter_has_them(self):
+            from ainative_agent_runtime.sync import SyncManager
+
+            class BulkCloud:
+                def __init__(self):
+                    self.memory_calls = []
+                    self.record_calls = []
+
+                async def store_memories(self, items):
+                    self.memory_calls.append(items)
+                    return [{"id": str(i)} for i, _ in enumerate(items)]
+
+                async def store_records(self, table, rows):
+                    self.record_calls.append((table, rows))
+                    return [{"id": str(i)} for i, _ in enumerate(rows)]
+
+            local = make_local()
+            local.get_pending_changes = AsyncMock(return_value=self.memories(3) + [
+                {"id": "rec-1", "type": "record", "table": "agents",
+                 "data": {"name": "Bot"}, "created_at": "2026-01-01T00:00:00Z"}
+            ])
+            cloud = BulkCloud()
+            manager = SyncManager(local_storage=local, cloud_storage=cloud)
+            await manager.force_push()
+            assert cloud.memory_calls == [[("m0", {}), ("m1", {}), ("m2", {})]]
+            assert cloud.record_calls == [("agents", [{"name": "Bot"}])]
+            assert sorted(local.mark_synced.call_args.args[0]) == ["mem-0", "mem-1", "mem-2", "rec-1"]
+
+        @pytest.mark.asyncio
+        async def it_backs_off_failed_items_exponentially(self):
+            from ainative_agent_runtime.sync import SyncManager
+            local = make_local()
+            local.get_pending_changes = AsyncMock(return_value=self.memories(1))
+            cloud = make_cloud()
+            cloud.store_memory = AsyncMock(side_effect=ConnectionError("offline"))
+            manager = SyncManager(local_storage=local, cloud_storage=cloud, base_backoff=60.0)
+
+            await manager.force_push()
+            await manager.force_push()  # still inside the backoff window
+            assert cloud.store_memory.await_count == 1
+            assert manager.metrics.deferred == 1
+            local.mark_synced.assert_not_called()
+
+            manager._retry_state["mem-0"] = (1, 0.0)  # window elapsed
+            await manager.force_push()
+            assert cloud.store_memory.await_count == 2
+            attempts, next_at = manager._retry_state["mem-0"]
+            assert attempts == 2
+            assert next_at - time.monotonic() > 100  # 60s * 2
+
+        @pytest.mark.asyncio
+        async def it_drains_the_queue_in_bounded_pages(self):
+            from ainative_agent_runtime.adapters.local_storage import LocalStorageAdapter
+            from ainative_agent_runtime.sync import SyncManager
+            local = LocalStorageAdapter()
+            for i in range(25):
+                await local.store_memory(f"m{i}", {})
+            await local.store_record("agents", {"name": "Bot"})
+            reads = []
+            get_pending_changes = local.get_pending_changes
+
+            async def spy(limit=None, offset=0):
+                reads.append((limit, offset))
+                return await get_pending_changes(limit=limit, offset=offset)
+
+            local.get_pending_changes = spy
+
+            async def store(content, metadata):
+                if content == "m3":
+                    raise ConnectionError("offline")
+                return {"id": content}
+
+            cloud = make_cloud()
+            cloud.store_memory = AsyncMock(side_effect=store)
+            manager = SyncManager(local_storage=local, cloud_storage=cloud, page_size=10)
+            await manager.force_push()
+
+            assert all(limit == 10 for limit, _ in reads)
+            assert reads[-1][1] == 1  # the failed item is skipped, not re-read
+            assert manager.metrics.pushed_total == 25
+            assert manager.metrics.queue_remaining == 1
+            assert [c["content"] for c in await get_pending_changes()] == ["m3"]
+            await local.close()
+
+        @pytest.mark.asyncio
+        async def it_acks_records_that_have_no_table(self):
+            from ainative_agent_runtime.sync import SyncManager
+            local = make_local()
+            local.get_pending_changes = AsyncMock(return_value=[
+                {"id": "rec-1", "type": "record", "table": "",
+                 "data": {"name": "Bot"}, "created_at": "2026-01-01T00:00:00Z"}
+            ])
+            cloud = make_cloud()
+            manager = SyncManager(local_storage=local, cloud_storage=cloud)
+            await manager.force_push()
+            cloud.store_record.assert_not_called()
+            local.mark_synced.assert_called_once_with(["rec-1"])
+            assert manager.metrics.dropped_total == 1
+            assert manager.metrics.pushed_total == 0
+            assert manager.metrics.queue_remaining == 0
+
     # ─── get_queue_size ───────────────────────────────────────────────────────
 
     class DescribeGetQueueSize: